@@ -6,31 +6,34 @@ Implements: GET /audit-log/v1/logs
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_audit_logs_mcp.config.logging import get_logger
 from greenlake_audit_logs_mcp.server.fastmcp_instance import mcp
+from greenlake_audit_logs_mcp.utils.odata_filter import normalize_filter
+from greenlake_audit_logs_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages, resolve_max_items
+from greenlake_audit_logs_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# Audit log properties accepted in ``filter``
+FILTER_FIELDS = frozenset(
+    {
+        "additionalInfo/ipAddress",
+        "application/id",
+        "category",
+        "createdAt",
+        "description",
+        "hasDetails",
+        "region",
+        "user/username",
+        "workspace/workspaceName",
+    }
+)
 
 
 @mcp.tool(
@@ -65,6 +68,30 @@ async def getauditlogs(  # noqa: E501
         int | str | None,
         Field(description="Specifies the zero-based resource offset to start the response from."),
     ] = None,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Fetch every page starting at offset (several pages at a time) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with pages fetched, elapsed time and whether it was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """The audit logs can be filtered using a variety of parameters. Queries should be separated by `and` and can utilize `eq`, `contains`, and `in` operators to construct the final query. Each query should follow the format:\n* key eq 'value' for equality operation.\n* contains(key, 'value') for contains operation.\n* key in ('value1', 'value2') for in operation.\n\n| Filter parameter         | Supported Operators | Type                    | Example                                                                                         |\n|--------------------------|---------------------|-------------------------|-------------------------------------------------------------------------------------------------|\n| createdAt                | lt, ge              | RFC timestamp in string | createdAt ge '2024-02-16T07:54:55.0Z'                                                           |\n| category                 | eq, in              | string                  | category eq 'User Management' category in ('Device Management', 'User Activity')                |\n| description              | eq, contains        | string                  | contains(description, 'Logged in') description eq 'User test@test.com logged in via ping mode.' |\n| additionalInfo/ipAddress | eq, contains        | IP string               | additionalInfo/ipAddress eq '192.168.12.12' contains(additionalInfo/ipAddress, '192.168')       |\n| user/username            | eq, contains        | email in string         | user/username eq 'test@test.com' contains(user/username, '@gmail.com')                          |\n| workspace/workspaceName  | eq, contains        | string                  | workspace/workspaceName eq 'Example workspace' contains(workspace/workspaceName, 'Example')     |\n| application/id           | eq                  | UUID in string          | application/id eq '12312-123123-123123-123121'                                                  |\n| region                   | eq                  | region code in string   | region eq 'us-west'                                                                             |\n| hasDetails               | eq                  | boolean                 | hasDetails eq 'true'                                                                              |\n
 
@@ -74,6 +101,10 @@ async def getauditlogs(  # noqa: E501
         all: Provide a free-text search to perform a comprehensive search across all properties for audit logs.\n\nExample: logged in user
         limit: How many items to return at one time (max 2000)
         offset: Specifies the zero-based resource offset to start the response from.
+        fetch_all: Fetch every page starting at offset and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -84,8 +115,6 @@ async def getauditlogs(  # noqa: E501
 
     # Collect query / body parameters; skip values that were not provided
     params: dict[str, Any] = {}
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
     if select is not None and select is not ...:
         params["select"] = select
     if all is not None and all is not ...:
@@ -104,7 +133,23 @@ async def getauditlogs(  # noqa: E501
             raise ValueError("'offset' must be an integer") from exc
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_pages(
+                http_client,
+                url,
+                params,
+                page_size=params.get("limit", 50),
+                max_items=resolve_max_items(max_items),
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
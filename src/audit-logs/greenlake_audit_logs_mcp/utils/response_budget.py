@@ -0,0 +1,197 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Response size budget for audit-logs MCP server tools.
+
+Every tool result passes through ``ResponseShaper.shape`` before FastMCP
+serializes it (see ``server.fastmcp_instance``). A result whose estimated
+serialized size is within the budget is returned unchanged. A larger list result
+is cut on whole-item boundaries to fit, and the full item list is kept in the
+``ResultStore`` so the agent can continue with ``read_result`` from exactly the
+first item it did not receive, without the pages being fetched again. Results
+that are already slices of a stored result continue from the same handle.
+
+The budget is set in bytes or in tokens; tokens are estimated from the
+serialized size at ``BYTES_PER_TOKEN``.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from greenlake_audit_logs_mcp.config.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Serialized bytes per model token used to convert between the two budgets
+BYTES_PER_TOKEN = 4
+
+# Keys that hold the items of a list result; ``rows`` is used by format="table"
+ITEM_KEYS = ("items", "rows")
+
+# Bytes kept free within the budget for the truncation summary
+_SUMMARY_RESERVE = 512
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+def budget_bytes(max_bytes: int = 0, max_tokens: int = 0) -> int:
+    """
+    Combine the byte and token budgets into one byte budget.
+
+    Args:
+        max_bytes: Byte budget, 0 for none
+        max_tokens: Token budget, 0 for none
+
+    Returns:
+        The smaller of the configured budgets in bytes, or 0 if neither is set
+    """
+    budgets = [b for b in (max_bytes, max_tokens * BYTES_PER_TOKEN) if b > 0]
+    return min(budgets) if budgets else 0
+
+
+@dataclass
+class TruncationStats:
+    """Counters for the response budget."""
+
+    results: int = 0
+    truncated: int = 0
+    over_budget_untrimmed: int = 0
+    items_withheld: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+class ResponseShaper:
+    """Trims tool results to a byte budget on whole-item boundaries."""
+
+    def __init__(self, max_bytes: int, result_store: Any = None):
+        """
+        Initialize the shaper.
+
+        Args:
+            max_bytes: Budget for the serialized result in bytes, 0 to disable
+            result_store: ``ResultStore`` holding the full item list of truncated results
+        """
+        self.max_bytes = max_bytes
+        self.result_store = result_store
+        self.stats = TruncationStats()
+
+    def shape(self, tool_name: str, result: Any) -> Any:
+        """
+        Return ``result`` trimmed to the budget.
+
+        Only results of the form ``[{"success": True, "result": {...}}]`` whose
+        payload holds an item list (``items`` or ``rows``) can be trimmed; other
+        results over the budget are returned unchanged and logged.
+
+        Args:
+            tool_name: Name of the tool that produced the result, for logging
+            result: Value returned by the tool function
+
+        Returns:
+            The result, with the item list cut short and a ``truncation`` entry
+            describing how to continue if it exceeded the budget
+        """
+        if not self.max_bytes:
+            return result
+        size = _json_size(result)
+        self.stats.results += 1
+        self.stats.bytes_in += size
+        if size <= self.max_bytes:
+            self.stats.bytes_out += size
+            return result
+
+        payload, key = _item_payload(result)
+        items: list[Any] = payload[key] if payload is not None and key is not None else []
+        kept = _items_within(items, self.max_bytes - (size - _json_size(items)) - _SUMMARY_RESERVE)
+        if payload is None or key is None or kept == len(items):
+            self.stats.over_budget_untrimmed += 1
+            self.stats.bytes_out += size
+            logger.warning(
+                f"{tool_name} result of {size} bytes exceeds the response budget of {self.max_bytes} bytes "
+                "and cannot be trimmed on item boundaries"
+            )
+            return result
+
+        shaped_payload = {**payload, key: items[:kept]}
+        if isinstance(payload.get("count"), int):
+            shaped_payload["count"] = kept
+        shaped_payload["truncation"] = self._continuation(tool_name, payload, key, kept)
+        shaped = [{**result[0], "result": shaped_payload}]
+
+        shaped_size = _json_size(shaped)
+        self.stats.truncated += 1
+        self.stats.items_withheld += len(items) - kept
+        self.stats.bytes_out += shaped_size
+        logger.info(
+            f"Truncated {tool_name} result from {size} to {shaped_size} bytes "
+            f"(~{shaped_size // BYTES_PER_TOKEN} tokens): {kept} of {len(items)} items returned"
+        )
+        return shaped
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return truncation counters."""
+        return asdict(self.stats)
+
+    def _continuation(self, tool_name: str, payload: dict[str, Any], key: str, kept: int) -> dict[str, Any]:
+        """Describe where the truncated result continues, storing the withheld items if needed."""
+        items = payload[key]
+        summary: dict[str, Any] = {
+            "returned_items": kept,
+            "withheld_items": len(items) - kept,
+            "budget_bytes": self.max_bytes,
+        }
+        if isinstance(payload.get("handle"), str) and isinstance(payload.get("offset"), int):
+            # Already a slice of a stored result: continue from the same handle
+            handle = payload["handle"]
+            offset = payload["offset"] + kept
+            if "next_offset" in payload:
+                summary["next_offset_without_budget"] = payload["next_offset"]
+        elif self.result_store is not None:
+            stored = {k: v for k, v in payload.items() if k != key}
+            stored["items"] = items
+            try:
+                handle = self.result_store.put(stored)
+            except ValueError as exc:
+                logger.warning(f"Could not keep the full {tool_name} result for continuation: {exc}")
+                summary["hint"] = "The full result is too large to keep; narrow the query or lower limit"
+                return summary
+            offset = kept
+        else:
+            summary["hint"] = "Narrow the query or lower limit to receive the remaining items"
+            return summary
+
+        summary["continuation"] = {"tool": "read_result", "handle": handle, "offset": offset}
+        summary["hint"] = (
+            f"Call read_result(handle='{handle}', offset={offset}) for the remaining items; "
+            "the full result is kept server-side and is not fetched again"
+        )
+        return summary
+
+
+def _items_within(items: list[Any], room: int) -> int:
+    """Return how many leading items serialize as a JSON array within ``room`` bytes."""
+    kept, used = 0, 2
+    for item in items:
+        used += _json_size(item) + 1
+        if used > room:
+            break
+        kept += 1
+    return kept
+
+
+def _item_payload(result: Any) -> tuple[dict[str, Any] | None, str | None]:
+    """Return the successful result payload and the key of its item list, if it has one."""
+    if not (isinstance(result, list) and len(result) == 1 and isinstance(result[0], dict)):
+        return None, None
+    if result[0].get("success") is not True or not isinstance(result[0].get("result"), dict):
+        return None, None
+    payload = result[0]["result"]
+    for key in ITEM_KEYS:
+        if isinstance(payload.get(key), list) and payload[key]:
+            return payload, key
+    return None, None
@@ -0,0 +1,144 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Single-flight coalescing of identical in-flight requests for audit-logs MCP server.
+
+When an agent fans out, several tool calls often issue the same GET at the same
+moment. The first caller (the leader) performs the request; callers that arrive
+while it is still in flight await the same task and receive the same decoded
+result, so N identical concurrent calls cost one upstream round trip.
+
+Nothing is cached once the request completes: a call that starts after the
+leader finished performs a fresh request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# Headers that do not influence the response body and must not split coalescing keys
+_IGNORED_KEY_HEADERS = frozenset({"user-agent", "x-hpe-thirdparty", "hpe-ai-origin"})
+
+
+def canonical_params(params: Mapping[str, Any] | None) -> tuple[tuple[str, str], ...]:
+    """
+    Canonicalize query parameters so equivalent requests produce the same key.
+
+    Parameters are sorted by name, ``None`` values are dropped (httpx omits them),
+    and sequences are rendered in order as repeated values.
+
+    Args:
+        params: Query parameters as passed to the HTTP client
+
+    Returns:
+        Sorted tuple of (name, value) string pairs
+    """
+    if not params:
+        return ()
+    items: list[tuple[str, str]] = []
+    for name, value in params.items():
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple)):
+            items.extend((str(name), str(v)) for v in value)
+        elif isinstance(value, bool):
+            items.append((str(name), "true" if value else "false"))
+        else:
+            items.append((str(name), str(value)))
+    return tuple(sorted(items))
+
+
+def request_key(
+    method: str,
+    url: str,
+    params: Mapping[str, Any] | None,
+    headers: Mapping[str, str],
+    identity: str | None = None,
+) -> tuple[str, str, tuple[tuple[str, str], ...], str]:
+    """
+    Build the coalescing (or caching) key for a request.
+
+    The auth identity is a digest of the Authorization header (plus any other
+    response-affecting headers), so the bearer token itself is never stored in keys.
+    Callers that need keys to survive token refreshes pass a stable ``identity``
+    (e.g. workspace and client ID) which replaces the Authorization header.
+
+    Args:
+        method: HTTP method
+        url: Fully-qualified request URL
+        params: Query parameters
+        headers: Final request headers
+        identity: Optional stable caller identity used instead of the Authorization header
+
+    Returns:
+        Hashable key identifying requests that would return the same response
+    """
+    digest = hashlib.sha256()
+    if identity is not None:
+        digest.update(f"identity:{identity}\n".encode())
+    for name in sorted(headers, key=str.lower):
+        lowered = name.lower()
+        if lowered in _IGNORED_KEY_HEADERS or (identity is not None and lowered == "authorization"):
+            continue
+        digest.update(f"{lowered}:{headers[name]}\n".encode())
+    return (method.upper(), url, canonical_params(params), digest.hexdigest())
+
+
+@dataclass
+class SingleFlightStats:
+    """Counters for request coalescing."""
+
+    leaders: int = 0
+    hits: int = 0
+    in_flight: int = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls that share a key into one execution."""
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, asyncio.Task[Any]] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``fn`` once for all concurrent callers sharing ``key``.
+
+        The shared work runs in its own task, so cancelling one waiting caller
+        (including the leader) does not cancel the request for the others.
+        Exceptions are propagated to every waiting caller.
+
+        Args:
+            key: Coalescing key (see ``request_key``)
+            fn: Zero-argument coroutine factory performing the request
+
+        Returns:
+            The result of ``fn``; concurrent callers receive the same object
+        """
+        task = self._calls.get(key)
+        if task is not None:
+            self.stats.hits += 1
+        else:
+            self.stats.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self.stats.in_flight = len(self._calls)
+            task.add_done_callback(functools.partial(self._forget, key))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        self.stats.in_flight = len(self._calls)
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return coalescing counters."""
+        return asdict(self.stats)
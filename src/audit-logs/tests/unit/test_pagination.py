@@ -0,0 +1,142 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for concurrent auto-pagination in audit-logs MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from greenlake_audit_logs_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages, merge_items, resolve_max_items
+
+
+class FakeCollection:
+    """Offset/limit endpoint over ``total`` items that records requested offsets."""
+
+    def __init__(self, total: int, page_cap: int | None = None, offset_unit: str = "items", report_total=True):
+        self.items = [{"id": f"dev-{i}"} for i in range(total)]
+        self.page_cap = page_cap
+        self.offset_unit = offset_unit
+        self.report_total = report_total
+        self.offsets: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        params = params or {}
+        self.offsets.append(params["offset"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        limit = min(params["limit"], self.page_cap or params["limit"])
+        start = params["offset"] * limit if self.offset_unit == "pages" else params["offset"]
+        page = self.items[start : start + limit]
+        response: dict[str, Any] = {"items": page, "count": len(page), "offset": params["offset"]}
+        if self.report_total:
+            response["total"] = len(self.items)
+        return response
+
+
+class TestFetchAllPages:
+    """Test cases for fetching and merging every page."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_concurrently_in_order(self):
+        api = FakeCollection(total=95)
+        result = await fetch_all_pages(api, "/audit-log/v1/logs", {"filter": "x"}, page_size=10, max_concurrency=4)
+
+        assert [item["id"] for item in result["items"]] == [f"dev-{i}" for i in range(95)]
+        assert result["count"] == 95
+        assert result["total"] == 95
+        assert sorted(api.offsets) == list(range(0, 100, 10))
+        assert api.max_in_flight == 4
+        assert result["pagination"]["pages_fetched"] == 10
+        assert result["pagination"]["truncated"] is False
+        assert result["pagination"]["elapsed_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_max_items_limits_pages_fetched(self):
+        api = FakeCollection(total=1000)
+        result = await fetch_all_pages(api, "/audit-log/v1/logs", {}, page_size=10, max_items=25)
+
+        assert result["count"] == 25
+        assert len(api.offsets) == 3
+        assert result["pagination"]["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_starts_at_requested_offset(self):
+        api = FakeCollection(total=50)
+        result = await fetch_all_pages(api, "/audit-log/v1/logs", {"offset": 30}, page_size=10)
+
+        assert [item["id"] for item in result["items"]] == [f"dev-{i}" for i in range(30, 50)]
+        assert result["offset"] == 30
+
+    @pytest.mark.asyncio
+    async def test_plans_with_page_size_returned_when_limit_is_clamped(self):
+        api = FakeCollection(total=30, page_cap=5)
+        result = await fetch_all_pages(api, "/audit-log/v1/logs", {}, page_size=20)
+
+        assert result["count"] == 30
+        assert sorted(api.offsets) == [0, 5, 10, 15, 20, 25]
+
+    @pytest.mark.asyncio
+    async def test_page_offsets(self):
+        api = FakeCollection(total=25, offset_unit="pages")
+        result = await fetch_all_pages(api, "/identity/v1/users", {}, page_size=10, offset_unit="pages")
+
+        assert result["count"] == 25
+        assert sorted(api.offsets) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_pages_serially_without_total(self):
+        api = FakeCollection(total=25, report_total=False)
+        result = await fetch_all_pages(api, "/audit-log/v1/logs", {}, page_size=10)
+
+        assert result["count"] == 25
+        assert api.offsets == [0, 10, 20]
+        assert result["pagination"]["total"] is None
+
+    @pytest.mark.asyncio
+    async def test_page_failure_fails_the_call(self):
+        api = FakeCollection(total=30)
+        original = api.get
+
+        async def flaky(endpoint, params=None):
+            if params["offset"] == 20:
+                raise RuntimeError("upstream failed")
+            return await original(endpoint, params)
+
+        api.get = flaky  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError):
+            await fetch_all_pages(api, "/audit-log/v1/logs", {}, page_size=10)
+
+
+class TestMergeItems:
+    """Test cases for merging pages."""
+
+    def test_drops_duplicate_ids_keeping_first(self):
+        items, duplicates = merge_items([[{"id": 1}, {"id": 2}], [{"id": 2, "v": "moved"}, {"id": 3}]], 10)
+        assert items == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert duplicates == 1
+
+    def test_items_without_id_are_kept(self):
+        items, _ = merge_items([[{"name": "a"}], [{"name": "a"}]], 10)
+        assert len(items) == 2
+
+
+class TestResolveMaxItems:
+    """Test cases for max_items validation."""
+
+    def test_defaults_and_clamps_to_hard_cap(self):
+        assert resolve_max_items(None) == MAX_ITEMS_CAP
+        assert resolve_max_items(MAX_ITEMS_CAP * 10) == MAX_ITEMS_CAP
+        assert resolve_max_items("50") == 50
+
+    @pytest.mark.parametrize("value", ["many", 0, -5])
+    def test_rejects_invalid_values(self, value):
+        with pytest.raises(ValueError):
+            resolve_max_items(value)
@@ -2,5 +2,6 @@
 
 from .oauth2_provider import OAuth2Provider, OAuth2TokenResponse
 from .token_manager import TokenInfo, TokenManager
+from .token_store import SharedTokenStore
 
-__all__ = ["OAuth2Provider", "OAuth2TokenResponse", "TokenInfo", "TokenManager"]
+__all__ = ["OAuth2Provider", "OAuth2TokenResponse", "SharedTokenStore", "TokenInfo", "TokenManager"]
@@ -12,9 +12,10 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Sequence
 
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ContentBlock
 
 
 @dataclass
@@ -27,6 +28,10 @@ class AppContext:
     """
 
     http_client: Any  # DevicesHttpClient
+    response_cache: Any = None  # ResponseCache shared with http_client
+    result_store: Any = None  # ResultStore for list results returned by handle
+    response_shaper: Any = None  # ResponseShaper applied to every tool result
+    device_inventory: Any = None  # DeviceInventory answering lookupdevices lookups
 
 
 @asynccontextmanager
@@ -40,20 +45,68 @@ async def _lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     # Lazy imports keep this module free of circular dependencies
     from greenlake_devices_mcp.utils.http_client import get_http_client  # noqa: PLC0415
     from greenlake_devices_mcp.config.logging import get_logger  # noqa: PLC0415
+    from greenlake_devices_mcp.utils.response_budget import ResponseShaper, budget_bytes  # noqa: PLC0415
+    from greenlake_devices_mcp.utils.device_inventory import DeviceInventory  # noqa: PLC0415
+    from greenlake_devices_mcp.utils.result_store import ResultStore  # noqa: PLC0415
 
     log = get_logger(__name__)
     log.info("Initialising devices HTTP client...")
 
     http_client = get_http_client()
+    if http_client.settings.token_background_refresh:
+        # Fetch the token now and renew it ahead of expiry so tool calls never wait for it
+        http_client.token_manager.start_background_refresh(
+            refresh_fraction=http_client.settings.token_refresh_fraction,
+            jitter=http_client.settings.token_refresh_jitter,
+        )
+    result_store = ResultStore(
+        ttl=http_client.settings.result_store_ttl,
+        max_entries=http_client.settings.result_store_max_entries,
+        max_bytes=http_client.settings.result_store_max_bytes,
+    )
+    response_shaper = ResponseShaper(
+        max_bytes=budget_bytes(http_client.settings.response_max_bytes, http_client.settings.response_max_tokens),
+        result_store=result_store,
+    )
+    device_inventory = DeviceInventory(
+        max_age=http_client.settings.device_inventory_max_age,
+        max_devices=http_client.settings.device_inventory_max_devices,
+        reconcile_interval=http_client.settings.device_inventory_reconcile_interval,
+    )
+    device_inventory.start_background_sync(http_client, http_client.settings.device_inventory_sync_interval)
     try:
         log.info("devices MCP server ready")
-        yield AppContext(http_client=http_client)
+        yield AppContext(
+            http_client=http_client,
+            response_cache=http_client.response_cache,
+            result_store=result_store,
+            response_shaper=response_shaper,
+            device_inventory=device_inventory,
+        )
     finally:
+        await device_inventory.stop_background_sync()
         log.info("Shutting down devices HTTP client...")
         await http_client.close()
         log.info("HTTP client closed")
 
 
+class GreenLakeFastMCP(FastMCP):
+    """FastMCP that passes every tool result through the response budget before it is serialized."""
+
+    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Sequence[ContentBlock] | dict[str, Any]:
+        """Call a tool by name with arguments, trimming its result to the lifespan ``response_shaper`` budget."""
+        tool = self._tool_manager.get_tool(name)
+        if tool is None:
+            return await super().call_tool(name, arguments)
+
+        context = self.get_context()
+        result = await self._tool_manager.call_tool(name, arguments, context=context)
+        response_shaper = getattr(context.request_context.lifespan_context, "response_shaper", None)
+        if response_shaper is not None:
+            result = response_shaper.shape(name, result)
+        return tool.fn_metadata.convert_result(result)  # type: ignore[no-any-return]
+
+
 # ---------------------------------------------------------------------------
 # Module-level FastMCP instance
 # ---------------------------------------------------------------------------
@@ -66,7 +119,7 @@ async def _lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 #       http_client = ctx.request_context.lifespan_context.http_client
 #       ...
 # ---------------------------------------------------------------------------
-mcp: FastMCP = FastMCP(
+mcp: FastMCP = GreenLakeFastMCP(
     "devices-mcp",
     instructions=(
         ""
@@ -0,0 +1,208 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+aggregate_devices tool for devices MCP server.
+
+Answers rollups such as "how many devices per deviceType and region" without
+returning the devices: every matching device is folded into per-group counts
+and timestamp min/max (see ``utils.aggregation``) in a single pass, and only
+the resulting table is returned.
+
+The pass runs over the local device inventory snapshot (see
+``utils.device_inventory``) when it is enabled and keeps every field involved
+(grouped, timestamp and filter fields), filtering it with ``utils.odata_eval``.
+Otherwise it streams paged GET
+/devices/v1/devices requests, with the filters applied by the API, and folds
+each page as it arrives, so memory is bounded by a few pages and the groups.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any, Literal
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.tools.implementations.getdevicesv1 import FILTER_FIELDS
+from greenlake_devices_mcp.utils.aggregation import MAX_GROUP_BY_FIELDS, GroupAggregator
+from greenlake_devices_mcp.utils.batch_lookup import parse_ids
+from greenlake_devices_mcp.utils.device_inventory import COLLECTION_ENDPOINT, PAGE_SIZE, keeps_path, unkept_paths
+from greenlake_devices_mcp.utils.odata_filter import FieldRef, compile_filter, normalize_filter, parse_field
+from greenlake_devices_mcp.utils.pagination import MAX_ITEMS_CAP, PaginationSummary, iter_pages
+
+logger = get_logger(__name__)
+
+
+def _fields(values: list[str] | str | None, name: str) -> list[FieldRef]:
+    """Parse a list or comma separated string of device properties (quoted names are tag keys)."""
+    try:
+        return [parse_field(value, fields=FILTER_FIELDS) for value in parse_ids(values, name)]
+    except ValueError as exc:
+        raise ValueError(f"Invalid '{name}': {exc}") from exc
+
+
+@mcp.tool(
+    name="aggregate_devices",
+    description=f"Count devices per group instead of listing them: group by up to {MAX_GROUP_BY_FIELDS} device properties (for example deviceType, region, assignedState, model, location/name, subscription/id, or a quoted tag key such as 'city'), optionally restricted by the same OData filter and filter-tags as getdevicesv1, and optionally with the earliest and latest value of timestamp properties (createdAt, updatedAt) per group. Computed server-side in one pass over the local inventory snapshot (which excludes archived devices) or, when it is disabled or lacks a property, over paged getdevicesv1 results. Returns a small table: columns, one row per group with its count (largest first), the number of groups and devices, and how the devices were read.",
+)
+async def aggregate_devices(
+    ctx: Context,
+    group_by: Annotated[
+        list[str] | str,
+        Field(
+            description='Device properties to group by, as a list or a comma separated string, for example "deviceType,region". A device with several values at a path (subscription/id) is counted in each of their groups; devices without a value form a null group.'
+        ),
+    ],
+    filter: Annotated[
+        str | None,
+        Field(
+            description="Filter on device properties, as for getdevicesv1, for example \"assignedState eq 'ASSIGNED_TO_SERVICE'\"."
+        ),
+    ] = None,
+    filter_tags: Annotated[
+        str | None,
+        Field(description="Filter on tag keys and values, as for getdevicesv1, for example \"'city' eq 'London'\"."),
+    ] = None,
+    timestamps: Annotated[
+        list[str] | str | None,
+        Field(
+            description='Timestamp properties whose earliest and latest value are reported per group, for example "createdAt,updatedAt".'
+        ),
+    ] = None,
+    source: Annotated[
+        Literal["auto", "inventory", "api"],
+        Field(
+            description="Where devices are read from: the inventory snapshot, paged API requests, or auto (the snapshot when it is enabled and keeps every property involved). The default value is auto."
+        ),
+    ] = "auto",
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of rows (groups) returned. The default value is 100.", ge=1),
+    ] = 100,
+    refresh: Annotated[
+        bool,
+        Field(description="Rebuild the inventory snapshot before aggregating, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """Count devices per group of property values.
+
+    Args:
+        group_by: Device properties to group by
+        filter: Filter on device properties
+        filter_tags: Filter on tag keys and values
+        timestamps: Timestamp properties to report the earliest and latest value of
+        source: Read devices from the inventory snapshot, the API, or choose automatically
+        limit: Maximum number of rows returned
+        refresh: Rebuild the snapshot first
+    Returns:
+        Aggregate table, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    inventory = getattr(lifespan_context, "device_inventory", None)
+
+    try:
+        aggregator = GroupAggregator(_fields(group_by, "group_by"), _fields(timestamps, "timestamps"))
+        if filter:
+            filter = normalize_filter(filter, fields=FILTER_FIELDS)
+        if filter_tags:
+            filter_tags = normalize_filter(filter_tags)
+
+        inventory_enabled = inventory is not None and inventory.enabled
+        if source == "inventory" and not inventory_enabled:
+            raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use source 'api'")
+        dropped = {
+            f.path for f in (*aggregator.group_by, *aggregator.timestamps) if not f.quoted and not keeps_path(f.path)
+        }
+        if filter:
+            dropped.update(unkept_paths(compile_filter(filter, FILTER_FIELDS).ast))
+        covered = not dropped
+        if source == "inventory" and not covered:
+            raise ValueError(
+                "The inventory snapshot drops type and resourceUri and keeps only the id and name of nested objects; "
+                "use source 'api' for " + ", ".join(sorted(dropped))
+            )
+        use_inventory = source == "inventory" or (source == "auto" and inventory_enabled and covered)
+
+        started = time.perf_counter()
+        scan: dict[str, Any]
+        if use_inventory:
+            if inventory is None:
+                raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use source 'api'")
+            refreshed = await inventory.ensure_fresh(http_client, force=refresh)
+            started = time.perf_counter()
+            if filter or filter_tags:
+                selection = inventory.query(filter, filter_tags, fields=FILTER_FIELDS)
+                for device_id in selection.ids:
+                    aggregator.add(inventory.get(device_id))
+                scanned, indexed = selection.scanned, selection.indexed
+            else:
+                for record in inventory.records():
+                    aggregator.add(record)
+                scanned, indexed = aggregator.records, False
+            snapshot = inventory.snapshot()
+            scan = {
+                "source": "inventory",
+                "indexed": indexed,
+                "scanned": scanned,
+                "refreshed": refreshed,
+                "complete": snapshot["complete"],
+                "age_seconds": snapshot["age_seconds"],
+            }
+        else:
+            params = {k: v for k, v in (("filter", filter), ("filter-tags", filter_tags)) if v}
+            pagination = PaginationSummary()
+            seen: set[str] = set()
+            duplicates = 0
+            max_items = inventory.max_devices if inventory is not None else MAX_ITEMS_CAP
+            async for page in iter_pages(
+                http_client, COLLECTION_ENDPOINT, params, PAGE_SIZE, max_items=max_items, summary=pagination
+            ):
+                for device in page:
+                    device_id = device.get("id") if isinstance(device, dict) else None
+                    if device_id is not None:
+                        # Offset pages can overlap if devices change while they are read
+                        if device_id in seen:
+                            duplicates += 1
+                            continue
+                        seen.add(device_id)
+                    if isinstance(device, dict):
+                        aggregator.add(device)
+            scan = {
+                "source": "api",
+                "requests": pagination.pages_fetched,
+                "total": pagination.total,
+                "duplicates_dropped": duplicates,
+                "complete": not pagination.truncated,
+            }
+        scan["aggregate_milliseconds"] = round((time.perf_counter() - started) * 1e3, 1)
+
+        rows = aggregator.rows(limit)
+        logger.info(
+            f"aggregate_devices: {aggregator.records} devices in {len(aggregator)} groups "
+            f"from the {scan['source']} in {scan['aggregate_milliseconds']}ms"
+        )
+        result: dict[str, Any] = {
+            "format": "table",
+            "columns": aggregator.columns(),
+            "rows": rows,
+            "groups": len(aggregator),
+            "devices": aggregator.records,
+            "scan": scan,
+        }
+        if len(rows) < len(aggregator):
+            result["truncated"] = True
+        if aggregator.overflow:
+            # Devices in groups beyond MAX_GROUPS, counted but not tabulated
+            result["overflow_devices"] = aggregator.overflow
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in aggregate_devices: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in aggregate_devices: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
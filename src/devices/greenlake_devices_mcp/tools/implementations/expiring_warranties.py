@@ -0,0 +1,154 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+expiring_warranties tool for devices MCP server.
+
+Answers "which devices lose warranty or support coverage in the next N days"
+from the local device inventory snapshot without a request: the inventory
+keeps the support-level end dates of every device in a time-ordered index
+(see ``utils.warranty_index``), so the window is a range scan by bisection
+rather than a pass over the fleet.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.utils.warranty_index import format_instant
+
+logger = get_logger(__name__)
+
+# Longest window accepted, in days
+MAX_WINDOW_DAYS = 3650
+
+_SECONDS_PER_DAY = 86400
+
+
+def _as_of(value: str | None) -> datetime:
+    """Parse the reference instant (ISO 8601; naive values are UTC), or return now."""
+    if not value:
+        return datetime.now(timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValueError(f"'as_of' must be an ISO 8601 timestamp, got '{value}'") from exc
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+@mcp.tool(
+    name="expiring_warranties",
+    description="List the devices whose warranty or support levels end within a window of days (for example the next 90 days), earliest end first, answered from a time-ordered index over the support-level end dates in the local inventory snapshot (which excludes archived devices) instead of calling the API. Optionally restricted to one service level or to the current support level of each device. Returns one row per device and support level (id, serialNumber, deviceType, model, serviceLevel, endDate, daysLeft, current), the total number of matches and devices, the scan time, and the index size and build latency.",
+)
+async def expiring_warranties(
+    ctx: Context,
+    window: Annotated[
+        int,
+        Field(
+            description="Number of days after as_of in which a support level must end. The default value is 90.",
+            ge=0,
+            le=MAX_WINDOW_DAYS,
+        ),
+    ] = 90,
+    service_level: Annotated[
+        str | None,
+        Field(description="Only support levels with this serviceLevel (case-insensitive)."),
+    ] = None,
+    current_only: Annotated[
+        bool,
+        Field(description="Only the current support level of each device."),
+    ] = False,
+    as_of: Annotated[
+        str | None,
+        Field(
+            description="ISO 8601 instant the window starts at, for example '2026-12-31T00:00:00Z'. The default value is now."
+        ),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of rows returned. The default value is 100.", ge=1),
+    ] = 100,
+    refresh: Annotated[
+        bool,
+        Field(description="Rebuild the inventory snapshot before scanning, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """List support levels ending within a window, from the inventory's end date index.
+
+    Args:
+        window: Days after as_of in which a support level must end
+        service_level: Only support levels with this serviceLevel
+        current_only: Only the current support level of each device
+        as_of: Instant the window starts at
+        limit: Maximum number of rows returned
+        refresh: Rebuild the snapshot first
+    Returns:
+        Expiring support levels, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    inventory = getattr(lifespan_context, "device_inventory", None)
+
+    try:
+        if inventory is None or not inventory.enabled:
+            raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use getdevicesv1")
+        start = _as_of(as_of).timestamp()
+
+        refreshed = await inventory.ensure_fresh(http_client, force=refresh)
+        started = time.perf_counter()
+        matches = inventory.expiring(start, start + window * _SECONDS_PER_DAY)
+        scan_microseconds = round((time.perf_counter() - started) * 1e6, 1)
+        scanned = len(matches)
+        if service_level:
+            wanted = service_level.strip().casefold()
+            matches = [(i, e) for i, e in matches if str(e.service_level or "").casefold() == wanted]
+        if current_only:
+            matches = [(i, e) for i, e in matches if e.current]
+
+        items = []
+        for device_id, support_end in matches[:limit]:
+            record = inventory.get(device_id) or {}
+            items.append(
+                {
+                    "id": device_id,
+                    "serialNumber": record.get("serialNumber"),
+                    "deviceType": record.get("deviceType"),
+                    "model": record.get("model"),
+                    "serviceLevel": support_end.service_level,
+                    "endDate": support_end.end_date,
+                    "daysLeft": round((support_end.end - start) / _SECONDS_PER_DAY, 1),
+                    "current": support_end.current,
+                }
+            )
+
+        logger.info(
+            f"expiring_warranties: {len(matches)} support levels ending within {window} days "
+            f"({scanned} in range) in {scan_microseconds}us"
+        )
+        result = {
+            "items": items,
+            "count": len(items),
+            "total": len(matches),
+            "devices": len({device_id for device_id, _ in matches}),
+            "window": {"start": format_instant(start), "end": format_instant(start + window * _SECONDS_PER_DAY)},
+            "scan": {
+                "in_range": scanned,
+                "refreshed": refreshed,
+                "scan_microseconds": scan_microseconds,
+            },
+            "inventory": inventory.snapshot(),
+        }
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in expiring_warranties: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in expiring_warranties: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -0,0 +1,146 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+getdevicesbyids tool for devices MCP server.
+
+Looks up many devices in one tool call instead of one ``getdevicebyidv1`` call
+per device. Device IDs are packed into ``id in '...'`` filters on
+GET /devices/v1/devices (as many per request as the URL length allows); when that
+would not save requests, the IDs are fetched with GET /devices/v1/devices/{id}
+at bounded concurrency. IDs whose detail response is still cached need no
+request. Serial numbers are always looked up with ``serialNumber in '...'``
+filters.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.utils.batch_lookup import (
+    MAX_BATCH_IDS,
+    chunk_in_filters,
+    fetch_by_filter,
+    fetch_by_path,
+    parse_ids,
+    probe_cache,
+)
+
+logger = get_logger(__name__)
+
+COLLECTION_ENDPOINT = "/devices/v1/devices"
+ITEM_ENDPOINT = "/devices/v1/devices/{id}"
+
+
+async def _lookup_ids(
+    http_client: Any, ids: list[str], url_prefix: str
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]], dict[str, Any]]:
+    """Look up device IDs from the response cache, then with the strategy that needs fewer requests."""
+    found = await probe_cache(http_client, ITEM_ENDPOINT, ids)
+    lookup: dict[str, Any] = {"strategy": "cache", "requests": 0, "cache_hits": len(found), "fallback_ids": 0}
+    remaining = [i for i in ids if i not in found]
+    if not remaining:
+        return found, {}, lookup
+
+    chunks = chunk_in_filters("id", remaining, url_prefix)
+    if chunks is None or len(chunks) >= len(remaining):
+        fetched, errors = await fetch_by_path(http_client, ITEM_ENDPOINT, remaining)
+        lookup.update(strategy="fan_out", requests=len(remaining))
+        return found | fetched, errors, lookup
+
+    fetched, errors = await fetch_by_filter(http_client, COLLECTION_ENDPOINT, "id", chunks)
+    # A rejected filter request (400) is retried per ID; missing IDs and other failures are reported as they are
+    rejected = [i for i, error in errors.items() if error.get("status") == 400]
+    if rejected:
+        retried, retry_errors = await fetch_by_path(http_client, ITEM_ENDPOINT, rejected)
+        fetched.update(retried)
+        errors = {i: e for i, e in errors.items() if i not in retried} | retry_errors
+    lookup.update(strategy="filter", requests=len(chunks) + len(rejected), fallback_ids=len(rejected))
+    return found | fetched, errors, lookup
+
+
+@mcp.tool(
+    name="getdevicesbyids",
+    description=f"Get many devices in one call by device ID and/or serial number (up to {MAX_BATCH_IDS} in total), instead of calling getdevicebyidv1 once per device. IDs are looked up with as few filtered list requests as the URL length allows (falling back to concurrent per-ID requests when that is not cheaper) and serial numbers with filtered list requests. Returns the devices keyed by device ID, a serial_numbers map from each found serial number to its device ID, and per-item errors (not_found or request_failed) keyed by the requested ID or serial number.",
+)
+async def getdevicesbyids(
+    ctx: Context,
+    ids: Annotated[
+        list[str] | str | None,
+        Field(description="Device IDs to look up, as a list or a comma separated string."),
+    ] = None,
+    serial_numbers: Annotated[
+        list[str] | str | None,
+        Field(description="Device serial numbers to look up, as a list or a comma separated string."),
+    ] = None,
+) -> list[dict[str, Any]]:
+    """Get many devices by device ID and/or serial number.
+
+    Args:
+        ids: Device IDs to look up
+        serial_numbers: Device serial numbers to look up
+    Returns:
+        Devices keyed by ID with per-item errors, as a list containing one result dict.
+    """
+    http_client = ctx.request_context.lifespan_context.http_client
+
+    try:
+        device_ids = parse_ids(ids, "ids")
+        serials = parse_ids(serial_numbers, "serial_numbers")
+        if not device_ids and not serials:
+            raise ValueError("Provide at least one value in 'ids' or 'serial_numbers'")
+        if len(device_ids) + len(serials) > MAX_BATCH_IDS:
+            raise ValueError(f"'ids' and 'serial_numbers' accept at most {MAX_BATCH_IDS} values in total")
+
+        started = time.monotonic()
+        url_prefix = f"{http_client.base_url}{COLLECTION_ENDPOINT}"
+        devices: dict[str, Any] = {}
+        errors: dict[str, dict[str, Any]] = {}
+        lookup: dict[str, Any] = {"strategy": "filter", "requests": 0, "cache_hits": 0, "fallback_ids": 0}
+
+        if device_ids:
+            found, errors, lookup = await _lookup_ids(http_client, device_ids, url_prefix)
+            devices = {i: found[i] for i in device_ids if i in found}
+
+        by_serial: dict[str, Any] = {}
+        if serials:
+            chunks = chunk_in_filters("serialNumber", serials, url_prefix)
+            if chunks is None:
+                raise ValueError("A serial number is too long to look up")
+            found, serial_errors = await fetch_by_filter(http_client, COLLECTION_ENDPOINT, "serialNumber", chunks)
+            lookup["requests"] += len(chunks)
+            for serial in serials:
+                if serial in found:
+                    device = found[serial]
+                    device_id = device.get("id", serial)
+                    devices.setdefault(device_id, device)
+                    by_serial[serial] = device_id
+            errors.update(serial_errors)
+
+        lookup["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        logger.info(
+            f"getdevicesbyids: {len(devices)} of {len(device_ids) + len(serials)} found "
+            f"in {lookup['requests']} requests ({lookup['strategy']})"
+        )
+        result: dict[str, Any] = {
+            "items": devices,
+            "errors": errors,
+            "count": len(devices),
+            "requested": len(device_ids) + len(serials),
+            "lookup": lookup,
+        }
+        if serials:
+            result["serial_numbers"] = by_serial
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in getdevicesbyids: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in getdevicesbyids: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
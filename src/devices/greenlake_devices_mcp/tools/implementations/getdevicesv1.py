@@ -6,31 +6,46 @@ Implements: GET /devices/v1/devices
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_devices_mcp.config.logging import get_logger
 from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.utils.odata_filter import normalize_filter
+from greenlake_devices_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages, resolve_max_items
+from greenlake_devices_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# Device properties accepted in ``filter``; ``filter-tags`` compares tag keys, so it is not checked
+FILTER_FIELDS = frozenset(
+    {
+        "application",
+        "archived",
+        "assignedState",
+        "createdAt",
+        "dedicatedPlatformWorkspace",
+        "deviceName",
+        "deviceType",
+        "id",
+        "location",
+        "macAddress",
+        "model",
+        "partNumber",
+        "region",
+        "secondaryName",
+        "serialNumber",
+        "subscription",
+        "tags",
+        "tenantWorkspaceId",
+        "type",
+        "updatedAt",
+        "warranty",
+    }
+)
 
 
 @mcp.tool(
@@ -73,6 +88,30 @@ async def getdevicesv1(  # noqa: E501
             description="Specifies the zero-based resource offset to start the response from. The default value is 0."
         ),
     ] = None,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Fetch every page starting at offset (several pages at a time) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with pages fetched, elapsed time and whether it was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """With this API, you can: <ul><li>Retrieve a list of devices managed in a workspace.</li> <li>Filter  devices based on conditional expressions.</li></ul><p><b>NOTE</b>: You need view  permissions for Devices and Subscription service to invoke this API.</p>  Rate limits are enforced on this API. 160 requests per minute is supported per workspace. The API returns `429` if this threshold is breached.
 
@@ -83,6 +122,10 @@ async def getdevicesv1(  # noqa: E501
         select: A comma separated list of select properties to display in the response. The default is that all properties are returned.\n\nExample: serialNumber,macAddress
         limit: Specifies the number of results to be returned. The default value is 2000.
         offset: Specifies the zero-based resource offset to start the response from. The default value is 0.
+        fetch_all: Fetch every page starting at offset and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -93,10 +136,6 @@ async def getdevicesv1(  # noqa: E501
 
     # Collect query / body parameters; skip values that were not provided
     params: dict[str, Any] = {}
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
-    if filter_tags is not None and filter_tags is not ...:
-        params["filter-tags"] = _normalize_filter_quotes(filter_tags)
     if sort is not None and sort is not ...:
         params["sort"] = sort
     if select is not None and select is not ...:
@@ -115,7 +154,25 @@ async def getdevicesv1(  # noqa: E501
             raise ValueError("'offset' must be an integer") from exc
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if filter_tags is not None and filter_tags is not ...:
+            params["filter-tags"] = normalize_filter(filter_tags)
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_pages(
+                http_client,
+                url,
+                params,
+                page_size=params.get("limit", 2000),
+                max_items=resolve_max_items(max_items),
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
@@ -0,0 +1,166 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+join_device_subscriptions tool for devices MCP server.
+
+Answers "which devices are on subscription X" and "which devices have no
+subscription" from the local device inventory snapshot without a request.
+The inventory keeps an inverted index from subscription ID to device IDs and
+the set of devices without a subscription (see ``utils.device_inventory``),
+so the join is a hash probe per subscription; a device filter is applied by
+intersecting each device set with the filter matches, never by nested loops
+over devices and subscriptions.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.tools.implementations.getdevicesv1 import FILTER_FIELDS
+from greenlake_devices_mcp.utils.batch_lookup import MAX_BATCH_IDS, parse_ids
+from greenlake_devices_mcp.utils.device_inventory import require_kept_paths
+from greenlake_devices_mcp.utils.odata_filter import compile_filter
+
+logger = get_logger(__name__)
+
+
+def _device_set(device_ids: set[str], ids_per_set: int) -> dict[str, Any]:
+    """Return the size of a device set and its first IDs, sorted."""
+    listed = sorted(device_ids)[:ids_per_set]
+    device_set: dict[str, Any] = {"devices": len(device_ids), "device_ids": listed}
+    if len(device_ids) > len(listed):
+        device_set["ids_truncated"] = True
+    return device_set
+
+
+@mcp.tool(
+    name="join_device_subscriptions",
+    description=f"Join the devices of the workspace to their subscriptions: the set of devices on each subscription and the devices without a subscription, answered from an inverted subscription index kept with the local inventory snapshot (which excludes archived devices) instead of paging getdevicesv1. Optionally restricted to up to {MAX_BATCH_IDS} subscription IDs and to the devices matching the same OData filter and filter-tags as getdevicesv1. Returns one row per subscription with its device count and device IDs (largest first), the unsubscribed devices, join cardinalities (devices, subscriptions, subscribed and unsubscribed devices, device-subscription pairs, devices on several subscriptions) and the join time.",
+)
+async def join_device_subscriptions(
+    ctx: Context,
+    subscription_ids: Annotated[
+        list[str] | str | None,
+        Field(
+            description="Subscription IDs to join, as a list or a comma separated string. The default is every subscription carried by a device."
+        ),
+    ] = None,
+    filter: Annotated[
+        str | None,
+        Field(
+            description="Only devices matching this filter on device properties, as for getdevicesv1, for example \"deviceType eq 'COMPUTE'\"."
+        ),
+    ] = None,
+    filter_tags: Annotated[
+        str | None,
+        Field(
+            description="Only devices matching this filter on tag keys and values, for example \"'city' eq 'London'\"."
+        ),
+    ] = None,
+    include_unsubscribed: Annotated[
+        bool,
+        Field(description="Also return the devices without a subscription. The default value is true."),
+    ] = True,
+    ids_per_set: Annotated[
+        int,
+        Field(
+            description="Maximum number of device IDs listed per subscription and for unsubscribed devices. The default value is 100.",
+            ge=0,
+            le=MAX_BATCH_IDS,
+        ),
+    ] = 100,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of subscription rows returned. The default value is 100.", ge=1),
+    ] = 100,
+    refresh: Annotated[
+        bool,
+        Field(description="Rebuild the inventory snapshot before joining, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """Join devices to subscriptions in the local inventory snapshot.
+
+    Args:
+        subscription_ids: Subscription IDs to join
+        filter: Filter on device properties
+        filter_tags: Filter on tag keys and values
+        include_unsubscribed: Also return the devices without a subscription
+        ids_per_set: Maximum number of device IDs listed per set
+        limit: Maximum number of subscription rows returned
+        refresh: Rebuild the snapshot first
+    Returns:
+        Device sets per subscription, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    inventory = getattr(lifespan_context, "device_inventory", None)
+
+    try:
+        if inventory is None or not inventory.enabled:
+            raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use getdevicesv1")
+        wanted = parse_ids(subscription_ids, "subscription_ids") if subscription_ids is not None else None
+        # Checked before the snapshot is synced; the join must not run over a wrongly filtered device set
+        terms = [compile_filter(filter, FILTER_FIELDS).ast] if filter else []
+        if filter_tags:
+            terms.append(compile_filter(filter_tags).ast)
+        require_kept_paths(*terms)
+
+        refreshed = await inventory.ensure_fresh(http_client, force=refresh)
+        started = time.perf_counter()
+        device_ids = None
+        if filter or filter_tags:
+            device_ids = set(inventory.query(filter, filter_tags, fields=FILTER_FIELDS).ids)
+        filtered = time.perf_counter()
+        join = inventory.join_subscriptions(wanted, device_ids)
+        on_subscriptions = Counter(device_id for devices in join.subscriptions.values() for device_id in devices)
+        finished = time.perf_counter()
+
+        rows = sorted(join.subscriptions.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+        result: dict[str, Any] = {
+            "subscriptions": [
+                {"subscription_id": subscription_id, **_device_set(devices, ids_per_set)}
+                for subscription_id, devices in rows[:limit]
+            ],
+            "count": min(len(rows), limit),
+            "cardinality": {
+                "devices": join.devices,
+                "subscriptions": len(rows),
+                "empty_subscriptions": sum(1 for _, devices in rows if not devices),
+                "subscribed_devices": len(on_subscriptions),
+                "unsubscribed_devices": len(join.unsubscribed),
+                "pairs": sum(on_subscriptions.values()),
+                "multi_subscription_devices": sum(1 for n in on_subscriptions.values() if n > 1),
+            },
+            "join": {
+                "probes": join.probes,
+                "filtered": device_ids is not None,
+                "refreshed": refreshed,
+                "filter_microseconds": round((filtered - started) * 1e6, 1),
+                "join_microseconds": round((finished - filtered) * 1e6, 1),
+            },
+            "inventory": inventory.snapshot(),
+        }
+        if len(rows) > limit:
+            result["truncated"] = True
+        if include_unsubscribed:
+            result["unsubscribed"] = _device_set(join.unsubscribed, ids_per_set)
+
+        logger.info(
+            f"join_device_subscriptions: {len(rows)} subscriptions, {result['cardinality']['pairs']} pairs and "
+            f"{len(join.unsubscribed)} unsubscribed devices in {result['join']['join_microseconds']}us"
+        )
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in join_device_subscriptions: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in join_device_subscriptions: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -0,0 +1,120 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+lookupdevices tool for devices MCP server.
+
+Answers serial number, MAC address, part number, device ID and tag lookups from
+the local device inventory snapshot (see ``utils.device_inventory``) instead of
+one filtered GET /devices/v1/devices request per value. The snapshot is built
+with paged GET /devices/v1/devices requests on first use, brought up to date
+with an incremental ``updatedAt`` sync once it is older than
+DEVICE_INVENTORY_MAX_AGE (or by the background sync), and rebuilt when
+``refresh`` is set.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any, Literal
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.utils.batch_lookup import MAX_BATCH_IDS, parse_ids
+
+logger = get_logger(__name__)
+
+
+@mcp.tool(
+    name="lookupdevices",
+    description=f"Look up devices by serial number, MAC address, part number, device ID, tag key or tag (key=value) from a local snapshot of the workspace inventory, without a filtered getdevicesv1 request per value. Up to {MAX_BATCH_IDS} values per call, matched exactly or by prefix, case-insensitively (MAC addresses also ignore ':', '-' and '.' separators). The snapshot is built on first use, synced incrementally (devices updated since the last sync) when older than its staleness bound, and rebuilt when refresh is set. Returns compact device records keyed by device ID, the matching device IDs per value, and the snapshot size, sync lag, memory footprint, build time and last sync.",
+)
+async def lookupdevices(
+    ctx: Context,
+    field: Annotated[
+        Literal["serialNumber", "macAddress", "partNumber", "id", "tagKey", "tag"],
+        Field(description="Property to match: serialNumber, macAddress, partNumber, id, tagKey or tag."),
+    ],
+    values: Annotated[
+        list[str] | str,
+        Field(
+            description="Values to look up, as a list or a comma separated string. For field 'tag' each value is 'key=value'."
+        ),
+    ],
+    prefix: Annotated[
+        bool,
+        Field(description="Match values that start with each given value instead of equal to it."),
+    ] = False,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of matching devices returned per value. The default value is 100.", ge=1),
+    ] = 100,
+    refresh: Annotated[
+        bool,
+        Field(description="Rebuild the inventory snapshot before looking up, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """Look up devices in the local inventory snapshot.
+
+    Args:
+        field: Property to match
+        values: Values to look up
+        prefix: Match by prefix instead of equality
+        limit: Maximum number of matching devices returned per value
+        refresh: Rebuild the snapshot first
+    Returns:
+        Matching device records keyed by ID, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    inventory = getattr(lifespan_context, "device_inventory", None)
+
+    try:
+        if inventory is None or not inventory.enabled:
+            raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use getdevicesv1")
+        wanted = parse_ids(values, "values")
+        if not wanted:
+            raise ValueError("Provide at least one value in 'values'")
+
+        refreshed = await inventory.ensure_fresh(http_client, force=refresh)
+        started = time.perf_counter()
+        matches: dict[str, list[str]] = {}
+        truncated: dict[str, int] = {}
+        for value in wanted:
+            device_ids = inventory.lookup(field, value, prefix=prefix)
+            if len(device_ids) > limit:
+                truncated[value] = len(device_ids)
+                device_ids = device_ids[:limit]
+            matches[value] = device_ids
+        devices = {i: inventory.get(i) for ids in matches.values() for i in ids}
+        lookup_microseconds = round((time.perf_counter() - started) * 1e6, 1)
+
+        logger.info(
+            f"lookupdevices: {len(devices)} devices for {len(wanted)} {field} values "
+            f"in {lookup_microseconds}us{' after syncing the inventory' if refreshed else ''}"
+        )
+        result: dict[str, Any] = {
+            "items": devices,
+            "matches": matches,
+            "count": len(devices),
+            "lookup": {
+                "field": field,
+                "prefix": prefix,
+                "refreshed": refreshed,
+                "lookup_microseconds": lookup_microseconds,
+            },
+            "inventory": inventory.snapshot(),
+        }
+        if truncated:
+            # Total matches for values with more than ``limit`` devices
+            result["truncated"] = truncated
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in lookupdevices: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in lookupdevices: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -0,0 +1,117 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+querydevices tool for devices MCP server.
+
+Answers ``getdevicesv1`` style OData filters from the local device inventory
+snapshot (see ``utils.device_inventory`` and ``utils.odata_eval``) without a
+request: the filter is compiled into a Python predicate and evaluated over the
+compact device records, with ``eq`` and ``in`` terms on ``id``, serial number,
+MAC address, part number, ``subscription/id`` and tags answered from the
+inventory's hash indexes.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.tools.implementations.getdevicesv1 import FILTER_FIELDS
+from greenlake_devices_mcp.utils.device_inventory import require_kept_paths
+from greenlake_devices_mcp.utils.odata_filter import compile_filter
+
+logger = get_logger(__name__)
+
+
+@mcp.tool(
+    name="querydevices",
+    description="Filter the devices of the workspace with the same OData filter and filter-tags syntax as getdevicesv1 (eq, ne, gt, ge, lt, le, in, and, or, not, contains/startswith/endswith, slash paths such as location/id or subscription/id), evaluated locally over a snapshot of the inventory instead of calling the API. Use it for repeated or exploratory queries; use getdevicesv1 when you need archived devices, type, resourceUri or properties other than the ids and names of nested objects (filters on these properties are rejected). The snapshot is built on first use, synced incrementally when older than its staleness bound, and rebuilt when refresh is set. Returns compact device records (empty fields dropped, nested objects abbreviated to id and name), the total number of matches, whether indexes were used, the evaluation time and the snapshot sync lag.",
+)
+async def querydevices(
+    ctx: Context,
+    filter: Annotated[
+        str | None,
+        Field(
+            description="Filter on device properties, for example \"deviceType eq 'STORAGE' and updatedAt ge '2024-01-18T19:53:51.480Z'\"."
+        ),
+    ] = None,
+    filter_tags: Annotated[
+        str | None,
+        Field(description="Filter on tag keys and values, for example \"'city' eq 'London'\"."),
+    ] = None,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of devices returned. The default value is 100.", ge=1),
+    ] = 100,
+    offset: Annotated[
+        int,
+        Field(description="Zero-based offset of the first matching device returned.", ge=0),
+    ] = 0,
+    refresh: Annotated[
+        bool,
+        Field(description="Rebuild the inventory snapshot before querying, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """Filter devices in the local inventory snapshot.
+
+    Args:
+        filter: Filter on device properties
+        filter_tags: Filter on tag keys and values
+        limit: Maximum number of devices returned
+        offset: Offset of the first matching device returned
+        refresh: Rebuild the snapshot first
+    Returns:
+        Matching device records, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    inventory = getattr(lifespan_context, "device_inventory", None)
+
+    try:
+        if inventory is None or not inventory.enabled:
+            raise ValueError("The device inventory is disabled (DEVICE_INVENTORY_MAX_AGE=0); use getdevicesv1")
+        if not filter and not filter_tags:
+            raise ValueError("Provide 'filter' and/or 'filter_tags'")
+        # Checked before the snapshot is synced, so a bad filter is rejected without paging the inventory
+        terms = [compile_filter(filter, FILTER_FIELDS).ast] if filter else []
+        if filter_tags:
+            terms.append(compile_filter(filter_tags).ast)
+        require_kept_paths(*terms)
+
+        refreshed = await inventory.ensure_fresh(http_client, force=refresh)
+        started = time.perf_counter()
+        selection = inventory.query(filter, filter_tags, fields=FILTER_FIELDS)
+        evaluate_microseconds = round((time.perf_counter() - started) * 1e6, 1)
+        devices = [inventory.get(i) for i in selection.ids[offset : offset + limit]]
+
+        logger.info(
+            f"querydevices: {len(selection.ids)} matches, {selection.scanned} devices scanned "
+            f"({'indexed' if selection.indexed else 'full scan'}) in {evaluate_microseconds}us"
+        )
+        result = {
+            "items": devices,
+            "count": len(devices),
+            "offset": offset,
+            "total": len(selection.ids),
+            "query": {
+                "indexed": selection.indexed,
+                "candidates": selection.candidates,
+                "scanned": selection.scanned,
+                "refreshed": refreshed,
+                "evaluate_microseconds": evaluate_microseconds,
+            },
+            "inventory": inventory.snapshot(),
+        }
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in querydevices: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in querydevices: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -0,0 +1,98 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+read_result tool and results resource for devices MCP server.
+
+Pages through list results that a list tool stored server-side when called with
+``return_handle`` (see ``utils.result_store``). The same slices are available as
+the MCP resource ``greenlake://results/{handle}?offset=&limit=``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Annotated, Any, Literal
+from urllib.parse import parse_qs
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.utils.table_format import format_result
+
+logger = get_logger(__name__)
+
+DEFAULT_READ_LIMIT = 100
+
+
+def _read(ctx: Context, handle: str, offset: Any, limit: Any) -> dict[str, Any]:
+    """Coerce paging arguments and read a slice from the lifespan result store."""
+    try:
+        offset = int(offset)
+        limit = int(limit)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("'offset' and 'limit' must be integers") from exc
+    result_store = ctx.request_context.lifespan_context.result_store
+    return result_store.read(handle, offset=offset, limit=limit)  # type: ignore[no-any-return]
+
+
+@mcp.tool(
+    name="read_result",
+    description="Read a slice of a list result stored server-side by a list tool called with return_handle=true. Returns the items from offset (up to limit) and next_offset for the following slice, or null at the end. Also continues a list result cut to the response budget from the handle and offset in its truncation.continuation.",
+)
+async def read_result(
+    ctx: Context,
+    handle: Annotated[str, Field(description="Result handle returned by the list tool")],
+    offset: Annotated[
+        int | str, Field(description="Zero-based index of the first item to return. The default value is 0.")
+    ] = 0,
+    limit: Annotated[
+        int | str,
+        Field(description=f"Maximum number of items to return. The default value is {DEFAULT_READ_LIMIT}."),
+    ] = DEFAULT_READ_LIMIT,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the slice as columns plus value rows (see the list tools). The default value is json."
+        ),
+    ] = "json",
+) -> list[dict[str, Any]]:
+    """Read a slice of a stored list result.
+
+    Args:
+        handle: Result handle returned by the list tool
+        offset: Zero-based index of the first item to return
+        limit: Maximum number of items to return
+        format: Output format, json or table
+    Returns:
+        The slice as a list containing one result dict.
+    """
+    try:
+        return [{"success": True, "result": format_result(_read(ctx, handle, offset, limit), format)}]
+
+    except KeyError as exc:
+        return [{"success": False, "error": "not_found", "message": str(exc.args[0])}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in read_result: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+
+@mcp.resource(
+    "greenlake://results/{handle}",
+    name="stored_result",
+    description="A slice of a list result stored by a list tool called with return_handle=true. "
+    f"Append ?offset=&limit= to page (default offset 0, limit {DEFAULT_READ_LIMIT}).",
+    mime_type="application/json",
+)
+async def stored_result(handle: str, ctx: Context) -> str:
+    """Return a slice of a stored list result as JSON.
+
+    The template matches everything after ``results/``, so the query string arrives
+    as part of ``handle`` and is split off here.
+    """
+    handle, _, query = handle.partition("?")
+    params = parse_qs(query)
+    offset = params.get("offset", ["0"])[0]
+    limit = params.get("limit", [str(DEFAULT_READ_LIMIT)])[0]
+    return json.dumps(_read(ctx, handle, offset, limit), default=str)
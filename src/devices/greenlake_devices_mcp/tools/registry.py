@@ -46,8 +46,17 @@ def get_tool_classes(mode: str | None = None) -> list:
             # register the function with the FastMCP instance.
             import greenlake_devices_mcp.tools.implementations.getdevicesv1  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_devices_mcp.tools.implementations.getdevicebyidv1  # noqa: F401 (triggers @mcp.tool registration)
-
-            logger.info("Static mode: 2 endpoint tools registered")
+            import greenlake_devices_mcp.tools.implementations.getdevicesbyids  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.lookupdevices  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.querydevices  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.aggregate_devices  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.expiring_warranties  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.join_device_subscriptions  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_devices_mcp.tools.implementations.read_result  # noqa: F401 (triggers @mcp.tool registration)
+
+            logger.info(
+                "Static mode: 2 endpoint tools, getdevicesbyids, lookupdevices, querydevices, aggregate_devices, expiring_warranties, join_device_subscriptions and read_result registered"
+            )
     except ImportError as exc:
         logger.error(f"Failed to import tool module: {exc}")
 
@@ -0,0 +1,148 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Streaming group-by aggregation over device records for devices MCP server.
+
+``GroupAggregator`` folds records one at a time into per-group accumulators: a
+count and, for each requested timestamp property, the earliest and latest value.
+A rollup over a paginated collection or the inventory snapshot therefore needs
+memory proportional to the number of groups, not the number of devices, and
+the result is a small table instead of every device.
+
+Group values are read with the filters' path semantics (see
+``utils.odata_eval.resolver``): ``location/name`` walks nested objects, a quoted
+name such as ``'city'`` is a tag key, and a device with several values at a path
+(``subscription/id``) is counted once in each of their groups. A missing value
+forms a ``null`` group. Timestamps are compared as instants; values that are not
+ISO 8601 timestamps are ignored.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from itertools import product
+from typing import Any
+
+from greenlake_devices_mcp.utils.odata_eval import parse_timestamp, resolver
+from greenlake_devices_mcp.utils.odata_filter import FieldRef
+
+# Maximum number of group_by fields
+MAX_GROUP_BY_FIELDS = 4
+
+# Maximum number of distinct groups tracked; devices in further groups are only counted as overflow
+MAX_GROUPS = 10000
+
+
+class _Group:
+    """Accumulators of one group: device count and the earliest and latest value per timestamp property."""
+
+    __slots__ = ("count", "earliest", "latest")
+
+    def __init__(self, timestamps: int) -> None:
+        self.count = 0
+        self.earliest: list[tuple[datetime, str] | None] = [None] * timestamps
+        self.latest: list[tuple[datetime, str] | None] = [None] * timestamps
+
+
+class GroupAggregator:
+    """Count records per combination of group values, with min/max of timestamp properties."""
+
+    def __init__(self, group_by: Sequence[FieldRef], timestamps: Sequence[FieldRef] = (), tags_field: str = "tags"):
+        """
+        Initialize empty accumulators.
+
+        Args:
+            group_by: Properties whose values form the groups
+            timestamps: Timestamp properties whose earliest and latest value are reported per group
+            tags_field: Record property holding the tags read by quoted fields
+
+        Raises:
+            ValueError: If no or more than ``MAX_GROUP_BY_FIELDS`` group_by fields are given
+        """
+        if not group_by:
+            raise ValueError("Provide at least one field in 'group_by'")
+        if len(group_by) > MAX_GROUP_BY_FIELDS:
+            raise ValueError(f"'group_by' accepts at most {MAX_GROUP_BY_FIELDS} fields, got {len(group_by)}")
+        self.group_by = tuple(group_by)
+        self.timestamps = tuple(timestamps)
+        self.records = 0
+        self.overflow = 0
+        self._group_values = tuple(resolver(field, tags_field) for field in self.group_by)
+        self._timestamp_values = tuple(resolver(field, tags_field) for field in self.timestamps)
+        self._groups: dict[tuple[Any, ...], _Group] = {}
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def add(self, record: Mapping[str, Any]) -> None:
+        """Fold one record into the accumulators of each of its groups."""
+        self.records += 1
+        instants = [self._instants(values(record)) for values in self._timestamp_values]
+        for key in product(*(_distinct(values(record)) for values in self._group_values)):
+            group = self._groups.get(key)
+            if group is None:
+                if len(self._groups) >= MAX_GROUPS:
+                    self.overflow += 1
+                    continue
+                group = self._groups[key] = _Group(len(self.timestamps))
+            group.count += 1
+            for i, (earliest, latest) in enumerate(instants):
+                if earliest is None or latest is None:
+                    continue
+                current = group.earliest[i]
+                if current is None or earliest[0] < current[0]:
+                    group.earliest[i] = earliest
+                current = group.latest[i]
+                if current is None or latest[0] > current[0]:
+                    group.latest[i] = latest
+
+    @staticmethod
+    def _instants(values: list[Any]) -> tuple[tuple[datetime, str] | None, tuple[datetime, str] | None]:
+        """Return the earliest and latest (instant, original text) among a record's timestamp values."""
+        parsed = [(instant, v) for v in values if isinstance(v, str) and (instant := parse_timestamp(v)) is not None]
+        if not parsed:
+            return None, None
+        return min(parsed), max(parsed)
+
+    def columns(self) -> list[str]:
+        """Return the column names: the group_by fields, ``count``, then ``min(x)`` and ``max(x)`` per timestamp."""
+        names = [_column_name(field) for field in self.group_by]
+        names.append("count")
+        for field in self.timestamps:
+            names.extend((f"min({field.path})", f"max({field.path})"))
+        return names
+
+    def rows(self, limit: int | None = None) -> list[list[Any]]:
+        """
+        Return one row per group, largest count first (ties by group values).
+
+        Args:
+            limit: Maximum number of rows, or None for every group
+
+        Returns:
+            Rows of values in ``columns()`` order
+        """
+        rows = []
+        for key, group in self._groups.items():
+            row = list(key)
+            row.append(group.count)
+            for earliest, latest in zip(group.earliest, group.latest, strict=True):
+                row.extend((earliest[1] if earliest else None, latest[1] if latest else None))
+            rows.append(row)
+        width = len(self.group_by)
+        rows.sort(key=lambda row: (-row[width], [_sort_key(v) for v in row[:width]]))
+        return rows if limit is None else rows[:limit]
+
+
+def _distinct(values: list[Any]) -> list[Any]:
+    """Return the hashable group values of a record at one path, each once (unhashable values as strings)."""
+    return list(dict.fromkeys(v if isinstance(v, (str, int, float, bool)) or v is None else str(v) for v in values))
+
+
+def _sort_key(value: Any) -> tuple[int, str]:
+    """Order group values with nulls last and mixed types comparable."""
+    return (1, "") if value is None else (0, str(value))
+
+
+def _column_name(field: FieldRef) -> str:
+    return f"'{field.path}'" if field.quoted else field.path
@@ -0,0 +1,734 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Local device inventory snapshot for devices MCP server.
+
+Serial number, MAC address and part number lookups are each a filtered
+``GET /devices/v1/devices`` request against a 160 requests per minute budget.
+The inventory instead loads every device with paged requests (2000 devices per
+page), keeps a compact record per device (nested objects abbreviated to their
+``id``/``name``, empty fields dropped) and hash indexes on ``id``,
+``serialNumber``, ``macAddress``, ``partNumber``, tag keys and tag key/value
+pairs, so point and prefix lookups are answered in memory. ``warranty`` is
+kept as the ``serviceLevel`` and ``endDate`` of the current and every support
+level, and an ``EndDateIndex`` (see ``utils.warranty_index``) orders those end
+dates for ``expiring`` range scans. An inverted index maps each subscription ID
+in ``subscription`` to the devices carrying it, next to the set of devices
+without a subscription, for ``join_subscriptions``.
+
+Index keys are case-insensitive and MAC addresses are compared without
+separators (``AA:BB:CC:DD:EE:FF`` matches ``aabb.ccdd.eeff``). Each index keeps
+its keys sorted (re-sorted lazily after changes) for prefix lookups by bisection.
+
+The snapshot is synced when it is older than ``max_age``, on request, and
+optionally every few seconds by a background task; concurrent callers share one
+sync. A sync normally fetches only devices changed since the ``updatedAt``
+watermark (the highest ``updatedAt`` seen) and merges them, removing archived
+devices. Deleted devices never show up in such a delta, so once
+``reconcile_interval`` has passed the next sync reloads every device instead.
+Lookups keep using the previous snapshot until a rebuild is complete.
+
+``query`` evaluates ``getdevicesv1`` style OData filters over the snapshot
+(see ``utils.odata_eval``); ``eq`` and ``in`` terms on indexed properties,
+``subscription/id`` and tags narrow the candidates through the hash indexes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from greenlake_devices_mcp.config.logging import get_logger
+from greenlake_devices_mcp.utils.odata_eval import Selection, select
+from greenlake_devices_mcp.utils.odata_filter import FieldRef, Logical, Node, compile_filter, field_refs
+from greenlake_devices_mcp.utils.pagination import fetch_all_pages
+from greenlake_devices_mcp.utils.single_flight import SingleFlight
+from greenlake_devices_mcp.utils.warranty_index import EndDateIndex, SupportEnd, support_ends
+
+logger = get_logger(__name__)
+
+COLLECTION_ENDPOINT = "/devices/v1/devices"
+
+# Page size used to load the inventory (the API default and maximum)
+PAGE_SIZE = 2000
+
+# Device properties with a hash index (``id`` is the primary key)
+INDEXED_FIELDS = ("serialNumber", "macAddress", "partNumber")
+
+# Keys kept when a nested object is abbreviated in a compact record
+_REFERENCE_KEYS = ("id", "name")
+
+# Keys kept for each support level of a compact ``warranty``
+_SUPPORT_LEVEL_KEYS = ("serviceLevel", "endDate")
+
+# Slash paths of a compact ``warranty``
+_WARRANTY_PATHS = frozenset(
+    f"warranty/{level}/{key}" for level in ("currentSupportLevel", "supportLevels") for key in _SUPPORT_LEVEL_KEYS
+)
+
+# Top-level properties dropped from compact records
+_DROPPED_FIELDS = frozenset({"resourceUri", "type"})
+
+# Separator between tag key and value in the tag pair index
+_TAG_SEPARATOR = "\x00"
+
+# Backoff between failed background sync attempts (capped at the sync interval)
+_SYNC_RETRY_INITIAL = 5.0
+
+
+def compact_device(device: dict[str, Any]) -> dict[str, Any]:
+    """
+    Return the compact inventory record for a device.
+
+    Empty values are dropped, ``tags`` are kept as they are, ``warranty`` keeps
+    the ``serviceLevel`` and ``endDate`` of its support levels, and other nested
+    objects (and lists of objects) are abbreviated to their ``id`` and ``name``.
+
+    Args:
+        device: Device as returned by the devices API
+
+    Returns:
+        Compact device record
+    """
+    record: dict[str, Any] = {}
+    for key, value in device.items():
+        if key in _DROPPED_FIELDS or value is None or value == "" or value == [] or value == {}:
+            continue
+        if key == "tags" and isinstance(value, dict):
+            record[key] = dict(value)
+        elif key == "warranty" and isinstance(value, dict):
+            warranty = _warranty(value)
+            if warranty:
+                record[key] = warranty
+        elif isinstance(value, dict):
+            reference = _reference(value)
+            if reference:
+                record[key] = reference
+        elif isinstance(value, list):
+            record[key] = [_reference(v) if isinstance(v, dict) else v for v in value]
+        else:
+            record[key] = value
+    return record
+
+
+def _reference(value: dict[str, Any]) -> dict[str, Any]:
+    return {k: value[k] for k in _REFERENCE_KEYS if value.get(k) not in (None, "")}
+
+
+def _warranty(value: dict[str, Any]) -> dict[str, Any]:
+    warranty: dict[str, Any] = {}
+    current = value.get("currentSupportLevel")
+    if isinstance(current, dict) and (level := _support_level(current)):
+        warranty["currentSupportLevel"] = level
+    levels = [_support_level(v) for v in value.get("supportLevels") or [] if isinstance(v, dict)]
+    if any(levels):
+        warranty["supportLevels"] = [level for level in levels if level]
+    return warranty
+
+
+def _support_level(value: dict[str, Any]) -> dict[str, Any]:
+    return {k: value[k] for k in _SUPPORT_LEVEL_KEYS if value.get(k) not in (None, "")}
+
+
+def keeps_path(path: str) -> bool:
+    """
+    Whether compact records keep the property at a slash ``path``.
+
+    Compact records drop ``_DROPPED_FIELDS`` and abbreviate nested objects to their ``id`` and ``name``.
+    """
+    steps = path.split("/")
+    if steps[0] in _DROPPED_FIELDS:
+        return False
+    return (
+        len(steps) == 1
+        or steps[0] == "tags"
+        or (len(steps) == 2 and steps[1] in _REFERENCE_KEYS)
+        or path in _WARRANTY_PATHS
+    )
+
+
+def unkept_paths(*filters: Node) -> list[str]:
+    """Return the property paths referenced by parsed filters that compact records do not keep, sorted."""
+    return sorted({f.path for node in filters for f in field_refs(node) if not f.quoted and not keeps_path(f.path)})
+
+
+def require_kept_paths(*filters: Node) -> None:
+    """
+    Reject parsed filters that reference properties compact records do not keep.
+
+    Every record would read such a property as null, so a filter on it would
+    silently match nothing (``eq``) or everything (``ne``).
+
+    Raises:
+        ValueError: Naming the paths that are not kept
+    """
+    dropped = unkept_paths(*filters)
+    if dropped:
+        raise ValueError(
+            f"The inventory snapshot does not keep {', '.join(dropped)} (compact records drop type and "
+            "resourceUri, and nested objects keep only their id and name); use getdevicesv1"
+        )
+
+
+def normalize_key(field: str, value: Any) -> str:
+    """Return the index key for a property value: case-folded, and without separators for MAC addresses."""
+    key = str(value).strip().casefold()
+    if field == "macAddress":
+        key = key.replace(":", "").replace("-", "").replace(".", "")
+    return key
+
+
+class HashIndex:
+    """Maps index keys to the set of device IDs carrying them, with prefix search."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._ids: dict[str, set[str]] = {}
+        self._sorted: list[str] | None = []
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, key: str, device_id: str) -> None:
+        """Add ``device_id`` under ``key``."""
+        bucket = self._ids.get(key)
+        if bucket is None:
+            self._ids[key] = bucket = set()
+            self._sorted = None
+        bucket.add(device_id)
+
+    def discard(self, key: str, device_id: str) -> None:
+        """Remove ``device_id`` from ``key``, dropping the key when it has no devices left."""
+        bucket = self._ids.get(key)
+        if bucket is None:
+            return
+        bucket.discard(device_id)
+        if not bucket:
+            del self._ids[key]
+            self._sorted = None
+
+    def get(self, key: str) -> set[str]:
+        """Return the device IDs with exactly ``key``."""
+        return self._ids.get(key, set())
+
+    def keys(self) -> Iterable[str]:
+        """Return every key with at least one device."""
+        return self._ids.keys()
+
+    def prefix(self, prefix: str) -> set[str]:
+        """Return the device IDs whose key starts with ``prefix``."""
+        if self._sorted is None:
+            self._sorted = sorted(self._ids)
+        found: set[str] = set()
+        for key in self._sorted[bisect.bisect_left(self._sorted, prefix) :]:
+            if not key.startswith(prefix):
+                break
+            found |= self._ids[key]
+        return found
+
+
+@dataclass
+class InventoryStats:
+    """Counters for inventory syncs and lookups since the server started."""
+
+    builds: int = 0
+    build_requests: int = 0
+    build_seconds: float = 0.0
+    delta_syncs: int = 0
+    delta_requests: int = 0
+    items_changed: int = 0
+    archived_removed: int = 0
+    deleted_removed: int = 0
+    sync_failures: int = 0
+    last_error: str | None = None
+    memory_bytes: int = 0
+    lookups: int = 0
+    queries: int = 0
+    indexed_queries: int = 0
+    warranty_scans: int = 0
+    subscription_joins: int = 0
+
+
+@dataclass
+class SubscriptionJoin:
+    """Devices per subscription and devices without a subscription, from ``DeviceInventory.join_subscriptions``."""
+
+    subscriptions: dict[str, set[str]]
+    unsubscribed: set[str]
+    devices: int
+    probes: int
+
+
+class DeviceInventory:
+    """Compact records of every device in the workspace with secondary hash indexes."""
+
+    def __init__(self, max_age: float, max_devices: int, reconcile_interval: float = 3600.0) -> None:
+        """
+        Initialize an empty inventory.
+
+        Args:
+            max_age: Seconds a snapshot is used before it is synced again (0 disables the inventory)
+            max_devices: Maximum number of devices loaded by a full build or one delta sync
+            reconcile_interval: Seconds after which a sync is a full rebuild instead of a delta
+        """
+        self.max_age = max_age
+        self.max_devices = max_devices
+        self.reconcile_interval = reconcile_interval
+        self.complete = False
+        self.watermark: str | None = None
+        self.last_sync: dict[str, Any] | None = None
+        self.stats = InventoryStats()
+        self._records: dict[str, dict[str, Any]] = {}
+        self._indexes: dict[str, HashIndex] = self._empty_indexes()
+        self._warranties = EndDateIndex()
+        # Subscription ID -> device IDs, as given by the API (filters compare IDs case-sensitively)
+        self._subscriptions = HashIndex()
+        self._unsubscribed: set[str] = set()
+        self._synced_at: float | None = None
+        self._reconciled_at: float | None = None
+        self._sync_flight = SingleFlight()
+        self._sync_task: asyncio.Task[None] | None = None
+
+    @staticmethod
+    def _empty_indexes() -> dict[str, HashIndex]:
+        return {field: HashIndex() for field in ("id", *INDEXED_FIELDS, "tagKey", "tag")}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups may be answered from the inventory."""
+        return self.max_age > 0
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def age(self) -> float | None:
+        """Seconds since the last successful sync (the sync lag), or None if the inventory was never built."""
+        if self._synced_at is None:
+            return None
+        return time.monotonic() - self._synced_at
+
+    def is_fresh(self) -> bool:
+        """Whether the inventory is built and was synced less than ``max_age`` ago."""
+        age = self.age()
+        return age is not None and age < self.max_age
+
+    async def ensure_fresh(self, http_client: Any, force: bool = False) -> bool:
+        """
+        Sync the inventory if it is stale, or rebuild it if ``force`` is set.
+
+        Concurrent callers that find the inventory stale wait for the same sync;
+        forced rebuilds are shared separately, so ``force`` never joins a delta sync.
+
+        Args:
+            http_client: Client whose ``get`` performs (rate-limited) requests
+            force: Rebuild even if the inventory is fresh
+
+        Returns:
+            True if this call waited for a sync
+        """
+        if not self.enabled or (self.is_fresh() and not force):
+            return False
+        await self._sync_flight.do((COLLECTION_ENDPOINT, force), lambda: self.sync(http_client, full=force))
+        return True
+
+    async def sync(self, http_client: Any, full: bool = False) -> dict[str, Any]:
+        """
+        Bring the inventory up to date.
+
+        Without a watermark, or once ``reconcile_interval`` has passed since the last
+        full build, every device is loaded again, which also drops deleted devices.
+        Otherwise only devices with ``updatedAt`` at or after the watermark are
+        fetched (sorted by ``updatedAt``, so a sync cut at ``max_devices`` resumes
+        where it stopped) and merged; archived devices are removed.
+
+        Args:
+            http_client: Client whose ``get`` performs (rate-limited) requests
+            full: Rebuild from every device even if a delta would do
+
+        Returns:
+            Summary of the sync: mode, requests, items changed and elapsed seconds
+        """
+        reconcile_due = self._reconciled_at is None or time.monotonic() - self._reconciled_at >= self.reconcile_interval
+        started = time.monotonic()
+        if full or self.watermark is None or reconcile_due:
+            summary = await self._full_sync(http_client)
+        else:
+            summary = await self._delta_sync(http_client)
+        summary["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        self.stats.items_changed += summary["items_changed"]
+        self._synced_at = time.monotonic()
+        self.last_sync = summary
+        return summary
+
+    async def _full_sync(self, http_client: Any) -> dict[str, Any]:
+        started = time.monotonic()
+        response = await fetch_all_pages(
+            http_client, COLLECTION_ENDPOINT, {}, page_size=PAGE_SIZE, max_items=self.max_devices
+        )
+        pagination = response["pagination"]
+        before = self._records
+        self.replace(response["items"], complete=not pagination["truncated"])
+        deleted = sum(1 for i in before if i not in self._records)
+        changed = deleted + sum(1 for i, record in self._records.items() if before.get(i) != record)
+        self.watermark = _latest_update(response["items"]) or self.watermark
+        self._reconciled_at = time.monotonic()
+        self.stats.builds += 1
+        self.stats.build_requests += pagination["pages_fetched"]
+        self.stats.build_seconds = round(time.monotonic() - started, 3)
+        self.stats.deleted_removed += deleted
+        logger.info(
+            f"Device inventory built: {len(self._records)} devices in {pagination['pages_fetched']} requests "
+            f"({self.stats.build_seconds}s, {self.stats.memory_bytes} bytes, {changed} changed"
+            f"{', truncated' if not self.complete else ''})"
+        )
+        return {"mode": "full", "requests": pagination["pages_fetched"], "items_changed": changed}
+
+    async def _delta_sync(self, http_client: Any) -> dict[str, Any]:
+        params = {"filter": f"updatedAt ge '{self.watermark}'", "sort": "updatedAt asc"}
+        response = await fetch_all_pages(
+            http_client, COLLECTION_ENDPOINT, params, page_size=PAGE_SIZE, max_items=self.max_devices
+        )
+        changed = archived = 0
+        for device in response["items"]:
+            if not isinstance(device, dict) or not device.get("id"):
+                continue
+            device_id = str(device["id"])
+            previous = self._records.get(device_id)
+            if device.get("archived"):
+                if previous is not None:
+                    self.remove(device_id)
+                    self.stats.memory_bytes -= _deep_sizeof(previous)
+                    archived += 1
+                continue
+            record = compact_device(device)
+            if record != previous:
+                self.upsert(device)
+                self.stats.memory_bytes += _deep_sizeof(record) - (_deep_sizeof(previous) if previous else 0)
+                changed += 1
+        self.watermark = _latest_update([*response["items"], {"updatedAt": self.watermark}])
+        requests = response["pagination"]["pages_fetched"]
+        self.stats.delta_syncs += 1
+        self.stats.delta_requests += requests
+        self.stats.archived_removed += archived
+        if changed or archived:
+            logger.info(
+                f"Device inventory delta sync: {changed} updated and {archived} archived devices "
+                f"in {requests} requests (watermark {self.watermark})"
+            )
+        return {"mode": "delta", "requests": requests, "items_changed": changed + archived}
+
+    def start_background_sync(self, http_client: Any, interval: float) -> None:
+        """
+        Start a task that syncs the inventory every ``interval`` seconds.
+
+        The first sync (a full build) runs immediately. Failed syncs are logged and
+        retried with backoff, up to ``interval``; lookups keep using the last snapshot.
+        Does nothing if the inventory is disabled, ``interval`` is not positive or
+        the task is already running.
+
+        Args:
+            http_client: Client whose ``get`` performs (rate-limited) requests
+            interval: Seconds between syncs
+        """
+        if not self.enabled or interval <= 0 or (self._sync_task and not self._sync_task.done()):
+            return
+        self._sync_task = asyncio.create_task(self._sync_loop(http_client, interval))
+        logger.info(f"Background device inventory sync started (every {interval}s)")
+
+    async def stop_background_sync(self) -> None:
+        """Cancel the background sync task and wait for it to finish."""
+        task, self._sync_task = self._sync_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _sync_loop(self, http_client: Any, interval: float) -> None:
+        """Sync the inventory every ``interval`` seconds until cancelled."""
+        failures = 0
+        while True:
+            try:
+                await self._sync_flight.do((COLLECTION_ENDPOINT, False), lambda: self.sync(http_client))
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                failures += 1
+                self.stats.sync_failures += 1
+                self.stats.last_error = str(exc)
+                logger.warning(f"Background device inventory sync failed, will retry: {exc}")
+            await asyncio.sleep(min(_SYNC_RETRY_INITIAL * 2 ** (failures - 1), interval) if failures else interval)
+
+    def replace(self, devices: Iterable[Any], complete: bool = True) -> None:
+        """
+        Replace the snapshot with ``devices``, swapping in the new records and indexes at once.
+
+        The warranty end date index is built in bulk: entries are collected while
+        the records are added and sorted once at the end.
+
+        Args:
+            devices: Devices as returned by the devices API
+            complete: Whether ``devices`` is the whole inventory
+        """
+        previous = self._records, self._indexes, self._warranties, self._subscriptions, self._unsubscribed
+        self._records, self._indexes, self._warranties = {}, self._empty_indexes(), EndDateIndex(bulk=True)
+        self._subscriptions, self._unsubscribed = HashIndex(), set()
+        try:
+            for device in devices:
+                self.upsert(device)
+            self._warranties.build()
+        except Exception:
+            self._records, self._indexes, self._warranties, self._subscriptions, self._unsubscribed = previous
+            raise
+        self.complete = complete
+        self._synced_at = time.monotonic()
+        self.stats.memory_bytes = _deep_sizeof(self._records) + _deep_sizeof(
+            {
+                **{field: index._ids for field, index in self._indexes.items()},
+                "subscription": self._subscriptions._ids,
+                "unsubscribed": self._unsubscribed,
+            }
+        )
+
+    def upsert(self, device: Any) -> None:
+        """Add or replace one device record and its index entries; archived devices are removed."""
+        if not isinstance(device, dict) or not device.get("id"):
+            return
+        device_id = str(device["id"])
+        self.remove(device_id)
+        if device.get("archived"):
+            return
+        record = compact_device(device)
+        self._records[device_id] = record
+        for field, key in _index_keys(record):
+            self._indexes[field].add(key, device_id)
+        self._warranties.add(device_id, support_ends(record))
+        subscription_ids = _subscription_ids(record)
+        for subscription_id in subscription_ids:
+            self._subscriptions.add(subscription_id, device_id)
+        if not subscription_ids:
+            self._unsubscribed.add(device_id)
+
+    def remove(self, device_id: str) -> None:
+        """Remove one device record and its index entries."""
+        record = self._records.pop(device_id, None)
+        if record is not None:
+            for field, key in _index_keys(record):
+                self._indexes[field].discard(key, device_id)
+            self._warranties.discard(device_id)
+            for subscription_id in _subscription_ids(record):
+                self._subscriptions.discard(subscription_id, device_id)
+            self._unsubscribed.discard(device_id)
+
+    def lookup(self, field: str, value: str, prefix: bool = False) -> list[str]:
+        """
+        Return the IDs of devices matching one value.
+
+        Args:
+            field: ``id``, one of ``INDEXED_FIELDS``, ``tagKey``, or ``tag`` (value ``key=value``)
+            value: Value to match, case-insensitively
+            prefix: Match values starting with ``value`` instead of equal to it
+
+        Returns:
+            Matching device IDs, sorted
+        """
+        self.stats.lookups += 1
+        if field not in self._indexes:
+            raise ValueError(f"Unsupported lookup field '{field}'")
+        if field == "tag":
+            tag_key, separator, tag_value = value.partition("=")
+            if not separator:
+                raise ValueError(f"Tag lookups take 'key=value', got '{value}'")
+            key = normalize_key(field, tag_key) + _TAG_SEPARATOR + normalize_key(field, tag_value)
+        else:
+            key = normalize_key(field, value)
+        index = self._indexes[field]
+        return sorted(index.prefix(key) if prefix else index.get(key))
+
+    def query(
+        self, filter: str | None = None, filter_tags: str | None = None, fields: frozenset[str] | None = None
+    ) -> Selection:
+        """
+        Return the IDs of devices matching OData filters, evaluated over the compact records.
+
+        ``eq`` and ``in`` terms on ``id``, the indexed properties, ``subscription/id``
+        and tags are answered from the hash indexes; the rest of the filter is checked per
+        candidate (or per device when no term is indexed).
+
+        Args:
+            filter: Filter on device properties, as for ``getdevicesv1``
+            filter_tags: Filter on tag keys and values, as for ``getdevicesv1``
+            fields: Known device properties for ``filter``, or None to accept any property
+
+        Returns:
+            Matching device IDs, sorted, with the candidates and records scanned
+
+        Raises:
+            FilterError: If a filter is malformed or names an unknown field
+            ValueError: If a filter names a nested property that compact records do not keep
+        """
+        terms = []
+        if filter:
+            terms.append(compile_filter(filter, fields).ast)
+        if filter_tags:
+            terms.append(compile_filter(filter_tags).ast)
+        if not terms:
+            raise ValueError("Provide 'filter' and/or 'filter_tags'")
+        require_kept_paths(*terms)
+        selection = select(
+            self._records, terms[0] if len(terms) == 1 else Logical("and", tuple(terms)), self._candidates
+        )
+        self.stats.queries += 1
+        self.stats.indexed_queries += selection.indexed
+        return selection
+
+    def _candidates(self, field: FieldRef, value: Any) -> set[str] | None:
+        """Index lookup for ``select``: devices whose ``field`` may equal ``value``."""
+        if not isinstance(value, str):
+            return None
+        if field.quoted:
+            return self._indexes["tag"].get(
+                normalize_key("tag", field.path) + _TAG_SEPARATOR + normalize_key("tag", value)
+            )
+        if field.path == "id":
+            return {value}
+        if field.path in INDEXED_FIELDS:
+            return self._indexes[field.path].get(normalize_key(field.path, value))
+        if field.path == "subscription/id":
+            return self._subscriptions.get(value)
+        return None
+
+    def expiring(self, start: float, end: float) -> list[tuple[str, SupportEnd]]:
+        """
+        Return the support levels ending between two instants, by range scan of the end date index.
+
+        Args:
+            start: Window start, in seconds since the epoch
+            end: Window end, in seconds since the epoch
+
+        Returns:
+            (device ID, support-level end) pairs, earliest end first
+        """
+        self.stats.warranty_scans += 1
+        return self._warranties.range(start, end)
+
+    def join_subscriptions(
+        self, subscription_ids: Iterable[str] | None = None, device_ids: set[str] | None = None
+    ) -> SubscriptionJoin:
+        """
+        Join devices to their subscriptions through the subscription index.
+
+        Each subscription ID is probed in the inverted index (a hash lookup) and,
+        when ``device_ids`` restricts the devices, its set is intersected with
+        them; devices without a subscription come from a set kept alongside the
+        index, so no pass over the records is needed.
+
+        Args:
+            subscription_ids: Subscriptions to join, or None for every subscription carried by a device
+            device_ids: Devices to join (for example the matches of a filter), or None for every device
+
+        Returns:
+            Device IDs per subscription (empty for subscriptions no device carries) and unsubscribed device IDs
+        """
+        self.stats.subscription_joins += 1
+        probe = (
+            list(dict.fromkeys(subscription_ids)) if subscription_ids is not None else list(self._subscriptions.keys())
+        )
+        subscriptions: dict[str, set[str]] = {}
+        for subscription_id in probe:
+            devices = self._subscriptions.get(subscription_id)
+            if device_ids is not None:
+                devices = devices & device_ids
+            subscriptions[subscription_id] = set(devices)
+        unsubscribed = self._unsubscribed if device_ids is None else self._unsubscribed & device_ids
+        return SubscriptionJoin(
+            subscriptions,
+            set(unsubscribed),
+            len(self._records) if device_ids is None else len(device_ids),
+            len(probe),
+        )
+
+    def get(self, device_id: str) -> dict[str, Any] | None:
+        """Return the compact record of one device."""
+        return self._records.get(device_id)
+
+    def records(self) -> Iterable[dict[str, Any]]:
+        """Return the compact records of every device."""
+        return self._records.values()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return inventory size, memory footprint, sync lag and sync counters."""
+        age = self.age()
+        return {
+            "devices": len(self._records),
+            "complete": self.complete,
+            "max_age_seconds": self.max_age,
+            "age_seconds": round(age, 3) if age is not None else None,
+            "watermark": self.watermark,
+            "background_sync": self._sync_task is not None and not self._sync_task.done(),
+            "last_sync": self.last_sync,
+            "index_keys": {field: len(index) for field, index in self._indexes.items()},
+            "warranty_index": self._warranties.stats(),
+            "subscription_index": {"subscriptions": len(self._subscriptions), "unsubscribed": len(self._unsubscribed)},
+            **asdict(self.stats),
+        }
+
+
+def _index_keys(record: dict[str, Any]) -> list[tuple[str, str]]:
+    keys = [(field, normalize_key(field, record[field])) for field in ("id", *INDEXED_FIELDS) if record.get(field)]
+    tags = record.get("tags")
+    if isinstance(tags, dict):
+        for tag_key, tag_value in tags.items():
+            keys.append(("tagKey", normalize_key("tagKey", tag_key)))
+            keys.append(("tag", normalize_key("tag", tag_key) + _TAG_SEPARATOR + normalize_key("tag", tag_value)))
+    return keys
+
+
+def _subscription_ids(record: dict[str, Any]) -> list[str]:
+    """Return the IDs of the subscriptions referenced by a compact record."""
+    references = record.get("subscription")
+    if isinstance(references, dict):
+        references = [references]
+    if not isinstance(references, list):
+        return []
+    return list(dict.fromkeys(str(r["id"]) for r in references if isinstance(r, dict) and r.get("id")))
+
+
+def _latest_update(devices: Iterable[Any]) -> str | None:
+    """Return the latest ``updatedAt`` value among ``devices``, as given by the API."""
+    latest: tuple[datetime, str] | None = None
+    for device in devices:
+        value = device.get("updatedAt") if isinstance(device, dict) else None
+        if not isinstance(value, str):
+            continue
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            continue
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        if latest is None or parsed > latest[0]:
+            latest = (parsed, value)
+    return latest[1] if latest else None
+
+
+def _deep_sizeof(value: Any, seen: set[int] | None = None) -> int:
+    """Approximate memory in bytes held by a structure of dicts, lists, sets and scalars."""
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(_deep_sizeof(v, seen) for v in value)
+    return size
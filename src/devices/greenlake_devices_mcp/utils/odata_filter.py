@@ -0,0 +1,486 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+OData filter parsing, normalization and canonical serialization for devices MCP server tools.
+
+The GreenLake APIs accept a subset of OData 4.0 in their ``filter`` query
+parameters: comparisons (``eq``, ``ne``, ``gt``, ``ge``, ``lt``, ``le``), ``in``
+lists (``field in 'a', 'b'`` or ``field in ('a', 'b')``), the functions
+``contains``, ``startswith`` and ``endswith``, and ``and``, ``or``, ``not`` with
+parentheses. Fields may be slash paths (``user/username``); tag filters compare
+quoted tag keys (``'city' eq 'London'``).
+
+``compile_filter`` tokenizes and parses an expression into an AST, applies
+the repairs clients most often need, validates field names against the
+endpoint's known fields and serializes the result in canonical form. The
+repairs are: quoting bare numbers and words, unwrapping ``''value''``, using
+the endpoint's quote character, lower-casing operators, mapping ``=``, ``!=``,
+``>=`` etc. to their OData names, and correcting the case of known field names.
+A malformed filter raises ``FilterError`` (a ``ValueError``) locally instead of
+costing a ``400`` round trip. Equivalent spellings share one canonical form, and
+so one response cache entry. Compiled filters are kept in an LRU cache, so a
+repeated filter is not parsed again.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Number of compiled filters kept in the LRU cache
+FILTER_CACHE_SIZE = 1024
+
+# Comparison operators, and the symbolic spellings accepted for them
+COMPARISON_OPERATORS = ("eq", "ne", "gt", "ge", "lt", "le")
+_SYMBOLIC_OPERATORS = {"=": "eq", "==": "eq", "!=": "ne", "<>": "ne", ">": "gt", ">=": "ge", "<": "lt", "<=": "le"}
+
+# Boolean functions of a field and a value
+FUNCTIONS = ("contains", "startswith", "endswith")
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<string>'(?:[^']|'')*'|"(?:[^"]|"")*")
+    | (?P<symbol>[=!<>]+)
+    | (?P<punct>[(),])
+    | (?P<word>[^\s'"(),=!<>]+)
+    """,
+    re.VERBOSE,
+)
+_DOUBLED_QUOTE_RE = re.compile(r"''([^'\s][^']*)''")
+_FIELD_RE = re.compile(r"[A-Za-z_][\w.-]*(?:/[A-Za-z_][\w.-]*)*\Z")
+_NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?\Z")
+_KEYWORD_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class FilterError(ValueError):
+    """A filter expression that cannot be parsed or names an unknown field."""
+
+    def __init__(self, message: str, position: int | None = None):
+        """
+        Initialize with a message and the character position of the problem.
+
+        Args:
+            message: Description of the problem
+            position: Zero-based character offset in the expression, if known
+        """
+        self.position = position
+        super().__init__(f"Invalid filter at position {position}: {message}" if position is not None else message)
+
+
+@dataclass(frozen=True)
+class Token:
+    """A lexical token: ``kind`` is string, symbol, punct or word."""
+
+    kind: str
+    text: str
+    position: int
+
+
+@dataclass(frozen=True)
+class FieldRef:
+    """A property path such as ``serialNumber`` or ``user/username``; ``quoted`` for tag keys."""
+
+    path: str
+    quoted: bool = False
+
+
+@dataclass(frozen=True)
+class Literal:
+    """A value: ``kind`` is string, boolean or null (numbers are quoted as strings); ``value`` is the Python value."""
+
+    kind: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """``<field> <op> <value>``."""
+
+    op: str
+    field: FieldRef
+    value: Literal
+
+
+@dataclass(frozen=True)
+class InList:
+    """``<field> in <value>, ...``; ``parenthesized`` keeps the ``in (...)`` spelling the caller used."""
+
+    field: FieldRef
+    values: tuple[Literal, ...]
+    parenthesized: bool = False
+
+
+@dataclass(frozen=True)
+class Call:
+    """``<function>(<field>, <value>)``."""
+
+    function: str
+    field: FieldRef
+    value: Literal
+
+
+@dataclass(frozen=True)
+class Not:
+    """``not <operand>``."""
+
+    operand: Node
+
+
+@dataclass(frozen=True)
+class Logical:
+    """``<operand> and|or <operand> ...``."""
+
+    op: str
+    operands: tuple[Node, ...]
+
+
+Node = Comparison | InList | Call | Not | Logical
+
+
+@dataclass(frozen=True)
+class ParsedFilter:
+    """A compiled filter: its AST, canonical form and the repairs applied to the input."""
+
+    ast: Node
+    canonical: str
+    fixes: tuple[str, ...] = ()
+
+
+def tokenize(expression: str) -> list[Token]:
+    """
+    Split a filter expression into tokens, skipping whitespace.
+
+    Args:
+        expression: Filter expression
+
+    Returns:
+        Tokens in order
+
+    Raises:
+        FilterError: If a quoted string is not terminated
+    """
+    tokens: list[Token] = []
+    position = 0
+    while position < len(expression):
+        match = _TOKEN_RE.match(expression, position)
+        if match is None:
+            raise FilterError(f"unterminated string starting with {expression[position]}", position)
+        kind = match.lastgroup
+        if kind != "space" and kind is not None:
+            tokens.append(Token(kind, match.group(), position))
+        position = match.end()
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser: ``or`` binds loosest, then ``and``, then ``not``."""
+
+    def __init__(self, expression: str, fields: frozenset[str] | None, quote: str):
+        self.fixes: list[str] = []
+        self.quote = quote
+        repaired = _DOUBLED_QUOTE_RE.sub(r"'\1'", expression)
+        if repaired != expression:
+            self.fixes.append("unwrapped ''value'' to 'value'")
+        self.expression = repaired
+        self.tokens = tokenize(repaired)
+        self.index = 0
+        self.fields = {f.casefold(): f for f in fields} if fields is not None else None
+        self.roots = {f.casefold() for f in fields if "/" not in f} if fields is not None else None
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise FilterError("the filter is empty")
+        node = self._or()
+        if self.index < len(self.tokens):
+            token = self.tokens[self.index]
+            raise FilterError(f"unexpected '{token.text}'", token.position)
+        return node
+
+    # -- token helpers -------------------------------------------------------
+
+    def _peek(self) -> Token | None:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _next(self, expected: str) -> Token:
+        token = self._peek()
+        if token is None:
+            raise FilterError(f"expected {expected} at the end of the filter", len(self.expression))
+        self.index += 1
+        return token
+
+    def _keyword(self, *words: str) -> str | None:
+        token = self._peek()
+        if token is not None and token.kind == "word" and token.text.lower() in words:
+            if token.text != token.text.lower():
+                self._fix(f"lower-cased '{token.text}'")
+            self.index += 1
+            return token.text.lower()
+        return None
+
+    def _punct(self, char: str) -> bool:
+        token = self._peek()
+        if token is not None and token.kind == "punct" and token.text == char:
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, char: str) -> None:
+        token = self._next(f"'{char}'")
+        if token.kind != "punct" or token.text != char:
+            raise FilterError(f"expected '{char}' but found '{token.text}'", token.position)
+
+    def _fix(self, description: str) -> None:
+        if description not in self.fixes:
+            self.fixes.append(description)
+
+    # -- grammar -------------------------------------------------------------
+
+    def _or(self) -> Node:
+        operands = [self._and()]
+        while self._keyword("or"):
+            operands.append(self._and())
+        return operands[0] if len(operands) == 1 else Logical("or", tuple(operands))
+
+    def _and(self) -> Node:
+        operands = [self._not()]
+        while self._keyword("and"):
+            operands.append(self._not())
+        return operands[0] if len(operands) == 1 else Logical("and", tuple(operands))
+
+    def _not(self) -> Node:
+        if self._keyword("not"):
+            return Not(self._not())
+        return self._primary()
+
+    def _primary(self) -> Node:
+        if self._punct("("):
+            node = self._or()
+            self._expect(")")
+            return node
+        token = self._next("a comparison")
+        following = self.tokens[self.index] if self.index < len(self.tokens) else None
+        if token.kind == "word" and following is not None and following.kind == "punct" and following.text == "(":
+            return self._call(token)
+        field = self._field(token)
+        return self._comparison(field)
+
+    def _call(self, token: Token) -> Call:
+        function = token.text.lower()
+        if function not in FUNCTIONS:
+            raise FilterError(
+                f"unsupported function '{token.text}' (supported: {', '.join(FUNCTIONS)})", token.position
+            )
+        if function != token.text:
+            self._fix(f"lower-cased '{token.text}'")
+        self._expect("(")
+        field = self._field(self._next("a field"))
+        self._expect(",")
+        value = self._value()
+        self._expect(")")
+        return Call(function, field, value)
+
+    def _field(self, token: Token) -> FieldRef:
+        if token.kind == "string":
+            # Tag filters compare quoted tag keys
+            return FieldRef(self._string(token), quoted=True)
+        if token.kind != "word" or not _FIELD_RE.match(token.text) or token.text.lower() in _RESERVED_WORDS:
+            raise FilterError(f"expected a field name but found '{token.text}'", token.position)
+        return FieldRef(self._known_field(token))
+
+    def _known_field(self, token: Token) -> str:
+        path = token.text
+        if self.fields is None or self.roots is None:
+            return path
+        known = self.fields.get(path.casefold())
+        if known is None and "/" in path and path.split("/", 1)[0].casefold() in self.roots:
+            root = self.fields[path.split("/", 1)[0].casefold()]
+            known = root + "/" + path.split("/", 1)[1]
+        if known is None:
+            raise FilterError(
+                f"unknown field '{path}' (known fields: {', '.join(sorted(self.fields.values()))})", token.position
+            )
+        if known != path:
+            self._fix(f"corrected field '{path}' to '{known}'")
+        return known
+
+    def _comparison(self, field: FieldRef) -> Node:
+        token = self._next("an operator")
+        operator: str | None = None
+        if token.kind == "word" and token.text.lower() in (*COMPARISON_OPERATORS, "in"):
+            operator = token.text.lower()
+            if operator != token.text:
+                self._fix(f"lower-cased '{token.text}'")
+        elif token.kind == "symbol" and token.text in _SYMBOLIC_OPERATORS:
+            operator = _SYMBOLIC_OPERATORS[token.text]
+            self._fix(f"replaced '{token.text}' with '{operator}'")
+        if operator is None:
+            raise FilterError(
+                f"expected an operator ({', '.join(COMPARISON_OPERATORS)} or in) but found '{token.text}'",
+                token.position,
+            )
+        if operator != "in":
+            return Comparison(operator, field, self._value())
+        parenthesized = self._punct("(")
+        values = [self._value()]
+        while self._punct(","):
+            values.append(self._value())
+        if parenthesized:
+            self._expect(")")
+        return InList(field, tuple(values), parenthesized)
+
+    def _value(self) -> Literal:
+        token = self._next("a value")
+        if token.kind == "string":
+            return Literal("string", self._string(token))
+        if token.kind == "word" and token.text.lower() not in _OPERATOR_WORDS:
+            word = token.text
+            if word.lower() in _KEYWORD_LITERALS:
+                return Literal("null" if word.lower() == "null" else "boolean", _KEYWORD_LITERALS[word.lower()])
+            if _NUMBER_RE.match(word):
+                # The APIs compare numbers as strings and answer 400 to bare numbers
+                self._fix(f"quoted number {word}")
+            else:
+                self._fix(f"quoted bare value {word}")
+            return Literal("string", word)
+        raise FilterError(f"expected a value but found '{token.text}'", token.position)
+
+    def _string(self, token: Token) -> str:
+        if token.text[0] != self.quote:
+            self._fix(f"changed {token.text[0]} quotes to {self.quote}")
+        return _unquote(token.text)
+
+
+_OPERATOR_WORDS = frozenset({"and", "or", "not", "in", *COMPARISON_OPERATORS})
+_RESERVED_WORDS = _OPERATOR_WORDS | _KEYWORD_LITERALS.keys()
+
+
+def _unquote(text: str) -> str:
+    quote = text[0]
+    return text[1:-1].replace(quote * 2, quote)
+
+
+def _quote(value: str, quote: str) -> str:
+    return quote + value.replace(quote, quote * 2) + quote
+
+
+def serialize(node: Node, quote: str = "'") -> str:
+    """
+    Serialize an AST in canonical form.
+
+    Operators are lower case, tokens are separated by single spaces, strings use
+    ``quote`` and parentheses appear only where precedence requires them.
+
+    Args:
+        node: Parsed filter
+        quote: Quote character for string values (``'`` or ``"``)
+
+    Returns:
+        Filter expression
+    """
+    if isinstance(node, Logical):
+        parts = []
+        for operand in node.operands:
+            text = serialize(operand, quote)
+            parts.append(f"({text})" if isinstance(operand, Logical) and operand.op != node.op else text)
+        return f" {node.op} ".join(parts)
+    if isinstance(node, Not):
+        text = serialize(node.operand, quote)
+        return f"not ({text})" if isinstance(node.operand, Logical) else f"not {text}"
+    if isinstance(node, Comparison):
+        return f"{_field_text(node.field, quote)} {node.op} {_value_text(node.value, quote)}"
+    if isinstance(node, InList):
+        values = ", ".join(_value_text(v, quote) for v in node.values)
+        return f"{_field_text(node.field, quote)} in " + (f"({values})" if node.parenthesized else values)
+    return f"{node.function}({_field_text(node.field, quote)}, {_value_text(node.value, quote)})"
+
+
+def _field_text(field: FieldRef, quote: str) -> str:
+    return _quote(field.path, quote) if field.quoted else field.path
+
+
+def _value_text(value: Literal, quote: str) -> str:
+    if value.kind == "string":
+        return _quote(value.value, quote)
+    if value.kind == "boolean":
+        return "true" if value.value else "false"
+    return "null"
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def compile_filter(expression: str, fields: frozenset[str] | None = None, quote: str = "'") -> ParsedFilter:
+    """
+    Parse, repair and validate a filter expression (cached).
+
+    Args:
+        expression: Filter expression as given by the caller
+        fields: Known field names of the endpoint (slash paths allowed), or None to accept any field.
+            A path below a known top-level field (``location/id`` for ``location``) is accepted.
+        quote: Quote character the endpoint expects for string values
+
+    Returns:
+        The AST, canonical expression and the list of repairs applied
+
+    Raises:
+        FilterError: If the expression is malformed or names an unknown field
+    """
+    parser = _Parser(expression, fields, quote)
+    ast = parser.parse()
+    return ParsedFilter(ast, serialize(ast, quote), tuple(parser.fixes))
+
+
+def parse_field(text: str, fields: frozenset[str] | None = None, quote: str = "'") -> FieldRef:
+    """
+    Parse a single field reference: a property path, or a quoted tag key.
+
+    Field names are corrected against ``fields`` as in filters.
+
+    Args:
+        text: Field reference, for example ``location/name`` or ``'city'``
+        fields: Known field names, or None to accept any field
+        quote: Quote character of a quoted tag key
+
+    Returns:
+        The field reference
+
+    Raises:
+        FilterError: If ``text`` is not a single field reference or names an unknown field
+    """
+    parser = _Parser(text.strip(), fields, quote)
+    if len(parser.tokens) != 1:
+        raise FilterError(f"expected a single field name but found '{text}'")
+    return parser._field(parser.tokens[0])
+
+
+def field_refs(node: Node) -> list[FieldRef]:
+    """Return the field references of a parsed filter, in order of appearance."""
+    if isinstance(node, Logical):
+        return [field for operand in node.operands for field in field_refs(operand)]
+    if isinstance(node, Not):
+        return field_refs(node.operand)
+    return [node.field]
+
+
+def normalize_filter(expression: str, fields: frozenset[str] | None = None, quote: str = "'") -> str:
+    """
+    Return the canonical form of a filter expression, rejecting malformed ones.
+
+    Args:
+        expression: Filter expression as given by the caller
+        fields: Known field names of the endpoint, or None to accept any field
+        quote: Quote character the endpoint expects for string values
+
+    Returns:
+        Canonical filter expression
+
+    Raises:
+        FilterError: If the expression is malformed or names an unknown field
+    """
+    return compile_filter(expression, fields, quote).canonical
+
+
+def filter_cache_info() -> dict[str, int]:
+    """Return hit, miss and size counters of the compiled filter cache."""
+    info = compile_filter.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize or 0}
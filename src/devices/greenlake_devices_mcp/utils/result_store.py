@@ -0,0 +1,217 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Server-side store for large list results of devices MCP server tools.
+
+A full ``getdevicesv1`` page can hold thousands of items; returning it inline
+means serializing it, shipping it over stdio and pushing all of it through the
+model context. With ``return_handle`` a list tool instead keeps the full result
+here and returns a compact summary (item count, field names, a short preview)
+plus a handle. The agent then reads only the slices it needs with the
+``read_result`` tool or the ``greenlake://results/{handle}`` resource.
+
+Results live in process memory, expire after a TTL and are evicted least
+recently used first to stay within an entry-count and byte-size bound.
+"""
+
+from __future__ import annotations
+
+import json
+import secrets
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+RESULT_URI_PREFIX = "greenlake://results/"
+
+# Items included inline in the summary returned instead of the full result
+PREVIEW_ITEMS = 3
+
+# Items whose keys are collected for the summary's field list
+_FIELD_SAMPLE_ITEMS = 50
+
+
+@dataclass
+class StoredResult:
+    """A stored list result."""
+
+    items: list[Any]
+    metadata: dict[str, Any]
+    size: int
+    expires_at: float
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class ResultStoreStats:
+    """Counters for the result store."""
+
+    stores: int = 0
+    reads: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejected: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class ResultStore:
+    """In-process store of list results, bounded by entry count, total size and age."""
+
+    def __init__(self, ttl: float = 900.0, max_entries: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the store.
+
+        Args:
+            ttl: Seconds a stored result stays readable
+            max_entries: Maximum number of stored results
+            max_bytes: Maximum total serialized size of stored results in bytes
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._results: OrderedDict[str, StoredResult] = OrderedDict()
+        self._bytes = 0
+        self.stats = ResultStoreStats()
+
+    def put(self, response: dict[str, Any]) -> str:
+        """
+        Store a list response and return its handle.
+
+        Args:
+            response: Decoded list response; its ``items`` are stored for paging and
+                the remaining keys (``total``, ``pagination``, ...) as metadata
+
+        Returns:
+            Opaque handle of the stored result
+
+        Raises:
+            ValueError: If the result alone exceeds the store's byte bound
+        """
+        items = list(response.get("items") or [])
+        metadata = {k: v for k, v in response.items() if k != "items"}
+        size = len(json.dumps(response, default=str, separators=(",", ":")))
+        if size > self.max_bytes:
+            self.stats.rejected += 1
+            raise ValueError(
+                f"Result of {size} bytes exceeds the result store limit of {self.max_bytes} bytes; "
+                "narrow the query or lower max_items"
+            )
+
+        self._purge_expired()
+        handle = secrets.token_urlsafe(12)
+        self._results[handle] = StoredResult(
+            items=items, metadata=metadata, size=size, expires_at=time.monotonic() + self.ttl
+        )
+        self._bytes += size
+        self.stats.stores += 1
+        while len(self._results) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._results))
+            self._remove(oldest)
+            self.stats.evictions += 1
+        self._update_gauges()
+        return handle
+
+    def get(self, handle: str) -> StoredResult | None:
+        """Return the stored result for ``handle`` (marking it recently used), or None if unknown or expired."""
+        result = self._results.get(handle)
+        if result is not None and result.expires_at <= time.monotonic():
+            self._remove(handle)
+            self.stats.expirations += 1
+            self._update_gauges()
+            result = None
+        if result is None:
+            self.stats.misses += 1
+            return None
+        self._results.move_to_end(handle)
+        return result
+
+    def read(self, handle: str, offset: int = 0, limit: int = 100) -> dict[str, Any]:
+        """
+        Return a slice of a stored result's items.
+
+        Args:
+            handle: Handle returned by ``put``
+            offset: Zero-based index of the first item to return
+            limit: Maximum number of items to return
+
+        Returns:
+            Dictionary with the ``items`` slice, paging fields and the stored metadata
+
+        Raises:
+            KeyError: If the handle is unknown or has expired
+            ValueError: If offset or limit is out of range
+        """
+        if offset < 0:
+            raise ValueError("'offset' must not be negative")
+        if limit < 1:
+            raise ValueError("'limit' must be at least 1")
+        result = self.get(handle)
+        if result is None:
+            raise KeyError(f"Result handle '{handle}' is unknown or has expired; run the query again")
+
+        self.stats.reads += 1
+        items = result.items[offset : offset + limit]
+        end = offset + len(items)
+        return {
+            "handle": handle,
+            "items": items,
+            "offset": offset,
+            "count": len(items),
+            "total_items": len(result.items),
+            "next_offset": end if end < len(result.items) else None,
+            "metadata": result.metadata,
+        }
+
+    def summarize(self, handle: str, preview_items: int = PREVIEW_ITEMS) -> dict[str, Any]:
+        """
+        Build the compact summary returned to the agent instead of the full result.
+
+        Args:
+            handle: Handle returned by ``put``
+            preview_items: Number of leading items to include inline
+
+        Returns:
+            Dictionary with the handle, resource URI, item count, field names, preview and metadata
+        """
+        result = self._results[handle]
+        fields: dict[str, None] = {}
+        for item in result.items[:_FIELD_SAMPLE_ITEMS]:
+            if isinstance(item, dict):
+                fields.update(dict.fromkeys(item))
+        return {
+            "handle": handle,
+            "resource_uri": f"{RESULT_URI_PREFIX}{handle}",
+            "total_items": len(result.items),
+            "fields": list(fields),
+            "preview": result.items[:preview_items],
+            "expires_in_seconds": max(0, round(result.expires_at - time.monotonic())),
+            "metadata": result.metadata,
+            "hint": "Read slices with read_result(handle, offset, limit) or the resource_uri with ?offset=&limit=",
+        }
+
+    def store(self, response: dict[str, Any]) -> dict[str, Any]:
+        """Store ``response`` and return its summary (see ``put`` and ``summarize``)."""
+        return self.summarize(self.put(response))
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return store counters."""
+        self._purge_expired()
+        return asdict(self.stats)
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for handle in [h for h, r in self._results.items() if r.expires_at <= now]:
+            self._remove(handle)
+            self.stats.expirations += 1
+        self._update_gauges()
+
+    def _remove(self, handle: str) -> None:
+        result = self._results.pop(handle, None)
+        if result is not None:
+            self._bytes -= result.size
+
+    def _update_gauges(self) -> None:
+        self.stats.entries = len(self._results)
+        self.stats.bytes = self._bytes
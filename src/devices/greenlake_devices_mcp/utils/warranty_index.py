@@ -0,0 +1,185 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Time-ordered index of warranty and support-level end dates for devices MCP server.
+
+A device's ``warranty`` holds its ``supportLevels`` (``ResponseSupportLevel``:
+``serviceLevel``, ``startDate``, ``endDate``, ranks) and the
+``currentSupportLevel``. ``EndDateIndex`` keeps one entry per support level
+of every device in the inventory snapshot, as ``(end, device ID, position)``
+tuples in a list sorted by end date. Finding what lapses within a window is a
+range scan: two bisections bound the window and the entries in between
+are read in end date order, with no pass over the fleet.
+
+The index is built in bulk (one sort) when the snapshot is rebuilt, and
+updated in place by bisection when devices change between rebuilds.
+
+End dates are epoch timestamps in the API (milliseconds; values too small to
+be milliseconds are read as seconds); ISO 8601 strings are accepted too.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+# Epoch values at or above this are milliseconds (1e11 seconds is in the year 5138)
+_MILLISECONDS_THRESHOLD = 1e11
+
+
+@dataclass(frozen=True)
+class SupportEnd:
+    """End of one support level of a device."""
+
+    end: float
+    service_level: str | None
+    current: bool
+
+    @property
+    def end_date(self) -> str:
+        """The end as an ISO 8601 UTC timestamp."""
+        return format_instant(self.end)
+
+
+def parse_end_date(value: Any) -> float | None:
+    """
+    Return a support-level end date as seconds since the epoch.
+
+    Args:
+        value: Epoch milliseconds (or seconds), or an ISO 8601 timestamp
+
+    Returns:
+        Seconds since the epoch, or None if ``value`` is not a date
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000 if abs(value) >= _MILLISECONDS_THRESHOLD else float(value)
+    if isinstance(value, str) and value.strip():
+        try:
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        return (parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)).timestamp()
+    return None
+
+
+def format_instant(seconds: float) -> str:
+    """Return seconds since the epoch as an ISO 8601 UTC timestamp."""
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def support_ends(record: Mapping[str, Any]) -> list[SupportEnd]:
+    """
+    Return the support-level end dates of a device record, earliest first.
+
+    The current support level is flagged; it is listed once even when it also
+    appears in ``supportLevels``. Levels without a readable end date are skipped.
+
+    Args:
+        record: Device record with a ``warranty`` object
+
+    Returns:
+        One entry per support level with an end date
+    """
+    warranty = record.get("warranty")
+    if not isinstance(warranty, Mapping):
+        return []
+    levels = [level for level in warranty.get("supportLevels") or [] if isinstance(level, Mapping)]
+    current = warranty.get("currentSupportLevel")
+    current_key = None
+    if isinstance(current, Mapping):
+        current_key = _level_key(current)
+        if current_key not in {_level_key(level) for level in levels}:
+            levels.append(current)
+    ends = set()
+    for level in levels:
+        end = parse_end_date(level.get("endDate"))
+        if end is not None:
+            ends.add(SupportEnd(end, level.get("serviceLevel"), _level_key(level) == current_key))
+    return sorted(ends, key=lambda e: (e.end, str(e.service_level)))
+
+
+def _level_key(level: Mapping[str, Any]) -> tuple[Any, Any]:
+    return level.get("serviceLevel"), parse_end_date(level.get("endDate"))
+
+
+class EndDateIndex:
+    """Support-level end dates of every device, sorted by end date for range scans."""
+
+    def __init__(self, bulk: bool = False) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            bulk: Collect entries without keeping them sorted until ``build`` is called
+        """
+        self._ends: dict[str, list[SupportEnd]] = {}
+        self._sorted: list[tuple[float, str, int]] | None = None if bulk else []
+        self.build_seconds = 0.0
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return sum(len(ends) for ends in self._ends.values())
+
+    def add(self, device_id: str, ends: list[SupportEnd]) -> None:
+        """Index the support-level ends of one device (which must not be indexed yet)."""
+        if not ends:
+            return
+        self._ends[device_id] = ends
+        if self._sorted is not None:
+            for position, support_end in enumerate(ends):
+                bisect.insort(self._sorted, (support_end.end, device_id, position))
+            self.updates += 1
+
+    def discard(self, device_id: str) -> None:
+        """Remove the entries of one device."""
+        ends = self._ends.pop(device_id, None)
+        if ends is None or self._sorted is None:
+            return
+        for position, support_end in enumerate(ends):
+            index = bisect.bisect_left(self._sorted, (support_end.end, device_id, position))
+            if index < len(self._sorted) and self._sorted[index] == (support_end.end, device_id, position):
+                del self._sorted[index]
+        self.updates += 1
+
+    def build(self) -> None:
+        """Sort the entries collected in bulk mode (a no-op once sorted)."""
+        if self._sorted is not None:
+            return
+        started = time.perf_counter()
+        self._sorted = sorted(
+            (support_end.end, device_id, position)
+            for device_id, ends in self._ends.items()
+            for position, support_end in enumerate(ends)
+        )
+        self.build_seconds = time.perf_counter() - started
+
+    def range(self, start: float, end: float) -> list[tuple[str, SupportEnd]]:
+        """
+        Return the support levels ending in ``[start, end]``, earliest first.
+
+        Args:
+            start: Window start, in seconds since the epoch
+            end: Window end, in seconds since the epoch
+
+        Returns:
+            (device ID, support-level end) pairs
+        """
+        self.build()
+        assert self._sorted is not None
+        low = bisect.bisect_left(self._sorted, (start,))
+        high = bisect.bisect_right(self._sorted, (end, "\U0010ffff"))
+        return [(device_id, self._ends[device_id][position]) for _, device_id, position in self._sorted[low:high]]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the index size, build latency and number of incremental updates."""
+        return {
+            "entries": len(self),
+            "devices": len(self._ends),
+            "build_milliseconds": round(self.build_seconds * 1e3, 3),
+            "incremental_updates": self.updates,
+        }
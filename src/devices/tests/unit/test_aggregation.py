@@ -0,0 +1,191 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for streaming group-by aggregation and the aggregate_devices tool in devices MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.aggregate_devices import aggregate_devices
+from greenlake_devices_mcp.utils import aggregation
+from greenlake_devices_mcp.utils.aggregation import GroupAggregator
+from greenlake_devices_mcp.utils.device_inventory import DeviceInventory
+from greenlake_devices_mcp.utils.odata_filter import FieldRef
+
+TYPES = ("COMPUTE", "STORAGE", "SWITCH")
+
+
+def _device(i: int) -> dict[str, Any]:
+    device: dict[str, Any] = {
+        "id": f"dev-{i:05d}",
+        "serialNumber": f"SN{i:05d}",
+        "deviceType": TYPES[i % 3],
+        "region": "us-west" if i % 4 else "eu-central",
+        "createdAt": f"2024-{i % 12 + 1:02d}-01T00:00:00.000Z",
+        "location": {"id": f"loc-{i % 2}", "name": f"Site {i % 2}"},
+        "warranty": {"endDate": f"2027-{i % 12 + 1:02d}-01T00:00:00.000Z"},
+        "tags": {"city": "London"} if i % 5 else {},
+    }
+    if i % 7 == 0:
+        del device["region"]
+    return device
+
+
+class FakeDevicesApi:
+    """Devices API paged by item offset that applies ``deviceType eq`` filters."""
+
+    def __init__(self, count: int = 2500):
+        self.devices = [_device(i) for i in range(count)]
+        self.requests: list[dict[str, Any]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        await asyncio.sleep(0.001)
+        devices = self.devices
+        if "filter" in params:
+            wanted = params["filter"].split("'")[1]
+            devices = [d for d in devices if d["deviceType"] == wanted]
+        offset, limit = params["offset"], params["limit"]
+        return {"items": devices[offset : offset + limit], "total": len(devices)}
+
+
+def _ctx(api: FakeDevicesApi, inventory: DeviceInventory) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    ctx.request_context.lifespan_context.device_inventory = inventory
+    return ctx
+
+
+class TestGroupAggregator:
+    """Test cases for folding records into per-group accumulators."""
+
+    def test_counts_per_value_combination(self):
+        aggregator = GroupAggregator([FieldRef("deviceType"), FieldRef("region")])
+        devices = [_device(i) for i in range(100)]
+        for device in devices:
+            aggregator.add(device)
+
+        expected = Counter((d["deviceType"], d.get("region")) for d in devices)
+        assert aggregator.columns() == ["deviceType", "region", "count"]
+        assert {(r[0], r[1]): r[2] for r in aggregator.rows()} == expected
+        counts = [r[2] for r in aggregator.rows()]
+        assert counts == sorted(counts, reverse=True)
+        assert aggregator.records == 100
+
+    def test_missing_values_and_list_paths(self):
+        aggregator = GroupAggregator([FieldRef("subscription/id"), FieldRef("city", quoted=True)])
+        aggregator.add({"subscription": [{"id": "s1"}, {"id": "s2"}], "tags": {"city": "Paris"}})
+        aggregator.add({"subscription": [{"id": "s1"}]})
+        aggregator.add({})
+
+        assert aggregator.columns() == ["subscription/id", "'city'", "count"]
+        assert aggregator.rows() == [["s1", "Paris", 1], ["s1", None, 1], ["s2", "Paris", 1], [None, None, 1]]
+
+    def test_timestamps_compare_as_instants(self):
+        aggregator = GroupAggregator([FieldRef("deviceType")], [FieldRef("createdAt")])
+        aggregator.add({"deviceType": "A", "createdAt": "2024-01-01T10:00:00+02:00"})
+        aggregator.add({"deviceType": "A", "createdAt": "2024-01-01T09:00:00.000Z"})
+        aggregator.add({"deviceType": "A", "createdAt": "not a timestamp"})
+        aggregator.add({"deviceType": "B"})
+
+        assert aggregator.columns() == ["deviceType", "count", "min(createdAt)", "max(createdAt)"]
+        assert aggregator.rows() == [
+            ["A", 3, "2024-01-01T10:00:00+02:00", "2024-01-01T09:00:00.000Z"],
+            ["B", 1, None, None],
+        ]
+
+    def test_groups_beyond_the_cap_are_counted_as_overflow(self, monkeypatch):
+        monkeypatch.setattr(aggregation, "MAX_GROUPS", 2)
+        aggregator = GroupAggregator([FieldRef("serialNumber")])
+        for i in range(5):
+            aggregator.add(_device(i % 3))
+
+        assert len(aggregator) == 2
+        assert aggregator.overflow == 1
+        assert aggregator.rows(limit=1) == [["SN00000", 2]]
+
+    def test_group_by_is_bounded(self):
+        with pytest.raises(ValueError, match="at most"):
+            GroupAggregator([FieldRef(f"f{i}") for i in range(aggregation.MAX_GROUP_BY_FIELDS + 1)])
+
+
+class TestAggregateDevicesTool:
+    """Test cases for the aggregate_devices tool over the snapshot and over streamed pages."""
+
+    @pytest.mark.asyncio
+    async def test_snapshot_answers_repeated_rollups_without_requests(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=10000))
+
+        first = (await aggregate_devices(ctx, group_by="deviceType, Region", timestamps="createdAt"))[0]["result"]
+        second = (await aggregate_devices(ctx, group_by=["location/name"], filter="deviceType eq STORAGE"))[0]["result"]
+
+        assert first["columns"] == ["deviceType", "region", "count", "min(createdAt)", "max(createdAt)"]
+        assert sum(row[2] for row in first["rows"]) == first["devices"] == 2500
+        assert first["scan"]["source"] == "inventory"
+        assert second["rows"] == [["Site 1", 417], ["Site 0", 416]]
+        assert second["scan"]["scanned"] == 2500
+        # Only the snapshot build, two pages of 2000 devices
+        assert len(api.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_streams_pages_when_the_snapshot_lacks_a_property(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=10000))
+
+        result = (
+            await aggregate_devices(
+                ctx, group_by="deviceType", timestamps="warranty/endDate", filter="deviceType eq 'SWITCH'"
+            )
+        )[0]["result"]
+
+        assert result["rows"] == [["SWITCH", 833, "2027-03-01T00:00:00.000Z", "2027-12-01T00:00:00.000Z"]]
+        assert result["scan"]["source"] == "api"
+        assert result["scan"]["complete"] is True
+        assert all(r["filter"] == "deviceType eq 'SWITCH'" for r in api.requests)
+
+    @pytest.mark.asyncio
+    async def test_filter_on_a_dropped_path_is_not_aggregated_over_the_snapshot(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=10000))
+        location_filter = "location/locationName eq 'Site 1'"
+
+        auto = (await aggregate_devices(ctx, group_by="deviceType", filter=location_filter))[0]
+        snapshot = (await aggregate_devices(ctx, group_by="deviceType", filter=location_filter, source="inventory"))[0]
+
+        # The snapshot drops location/locationName, so auto streams pages with the filter applied by the API
+        assert auto["result"]["scan"]["source"] == "api"
+        assert all(r["filter"] == location_filter for r in api.requests)
+        assert snapshot["error"] == "validation_error"
+        assert "location/locationName" in snapshot["message"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_inventory_streams_pages(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=0, max_devices=10000))
+
+        result = (await aggregate_devices(ctx, group_by="'city'", limit=1))[0]["result"]
+
+        assert result["rows"] == [["London", 2000]]
+        assert result["groups"] == 2
+        assert result["truncated"] is True
+        assert (result["scan"]["source"], result["scan"]["requests"]) == ("api", 2)
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests_are_validation_errors(self):
+        api = FakeDevicesApi(count=1)
+        ctx = _ctx(api, DeviceInventory(max_age=0, max_devices=10))
+
+        unknown = await aggregate_devices(ctx, group_by="colour")
+        disabled = await aggregate_devices(ctx, group_by="deviceType", source="inventory")
+
+        assert unknown[0]["error"] == "validation_error"
+        assert "unknown field 'colour'" in unknown[0]["message"]
+        assert disabled[0]["error"] == "validation_error"
+        assert api.requests == []
@@ -0,0 +1,187 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for batch device lookup in devices MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Any
+from unittest.mock import MagicMock
+from urllib.parse import quote, urlencode
+
+import httpx
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.getdevicesbyids import getdevicesbyids
+from greenlake_devices_mcp.utils.batch_lookup import (
+    MAX_BATCH_IDS,
+    chunk_in_filters,
+    fetch_by_path,
+    in_filter,
+    parse_ids,
+)
+
+BASE_URL = "https://global.api.greenlake.hpe.com"
+PREFIX = f"{BASE_URL}/devices/v1/devices"
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", PREFIX)
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=httpx.Response(status, request=request))
+
+
+class FakeDevicesApi:
+    """Devices API over a fixed inventory that records requests and in-flight concurrency."""
+
+    def __init__(self, count: int = 600, reject_filters: bool = False):
+        self.base_url = BASE_URL
+        self.devices = {
+            f"{i:08d}-0000-4000-8000-000000000000": {
+                "id": f"{i:08d}-0000-4000-8000-000000000000",
+                "serialNumber": f"SN{i:05d}",
+            }
+            for i in range(count)
+        }
+        self.reject_filters = reject_filters
+        self.requests: list[tuple[str, dict[str, Any] | None]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append((endpoint, params))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if endpoint == "/devices/v1/devices":
+                if self.reject_filters:
+                    raise _status_error(400)
+                field, values = re.match(r"(\w+) in (.*)", params["filter"]).groups()
+                wanted = {v.strip().strip("'") for v in values.split(",")}
+                return {"items": [d for d in self.devices.values() if d[field] in wanted]}
+            device_id = endpoint.rsplit("/", 1)[1]
+            if device_id not in self.devices:
+                raise _status_error(404)
+            return self.devices[device_id]
+        finally:
+            self.in_flight -= 1
+
+
+def _ctx(api: FakeDevicesApi) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    return ctx
+
+
+class TestChunking:
+    """Test cases for packing identifiers into filters."""
+
+    def test_chunks_fit_url_limit_and_keep_order(self):
+        ids = [f"{i:08d}-0000-4000-8000-000000000000" for i in range(500)]
+        chunks = chunk_in_filters("id", ids, PREFIX, max_url_length=2048)
+
+        assert [i for chunk in chunks for i in chunk] == ids
+        assert len(chunks) < 20
+        for chunk in chunks:
+            query = urlencode({"filter": in_filter("id", chunk), "limit": len(chunk)}, quote_via=quote)
+            assert len(PREFIX) + 1 + len(query) <= 2048
+
+    def test_identifier_too_long_for_url_returns_none(self):
+        assert chunk_in_filters("id", ["x" * 3000], PREFIX) is None
+
+    def test_quotes_are_escaped(self):
+        assert in_filter("serialNumber", ["O'NEIL", "B"]) == "serialNumber in 'O''NEIL', 'B'"
+
+    def test_parse_ids_accepts_comma_separated_string_and_dedupes(self):
+        assert parse_ids(" a, b ,a,,c") == ["a", "b", "c"]
+        with pytest.raises(ValueError):
+            parse_ids([str(i) for i in range(MAX_BATCH_IDS + 1)])
+
+
+class TestFetchByPath:
+    """Test cases for the per-identifier fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency_and_per_item_errors(self):
+        api = FakeDevicesApi(count=20)
+        ids = [*list(api.devices)[:10], "missing"]
+
+        found, errors = await fetch_by_path(api, "/devices/v1/devices/{id}", ids, max_concurrency=3)
+
+        assert len(found) == 10
+        assert errors["missing"]["error"] == "not_found"
+        assert api.max_in_flight <= 3
+
+
+class TestGetDevicesByIds:
+    """Test cases for the getdevicesbyids tool."""
+
+    @pytest.mark.asyncio
+    async def test_uses_filter_chunks_for_many_ids(self):
+        api = FakeDevicesApi()
+        ids = list(api.devices)[:300]
+
+        result = await getdevicesbyids(_ctx(api), ids=[*ids, "ffffffff-0000-4000-8000-000000000000"])
+        payload = result[0]["result"]
+
+        assert result[0]["success"] is True
+        assert list(payload["items"]) == ids
+        assert payload["errors"]["ffffffff-0000-4000-8000-000000000000"]["error"] == "not_found"
+        assert payload["lookup"]["strategy"] == "filter"
+        assert payload["lookup"]["requests"] == len(api.requests) < 20
+
+    @pytest.mark.asyncio
+    async def test_single_id_uses_item_endpoint(self):
+        api = FakeDevicesApi(count=5)
+        device_id = next(iter(api.devices))
+
+        result = await getdevicesbyids(_ctx(api), ids=device_id)
+
+        assert result[0]["result"]["lookup"]["strategy"] == "fan_out"
+        assert api.requests == [(f"/devices/v1/devices/{device_id}", None)]
+
+    @pytest.mark.asyncio
+    async def test_rejected_filter_falls_back_to_item_endpoint(self):
+        api = FakeDevicesApi(count=50, reject_filters=True)
+        ids = list(api.devices)
+
+        payload = (await getdevicesbyids(_ctx(api), ids=ids))[0]["result"]
+
+        assert len(payload["items"]) == 50
+        assert payload["errors"] == {}
+        assert payload["lookup"]["fallback_ids"] == 50
+
+    @pytest.mark.asyncio
+    async def test_serial_numbers_map_to_device_ids(self):
+        api = FakeDevicesApi(count=10)
+        device_id = next(iter(api.devices))
+
+        payload = (await getdevicesbyids(_ctx(api), serial_numbers=["SN00000", "SN99999"]))[0]["result"]
+
+        assert list(payload["items"]) == [device_id]
+        assert payload["serial_numbers"] == {"SN00000": device_id}
+        assert payload["errors"]["SN99999"]["error"] == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_requires_ids_or_serial_numbers(self):
+        result = await getdevicesbyids(_ctx(FakeDevicesApi(count=1)))
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
+
+    @pytest.mark.asyncio
+    async def test_cached_devices_need_no_request(self):
+        api = FakeDevicesApi(count=5)
+        cached_id, other_id = list(api.devices)[:2]
+
+        async def get_cached(endpoint, params=None):
+            return api.devices[cached_id] if endpoint.endswith(cached_id) else None
+
+        api.get_cached = get_cached  # type: ignore[attr-defined]
+        payload = (await getdevicesbyids(_ctx(api), ids=[cached_id, other_id]))[0]["result"]
+
+        assert list(payload["items"]) == [cached_id, other_id]
+        assert payload["lookup"]["cache_hits"] == 1
+        assert api.requests == [(f"/devices/v1/devices/{other_id}", None)]
@@ -0,0 +1,372 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the device inventory snapshot and lookupdevices tool in devices MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.lookupdevices import lookupdevices
+from greenlake_devices_mcp.tools.implementations.querydevices import querydevices
+from greenlake_devices_mcp.utils.device_inventory import DeviceInventory, HashIndex, compact_device, keeps_path
+
+
+def _device(i: int) -> dict[str, Any]:
+    return {
+        "id": f"{i:08d}-0000-4000-8000-000000000000",
+        "type": "devices/device",
+        "resourceUri": f"/devices/v1/devices/{i:08d}-0000-4000-8000-000000000000",
+        "serialNumber": f"SN{i:05d}",
+        "macAddress": f"00:1A:2B:3C:{i // 256:02X}:{i % 256:02X}",
+        "partNumber": f"PN-{i % 3}",
+        "deviceType": "COMPUTE",
+        "secondaryName": None,
+        "location": {"id": "loc-1", "name": "London", "resourceUri": "/locations/v1/locations/loc-1"},
+        "subscription": [{"id": "sub-1", "resourceUri": "/subscriptions/v1/subscriptions/sub-1"}],
+        "tags": {"city": "London" if i % 2 else "Paris"},
+    }
+
+
+class FakeDevicesApi:
+    """Devices API over a fixed inventory paged by item offset."""
+
+    def __init__(self, count: int = 4500):
+        self.devices = [_device(i) for i in range(count)]
+        self.requests: list[dict[str, Any]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        await asyncio.sleep(0.001)
+        offset, limit = params["offset"], params["limit"]
+        return {"items": self.devices[offset : offset + limit], "total": len(self.devices)}
+
+
+class ChangingDevicesApi:
+    """Devices API whose devices carry ``updatedAt`` and that answers ``updatedAt ge`` filters sorted by it."""
+
+    def __init__(self, count: int = 10):
+        self.clock = 0
+        self.devices: dict[str, dict[str, Any]] = {}
+        for i in range(count):
+            self.update(_device(i))
+        self.requests: list[dict[str, Any]] = []
+
+    def update(self, device: dict[str, Any]) -> None:
+        self.clock += 1
+        self.devices[device["id"]] = {
+            **device,
+            "updatedAt": f"2026-01-01T00:{self.clock // 60:02d}:{self.clock % 60:02d}.000Z",
+        }
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        devices = sorted(self.devices.values(), key=lambda d: d["updatedAt"])
+        if "filter" in params:
+            watermark = re.match(r"updatedAt ge '(.*)'", params["filter"]).group(1)
+            devices = [d for d in devices if d["updatedAt"] >= watermark]
+        offset, limit = params["offset"], params["limit"]
+        return {"items": devices[offset : offset + limit], "total": len(devices)}
+
+
+def _ctx(api: FakeDevicesApi, inventory: DeviceInventory | None) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    ctx.request_context.lifespan_context.device_inventory = inventory
+    return ctx
+
+
+class TestDeviceInventory:
+    """Test cases for building and querying the snapshot."""
+
+    def test_compact_device_abbreviates_nested_objects(self):
+        record = compact_device(_device(1))
+
+        assert "resourceUri" not in record and "secondaryName" not in record
+        assert record["location"] == {"id": "loc-1", "name": "London"}
+        assert record["subscription"] == [{"id": "sub-1"}]
+        assert record["tags"] == {"city": "London"}
+
+    def test_hash_index_prefix_after_changes(self):
+        index = HashIndex()
+        index.add("sn001", "a")
+        index.add("sn002", "b")
+        index.add("pn001", "c")
+        assert index.prefix("sn") == {"a", "b"}
+
+        index.discard("sn001", "a")
+        index.add("sn003", "d")
+
+        assert index.prefix("sn00") == {"b", "d"}
+        assert len(index) == 3
+
+    @pytest.mark.asyncio
+    async def test_build_pages_and_indexes(self):
+        api = FakeDevicesApi()
+        inventory = DeviceInventory(max_age=60, max_devices=100000)
+
+        assert await inventory.ensure_fresh(api) is True
+        assert len(inventory) == 4500
+        assert len(api.requests) == 3
+        assert inventory.lookup("serialNumber", "sn00042") == ["00000042-0000-4000-8000-000000000000"]
+        assert inventory.lookup("macAddress", "001a.2b3c.002a") == ["00000042-0000-4000-8000-000000000000"]
+        assert len(inventory.lookup("partNumber", "PN-0")) == 1500
+        assert len(inventory.lookup("serialNumber", "SN0001", prefix=True)) == 10
+        assert len(inventory.lookup("tag", "city=london")) == 2250
+        assert len(inventory.lookup("tagKey", "CITY")) == 4500
+        snapshot = inventory.snapshot()
+        assert snapshot["complete"] is True
+        assert snapshot["memory_bytes"] > 0
+        assert snapshot["build_requests"] == 3
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_is_reused_until_stale_or_forced(self):
+        api = FakeDevicesApi(count=10)
+        inventory = DeviceInventory(max_age=60, max_devices=100)
+
+        await asyncio.gather(*(inventory.ensure_fresh(api) for _ in range(3)))
+        assert await inventory.ensure_fresh(api) is False
+        assert inventory.stats.builds == 1
+
+        assert await inventory.ensure_fresh(api, force=True) is True
+        inventory._synced_at -= 61
+        assert await inventory.ensure_fresh(api) is True
+        assert inventory.stats.builds == 3
+
+    def test_upsert_reindexes_changed_device(self):
+        inventory = DeviceInventory(max_age=60, max_devices=100)
+        inventory.replace([_device(1)])
+
+        inventory.upsert({**_device(1), "serialNumber": "NEW1"})
+
+        assert inventory.lookup("serialNumber", "SN00001") == []
+        assert inventory.lookup("serialNumber", "new1") == ["00000001-0000-4000-8000-000000000000"]
+
+    def test_id_lookups_are_case_insensitive(self):
+        inventory = DeviceInventory(max_age=60, max_devices=100)
+        inventory.replace([{**_device(1), "id": "Dev-ABC-1"}, {**_device(2), "id": "dev-abd-2"}])
+
+        assert inventory.lookup("id", "DEV-abc-1") == ["Dev-ABC-1"]
+        assert inventory.lookup("id", "dev-ab", prefix=True) == ["Dev-ABC-1", "dev-abd-2"]
+        assert inventory.lookup("id", "DEV-ABC", prefix=True) == ["Dev-ABC-1"]
+
+    def test_tag_lookup_requires_key_and_value(self):
+        with pytest.raises(ValueError):
+            DeviceInventory(max_age=60, max_devices=100).lookup("tag", "city")
+
+
+class TestIncrementalSync:
+    """Test cases for watermark delta syncs, reconciliation and the background task."""
+
+    @pytest.mark.asyncio
+    async def test_delta_sync_fetches_changes_since_watermark(self):
+        api = ChangingDevicesApi(count=10)
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        await inventory.sync(api)
+        assert inventory.watermark == "2026-01-01T00:00:10.000Z"
+
+        api.update({**_device(3), "serialNumber": "CHANGED"})
+        api.update({**_device(4), "archived": True})
+        api.update(_device(10))
+        summary = await inventory.sync(api)
+
+        assert summary["mode"] == "delta"
+        assert summary["items_changed"] == 3
+        assert api.requests[-1]["filter"] == "updatedAt ge '2026-01-01T00:00:10.000Z'"
+        assert api.requests[-1]["sort"] == "updatedAt asc"
+        assert inventory.lookup("serialNumber", "changed") == ["00000003-0000-4000-8000-000000000000"]
+        assert inventory.get("00000004-0000-4000-8000-000000000000") is None
+        assert len(inventory) == 10
+        assert inventory.watermark == "2026-01-01T00:00:13.000Z"
+        assert inventory.stats.archived_removed == 1
+
+    @pytest.mark.asyncio
+    async def test_forced_refresh_does_not_join_a_running_delta(self):
+        api = ChangingDevicesApi(count=5)
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        await inventory.sync(api)
+        inventory._synced_at -= 61
+
+        await asyncio.gather(inventory.ensure_fresh(api), inventory.ensure_fresh(api, force=True))
+
+        assert sorted(len(p) for p in api.requests[1:]) == [2, 4]
+        assert inventory.stats.builds == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_delta_counts_no_changes(self):
+        api = ChangingDevicesApi(count=5)
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        await inventory.sync(api)
+
+        summary = await inventory.sync(api)
+
+        assert (summary["mode"], summary["items_changed"], summary["requests"]) == ("delta", 0, 1)
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_drops_deleted_devices(self):
+        api = ChangingDevicesApi(count=5)
+        inventory = DeviceInventory(max_age=60, max_devices=1000, reconcile_interval=3600)
+        await inventory.sync(api)
+        del api.devices["00000002-0000-4000-8000-000000000000"]
+
+        assert (await inventory.sync(api))["mode"] == "delta"
+        assert len(inventory) == 5
+
+        inventory._reconciled_at -= 3600
+        summary = await inventory.sync(api)
+
+        assert summary["mode"] == "full"
+        assert summary["items_changed"] == 1
+        assert len(inventory) == 4
+        assert inventory.stats.deleted_removed == 1
+
+    @pytest.mark.asyncio
+    async def test_background_sync_runs_until_stopped(self):
+        api = ChangingDevicesApi(count=5)
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+
+        inventory.start_background_sync(api, interval=0.01)
+        await asyncio.sleep(0.05)
+        snapshot = inventory.snapshot()
+        await inventory.stop_background_sync()
+
+        assert snapshot["background_sync"] is True
+        assert inventory.stats.builds == 1
+        assert inventory.stats.delta_syncs >= 1
+        assert snapshot["age_seconds"] < 1
+        assert inventory.snapshot()["background_sync"] is False
+
+
+class TestLookupDevices:
+    """Test cases for the lookupdevices tool."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_are_served_from_the_snapshot(self):
+        api = FakeDevicesApi(count=100)
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        ctx = _ctx(api, inventory)
+
+        first = (await lookupdevices(ctx, field="serialNumber", values="SN00001, SN99999"))[0]["result"]
+        second = (await lookupdevices(ctx, field="partNumber", values=["PN-1"], limit=5))[0]["result"]
+
+        assert first["lookup"]["refreshed"] is True
+        assert first["matches"] == {"SN00001": ["00000001-0000-4000-8000-000000000000"], "SN99999": []}
+        assert first["items"]["00000001-0000-4000-8000-000000000000"]["serialNumber"] == "SN00001"
+        assert second["lookup"]["refreshed"] is False
+        assert second["count"] == 5
+        assert second["truncated"] == {"PN-1": 33}
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_inventory_is_a_validation_error(self):
+        result = await lookupdevices(
+            _ctx(FakeDevicesApi(count=1), DeviceInventory(max_age=0, max_devices=1)),
+            field="id",
+            values="x",
+        )
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
+
+
+class TestQueryDevices:
+    """Test cases for filters evaluated over the snapshot and the querydevices tool."""
+
+    def test_indexed_terms_use_the_hash_indexes(self):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(100))
+
+        selection = inventory.query("serialNumber in 'SN00001', 'sn00002' and partNumber eq 'PN-1'")
+
+        assert selection.ids == ["00000001-0000-4000-8000-000000000000"]
+        # Both terms are indexed, so only the intersection of their candidates is checked
+        assert (selection.indexed, selection.scanned) == (True, 1)
+        tagged = inventory.query(filter_tags="'city' eq 'Paris'", filter="location/id eq 'loc-1'")
+        assert tagged.indexed is True
+        assert len(tagged.ids) == 50
+        assert inventory.stats.queries == 2
+
+    def test_unindexed_filters_scan_every_device(self):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(100))
+
+        selection = inventory.query("location/id eq 'loc-1' and not startswith(serialNumber, 'SN0000')")
+
+        assert (selection.indexed, selection.scanned, len(selection.ids)) == (False, 100, 90)
+
+    def test_subscription_terms_use_the_subscription_index(self):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(100))
+
+        selection = inventory.query("subscription/id eq 'sub-1' and not startswith(serialNumber, 'SN0000')")
+        other = inventory.query("subscription/id eq 'SUB-1'")
+
+        assert (selection.indexed, selection.scanned, len(selection.ids)) == (True, 100, 90)
+        # Filters compare subscription IDs case-sensitively, as the API does
+        assert (other.indexed, other.scanned, other.ids) == (True, 0, [])
+
+    @pytest.mark.asyncio
+    async def test_queries_are_answered_without_requests(self):
+        api = FakeDevicesApi(count=100)
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        first = (await querydevices(ctx, filter="deviceType eq 'COMPUTE'", limit=10, offset=95))[0]["result"]
+        second = (await querydevices(ctx, filter="macAddress eq '00:1A:2B:3C:00:2A'"))[0]["result"]
+
+        assert (first["total"], first["count"], first["query"]["refreshed"]) == (100, 5, True)
+        assert second["items"] == [compact_device(_device(42))]
+        assert second["query"]["indexed"] is True
+        assert len(api.requests) == 1
+
+    @pytest.mark.parametrize("op", ["eq", "ne"])
+    def test_filters_on_dropped_nested_paths_are_rejected(self, op):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(10))
+
+        # Compact records drop location/locationName, so eq would match nothing and ne every device
+        with pytest.raises(ValueError, match=r"does not keep location/locationName"):
+            inventory.query(f"location/locationName {op} 'Paris' and deviceType eq 'COMPUTE'")
+
+    @pytest.mark.parametrize("path", ["type", "resourceUri"])
+    def test_filters_on_dropped_top_level_fields_are_rejected(self, path):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(10))
+
+        assert not keeps_path(path)
+        with pytest.raises(ValueError, match=rf"does not keep {path}"):
+            inventory.query(f"{path} ne 'devices/device'")
+
+    @pytest.mark.asyncio
+    async def test_dropped_nested_path_is_a_validation_error(self):
+        api = FakeDevicesApi(count=10)
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        for op in ("eq", "ne"):
+            result = await querydevices(ctx, filter=f"location/locationName {op} 'Paris'")
+            assert result[0]["error"] == "validation_error"
+            assert "location/locationName" in result[0]["message"]
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_is_a_validation_error(self):
+        api = FakeDevicesApi(count=1)
+        result = await querydevices(_ctx(api, DeviceInventory(max_age=60, max_devices=10)), filter="colour eq 'red'")
+
+        assert result[0]["error"] == "validation_error"
+        assert "unknown field 'colour'" in result[0]["message"]
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_filter_tags_are_rejected_before_syncing(self):
+        api = FakeDevicesApi(count=10)
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        result = await querydevices(ctx, filter="deviceType eq 'COMPUTE'", filter_tags="'city' eq")
+
+        assert result[0]["error"] == "validation_error"
+        assert api.requests == []
@@ -72,3 +72,53 @@ class TestGetdevicesv1Tool:
         await _impl_getdevicesv1(ctx)
 
         ctx.request_context.lifespan_context.http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_merges_pages(self):
+        """fetch_all must request the remaining pages and return the merged items."""
+        ctx = _make_mock_ctx()
+
+        async def get(url, params=None):
+            offset = params["offset"]
+            return {"items": [{"id": f"item-{offset + i}"} for i in range(min(2, 5 - offset))], "total": 5}
+
+        ctx.request_context.lifespan_context.http_client.get.side_effect = get
+
+        result = await _impl_getdevicesv1(ctx, limit=2, fetch_all=True)
+
+        assert result[0]["success"] is True
+        assert [item["id"] for item in result[0]["result"]["items"]] == [f"item-{i}" for i in range(5)]
+        assert result[0]["result"]["pagination"]["pages_fetched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_items_returns_validation_error(self):
+        """An invalid max_items must be reported as a validation error."""
+        ctx = _make_mock_ctx()
+
+        result = await _impl_getdevicesv1(ctx, max_items="lots")
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
+
+    @pytest.mark.asyncio
+    async def test_filters_are_sent_in_canonical_form(self):
+        """Filters must be repaired and canonicalized before the request is made."""
+        ctx = _make_mock_ctx()
+        ctx.request_context.lifespan_context.http_client.get.return_value = {}
+
+        await _impl_getdevicesv1(ctx, filter="SerialNumber = STIAPL6404", filter_tags="'city' EQ London")
+
+        params = ctx.request_context.lifespan_context.http_client.get.call_args.kwargs["params"]
+        assert params["filter"] == "serialNumber eq 'STIAPL6404'"
+        assert params["filter-tags"] == "'city' eq 'London'"
+
+    @pytest.mark.asyncio
+    async def test_malformed_filter_returns_validation_error(self):
+        """A filter naming an unknown field must fail locally without an API call."""
+        ctx = _make_mock_ctx()
+
+        result = await _impl_getdevicesv1(ctx, filter="colour eq 'red'")
+
+        assert result[0]["error"] == "validation_error"
+        assert "unknown field 'colour'" in result[0]["message"]
+        ctx.request_context.lifespan_context.http_client.get.assert_not_called()
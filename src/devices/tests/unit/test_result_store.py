@@ -0,0 +1,135 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the server-side result store and read_result tool in devices MCP server.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from greenlake_devices_mcp.server.fastmcp_instance import mcp
+from greenlake_devices_mcp.tools.implementations.getdevicesv1 import getdevicesv1 as _impl_getdevicesv1
+from greenlake_devices_mcp.tools.implementations.read_result import read_result, stored_result
+from greenlake_devices_mcp.utils.result_store import ResultStore
+
+
+def _response(n: int = 10) -> dict:
+    return {
+        "items": [{"id": f"dev-{i}", "serialNumber": f"SN{i}", "deviceType": "COMPUTE"} for i in range(n)],
+        "count": n,
+        "total": 500,
+    }
+
+
+def _make_mock_ctx(store: ResultStore) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.result_store = store
+    return ctx
+
+
+class TestResultStore:
+    """Test cases for storing and paging results."""
+
+    def test_summary_is_compact(self):
+        store = ResultStore()
+        summary = store.store(_response(100))
+
+        assert summary["total_items"] == 100
+        assert summary["fields"] == ["id", "serialNumber", "deviceType"]
+        assert len(summary["preview"]) == 3
+        assert summary["metadata"] == {"count": 100, "total": 500}
+        assert summary["resource_uri"] == f"greenlake://results/{summary['handle']}"
+        assert len(json.dumps(summary)) < len(json.dumps(_response(100))) / 5
+
+    def test_read_pages_through_items(self):
+        store = ResultStore()
+        handle = store.put(_response(10))
+
+        first = store.read(handle, offset=0, limit=4)
+        last = store.read(handle, offset=8, limit=4)
+
+        assert [item["id"] for item in first["items"]] == ["dev-0", "dev-1", "dev-2", "dev-3"]
+        assert first["next_offset"] == 4
+        assert [item["id"] for item in last["items"]] == ["dev-8", "dev-9"]
+        assert last["next_offset"] is None
+
+    def test_expired_result_is_not_readable(self):
+        store = ResultStore(ttl=60)
+        with patch("greenlake_devices_mcp.utils.result_store.time.monotonic", return_value=1000.0):
+            handle = store.put(_response())
+        with (
+            patch("greenlake_devices_mcp.utils.result_store.time.monotonic", return_value=1061.0),
+            pytest.raises(KeyError),
+        ):
+            store.read(handle)
+        assert store.stats.expirations == 1
+
+    def test_evicts_least_recently_used_beyond_entry_bound(self):
+        store = ResultStore(max_entries=2)
+        first, second = store.put(_response()), store.put(_response())
+        store.get(first)
+        store.put(_response())
+
+        assert store.get(first) is not None
+        assert store.get(second) is None
+        assert store.stats.evictions == 1
+
+    def test_byte_bound_is_enforced(self):
+        size = len(json.dumps(_response(10), separators=(",", ":")))
+        store = ResultStore(max_bytes=size * 2)
+        handles = [store.put(_response(10)) for _ in range(3)]
+
+        assert store.get(handles[0]) is None
+        assert store.snapshot()["bytes"] <= size * 2
+        with pytest.raises(ValueError):
+            ResultStore(max_bytes=10).put(_response(10))
+
+    def test_rejects_invalid_slices(self):
+        store = ResultStore()
+        handle = store.put(_response())
+        with pytest.raises(ValueError):
+            store.read(handle, offset=-1)
+        with pytest.raises(ValueError):
+            store.read(handle, limit=0)
+
+
+class TestReadResultTool:
+    """Test cases for the read_result tool and results resource."""
+
+    @pytest.mark.asyncio
+    async def test_list_tool_returns_handle_readable_by_read_result(self):
+        store = ResultStore()
+        ctx = _make_mock_ctx(store)
+        ctx.request_context.lifespan_context.http_client = AsyncMock()
+        ctx.request_context.lifespan_context.http_client.get.return_value = _response(10)
+
+        listed = await _impl_getdevicesv1(ctx, return_handle=True)
+        handle = listed[0]["result"]["handle"]
+        page = await read_result(ctx, handle=handle, offset="5", limit="2")
+
+        assert "items" not in listed[0]["result"]
+        assert page[0]["success"] is True
+        assert [item["id"] for item in page[0]["result"]["items"]] == ["dev-5", "dev-6"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_handle_returns_not_found(self):
+        result = await read_result(_make_mock_ctx(ResultStore()), handle="missing")
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "not_found"
+
+    @pytest.mark.asyncio
+    async def test_resource_pages_with_query_string(self):
+        store = ResultStore()
+        handle = store.put(_response(10))
+        uri = f"greenlake://results/{handle}?offset=3&limit=2"
+        template = mcp._resource_manager._templates["greenlake://results/{handle}"]
+
+        params = template.matches(uri)
+        page = json.loads(await stored_result(params["handle"], _make_mock_ctx(store)))
+
+        assert [item["id"] for item in page["items"]] == ["dev-3", "dev-4"]
+        assert page["next_offset"] == 5
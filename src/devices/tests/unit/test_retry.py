@@ -0,0 +1,154 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the HTTP retry policy in devices MCP server.
+
+Covers Retry-After / retryAfterSeconds parsing, backoff computation, and the
+retry loop in the HTTP client's GET path.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from greenlake_devices_mcp.utils.http_client import DevicesHttpClient, endpoint_family
+from greenlake_devices_mcp.utils.retry import RetryPolicy, parse_retry_after
+
+
+def _response(status_code: int, payload: object = None, headers: dict[str, str] | None = None) -> httpx.Response:
+    request = httpx.Request("GET", "https://api.example.test/devices/v1/devices")
+    return httpx.Response(status_code, json=payload if payload is not None else {}, headers=headers, request=request)
+
+
+@pytest.fixture
+def http_client() -> DevicesHttpClient:
+    """HTTP client with a stubbed token manager and a generous retry budget."""
+    token_manager = Mock(get_auth_headers=AsyncMock(), aclose=AsyncMock())
+    token_manager.get_auth_headers.return_value = {"Authorization": "Bearer test-token"}
+    with patch("greenlake_devices_mcp.utils.http_client.TokenManager", return_value=token_manager):
+        client = DevicesHttpClient()
+    client.retry_policy = RetryPolicy(max_retries=3, initial_backoff=0.5, max_backoff=30.0, deadline=300.0)
+    return client
+
+
+class TestParseRetryAfter:
+    """Test cases for server-requested retry delays."""
+
+    def test_header_seconds(self):
+        assert parse_retry_after(_response(429, headers={"Retry-After": "7"})) == 7.0
+
+    def test_header_http_date_in_past(self):
+        response = _response(503, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        assert parse_retry_after(response) == 0.0
+
+    def test_body_server_error_details(self):
+        body = {"httpStatusCode": 429, "serverErrorDetails": [{"type": "retry", "retryAfterSeconds": 12}]}
+        assert parse_retry_after(_response(429, body)) == 12.0
+
+    def test_body_top_level(self):
+        assert parse_retry_after(_response(429, {"retryAfterSeconds": 3})) == 3.0
+
+    def test_header_takes_precedence_over_body(self):
+        response = _response(429, {"retryAfterSeconds": 30}, headers={"Retry-After": "2"})
+        assert parse_retry_after(response) == 2.0
+
+    def test_missing(self):
+        assert parse_retry_after(_response(429, {"message": "slow down"})) is None
+
+
+class TestRetryPolicy:
+    """Test cases for backoff computation."""
+
+    def test_backoff_is_bounded_by_exponential_ceiling(self):
+        policy = RetryPolicy(initial_backoff=1.0, max_backoff=4.0)
+        for attempt in range(6):
+            assert 0 <= policy.compute_delay(attempt) <= min(2**attempt, 4.0)
+
+    def test_server_hint_is_a_floor(self):
+        policy = RetryPolicy(max_backoff=1.0)
+        delay = policy.compute_delay(0, retry_after=10.0)
+        assert 10.0 <= delay <= 11.0
+
+
+class TestEndpointFamily:
+    """Test cases for endpoint family normalisation."""
+
+    def test_collapses_identifiers(self):
+        assert endpoint_family("/devices/v1/devices/STIAPL6404") == "/devices/v1/devices/{id}"
+
+    def test_keeps_collection_and_version(self):
+        assert endpoint_family("/service-catalog/v1beta1/service-offers") == "/service-catalog/v1beta1/service-offers"
+
+
+class TestGetWithRetry:
+    """Test cases for the retry loop in the GET path."""
+
+    @pytest.mark.asyncio
+    async def test_retries_429_then_succeeds(self, http_client):
+        responses = [
+            _response(429, {"serverErrorDetails": [{"retryAfterSeconds": 2}]}),
+            _response(200, {"items": [], "count": 0}),
+        ]
+        with (
+            patch.object(http_client.client, "get", AsyncMock(side_effect=responses)) as mock_get,
+            patch("greenlake_devices_mcp.utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            result = await http_client.get("/devices/v1/devices")
+
+        assert result == {"items": [], "count": 0}
+        assert mock_get.call_count == 2
+        assert mock_sleep.await_args.args[0] >= 2.0
+
+        stats = http_client.get_retry_stats()["/devices/v1/devices"]
+        assert stats["requests"] == 1
+        assert stats["attempts"] == 2
+        assert stats["retries"] == 1
+        assert stats["recovered"] == 1
+        assert stats["reasons"] == {"429": 1}
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_reset(self, http_client):
+        side_effect = [httpx.ReadError("connection reset"), _response(200, {"ok": True})]
+        with (
+            patch.object(http_client.client, "get", AsyncMock(side_effect=side_effect)),
+            patch("greenlake_devices_mcp.utils.http_client.asyncio.sleep", new=AsyncMock()),
+        ):
+            assert await http_client.get("/devices/v1/devices/abc123") == {"ok": True}
+
+        assert http_client.get_retry_stats()["/devices/v1/devices/{id}"]["reasons"] == {"ReadError": 1}
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self, http_client):
+        with (
+            patch.object(http_client.client, "get", AsyncMock(return_value=_response(503))) as mock_get,
+            patch("greenlake_devices_mcp.utils.http_client.asyncio.sleep", new=AsyncMock()),
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                await http_client.get("/devices/v1/devices")
+
+        assert mock_get.call_count == 4
+        assert http_client.get_retry_stats()["/devices/v1/devices"]["exhausted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_deadline_stops_retry_that_would_overrun(self, http_client):
+        http_client.retry_policy.deadline = 5.0
+        too_long = _response(429, headers={"Retry-After": "60"})
+        with (
+            patch.object(http_client.client, "get", AsyncMock(return_value=too_long)) as mock_get,
+            patch("greenlake_devices_mcp.utils.http_client.asyncio.sleep", new=AsyncMock()) as mock_sleep,
+        ):
+            with pytest.raises(httpx.HTTPStatusError):
+                await http_client.get("/devices/v1/devices")
+
+        mock_get.assert_called_once()
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_status_is_not_retried(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_response(400))) as mock_get:
+            with pytest.raises(httpx.HTTPStatusError):
+                await http_client.get("/devices/v1/devices")
+
+        mock_get.assert_called_once()
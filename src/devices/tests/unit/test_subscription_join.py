@@ -0,0 +1,150 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the subscription index and the join_device_subscriptions tool in devices MCP server.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.join_device_subscriptions import join_device_subscriptions
+from greenlake_devices_mcp.utils.device_inventory import DeviceInventory
+
+
+def _device(i: int) -> dict[str, Any]:
+    """Device i is on sub-A if i % 2 == 0 and on sub-B if i % 3 == 0; others have no subscription."""
+    subscriptions = [f"sub-{name}" for name, step in (("A", 2), ("B", 3)) if i % step == 0]
+    return {
+        "id": f"dev-{i:03d}",
+        "serialNumber": f"SN{i:03d}",
+        "deviceType": "COMPUTE" if i < 60 else "SWITCH",
+        "subscription": [{"id": s, "resourceUri": f"/subscriptions/v1/subscriptions/{s}"} for s in subscriptions],
+    }
+
+
+class FakeDevicesApi:
+    """Devices API paged by item offset over a fixed list."""
+
+    def __init__(self, count: int = 120):
+        self.devices = [_device(i) for i in range(count)]
+        self.requests: list[dict[str, Any]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        offset, limit = params["offset"], params["limit"]
+        return {"items": self.devices[offset : offset + limit], "total": len(self.devices)}
+
+
+def _ctx(api: FakeDevicesApi, inventory: DeviceInventory) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    ctx.request_context.lifespan_context.device_inventory = inventory
+    return ctx
+
+
+class TestSubscriptionIndex:
+    """Test cases for the inverted subscription index kept with the inventory."""
+
+    def test_join_every_subscription(self):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(12))
+
+        join = inventory.join_subscriptions()
+
+        assert join.subscriptions == {
+            "sub-A": {f"dev-{i:03d}" for i in (0, 2, 4, 6, 8, 10)},
+            "sub-B": {f"dev-{i:03d}" for i in (0, 3, 6, 9)},
+        }
+        assert join.unsubscribed == {"dev-001", "dev-005", "dev-007", "dev-011"}
+        assert (join.devices, join.probes) == (12, 2)
+
+    def test_index_follows_upserts_and_removals(self):
+        inventory = DeviceInventory(max_age=60, max_devices=1000)
+        inventory.replace(_device(i) for i in range(12))
+
+        inventory.upsert({**_device(1), "subscription": [{"id": "sub-C"}]})
+        inventory.upsert({**_device(0), "subscription": []})
+        inventory.remove("dev-003")
+        join = inventory.join_subscriptions(["sub-B", "sub-C", "sub-X"], device_ids={"dev-000", "dev-001", "dev-009"})
+
+        assert join.subscriptions == {"sub-B": {"dev-009"}, "sub-C": {"dev-001"}, "sub-X": set()}
+        assert join.unsubscribed == {"dev-000"}
+        assert inventory.snapshot()["subscription_index"] == {"subscriptions": 3, "unsubscribed": 4}
+
+
+class TestJoinDeviceSubscriptionsTool:
+    """Test cases for the join_device_subscriptions tool."""
+
+    @pytest.mark.asyncio
+    async def test_join_reports_device_sets_and_cardinalities(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        result = (await join_device_subscriptions(ctx, ids_per_set=2))[0]["result"]
+
+        assert [(r["subscription_id"], r["devices"]) for r in result["subscriptions"]] == [("sub-A", 60), ("sub-B", 40)]
+        assert result["subscriptions"][0]["device_ids"] == ["dev-000", "dev-002"]
+        assert result["subscriptions"][0]["ids_truncated"] is True
+        assert result["unsubscribed"]["devices"] == 40
+        assert result["cardinality"] == {
+            "devices": 120,
+            "subscriptions": 2,
+            "empty_subscriptions": 0,
+            "subscribed_devices": 80,
+            "unsubscribed_devices": 40,
+            "pairs": 100,
+            "multi_subscription_devices": 20,
+        }
+        assert result["join"]["probes"] == 2
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_filters_and_requested_subscriptions(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        result = (
+            await join_device_subscriptions(
+                ctx, subscription_ids="sub-B, sub-Z", filter="deviceType eq 'SWITCH'", include_unsubscribed=False
+            )
+        )[0]["result"]
+
+        assert [(r["subscription_id"], r["devices"]) for r in result["subscriptions"]] == [("sub-B", 20), ("sub-Z", 0)]
+        assert "unsubscribed" not in result
+        assert (result["cardinality"]["devices"], result["cardinality"]["empty_subscriptions"]) == (60, 1)
+        assert result["join"]["filtered"] is True
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests_are_validation_errors(self):
+        api = FakeDevicesApi(count=1)
+
+        disabled = await join_device_subscriptions(_ctx(api, DeviceInventory(max_age=0, max_devices=10)))
+        bad_filter = await join_device_subscriptions(
+            _ctx(api, DeviceInventory(max_age=60, max_devices=10)), filter="colour eq 'red'"
+        )
+
+        assert [r[0]["error"] for r in (disabled, bad_filter)] == ["validation_error"] * 2
+
+    @pytest.mark.asyncio
+    async def test_filter_on_a_dropped_path_is_rejected_before_joining(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        result = await join_device_subscriptions(ctx, filter="subscription/resourceUri ne 'x'")
+
+        assert result[0]["error"] == "validation_error"
+        assert "subscription/resourceUri" in result[0]["message"]
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_malformed_filter_tags_are_rejected_before_joining(self):
+        api = FakeDevicesApi()
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        result = await join_device_subscriptions(ctx, filter_tags="'city' eq")
+
+        assert result[0]["error"] == "validation_error"
+        assert api.requests == []
@@ -0,0 +1,127 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the columnar table format of list results in devices MCP server.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.getdevicesv1 import getdevicesv1 as _impl_getdevicesv1
+from greenlake_devices_mcp.utils.table_format import VALUE_COLUMN, format_result, to_table
+
+
+def _item(i: int) -> dict:
+    return {
+        "id": f"dev-{i}",
+        "serialNumber": f"SN{i}",
+        "deviceType": "COMPUTE",
+        "location": None,
+        "tags": {},
+        "application": {"id": "app-1", "resourceUri": "/apps/app-1"},
+        "subscription": [{"key": "SUB-1", "tier": None}],
+    }
+
+
+def _response(n: int = 20) -> dict:
+    return {"items": [_item(i) for i in range(n)], "count": n, "total": 500}
+
+
+class TestToTable:
+    """Test cases for the columnar encoding."""
+
+    def test_header_and_rows_keep_item_order(self):
+        table = to_table(_response(3))
+
+        assert table["format"] == "table"
+        assert table["columns"] == ["id", "serialNumber", "deviceType", "application", "subscription"]
+        assert table["rows"][0] == ["dev-0", "SN0", "COMPUTE", "app-1", [{"key": "SUB-1"}]]
+        assert table["count"] == 3
+        assert table["total"] == 500
+        assert "items" not in table
+
+    def test_column_kept_when_only_some_items_have_a_value(self):
+        response = {"items": [{"id": "a", "name": None}, {"id": "b", "name": "second"}]}
+        table = to_table(response)
+
+        assert table["columns"] == ["id", "name"]
+        assert table["rows"] == [["a", None], ["b", "second"]]
+
+    def test_nested_objects_kept_without_abbreviation(self):
+        table = to_table(_response(1), abbreviate_nested=False)
+
+        column = table["columns"].index("application")
+        assert table["rows"][0][column] == {"id": "app-1", "resourceUri": "/apps/app-1"}
+
+    def test_tags_and_objects_without_a_reference_key_are_not_abbreviated(self):
+        response = {
+            "items": [
+                {
+                    "id": "a",
+                    "tags": {"name": "web", "city": "London"},
+                    "owner": {"name": "ops", "email": "ops@example.com"},
+                    "application": {"id": "app-1", "resourceUri": "/apps/app-1"},
+                }
+            ]
+        }
+        table = to_table(response)
+
+        assert table["rows"][0] == [
+            "a",
+            {"name": "web", "city": "London"},
+            {"name": "ops", "email": "ops@example.com"},
+            "app-1",
+        ]
+
+    def test_reports_compression_ratio(self):
+        table = to_table(_response(200))
+        encoding = table["encoding"]
+
+        assert encoding["table_bytes"] < encoding["json_bytes"]
+        assert encoding["compression_ratio"] == round(encoding["json_bytes"] / encoding["table_bytes"], 2)
+        assert encoding["compression_ratio"] > 2
+
+    def test_non_object_items_use_value_column(self):
+        table = to_table({"items": ["a", "b"]})
+
+        assert table["columns"] == [VALUE_COLUMN]
+        assert table["rows"] == [["a"], ["b"]]
+
+    def test_response_without_items_is_unchanged(self):
+        response = {"id": "dev-1"}
+
+        assert to_table(response) is response
+
+    def test_format_result_rejects_unknown_format(self):
+        assert format_result(_response(1), "json") == _response(1)
+        with pytest.raises(ValueError):
+            format_result(_response(1), "csv")
+
+
+class TestListToolTableFormat:
+    """Test cases for format="table" on list tools."""
+
+    @pytest.mark.asyncio
+    async def test_list_tool_returns_table(self):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.http_client = AsyncMock()
+        ctx.request_context.lifespan_context.http_client.get.return_value = _response(5)
+
+        result = await _impl_getdevicesv1(ctx, format="table")
+
+        assert result[0]["success"] is True
+        assert result[0]["result"]["columns"][0] == "id"
+        assert len(result[0]["result"]["rows"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_unknown_format_is_a_validation_error(self):
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.http_client = AsyncMock()
+        ctx.request_context.lifespan_context.http_client.get.return_value = _response(5)
+
+        result = await _impl_getdevicesv1(ctx, format="csv")  # type: ignore[arg-type]
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
@@ -0,0 +1,160 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the cross-process shared token store in devices MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import json
+import os
+import stat
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from greenlake_devices_mcp.auth.oauth2_provider import OAuth2TokenResponse
+from greenlake_devices_mcp.auth.token_manager import TokenManager
+from greenlake_devices_mcp.auth.token_store import SharedTokenStore
+
+ISSUER = "https://sso.example/authorization/v2/oauth2/ws/token"
+
+
+def _token(access_token: str = "fresh-token", expires_in: int | None = 3600) -> OAuth2TokenResponse:
+    return OAuth2TokenResponse(access_token=access_token, expires_in=expires_in)
+
+
+@pytest.fixture
+def store(tmp_path) -> SharedTokenStore:
+    return SharedTokenStore(tmp_path, issuer=ISSUER, client_id="client")
+
+
+def _manager(store: SharedTokenStore, provider: Mock) -> TokenManager:
+    settings = Mock(
+        client_id="client", client_secret="secret", workspace_id="ws", token_issuer=ISSUER, is_testing=False
+    )
+    with patch("greenlake_devices_mcp.auth.token_manager.OAuth2Provider", return_value=provider):
+        return TokenManager(settings=settings, token_store=store)
+
+
+class TestTokenFile:
+    """Test cases for reading and writing the token file."""
+
+    def test_round_trip_with_owner_only_permissions(self, store):
+        token = _token()
+        store.save(token)
+
+        loaded = store.load()
+        assert loaded is not None
+        assert loaded.access_token == "fresh-token"
+        assert loaded.expires_at == pytest.approx(token.expires_at)
+        assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+        assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+
+    def test_token_expiring_within_buffer_is_not_returned(self, store):
+        store.save(_token(expires_in=100))
+        assert store.load() is not None
+        assert store.load(buffer_seconds=300) is None
+
+    def test_tokens_are_keyed_by_issuer_and_client(self, store, tmp_path):
+        store.save(_token())
+        assert SharedTokenStore(tmp_path, issuer=ISSUER, client_id="other").load() is None
+        assert SharedTokenStore(tmp_path, issuer="https://other/token", client_id="client").load() is None
+
+    def test_file_with_widened_permissions_is_ignored(self, store):
+        store.save(_token())
+        os.chmod(store.path, 0o644)
+        assert store.load() is None
+
+    def test_corrupt_file_is_ignored(self, store):
+        store.path.write_text("{not json")
+        os.chmod(store.path, 0o600)
+        assert store.load() is None
+
+    def test_token_without_expiry_is_not_shared(self, store):
+        store.save(_token(expires_in=None))
+        assert not store.path.exists()
+
+    def test_file_records_expiry_metadata(self, store):
+        store.save(_token())
+        data = json.loads(store.path.read_text())
+        assert data["issuer"] == ISSUER
+        assert data["client_id"] == "client"
+        assert data["expires_at"] > data["issued_at"]
+
+
+class TestAcquire:
+    """Test cases for coordinated token acquisition."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_valid_stored_token(self, store):
+        store.save(_token("shared"))
+        fetch = AsyncMock(return_value=_token())
+
+        assert (await store.acquire(fetch)).access_token == "shared"
+        fetch.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_replaces_token_being_renewed(self, store):
+        store.save(_token("old"))
+        fetch = AsyncMock(return_value=_token("new"))
+
+        assert (await store.acquire(fetch, replace="old")).access_token == "new"
+        assert store.load().access_token == "new"
+
+    @pytest.mark.asyncio
+    async def test_only_one_of_concurrent_processes_fetches(self, tmp_path):
+        # Separate stores open separate lock file descriptions, like separate processes
+        stores = [SharedTokenStore(tmp_path, issuer=ISSUER, client_id="client") for _ in range(3)]
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return _token("shared")
+
+        tokens = await asyncio.gather(*(s.acquire(fetch, buffer_seconds=300) for s in stores))
+        assert calls == 1
+        assert {t.access_token for t in tokens} == {"shared"}
+
+    @pytest.mark.asyncio
+    async def test_lock_timeout_fetches_without_sharing(self, tmp_path):
+        store = SharedTokenStore(tmp_path, issuer=ISSUER, client_id="client", lock_timeout=0.05, poll_interval=0.01)
+        fd = os.open(store.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            token = await store.acquire(AsyncMock(return_value=_token("unshared")))
+        finally:
+            os.close(fd)
+
+        assert token.access_token == "unshared"
+        assert store.load() is None
+
+
+class TestTokenManagerSharing:
+    """Test cases for token managers sharing a store."""
+
+    @pytest.mark.asyncio
+    async def test_second_manager_reuses_first_managers_token(self, tmp_path):
+        first = Mock(get_token=AsyncMock(return_value=_token("shared")), aclose=AsyncMock())
+        second = Mock(get_token=AsyncMock(return_value=_token("own")), aclose=AsyncMock())
+
+        await _manager(SharedTokenStore(tmp_path, ISSUER, "client"), first).get_auth_headers()
+        headers = await _manager(SharedTokenStore(tmp_path, ISSUER, "client"), second).get_auth_headers()
+
+        assert headers["Authorization"] == "Bearer shared"
+        second.get_token.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_adopts_token_renewed_by_another_process(self, tmp_path):
+        provider = Mock(get_token=AsyncMock(side_effect=[_token("first"), _token("unused")]), aclose=AsyncMock())
+        manager = _manager(SharedTokenStore(tmp_path, ISSUER, "client"), provider)
+        await manager.get_auth_headers()
+
+        SharedTokenStore(tmp_path, ISSUER, "client").save(_token("renewed-elsewhere"))
+        await manager.refresh_token()
+
+        assert manager.get_raw_token() == "renewed-elsewhere"
+        assert provider.get_token.await_count == 1
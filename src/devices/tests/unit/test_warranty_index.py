@@ -0,0 +1,156 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the warranty end date index and the expiring_warranties tool in devices MCP server.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from greenlake_devices_mcp.tools.implementations.expiring_warranties import expiring_warranties
+from greenlake_devices_mcp.utils.device_inventory import DeviceInventory, compact_device, keeps_path
+from greenlake_devices_mcp.utils.warranty_index import EndDateIndex, SupportEnd, parse_end_date, support_ends
+
+AS_OF = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _millis(days: float) -> int:
+    return int((AS_OF + timedelta(days=days)).timestamp() * 1000)
+
+
+def _device(i: int, days: float | None = None) -> dict[str, Any]:
+    days = i if days is None else days
+    current = {"serviceLevel": "CARE_PACK", "endDate": _millis(days), "startDate": _millis(-365), "serviceLevelRank": 2}
+    return {
+        "id": f"dev-{i:05d}",
+        "serialNumber": f"SN{i:05d}",
+        "deviceType": "COMPUTE",
+        "warranty": {
+            "country": "GB",
+            "currentSupportLevel": current,
+            "supportLevels": [{"serviceLevel": "WARRANTY", "endDate": _millis(days - 180)}, current],
+        },
+    }
+
+
+class FakeDevicesApi:
+    """Devices API paged by item offset over a fixed list."""
+
+    def __init__(self, devices: list[dict[str, Any]]):
+        self.devices = devices
+        self.requests: list[dict[str, Any]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        offset, limit = params["offset"], params["limit"]
+        return {"items": self.devices[offset : offset + limit], "total": len(self.devices)}
+
+
+def _ctx(api: FakeDevicesApi, inventory: DeviceInventory) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    ctx.request_context.lifespan_context.device_inventory = inventory
+    return ctx
+
+
+class TestEndDateIndex:
+    """Test cases for the time-ordered support-level end date index."""
+
+    def test_parse_end_date(self):
+        assert parse_end_date(1767225600000) == parse_end_date(1767225600) == AS_OF.timestamp()
+        assert parse_end_date("2026-01-01T01:00:00+01:00") == AS_OF.timestamp()
+        assert parse_end_date("soon") is None
+        assert parse_end_date(True) is None
+
+    def test_support_ends_flag_the_current_level_once(self):
+        ends = support_ends(compact_device(_device(10)))
+
+        assert [(e.service_level, e.current) for e in ends] == [("WARRANTY", False), ("CARE_PACK", True)]
+        assert ends[1].end_date == "2026-01-11T00:00:00Z"
+
+    def test_compact_warranty_keeps_levels_only(self):
+        record = compact_device(_device(1))
+
+        assert record["warranty"]["currentSupportLevel"] == {"serviceLevel": "CARE_PACK", "endDate": _millis(1)}
+        assert "country" not in record["warranty"]
+        assert keeps_path("warranty/supportLevels/endDate")
+        assert not keeps_path("warranty/country")
+
+    def test_range_scan_after_bulk_build_and_updates(self):
+        index = EndDateIndex(bulk=True)
+        for i in range(10):
+            index.add(f"d{i}", [SupportEnd(float(i * 10), "L", True)])
+        index.build()
+        index.discard("d3")
+        index.add("d3", [SupportEnd(55.0, "L", True), SupportEnd(95.0, "M", False)])
+
+        assert [(i, e.end) for i, e in index.range(20, 60)] == [
+            ("d2", 20.0),
+            ("d4", 40.0),
+            ("d5", 50.0),
+            ("d3", 55.0),
+            ("d6", 60.0),
+        ]
+        assert index.stats()["entries"] == 11
+        assert index.stats()["incremental_updates"] == 2
+
+    def test_inventory_keeps_the_index_in_step_with_changes(self):
+        inventory = DeviceInventory(max_age=60, max_devices=100)
+        inventory.replace([_device(i) for i in range(50)])
+        start = AS_OF.timestamp()
+
+        assert len(inventory.expiring(start, start + 9.5 * 86400)) == 10
+        inventory.upsert(_device(3, days=400))
+        inventory.upsert({**_device(4), "archived": True})
+        inventory.upsert({"id": "dev-99999", "serialNumber": "NEW"})
+
+        assert [i for i, _ in inventory.expiring(start, start + 9.5 * 86400)] == [
+            f"dev-{i:05d}" for i in (0, 1, 2, 5, 6, 7, 8, 9)
+        ]
+        stats = inventory.snapshot()["warranty_index"]
+        assert (stats["entries"], stats["devices"], stats["incremental_updates"]) == (98, 49, 3)
+
+
+class TestExpiringWarrantiesTool:
+    """Test cases for the expiring_warranties tool."""
+
+    @pytest.mark.asyncio
+    async def test_window_is_answered_from_the_snapshot(self):
+        api = FakeDevicesApi([_device(i) for i in range(300)])
+        ctx = _ctx(api, DeviceInventory(max_age=60, max_devices=1000))
+
+        first = (await expiring_warranties(ctx, window=30, as_of="2026-01-01T00:00:00Z", limit=5))[0]["result"]
+        second = (await expiring_warranties(ctx, window=30, as_of="2026-01-01T00:00:00Z", service_level="warranty"))[0][
+            "result"
+        ]
+
+        # CARE_PACK levels of devices 0 to 30, WARRANTY levels (180 days earlier) of devices 180 to 210
+        assert (first["total"], first["devices"], first["scan"]["in_range"]) == (62, 62, 62)
+        assert first["items"][0] == {
+            "id": "dev-00000",
+            "serialNumber": "SN00000",
+            "deviceType": "COMPUTE",
+            "model": None,
+            "serviceLevel": "CARE_PACK",
+            "endDate": "2026-01-01T00:00:00Z",
+            "daysLeft": 0.0,
+            "current": True,
+        }
+        assert first["count"] == 5
+        assert [item["id"] for item in second["items"]] == [f"dev-{i:05d}" for i in range(180, 211)]
+        assert second["inventory"]["warranty_index"]["entries"] == 600
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_inventory_and_bad_as_of_are_validation_errors(self):
+        api = FakeDevicesApi([])
+
+        disabled = await expiring_warranties(_ctx(api, DeviceInventory(max_age=0, max_devices=10)))
+        bad_as_of = await expiring_warranties(_ctx(api, DeviceInventory(max_age=60, max_devices=10)), as_of="later")
+
+        assert [r[0]["error"] for r in (disabled, bad_as_of)] == ["validation_error"] * 2
+        assert api.requests == []
@@ -1,6 +1,7 @@
 # (c) Copyright 2026 Hewlett Packard Enterprise Development LP
 """OAuth2 client credentials provider for reporting API authentication."""
 
+import asyncio
 import time
 
 import httpx
@@ -41,6 +42,7 @@ class OAuth2Provider:
         max_retries: int = 5,
         initial_backoff: float = 1.0,
         max_backoff: float = 60.0,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """Initialize the OAuth2 provider.
 
@@ -52,6 +54,8 @@ class OAuth2Provider:
             max_retries: Maximum number of retry attempts for 429 errors (default: 5)
             initial_backoff: Initial backoff delay in seconds (default: 1.0)
             max_backoff: Maximum backoff delay in seconds (default: 60.0)
+            http_client: Optional AsyncClient to send token requests with; by default a
+                pooled client is created on first use and closed by ``aclose()``
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -60,6 +64,8 @@ class OAuth2Provider:
         self.max_retries = max_retries
         self.initial_backoff = initial_backoff
         self.max_backoff = max_backoff
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
 
         logger.info(
             "OAuth2 provider initialized",
@@ -69,7 +75,14 @@ class OAuth2Provider:
             max_retries=max_retries,
         )
 
-    def _make_token_request(self) -> dict:
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled AsyncClient used for token requests, creating it on first use."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(timeout=30.0)
+            self._owns_http_client = True
+        return self._http_client
+
+    async def _make_token_request(self) -> dict:
         """Make the actual HTTP request for token.
 
         Returns:
@@ -78,30 +91,31 @@ class OAuth2Provider:
         Raises:
             httpx.HTTPStatusError: For all HTTP errors including 429
         """
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(
-                self.token_url,
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded",
-                    "HPE-AI-Origin": "mcp",
-                },
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                },
-            )
-
-            # Raise exception for any non-2xx status code
-            response.raise_for_status()
-
-            return response.json()
-
-    def get_token(self) -> OAuth2TokenResponse:
+        response = await self._get_http_client().post(
+            self.token_url,
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded",
+                "HPE-AI-Origin": "mcp",
+            },
+            data={
+                "grant_type": "client_credentials",
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+            },
+        )
+
+        # Raise exception for any non-2xx status code
+        response.raise_for_status()
+
+        return response.json()  # type: ignore[no-any-return]
+
+    async def get_token(self) -> OAuth2TokenResponse:
         """Get an access token using client credentials flow with exponential backoff for rate limits.
 
         Implements exponential backoff retry logic for 429 (Too Many Requests) responses.
-        Other errors are raised immediately without retry.
+        Other errors are raised immediately without retry. Backoff uses ``asyncio.sleep``,
+        so other tasks keep running while a token is being retried, and cancelling the
+        calling task aborts the request or backoff immediately.
 
         Returns:
             OAuth2 token response with access token and metadata
@@ -120,7 +134,7 @@ class OAuth2Provider:
                         attempt=attempt + 1,
                         backoff_seconds=backoff_delay,
                     )
-                    time.sleep(backoff_delay)
+                    await asyncio.sleep(backoff_delay)
 
                 logger.info(
                     "Requesting access token",
@@ -129,7 +143,7 @@ class OAuth2Provider:
                 )
 
                 # Make the token request
-                token_data = self._make_token_request()
+                token_data = await self._make_token_request()
 
                 # Parse and return successful response
                 scope = token_data.get("scope")
@@ -176,6 +190,12 @@ class OAuth2Provider:
             response=None,  # type: ignore
         )
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client if this provider created it."""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+        self._http_client = None
+
     def validate_token(self, token: str) -> bool:
         """Validate an access token.
 
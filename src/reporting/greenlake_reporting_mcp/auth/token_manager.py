@@ -1,13 +1,24 @@
 # (c) Copyright 2026 Hewlett Packard Enterprise Development LP
 """Token management for reporting API authentication."""
 
+import asyncio
+import random
 import time
 from typing import Any
 
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from ..utils.single_flight import SingleFlight
 from .oauth2_provider import OAuth2Provider, OAuth2TokenResponse
+from .token_store import SharedTokenStore
+
+# Seconds before expiry at which a token is treated as expired (see TokenInfo.is_expired)
+EXPIRY_BUFFER_SECONDS = 300
+
+# Backoff between failed background refresh attempts
+_REFRESH_RETRY_INITIAL = 5.0
+_REFRESH_RETRY_MAX = 120.0
 
 
 class TokenInfo(BaseModel):
@@ -48,15 +59,25 @@ class TokenInfo(BaseModel):
 class TokenManager:
     """Manages authentication tokens for reporting API."""
 
-    def __init__(self, settings: Any | None = None, initial_token: str | None = None) -> None:
+    def __init__(
+        self,
+        settings: Any | None = None,
+        initial_token: str | None = None,
+        token_store: SharedTokenStore | None = None,
+    ) -> None:
         """Initialize the token manager.
 
         Args:
             settings: Application settings for OAuth2 configuration
             initial_token: Optional initial JWT token
+            token_store: Optional cross-process token cache shared with other server processes
         """
         self._token_info: TokenInfo | None = None
         self._oauth2_provider: OAuth2Provider | None = None
+        self._token_store = token_store
+        # Concurrent callers on a missing or expiring token share one token request
+        self._token_flight = SingleFlight()
+        self._refresh_task: asyncio.Task[None] | None = None
 
         # Set up OAuth2 provider if settings are provided
         if settings:
@@ -80,14 +101,15 @@ class TokenManager:
                 "Token manager initialized with lazy token generation", has_oauth2=self._oauth2_provider is not None
             )
 
-    def _set_token(self, token: str, expires_at: float | None = None) -> None:
+    def _set_token(self, token: str, expires_at: float | None = None, created_at: float | None = None) -> None:
         """Set a new token.
 
         Args:
             token: The JWT token to set
             expires_at: Optional expiration timestamp
+            created_at: Optional issue timestamp (defaults to now)
         """
-        self._token_info = TokenInfo(token=token, expires_at=expires_at)
+        self._token_info = TokenInfo(token=token, expires_at=expires_at, created_at=created_at or time.time())
         logger.info("Token updated", has_expiry=self._token_info.expires_at is not None)
 
     def _set_token_from_oauth2_response(self, response: OAuth2TokenResponse) -> None:
@@ -97,39 +119,53 @@ class TokenManager:
             response: OAuth2 token response
         """
         expires_at = response.expires_at_timestamp()
-        self._set_token(response.access_token, expires_at)
+        self._set_token(response.access_token, expires_at, created_at=response.issued_at)
 
-    def _generate_new_token(self) -> None:
+    async def _generate_new_token(self) -> None:
         """Generate a new token using OAuth2 provider.
 
+        Concurrent calls are coalesced: while a token request is in flight, further
+        callers wait for it instead of sending their own.
+
         Raises:
             RuntimeError: If OAuth2 provider is not configured or token generation fails
         """
         if not self._oauth2_provider:
             raise RuntimeError("OAuth2 provider not configured for token generation")
 
+        provider = self._oauth2_provider
+        await self._token_flight.do("token", lambda: self._request_token(provider))
+
+    async def _request_token(self, provider: OAuth2Provider) -> None:
+        """Request a token from the OAuth2 provider (or the shared token store) and store it."""
         try:
-            response = self._oauth2_provider.get_token()
+            if self._token_store is not None:
+                current = self._token_info.token if self._token_info else None
+                response = await self._token_store.acquire(
+                    provider.get_token, replace=current, buffer_seconds=EXPIRY_BUFFER_SECONDS
+                )
+            else:
+                response = await provider.get_token()
             self._set_token_from_oauth2_response(response)
             logger.info("New token generated successfully")
         except Exception as e:
             logger.error("Failed to generate new token", error=str(e))
             raise
 
-    def _ensure_valid_token(self) -> None:
+    async def _ensure_valid_token(self) -> None:
         """Ensure we have a valid token, generating/refreshing if necessary.
 
         Raises:
             RuntimeError: If no valid token can be obtained
         """
-        if not self._token_info or self._token_info.is_expired():
+        if not self._token_info or self._token_info.is_expired(EXPIRY_BUFFER_SECONDS):
             if self._oauth2_provider:
                 logger.info("Token expired or missing, generating new token")
-                self._generate_new_token()
+                await self._generate_new_token()
             else:
                 raise RuntimeError("Token expired and no OAuth2 provider configured for renewal")
 
-    def get_auth_headers(self) -> dict[str, str]:
+    async def get_auth_headers(self) -> dict[str, str]:
         """Get authentication headers for API requests.
 
         This method implements lazy token initialization:
@@ -147,7 +183,7 @@ class TokenManager:
             RuntimeError: If no valid token is available
         """
         # Ensure we have a valid token before returning headers
-        self._ensure_valid_token()
+        await self._ensure_valid_token()
 
         if not self._token_info:
             raise RuntimeError("No token available")
@@ -166,7 +202,7 @@ class TokenManager:
         logger.info("Manually updating token")
         self._set_token(new_token)
 
-    def refresh_token(self) -> None:
+    async def refresh_token(self) -> None:
         """Refresh the current token using OAuth2 provider.
 
         Raises:
@@ -176,7 +212,7 @@ class TokenManager:
             raise RuntimeError("OAuth2 provider not configured for token refresh")
 
         logger.info("Manually refreshing token")
-        self._generate_new_token()
+        await self._generate_new_token()
 
     def is_token_valid(self) -> bool:
         """Check if the current token is valid.
@@ -194,6 +230,78 @@ class TokenManager:
         """
         return self._token_info
 
+    def start_background_refresh(self, refresh_fraction: float = 0.8, jitter: float = 0.1) -> None:
+        """Start a task that renews the token before request paths see it expire.
+
+        The token is fetched immediately if none is cached, then renewed once
+        ``refresh_fraction`` of its lifetime has passed (spread by +/- ``jitter`` of
+        that point so several servers do not refresh in lockstep), and always before
+        the expiry buffer that would make a request refresh it inline. Failed
+        refreshes are retried with backoff; the request path still refreshes lazily
+        if the background task has not succeeded in time.
+
+        Does nothing without an OAuth2 provider or if the task is already running.
+
+        Args:
+            refresh_fraction: Fraction of the token lifetime after which to refresh (0-1]
+            jitter: Relative random spread applied to the refresh point [0-1)
+        """
+        if not self._oauth2_provider or (self._refresh_task and not self._refresh_task.done()):
+            return
+        self._refresh_task = asyncio.create_task(self._refresh_loop(refresh_fraction, jitter))
+        logger.info("Background token refresh started", refresh_fraction=refresh_fraction, jitter=jitter)
+
+    async def stop_background_refresh(self) -> None:
+        """Cancel the background refresh task and wait for it to finish."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _seconds_until_refresh(self, refresh_fraction: float, jitter: float) -> float | None:
+        """Return how long to wait before the next background refresh (None = never)."""
+        if self._token_info is None:
+            return 0.0
+        expires_at = self._token_info.expires_at
+        if expires_at is None:
+            return None
+        lifetime = expires_at - self._token_info.created_at
+        spread = 1 + random.uniform(-jitter, jitter)
+        refresh_at = self._token_info.created_at + lifetime * refresh_fraction * spread
+        if lifetime > EXPIRY_BUFFER_SECONDS:
+            refresh_at = min(refresh_at, expires_at - EXPIRY_BUFFER_SECONDS)
+        return max(0.0, refresh_at - time.time())
+
+    async def _refresh_loop(self, refresh_fraction: float, jitter: float) -> None:
+        """Renew the token ahead of expiry until cancelled."""
+        failures = 0
+        while True:
+            delay = self._seconds_until_refresh(refresh_fraction, jitter)
+            if delay is None:
+                logger.info("Token has no expiry, background refresh stopped")
+                return
+            if failures:
+                delay = min(_REFRESH_RETRY_INITIAL * 2 ** (failures - 1), _REFRESH_RETRY_MAX)
+            await asyncio.sleep(delay)
+            try:
+                await self._generate_new_token()
+                failures = 0
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures += 1
+                logger.warning("Background token refresh failed, will retry", error=str(e), failures=failures)
+
+    async def aclose(self) -> None:
+        """Stop background refresh and release the OAuth2 provider's HTTP connections."""
+        await self.stop_background_refresh()
+        if self._oauth2_provider:
+            await self._oauth2_provider.aclose()
+
     def get_raw_token(self) -> str | None:
         """Get the raw token string.
 
@@ -6,33 +6,20 @@ Implements: GET /reporting/v1/statuses
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_reporting_mcp.config.logging import get_logger
 from greenlake_reporting_mcp.server.fastmcp_instance import mcp
+from greenlake_reporting_mcp.utils.odata_filter import normalize_filter
+from greenlake_reporting_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages, resolve_max_items
+from greenlake_reporting_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
-
-
 @mcp.tool(
     name="getreportingstatuses",
     description="This API is designed to fetch the status of all reports for a specific workspace. Only reports belonging to the workspace ID and username are returned. This API supports pagination, allowing you to use offset and limit parameters.\n",
@@ -59,6 +46,30 @@ async def getreportingstatuses(  # noqa: E501
         int | str | None,
         Field(description="Zero-based resource offset to start the response from.\n\nExample: 20"),
     ] = None,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Fetch every page starting at offset (several pages at a time) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with pages fetched, elapsed time and whether it was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """This API is designed to fetch the status of all reports for a specific workspace. Only reports belonging to the workspace ID and username are returned. This API supports pagination, allowing you to use offset and limit parameters.\n
 
@@ -67,6 +78,10 @@ async def getreportingstatuses(  # noqa: E501
         sort: The order in which to return the resources in the collection.The value of the sort query parameter is a comma separated list of sort expressions. Each sort expression is a property name optionally followed by a direction indicator asc (ascending) or desc (descending).The first sort expression in the list defines the primary sort order, the second defines the secondary sort order, and so on. If a direction indicator is omitted the default direction is ascending.\n\nExamples:\n  - name,createdAt desc\n    Order resources ascending by name and then by descending by createdAt\n  - name asc\n    Order ascending by name
         limit: The maximum number of reports to return.\n\nExample: 50
         offset: Zero-based resource offset to start the response from.\n\nExample: 20
+        fetch_all: Fetch every page starting at offset and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -77,8 +92,6 @@ async def getreportingstatuses(  # noqa: E501
 
     # Collect query / body parameters; skip values that were not provided
     params: dict[str, Any] = {}
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
     if sort is not None and sort is not ...:
         params["sort"] = sort
     if limit is not None and limit is not ...:
@@ -95,7 +108,23 @@ async def getreportingstatuses(  # noqa: E501
             raise ValueError("'offset' must be an integer") from exc
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, quote='"')
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_pages(
+                http_client,
+                url,
+                params,
+                page_size=params.get("limit", 10),
+                max_items=resolve_max_items(max_items),
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
@@ -46,8 +46,9 @@ def get_tool_classes(mode: str | None = None) -> list:
             # register the function with the FastMCP instance.
             import greenlake_reporting_mcp.tools.implementations.getreportingstatusbyid  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_reporting_mcp.tools.implementations.getreportingstatuses  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_reporting_mcp.tools.implementations.read_result  # noqa: F401 (triggers @mcp.tool registration)
 
-            logger.info("Static mode: 2 endpoint tools registered")
+            logger.info("Static mode: 2 endpoint tools and read_result registered")
     except ImportError as exc:
         logger.error(f"Failed to import tool module: {exc}")
 
@@ -0,0 +1,553 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Response cache for reporting MCP server HTTP requests.
+
+Caches decoded GET responses for endpoints whose data changes rarely. Which
+endpoints are cached, and for how long, is decided by the HTTP client from the
+per-endpoint TTLs in settings; this module only stores entries and enforces the
+entry-count and byte-size bounds.
+
+``ResponseCache`` is the extension point: the HTTP client talks to any backend
+implementing it. ``MemoryResponseCache`` is the default in-process LRU backend;
+``SqliteResponseCache`` persists entries on disk so they survive restarts and
+are shared by every server process pointing at the same cache directory.
+
+Entries that carry an ``ETag`` or ``Last-Modified`` validator are kept after they
+expire so the client can revalidate them with a conditional GET; a ``304 Not
+Modified`` then refreshes the entry without downloading or decoding the body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+@dataclass
+class CacheEntry:
+    """A cached response."""
+
+    value: Any
+    family: str
+    size: int
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+    etag: str | None = None
+    last_modified: str | None = None
+    decode_seconds: float = 0.0
+
+    @property
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+
+@dataclass
+class CacheStats:
+    """Counters for a response cache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    hits_by_endpoint: dict[str, int] = field(default_factory=dict)
+    misses_by_endpoint: dict[str, int] = field(default_factory=dict)
+
+    def record_lookup(self, family: str, hit: bool) -> None:
+        """Count a lookup for ``family``."""
+        if hit:
+            self.hits += 1
+            self.hits_by_endpoint[family] = self.hits_by_endpoint.get(family, 0) + 1
+        else:
+            self.misses += 1
+            self.misses_by_endpoint[family] = self.misses_by_endpoint.get(family, 0) + 1
+
+
+@dataclass
+class EndpointRevalidationCounters:
+    """Conditional request counters for a single endpoint family."""
+
+    requests: int = 0
+    not_modified: int = 0
+    bytes_saved: int = 0
+    decode_seconds_saved: float = 0.0
+
+
+class RevalidationStats:
+    """Per-endpoint conditional GET counters.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._counters: dict[str, EndpointRevalidationCounters] = {}
+
+    def record(self, endpoint: str, entry: CacheEntry, not_modified: bool) -> None:
+        """Count a conditional request; a ``304`` saves the entry's body size and decode time."""
+        counters = self._counters.get(endpoint)
+        if counters is None:
+            counters = self._counters[endpoint] = EndpointRevalidationCounters()
+        counters.requests += 1
+        if not_modified:
+            counters.not_modified += 1
+            counters.bytes_saved += entry.size
+            counters.decode_seconds_saved += entry.decode_seconds
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of all counters keyed by endpoint family."""
+        return {endpoint: asdict(counters) for endpoint, counters in self._counters.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self._counters.clear()
+
+
+class ResponseCache(ABC):
+    """Interface for response cache backends used by the HTTP client."""
+
+    @abstractmethod
+    def get(self, key: Hashable, family: str) -> CacheEntry | None:
+        """
+        Look up a fresh entry.
+
+        Args:
+            key: Request key (see ``single_flight.request_key``)
+            family: Endpoint family, for per-endpoint statistics
+
+        Returns:
+            The cached entry, or None on a miss or if the entry has expired
+        """
+
+    @abstractmethod
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        family: str,
+        size: int,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        """
+        Store a response.
+
+        Entries without validators are only stored when ``ttl`` is positive; entries
+        with validators are stored even with a zero TTL so they can be revalidated.
+
+        Args:
+            key: Request key
+            value: Decoded response body
+            family: Endpoint family the response belongs to
+            size: Size of the raw response body in bytes
+            ttl: Time to live in seconds
+            etag: ``ETag`` response header, if any
+            last_modified: ``Last-Modified`` response header, if any
+            decode_seconds: Time spent decoding the body, reported as saved by a ``304``
+        """
+
+    @abstractmethod
+    def get_stale(self, key: Hashable) -> CacheEntry | None:
+        """
+        Look up an entry that can be revalidated, fresh or expired.
+
+        Does not count as a lookup in the statistics.
+
+        Args:
+            key: Request key
+
+        Returns:
+            The cached entry if it has validators, otherwise None
+        """
+
+    @abstractmethod
+    def refresh(self, key: Hashable, ttl: float) -> None:
+        """
+        Mark an entry fresh again after the server confirmed it is unchanged.
+
+        Args:
+            key: Request key
+            ttl: New time to live in seconds
+        """
+
+    @abstractmethod
+    def invalidate(self, family_prefix: str | None = None) -> int:
+        """
+        Drop cached entries.
+
+        Args:
+            family_prefix: Only drop entries whose endpoint family starts with this
+                prefix; ``None`` drops everything
+
+        Returns:
+            Number of entries removed
+        """
+
+    @abstractmethod
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache bounded by entry count and total body size."""
+
+    def __init__(self, max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies in bytes
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self.stats = CacheStats()
+
+    def get(self, key: Hashable, family: str) -> CacheEntry | None:
+        """Look up a fresh entry and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            if not entry.has_validators:
+                self._remove(key)
+                self.stats.expirations += 1
+            entry = None
+
+        self.stats.record_lookup(family, entry is not None)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        family: str,
+        size: int,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        """Store a response, evicting least recently used entries to stay within bounds."""
+        if (ttl <= 0 and not (etag or last_modified)) or size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(
+            value=value,
+            family=family,
+            size=size,
+            expires_at=time.monotonic() + max(ttl, 0.0),
+            etag=etag,
+            last_modified=last_modified,
+            decode_seconds=decode_seconds,
+        )
+        self._bytes += size
+        self.stats.stores += 1
+
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+        self._sync_size()
+
+    def get_stale(self, key: Hashable) -> CacheEntry | None:
+        """Return the entry for ``key`` if it has validators, regardless of expiry."""
+        entry = self._entries.get(key)
+        return entry if entry is not None and entry.has_validators else None
+
+    def refresh(self, key: Hashable, ttl: float) -> None:
+        """Extend the expiry of an entry and mark it most recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.monotonic() + max(ttl, 0.0)
+            self._entries.move_to_end(key)
+
+    def invalidate(self, family_prefix: str | None = None) -> int:
+        """Drop all entries, or those whose endpoint family starts with ``family_prefix``."""
+        if family_prefix is None:
+            keys = list(self._entries)
+        else:
+            keys = [k for k, e in self._entries.items() if e.family.startswith(family_prefix)]
+        for key in keys:
+            self._remove(key)
+        self.stats.invalidations += len(keys)
+        self._sync_size()
+        return len(keys)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics including current size."""
+        self._sync_size()
+        return asdict(self.stats)
+
+    def close(self) -> None:
+        """Nothing to release: the entries live in process memory and go with the cache."""
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def _sync_size(self) -> None:
+        self.stats.entries = len(self._entries)
+        self.stats.bytes = self._bytes
+
+
+class SqliteResponseCache(ResponseCache):
+    """
+    Persistent cache stored in a SQLite database.
+
+    The database runs in WAL mode, so several server processes can read and write
+    it concurrently; writers wait up to ``busy_timeout`` seconds for each other.
+    Expiry uses wall-clock time because entries outlive the process that stored
+    them. Least recently used entries are evicted once the entry-count or
+    byte-size bound is exceeded. Storage errors are logged and treated as misses:
+    the cache must never fail a request.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file; its directory is created with owner-only permissions
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached response bodies in bytes
+            busy_timeout: Seconds to wait for a lock held by another process
+        """
+        self.path = Path(path).expanduser()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=busy_timeout, isolation_level=None)
+        os.chmod(self.path, 0o600)  # cached responses contain workspace data
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        with self._transaction():
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    family TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    stored_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    decode_seconds REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS responses_family ON responses (family)")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # BEGIN IMMEDIATE takes the write lock up front so concurrent writers queue
+        # on busy_timeout instead of failing halfway through a read-modify-write.
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    @staticmethod
+    def _digest(key: Hashable) -> str:
+        return hashlib.sha256(json.dumps(key, separators=(",", ":")).encode()).hexdigest()
+
+    def get(self, key: Hashable, family: str) -> CacheEntry | None:
+        """Look up a fresh entry and record the access for LRU eviction."""
+        entry = None
+        try:
+            stored = self._load(key)
+            if stored is not None and stored.expires_at <= time.monotonic():
+                if not stored.has_validators:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (self._digest(key),))
+                    self.stats.expirations += 1
+            else:
+                entry = stored
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+
+        self.stats.record_lookup(family, entry is not None)
+        return entry
+
+    def get_stale(self, key: Hashable) -> CacheEntry | None:
+        """Return the entry for ``key`` if it has validators, regardless of expiry."""
+        try:
+            entry = self._load(key)
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Response cache lookup failed: {e}")
+            return None
+        return entry if entry is not None and entry.has_validators else None
+
+    def _load(self, key: Hashable) -> CacheEntry | None:
+        digest = self._digest(key)
+        row = self._conn.execute(
+            "SELECT value, family, size, expires_at, stored_at, etag, last_modified, decode_seconds "
+            "FROM responses WHERE key = ?",
+            (digest,),
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        self._conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, digest))
+        return CacheEntry(
+            value=json.loads(row[0]),
+            family=row[1],
+            size=row[2],
+            expires_at=time.monotonic() + (row[3] - now),
+            stored_at=row[4],
+            etag=row[5],
+            last_modified=row[6],
+            decode_seconds=row[7],
+        )
+
+    def refresh(self, key: Hashable, ttl: float) -> None:
+        """Extend the expiry of an entry."""
+        try:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?", (time.time() + max(ttl, 0.0), self._digest(key))
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache refresh failed: {e}")
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        family: str,
+        size: int,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        decode_seconds: float = 0.0,
+    ) -> None:
+        """Store a response, evicting least recently used entries to stay within bounds."""
+        if ttl <= 0 and not (etag or last_modified):
+            return
+        try:
+            payload = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        size = max(size, len(payload))
+        if size > self.max_bytes:
+            return
+
+        now = time.time()
+        try:
+            with self._transaction():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self._digest(key),
+                        family,
+                        payload,
+                        size,
+                        now + max(ttl, 0.0),
+                        now,
+                        now,
+                        etag,
+                        last_modified,
+                        decode_seconds,
+                    ),
+                )
+                self.stats.stores += 1
+                self._evict()
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache store failed: {e}")
+
+    def _evict(self) -> None:
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        # Expired entries that cannot be revalidated go first, then the least recently used ones
+        expired = self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ? AND etag IS NULL AND last_modified IS NULL", (time.time(),)
+        ).rowcount
+        self.stats.expirations += expired
+        count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        victims = []
+        for digest, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            victims.append((digest,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.stats.evictions += len(victims)
+
+    def invalidate(self, family_prefix: str | None = None) -> int:
+        """Drop all entries, or those whose endpoint family starts with ``family_prefix``."""
+        try:
+            if family_prefix is None:
+                removed = self._conn.execute("DELETE FROM responses").rowcount
+            else:
+                removed = self._conn.execute(
+                    "DELETE FROM responses WHERE substr(family, 1, ?) = ?", (len(family_prefix), family_prefix)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache invalidation failed: {e}")
+            return 0
+        self.stats.invalidations += removed
+        return removed  # type: ignore[no-any-return]
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return cache statistics; entry count and size cover every process sharing the database."""
+        try:
+            count, total = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+            self.stats.entries = count
+            self.stats.bytes = total
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache size query failed: {e}")
+        return asdict(self.stats)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
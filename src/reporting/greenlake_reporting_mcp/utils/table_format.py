@@ -0,0 +1,126 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Columnar ("table") encoding of list results for reporting MCP server tools.
+
+List responses repeat every key (``type``, ``status``, ``createdAt``,
+...) in each of up to thousands of items. With ``format="table"`` a list tool
+returns the item keys once as ``columns`` and each item as a row of values in
+that column order instead. Null and empty values are dropped before the columns
+are chosen, so a field that is empty in every item gets no column, and nested
+resource references (objects with an ``id`` or ``resourceUri``) can be
+abbreviated to their ``id`` or ``name``. ``tags`` maps are kept as they are:
+their keys are chosen by users and may well be ``id`` or ``name``.
+
+The encoded result reports its size against the compact JSON encoding of the
+original response so the saving is visible per call.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+# Accepted values of the list tools' ``format`` parameter
+FORMATS = ("json", "table")
+
+# Column used for list items that are not objects
+VALUE_COLUMN = "value"
+
+# Keys that identify a nested object well enough to replace it, in order of preference
+_ABBREVIATION_KEYS = ("id", "name", "resourceUri")
+
+# Keys that make a nested object a resource reference
+_REFERENCE_KEYS = ("id", "resourceUri")
+
+# Properties holding user-defined maps, kept without compaction
+_VERBATIM_KEYS = frozenset({"tags"})
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _compact(value: Any, abbreviate_nested: bool, nested: bool = False) -> Any:
+    """Drop null/empty members recursively and optionally abbreviate nested resource references."""
+    if isinstance(value, dict):
+        if nested and abbreviate_nested and any(not _is_empty(value.get(key)) for key in _REFERENCE_KEYS):
+            for key in _ABBREVIATION_KEYS:
+                if not _is_empty(value.get(key)):
+                    return value[key]
+        compacted = {
+            k: v if k in _VERBATIM_KEYS else _compact(v, abbreviate_nested, nested=True) for k, v in value.items()
+        }
+        return {k: v for k, v in compacted.items() if not _is_empty(v)}
+    if isinstance(value, list):
+        compacted_items = [_compact(v, abbreviate_nested, nested=True) for v in value]
+        return [v for v in compacted_items if not _is_empty(v)]
+    return value
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+def to_table(response: dict[str, Any], abbreviate_nested: bool = True) -> dict[str, Any]:
+    """
+    Encode a list response's ``items`` as columns plus value rows.
+
+    Keys other than ``items`` (``count``, ``total``, ``pagination``, ...) are kept
+    as they are. Responses without an ``items`` list are returned unchanged.
+
+    Args:
+        response: Decoded list response
+        abbreviate_nested: Replace nested resource references by their ``id``,
+            ``name`` or ``resourceUri``; ``tags`` maps are never abbreviated
+
+    Returns:
+        The response with ``items`` replaced by ``columns`` and ``rows``, and an
+        ``encoding`` entry with byte counts, compression ratio and encode time
+    """
+    items = response.get("items")
+    if not isinstance(items, list):
+        return response
+
+    started = time.perf_counter()
+    records = [_compact(item, abbreviate_nested) if isinstance(item, dict) else {VALUE_COLUMN: item} for item in items]
+    columns: dict[str, None] = {}
+    for record in records:
+        columns.update(dict.fromkeys(record))
+    column_names = list(columns)
+    rows = [[record.get(name) for name in column_names] for record in records]
+
+    table: dict[str, Any] = {k: v for k, v in response.items() if k != "items"}
+    table.update({"format": "table", "columns": column_names, "rows": rows})
+    encode_seconds = time.perf_counter() - started
+
+    json_bytes = _json_size(response)
+    table_bytes = _json_size(table)
+    table["encoding"] = {
+        "json_bytes": json_bytes,
+        "table_bytes": table_bytes,
+        "compression_ratio": round(json_bytes / table_bytes, 2) if table_bytes else None,
+        "encode_seconds": round(encode_seconds, 4),
+    }
+    return table
+
+
+def format_result(response: dict[str, Any], output_format: str) -> dict[str, Any]:
+    """
+    Apply a list tool's ``format`` parameter to its response.
+
+    Args:
+        response: Decoded list response
+        output_format: ``"json"`` to return the response as is, ``"table"`` for ``to_table``
+
+    Returns:
+        The response in the requested format
+
+    Raises:
+        ValueError: If ``output_format`` is not one of ``FORMATS``
+    """
+    if output_format == "json":
+        return response
+    if output_format == "table":
+        return to_table(response)
+    raise ValueError(f"'format' must be one of: {', '.join(FORMATS)}")
@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Iterator
+from typing import get_origin
 from unittest.mock import AsyncMock
 
 import pytest
@@ -14,9 +15,19 @@ from greenlake_reporting_mcp.utils.http_client import ReportingHttpClient
 from tests.shared.http import make_json_response
 
 
-def _value_for_field(field_name: str, alias: str) -> str:
+def _value_for_field(field_name: str, alias: str, annotation: object = None) -> str:
     lowered = alias.lower()
 
+    if annotation is bool:
+        return "false"
+    if "rate_limit" in lowered:
+        return "{}" if get_origin(annotation) is dict else "0"  # client-side pacing off unless a test opts in
+    if "fraction" in lowered or "jitter" in lowered:
+        return "0.5"
+    if annotation in (int, float):
+        return "2"
+    if get_origin(annotation) is dict:
+        return "{}"
     if "url" in lowered or "endpoint" in lowered:
         return "https://api.example.test"
     if "secret" in lowered or "token" in lowered:
@@ -49,7 +60,7 @@ def configure_env(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatc
         return
     for field_name, field in Settings.model_fields.items():
         alias = field.alias or field_name.upper()
-        monkeypatch.setenv(alias, _value_for_field(field_name, alias))
+        monkeypatch.setenv(alias, _value_for_field(field_name, alias, field.annotation))
 
 
 @pytest.fixture(autouse=True)
@@ -5,8 +5,9 @@ Tests for authentication components in reporting MCP server.
 This file contains tests for OAuth2 provider and token manager.
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 import time
 import httpx
 
@@ -101,17 +102,17 @@ class TestOAuth2Provider:
         assert "reporting" in oauth2_provider.token_url
         assert oauth2_provider.workspace_id == "test-workspace-id"
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    def test_get_token_success(self, mock_client_class, mock_token_response):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    async def test_get_token_success(self, mock_client_class, mock_token_response):
         """Test successful token acquisition for reporting."""
         # Setup mock client instance and response
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = mock_token_response
         mock_client_instance.post.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         # Create provider
@@ -123,7 +124,7 @@ class TestOAuth2Provider:
         )
 
         # Get token
-        token = oauth2_provider.get_token()
+        token = await oauth2_provider.get_token()
 
         # Verify token response
         assert isinstance(token, OAuth2TokenResponse)
@@ -132,7 +133,7 @@ class TestOAuth2Provider:
         assert token.expires_in == 3600
         assert token.scope == "read write"
 
-        # Verify httpx.Client was called correctly
+        # Verify httpx.AsyncClient was called correctly
         mock_client_class.assert_called_once_with(timeout=30.0)
         mock_client_instance.post.assert_called_once_with(
             "https://reporting.example.com/oauth2/token",
@@ -144,11 +145,12 @@ class TestOAuth2Provider:
             },
         )
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    def test_get_token_failure(self, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    async def test_get_token_failure(self, mock_client_class):
         """Test failed token acquisition for reporting."""
         # Setup mock client to return error response
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response = Mock()
         mock_response.status_code = 400
         mock_response.text = "Bad Request: Invalid client credentials"
@@ -156,8 +158,7 @@ class TestOAuth2Provider:
             side_effect=Exception("Token request failed: HTTP 400: Bad Request: Invalid client credentials")
         )
         mock_client_instance.post.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -169,7 +170,7 @@ class TestOAuth2Provider:
 
         # Expect exception when getting token
         with pytest.raises(Exception) as exc_info:
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         assert "Token request failed" in str(exc_info.value)
         assert "HTTP 400" in str(exc_info.value)
@@ -215,14 +216,14 @@ class TestOAuth2Provider:
         # Test whitespace-only token
         assert oauth2_provider.validate_token("   ") is False
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    def test_get_token_http_exception(self, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    async def test_get_token_http_exception(self, mock_client_class):
         """Test handling of HTTP client exceptions during token acquisition."""
         # Setup mock client to raise an exception
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_client_instance.post.side_effect = Exception("Network error")
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -234,16 +235,17 @@ class TestOAuth2Provider:
 
         # Expect exception when getting token
         with pytest.raises(Exception) as exc_info:
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         assert "Network error" in str(exc_info.value)
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.time.sleep")
-    def test_get_token_retries_on_429(self, mock_sleep, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.asyncio.sleep", new_callable=AsyncMock)
+    async def test_get_token_retries_on_429(self, mock_sleep, mock_client_class):
         """Test that get_token retries on 429 rate limit errors."""
         # Setup mock client to return 429 twice, then succeed
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
 
         # Create mock 429 responses that will raise HTTPStatusError
         mock_response_429 = Mock()
@@ -267,8 +269,7 @@ class TestOAuth2Provider:
             mock_response_429,
             mock_response_success,
         ]
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -280,7 +281,7 @@ class TestOAuth2Provider:
         )
 
         # Should succeed after retries
-        token = oauth2_provider.get_token()
+        token = await oauth2_provider.get_token()
 
         assert token.access_token == "test-token-after-retry"
         assert mock_client_instance.post.call_count == 3
@@ -290,12 +291,13 @@ class TestOAuth2Provider:
         mock_sleep.assert_any_call(1.0)
         mock_sleep.assert_any_call(2.0)
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.time.sleep")
-    def test_get_token_exhausts_retries_on_persistent_429(self, mock_sleep, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.asyncio.sleep", new_callable=AsyncMock)
+    async def test_get_token_exhausts_retries_on_persistent_429(self, mock_sleep, mock_client_class):
         """Test that get_token fails after exhausting retries on persistent 429 errors."""
         # Setup mock client to always return 429
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response_429 = Mock()
         mock_response_429.status_code = 429
         mock_response_429.text = "Too Many Requests"
@@ -304,8 +306,7 @@ class TestOAuth2Provider:
         )
 
         mock_client_instance.post.return_value = mock_response_429
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -318,7 +319,7 @@ class TestOAuth2Provider:
 
         # Should raise after exhausting retries
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         assert exc_info.value.response.status_code == 429
         # Should try: initial + 3 retries = 4 attempts
@@ -326,12 +327,13 @@ class TestOAuth2Provider:
         # Should sleep 3 times (after each of the first 3 attempts)
         assert mock_sleep.call_count == 3
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.time.sleep")
-    def test_get_token_exponential_backoff_calculation(self, mock_sleep, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.asyncio.sleep", new_callable=AsyncMock)
+    async def test_get_token_exponential_backoff_calculation(self, mock_sleep, mock_client_class):
         """Test that exponential backoff is calculated correctly."""
         # Setup mock client to return 429 repeatedly
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response_429 = Mock()
         mock_response_429.status_code = 429
         mock_response_429.text = "Too Many Requests"
@@ -340,8 +342,7 @@ class TestOAuth2Provider:
         )
 
         mock_client_instance.post.return_value = mock_response_429
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -355,19 +356,20 @@ class TestOAuth2Provider:
 
         # Should raise after exhausting retries
         with pytest.raises(httpx.HTTPStatusError):
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         # Verify exponential backoff: 1s, 2s, 4s, 8s, 16s
         expected_delays = [1.0, 2.0, 4.0, 8.0, 16.0]
         actual_calls = [call[0][0] for call in mock_sleep.call_args_list]
         assert actual_calls == expected_delays
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.time.sleep")
-    def test_get_token_respects_max_backoff(self, mock_sleep, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.asyncio.sleep", new_callable=AsyncMock)
+    async def test_get_token_respects_max_backoff(self, mock_sleep, mock_client_class):
         """Test that backoff delay respects max_backoff limit."""
         # Setup mock client to return 429 repeatedly
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response_429 = Mock()
         mock_response_429.status_code = 429
         mock_response_429.text = "Too Many Requests"
@@ -376,8 +378,7 @@ class TestOAuth2Provider:
         )
 
         mock_client_instance.post.return_value = mock_response_429
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -391,27 +392,27 @@ class TestOAuth2Provider:
 
         # Should raise after exhausting retries
         with pytest.raises(httpx.HTTPStatusError):
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         # Verify backoff respects max: 1s, 2s, 4s, 5s (capped), 5s (capped)
         expected_delays = [1.0, 2.0, 4.0, 5.0, 5.0]
         actual_calls = [call[0][0] for call in mock_sleep.call_args_list]
         assert actual_calls == expected_delays
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.time.sleep")
-    def test_get_token_no_retry_on_non_429_errors(self, mock_sleep, mock_client_class):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.asyncio.sleep", new_callable=AsyncMock)
+    async def test_get_token_no_retry_on_non_429_errors(self, mock_sleep, mock_client_class):
         """Test that non-429 errors are not retried."""
         # Setup mock client to return 401 (Unauthorized)
-        mock_client_instance = Mock()
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response_401 = Mock()
         mock_response_401.status_code = 401
         mock_response_401.text = "Unauthorized"
         mock_response_401.raise_for_status = Mock(side_effect=Exception("HTTP 401: Unauthorized"))
 
         mock_client_instance.post.return_value = mock_response_401
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         oauth2_provider = OAuth2Provider(
@@ -423,7 +424,7 @@ class TestOAuth2Provider:
 
         # Should fail immediately without retries
         with pytest.raises(Exception) as exc_info:
-            oauth2_provider.get_token()
+            await oauth2_provider.get_token()
 
         assert "401" in str(exc_info.value)
         # Should only try once (no retries for non-429)
@@ -460,6 +461,80 @@ class TestOAuth2Provider:
         assert abs(oauth2_provider.initial_backoff - 1.0) < 0.001
         assert abs(oauth2_provider.max_backoff - 60.0) < 0.001
 
+    @pytest.mark.asyncio
+    async def test_get_token_backoff_does_not_block_event_loop(self):
+        """Test that other tasks keep running while the provider backs off after a 429."""
+        rate_limited = httpx.Response(429, request=httpx.Request("POST", "https://reporting.example.com/oauth2/token"))
+        success = httpx.Response(
+            200,
+            json={"access_token": "async-token", "expires_in": 3600},
+            request=httpx.Request("POST", "https://reporting.example.com/oauth2/token"),
+        )
+        http_client = Mock(post=AsyncMock(side_effect=[rate_limited, success]), is_closed=False)
+        oauth2_provider = OAuth2Provider(
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            token_url="https://reporting.example.com/oauth2/token",
+            initial_backoff=0.05,
+            http_client=http_client,
+        )
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker_task = asyncio.ensure_future(ticker())
+        token = await oauth2_provider.get_token()
+        ticker_task.cancel()
+
+        assert token.access_token == "async-token"
+        assert ticks > 2
+
+    @pytest.mark.asyncio
+    async def test_get_token_cancellation_during_backoff(self):
+        """Test that cancelling the caller aborts a token request that is backing off."""
+        rate_limited = httpx.Response(429, request=httpx.Request("POST", "https://reporting.example.com/oauth2/token"))
+        http_client = Mock(post=AsyncMock(return_value=rate_limited), is_closed=False)
+        oauth2_provider = OAuth2Provider(
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            token_url="https://reporting.example.com/oauth2/token",
+            initial_backoff=30.0,
+            http_client=http_client,
+        )
+
+        task = asyncio.ensure_future(oauth2_provider.get_token())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert http_client.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_pooled_client_is_reused_and_closed(self, mock_token_response):
+        """Test that token requests share one AsyncClient which aclose() releases."""
+        with patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient") as mock_client_class:
+            response = Mock()
+            response.json.return_value = mock_token_response
+            mock_client_instance = Mock(post=AsyncMock(return_value=response), aclose=AsyncMock(), is_closed=False)
+            mock_client_class.return_value = mock_client_instance
+
+            oauth2_provider = OAuth2Provider(
+                client_id="test-client-id",
+                client_secret="test-client-secret",
+                token_url="https://reporting.example.com/oauth2/token",
+            )
+            await oauth2_provider.get_token()
+            await oauth2_provider.get_token()
+            await oauth2_provider.aclose()
+
+        mock_client_class.assert_called_once()
+        mock_client_instance.aclose.assert_awaited_once()
+
 
 class TestTokenManager:
     """Test cases for TokenManager."""
@@ -480,7 +555,7 @@ class TestTokenManager:
         """Create TokenManager instance for testing."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider:
             # Mock the OAuth2 provider to avoid real network calls
-            mock_provider_instance = Mock()
+            mock_provider_instance = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             mock_provider.return_value = mock_provider_instance
             return TokenManager(settings=mock_settings)
 
@@ -508,7 +583,7 @@ class TestTokenManager:
         """Test TokenManager initialization for reporting with lazy token loading."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
             # Setup mock provider
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             mock_provider_class.return_value = mock_provider
 
             mock_settings = Mock()
@@ -529,7 +604,7 @@ class TestTokenManager:
     def test_token_manager_initialization_test_mode(self):
         """Test TokenManager initialization in test mode sets test token."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             mock_provider_class.return_value = mock_provider
 
             mock_settings = Mock()
@@ -548,11 +623,12 @@ class TestTokenManager:
             # Verify get_token was NOT called (test token used instead)
             mock_provider.get_token.assert_not_called()
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_get_valid_token_when_none_cached(self, mock_provider_class, mock_settings, valid_token):
+    async def test_get_valid_token_when_none_cached(self, mock_provider_class, mock_settings, valid_token):
         """Test lazy token generation when none is cached for reporting."""
         # Setup mock provider
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.return_value = valid_token
         mock_provider_class.return_value = mock_provider
 
@@ -563,18 +639,19 @@ class TestTokenManager:
         mock_provider.get_token.assert_not_called()
 
         # Token should be generated on first call to get_auth_headers
-        auth_headers = token_manager.get_auth_headers()
+        auth_headers = await token_manager.get_auth_headers()
 
         assert "Authorization" in auth_headers
         assert f"Bearer {valid_token.access_token}" in auth_headers["Authorization"]
         # Now get_token should have been called (lazy initialization)
         mock_provider.get_token.assert_called_once()
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_get_valid_token_when_valid_cached(self, mock_provider_class, mock_settings, valid_token):
+    async def test_get_valid_token_when_valid_cached(self, mock_provider_class, mock_settings, valid_token):
         """Test getting token when valid one is cached for reporting."""
         # Setup mock provider to return proper token
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.return_value = valid_token
         mock_provider_class.return_value = mock_provider
 
@@ -584,18 +661,21 @@ class TestTokenManager:
         token_manager._set_token_from_oauth2_response(valid_token)
 
         # First call should use cached token without calling get_token
-        auth_headers = token_manager.get_auth_headers()
+        auth_headers = await token_manager.get_auth_headers()
 
         assert "Authorization" in auth_headers
         assert f"Bearer {valid_token.access_token}" in auth_headers["Authorization"]
         # Should not call get_token since cached token is valid
         mock_provider.get_token.assert_not_called()
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_get_valid_token_when_expired_cached(self, mock_provider_class, mock_settings, expired_token, valid_token):
+    async def test_get_valid_token_when_expired_cached(
+        self, mock_provider_class, mock_settings, expired_token, valid_token
+    ):
         """Test automatic token refresh when expired token is cached for reporting."""
         # Setup mock provider
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.return_value = valid_token
         mock_provider_class.return_value = mock_provider
 
@@ -605,18 +685,19 @@ class TestTokenManager:
         token_manager._set_token_from_oauth2_response(expired_token)
 
         # Should automatically refresh the token
-        auth_headers = token_manager.get_auth_headers()
+        auth_headers = await token_manager.get_auth_headers()
 
         assert "Authorization" in auth_headers
         assert f"Bearer {valid_token.access_token}" in auth_headers["Authorization"]
         # Should call get_token to refresh expired token
         mock_provider.get_token.assert_called_once()
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_lazy_initialization_multiple_calls(self, mock_provider_class, mock_settings, valid_token):
+    async def test_lazy_initialization_multiple_calls(self, mock_provider_class, mock_settings, valid_token):
         """Test that lazy initialization only fetches token once for multiple calls."""
         # Setup mock provider
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.return_value = valid_token
         mock_provider_class.return_value = mock_provider
 
@@ -627,27 +708,28 @@ class TestTokenManager:
         mock_provider.get_token.assert_not_called()
 
         # First call should fetch token
-        headers1 = token_manager.get_auth_headers()
+        headers1 = await token_manager.get_auth_headers()
         assert "Authorization" in headers1
         mock_provider.get_token.assert_called_once()
 
         # Second call should reuse cached token
-        headers2 = token_manager.get_auth_headers()
+        headers2 = await token_manager.get_auth_headers()
         assert "Authorization" in headers2
         assert headers1 == headers2
         # Still only called once
         mock_provider.get_token.assert_called_once()
 
         # Third call should also reuse cached token
-        headers3 = token_manager.get_auth_headers()
+        headers3 = await token_manager.get_auth_headers()
         assert headers2 == headers3
         # Still only called once
         mock_provider.get_token.assert_called_once()
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_initialization_with_initial_token(self, mock_provider_class, mock_settings):
+    async def test_initialization_with_initial_token(self, mock_provider_class, mock_settings):
         """Test TokenManager initialization with pre-provided token bypasses lazy init."""
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider_class.return_value = mock_provider
 
         # Initialize with an initial token
@@ -662,7 +744,7 @@ class TestTokenManager:
         mock_provider.get_token.assert_not_called()
 
         # Getting headers should use the pre-provided token
-        headers = token_manager.get_auth_headers()
+        headers = await token_manager.get_auth_headers()
         assert f"Bearer {initial_token}" == headers["Authorization"]
         mock_provider.get_token.assert_not_called()
 
@@ -670,7 +752,7 @@ class TestTokenManager:
         """Test token validity check with valid token."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
             # Setup mock to return valid token during initialization
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             mock_provider.get_token.return_value = valid_token
             mock_provider_class.return_value = mock_provider
 
@@ -682,7 +764,7 @@ class TestTokenManager:
         """Test token validity check with expired token."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
             # Setup mock to return expired token during initialization
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             mock_provider.get_token.return_value = expired_token
             mock_provider_class.return_value = mock_provider
 
@@ -694,7 +776,7 @@ class TestTokenManager:
         """Test token validity check with None token."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
             # Setup mock to return a valid token during initialization but we'll clear it
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             valid_init_token = OAuth2TokenResponse(
                 access_token="init-token",
                 token_type="Bearer",
@@ -712,7 +794,7 @@ class TestTokenManager:
         """Test token validity check with soon-to-expire token."""
         with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider") as mock_provider_class:
             # Setup mock to return a valid token during initialization
-            mock_provider = Mock()
+            mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
             valid_init_token = OAuth2TokenResponse(
                 access_token="init-token",
                 token_type="Bearer",
@@ -735,11 +817,12 @@ class TestTokenManager:
             # Should be considered invalid due to buffer
             assert token_manager.is_token_valid() is False
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_token_refresh_on_auth_error(self, mock_provider_class, mock_settings, valid_token):
+    async def test_token_refresh_on_auth_error(self, mock_provider_class, mock_settings, valid_token):
         """Test manual token refresh using refresh_token method."""
         # Setup mock provider
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider_class.return_value = mock_provider
 
         # Create refreshed token
@@ -758,22 +841,23 @@ class TestTokenManager:
         assert token_manager._token_info is None
 
         # Get initial token through auth headers (triggers lazy init)
-        initial_headers = token_manager.get_auth_headers()
+        initial_headers = await token_manager.get_auth_headers()
         assert "Authorization" in initial_headers
         assert initial_headers["Authorization"].startswith("Bearer ")
         assert mock_provider.get_token.call_count == 1
 
         # Force refresh by calling refresh_token
-        token_manager.refresh_token()
+        await token_manager.refresh_token()
 
         # Verify that refresh_token caused an additional call to get_token
         assert mock_provider.get_token.call_count == 2
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_get_authorization_header(self, mock_provider_class, mock_settings, valid_token):
+    async def test_get_authorization_header(self, mock_provider_class, mock_settings, valid_token):
         """Test getting authorization header with lazy initialization for reporting."""
         # Setup mock provider
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.return_value = valid_token
         mock_provider_class.return_value = mock_provider
 
@@ -782,7 +866,7 @@ class TestTokenManager:
         # Token should be None initially (lazy init)
         assert token_manager._token_info is None
 
-        headers = token_manager.get_auth_headers()
+        headers = await token_manager.get_auth_headers()
 
         expected_header = f"Bearer {valid_token.access_token}"
         assert headers["Authorization"] == expected_header
@@ -804,11 +888,12 @@ class TestAuthIntegration:
         settings.is_testing = False  # Disable test mode for integration tests
         return settings
 
-    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.Client")
-    def test_end_to_end_token_flow(self, mock_client_class, mock_settings):
+    @pytest.mark.asyncio
+    @patch("greenlake_reporting_mcp.auth.oauth2_provider.httpx.AsyncClient")
+    async def test_end_to_end_token_flow(self, mock_client_class, mock_settings):
         """Test complete lazy token acquisition and management flow for reporting."""
-        # Setup mock httpx.Client
-        mock_client_instance = Mock()
+        # Setup mock httpx.AsyncClient
+        mock_client_instance = Mock(post=AsyncMock())
         mock_response = Mock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -818,8 +903,7 @@ class TestAuthIntegration:
             "scope": "read write admin",
         }
         mock_client_instance.post.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
+        mock_client_instance.is_closed = False
         mock_client_class.return_value = mock_client_instance
 
         # Create token manager with lazy initialization
@@ -830,14 +914,14 @@ class TestAuthIntegration:
         mock_client_instance.post.assert_not_called()
 
         # Get token through manager (triggers lazy init)
-        auth_headers = token_manager.get_auth_headers()
+        auth_headers = await token_manager.get_auth_headers()
 
         # Verify token properties through headers
         assert "Authorization" in auth_headers
         assert "integration-test-token-reporting" in auth_headers["Authorization"]
         assert auth_headers["Authorization"].startswith("Bearer ")
 
-        # Verify httpx.Client was called correctly
+        # Verify httpx.AsyncClient was called correctly
         mock_client_class.assert_called()
         mock_client_instance.post.assert_called()
 
@@ -871,11 +955,12 @@ class TestAuthErrorHandling:
             # If this fails, there's an issue with the model itself
             pytest.fail("OAuth2TokenResponse should accept valid minimal data")
 
+    @pytest.mark.asyncio
     @patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider")
-    def test_token_manager_handles_oauth_errors(self, mock_provider_class):
+    async def test_token_manager_handles_oauth_errors(self, mock_provider_class):
         """Test TokenManager handles OAuth provider errors gracefully with lazy init."""
         # Setup mock provider to raise exception
-        mock_provider = Mock()
+        mock_provider = Mock(get_token=AsyncMock(), aclose=AsyncMock())
         mock_provider.get_token.side_effect = Exception("OAuth server error")
         mock_provider_class.return_value = mock_provider
 
@@ -892,4 +977,4 @@ class TestAuthErrorHandling:
 
         # Error should occur when trying to get auth headers (first token fetch)
         with pytest.raises(Exception, match="OAuth server error"):
-            token_manager.get_auth_headers()
+            await token_manager.get_auth_headers()
@@ -74,3 +74,30 @@ class TestGetreportingstatusesTool:
         await _impl_getreportingstatuses(ctx)
 
         ctx.request_context.lifespan_context.http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_merges_pages(self):
+        """fetch_all must request the remaining pages and return the merged items."""
+        ctx = _make_mock_ctx()
+
+        async def get(url, params=None):
+            offset = params["offset"]
+            return {"items": [{"id": f"item-{offset + i}"} for i in range(min(2, 5 - offset))], "total": 5}
+
+        ctx.request_context.lifespan_context.http_client.get.side_effect = get
+
+        result = await _impl_getreportingstatuses(ctx, limit=2, fetch_all=True)
+
+        assert result[0]["success"] is True
+        assert [item["id"] for item in result[0]["result"]["items"]] == [f"item-{i}" for i in range(5)]
+        assert result[0]["result"]["pagination"]["pages_fetched"] == 3
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_items_returns_validation_error(self):
+        """An invalid max_items must be reported as a validation error."""
+        ctx = _make_mock_ctx()
+
+        result = await _impl_getreportingstatuses(ctx, max_items="lots")
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
@@ -0,0 +1,151 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for OData filter parsing and canonicalization in reporting MCP server.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from greenlake_reporting_mcp.utils.odata_filter import (
+    Comparison,
+    FieldRef,
+    FilterError,
+    InList,
+    Literal,
+    Logical,
+    Not,
+    compile_filter,
+    filter_cache_info,
+    normalize_filter,
+    tokenize,
+)
+
+FIELDS = frozenset({"serialNumber", "deviceType", "quantity", "createdAt", "user", "archived"})
+
+
+class TestParsing:
+    """Test cases for tokenizing and parsing filters into an AST."""
+
+    def test_tokenize_keeps_doubled_quotes_inside_strings(self):
+        tokens = tokenize("name eq 'O''Neil' and (x ne 1)")
+
+        assert [t.kind for t in tokens] == ["word", "word", "string", "word", "punct", "word", "word", "word", "punct"]
+        assert tokens[2].text == "'O''Neil'"
+
+    def test_and_binds_tighter_than_or(self):
+        ast = compile_filter("serialNumber eq 'A' or deviceType eq 'B' and not archived eq true").ast
+
+        assert ast == Logical(
+            "or",
+            (
+                Comparison("eq", FieldRef("serialNumber"), Literal("string", "A")),
+                Logical(
+                    "and",
+                    (
+                        Comparison("eq", FieldRef("deviceType"), Literal("string", "B")),
+                        Not(Comparison("eq", FieldRef("archived"), Literal("boolean", True))),
+                    ),
+                ),
+            ),
+        )
+
+    def test_in_lists_keep_their_spelling(self):
+        assert normalize_filter("deviceType in 'A','B'") == "deviceType in 'A', 'B'"
+        assert normalize_filter("deviceType in ('A','B')") == "deviceType in ('A', 'B')"
+        assert compile_filter("deviceType in ('A')").ast == InList(
+            FieldRef("deviceType"), (Literal("string", "A"),), parenthesized=True
+        )
+
+    def test_functions_and_tag_keys(self):
+        assert normalize_filter("Contains(serialNumber, 'SN')") == "contains(serialNumber, 'SN')"
+        assert normalize_filter("'city' eq 'London' and not 'street' eq 'Piccadilly'") == (
+            "'city' eq 'London' and not 'street' eq 'Piccadilly'"
+        )
+
+
+class TestRepairs:
+    """Test cases for the repairs applied to common client mistakes."""
+
+    @pytest.mark.parametrize(
+        ("expression", "canonical"),
+        [
+            ("quantity eq 5", "quantity eq '5'"),
+            ("quantity ge -1.5", "quantity ge '-1.5'"),
+            ("deviceType eq STORAGE", "deviceType eq 'STORAGE'"),
+            ("createdAt ge ''2024-01-18T19:53:51.480Z''", "createdAt ge '2024-01-18T19:53:51.480Z'"),
+            ('serialNumber eq "SN1"', "serialNumber eq 'SN1'"),
+            ("serialNumber = 'SN1' AND quantity >= 2", "serialNumber eq 'SN1' and quantity ge '2'"),
+            ("SERIALNUMBER ne 'SN1'", "serialNumber ne 'SN1'"),
+            ("archived eq TRUE or serialNumber eq null", "archived eq true or serialNumber eq null"),
+            ("((serialNumber eq 'A'))", "serialNumber eq 'A'"),
+        ],
+    )
+    def test_repairs(self, expression, canonical):
+        assert normalize_filter(expression, fields=FIELDS) == canonical
+
+    def test_repairs_are_recorded(self):
+        fixes = compile_filter("SerialNumber = 5", fields=FIELDS).fixes
+
+        assert fixes == (
+            "corrected field 'SerialNumber' to 'serialNumber'",
+            "replaced '=' with 'eq'",
+            "quoted number 5",
+        )
+
+    def test_equivalent_spellings_share_a_canonical_form(self):
+        spellings = [
+            "deviceType eq 'X' and quantity eq '1'",
+            "(deviceType = X) AND quantity eq 1",
+            'deviceType eq "X" and quantity eq 1',
+        ]
+
+        assert {normalize_filter(s) for s in spellings} == {"deviceType eq 'X' and quantity eq '1'"}
+
+    def test_endpoint_quote_character(self):
+        assert normalize_filter("type eq 'O\"K' or type eq X", quote='"') == 'type eq "O""K" or type eq "X"'
+
+    def test_paths_below_known_fields_are_accepted(self):
+        assert normalize_filter("user/username eq 'a@b.com'", fields=FIELDS) == "user/username eq 'a@b.com'"
+
+
+class TestErrors:
+    """Test cases for filters rejected before they reach the API."""
+
+    @pytest.mark.parametrize(
+        ("expression", "message"),
+        [
+            ("", "empty"),
+            ("serialNumber eq", "at the end of the filter"),
+            ("serialNumber eq 'SN1", "unterminated string"),
+            ("serialNumber like 'SN'", "expected an operator"),
+            ("length(serialNumber, 'SN')", "unsupported function"),
+            ("serialNumber eq 'A' deviceType eq 'B'", "deviceType"),
+            ("(serialNumber eq 'A'", r"'\)'"),
+        ],
+    )
+    def test_malformed_filters(self, expression, message):
+        with pytest.raises(FilterError, match=message):
+            normalize_filter(expression)
+
+    def test_unknown_field_lists_known_fields(self):
+        with pytest.raises(FilterError) as excinfo:
+            normalize_filter("colour eq 'red'", fields=FIELDS)
+
+        assert excinfo.value.position == 0
+        assert "unknown field 'colour'" in str(excinfo.value)
+        assert "serialNumber" in str(excinfo.value)
+
+    def test_filter_error_is_a_value_error(self):
+        with pytest.raises(ValueError):
+            normalize_filter("and")
+
+
+def test_compiled_filters_are_cached():
+    before = filter_cache_info()
+    for _ in range(3):
+        normalize_filter("serialNumber eq 'CACHED-1'")
+    after = filter_cache_info()
+
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 2
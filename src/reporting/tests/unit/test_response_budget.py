@@ -0,0 +1,141 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the response size budget applied to reporting MCP server tool results.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from greenlake_reporting_mcp.server.fastmcp_instance import GreenLakeFastMCP
+from greenlake_reporting_mcp.tools.implementations.read_result import read_result
+from greenlake_reporting_mcp.utils.response_budget import BYTES_PER_TOKEN, ResponseShaper, budget_bytes
+from greenlake_reporting_mcp.utils.result_store import ResultStore
+
+LIST_TOOL = "getreportingstatuses"
+
+
+def _result(n: int = 100) -> list[dict]:
+    items = [{"id": f"dev-{i}", "serialNumber": f"SN{i:04d}", "description": "x" * 80} for i in range(n)]
+    return [{"success": True, "result": {"items": items, "count": n, "total": 5000}}]
+
+
+def _size(value: object) -> int:
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+class TestResponseShaper:
+    """Test cases for trimming results to the budget."""
+
+    def test_result_within_budget_is_unchanged(self):
+        result = _result(5)
+
+        assert ResponseShaper(max_bytes=100_000).shape(LIST_TOOL, result) is result
+
+    def test_disabled_budget_returns_result_unchanged(self):
+        result = _result(1000)
+
+        assert ResponseShaper(max_bytes=0).shape(LIST_TOOL, result) is result
+
+    def test_trims_on_item_boundaries_within_budget(self):
+        store = ResultStore()
+        shaper = ResponseShaper(max_bytes=4000, result_store=store)
+
+        shaped = shaper.shape(LIST_TOOL, _result())
+        payload = shaped[0]["result"]
+        kept = payload["truncation"]["returned_items"]
+
+        assert _size(shaped) <= 4000
+        assert 0 < kept < 100
+        assert payload["items"] == _result()[0]["result"]["items"][:kept]
+        assert payload["count"] == kept
+        assert payload["total"] == 5000
+        assert payload["truncation"]["withheld_items"] == 100 - kept
+        assert shaper.stats.truncated == 1
+        assert shaper.stats.items_withheld == 100 - kept
+
+    def test_continuation_resumes_at_first_withheld_item(self):
+        store = ResultStore()
+        shaper = ResponseShaper(max_bytes=4000, result_store=store)
+
+        continuation = shaper.shape(LIST_TOOL, _result())[0]["result"]["truncation"]["continuation"]
+        rest = store.read(continuation["handle"], offset=continuation["offset"], limit=1000)
+
+        assert rest["items"][0]["id"] == f"dev-{continuation['offset']}"
+        assert rest["total_items"] == 100
+        assert rest["metadata"] == {"count": 100, "total": 5000}
+
+    def test_slice_of_stored_result_continues_from_same_handle(self):
+        store = ResultStore()
+        handle = store.put(_result()[0]["result"])
+        shaper = ResponseShaper(max_bytes=2000, result_store=store)
+
+        page = [{"success": True, "result": store.read(handle, offset=10, limit=100)}]
+        truncation = shaper.shape("read_result", page)[0]["result"]["truncation"]
+
+        assert truncation["continuation"]["handle"] == handle
+        assert truncation["continuation"]["offset"] == 10 + truncation["returned_items"]
+        assert store.snapshot()["entries"] == 1
+
+    def test_table_rows_are_trimmed(self):
+        rows = [[f"dev-{i}", "x" * 80] for i in range(100)]
+        result = [{"success": True, "result": {"format": "table", "columns": ["id", "description"], "rows": rows}}]
+
+        payload = ResponseShaper(max_bytes=3000, result_store=ResultStore()).shape(LIST_TOOL, result)[0]["result"]
+
+        assert payload["columns"] == ["id", "description"]
+        assert len(payload["rows"]) == payload["truncation"]["returned_items"]
+
+    def test_results_without_items_are_not_trimmed(self):
+        result = [{"success": True, "result": {"id": "dev-1", "description": "x" * 5000}}]
+        shaper = ResponseShaper(max_bytes=1000)
+
+        assert shaper.shape("get_by_id", result) is result
+        assert shaper.stats.over_budget_untrimmed == 1
+
+    def test_budget_bytes_uses_smaller_budget(self):
+        assert budget_bytes(max_bytes=0, max_tokens=1000) == 1000 * BYTES_PER_TOKEN
+        assert budget_bytes(max_bytes=2000, max_tokens=1000) == 2000
+        assert budget_bytes() == 0
+
+
+class TestToolResultShaping:
+    """Test cases for the shaping stage in front of every tool."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_applies_lifespan_shaper(self):
+        server = GreenLakeFastMCP("test")
+
+        @server.tool(name="list_things")
+        async def list_things() -> list[dict]:
+            return _result()
+
+        store = ResultStore()
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.response_shaper = ResponseShaper(max_bytes=3000, result_store=store)
+
+        with patch.object(server, "get_context", return_value=ctx):
+            _, structured = await server.call_tool("list_things", {})
+
+        payload = structured["result"][0]["result"]
+        assert payload["count"] < 100
+        assert payload["truncation"]["continuation"]["offset"] == payload["count"]
+        assert store.snapshot()["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_read_result_follows_continuation(self):
+        store = ResultStore()
+        shaper = ResponseShaper(max_bytes=4000, result_store=store)
+        ctx = MagicMock()
+        ctx.request_context.lifespan_context.result_store = store
+        ctx.request_context.lifespan_context.http_client = AsyncMock()
+
+        first = shaper.shape(LIST_TOOL, _result())[0]["result"]
+        continuation = first["truncation"]["continuation"]
+        rest = await read_result(ctx, handle=continuation["handle"], offset=continuation["offset"], limit=1000)
+
+        ids = [item["id"] for item in first["items"] + rest[0]["result"]["items"]]
+        assert ids == [f"dev-{i}" for i in range(100)]
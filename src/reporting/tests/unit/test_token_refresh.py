@@ -0,0 +1,132 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for coalesced token acquisition and background refresh in reporting MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from greenlake_reporting_mcp.auth.oauth2_provider import OAuth2TokenResponse
+from greenlake_reporting_mcp.auth.token_manager import TokenInfo, TokenManager
+
+
+def _token(access_token: str = "fresh-token", expires_in: int | None = 3600) -> OAuth2TokenResponse:
+    return OAuth2TokenResponse(access_token=access_token, expires_in=expires_in)
+
+
+@pytest.fixture
+def provider() -> Mock:
+    return Mock(get_token=AsyncMock(return_value=_token()), aclose=AsyncMock())
+
+
+@pytest.fixture
+def token_manager(provider) -> TokenManager:
+    settings = Mock(
+        client_id="id", client_secret="secret", workspace_id="ws", token_issuer="https://t", is_testing=False
+    )
+    with patch("greenlake_reporting_mcp.auth.token_manager.OAuth2Provider", return_value=provider):
+        return TokenManager(settings=settings)
+
+
+class TestCoalescedAcquisition:
+    """Test cases for single-flight token acquisition."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_callers_share_one_request(self, token_manager, provider):
+        async def slow_token():
+            await asyncio.sleep(0.01)
+            return _token()
+
+        provider.get_token.side_effect = slow_token
+        headers = await asyncio.gather(*(token_manager.get_auth_headers() for _ in range(10)))
+
+        provider.get_token.assert_awaited_once()
+        assert all(h["Authorization"] == "Bearer fresh-token" for h in headers)
+
+    @pytest.mark.asyncio
+    async def test_failure_reaches_all_waiters_and_next_call_retries(self, token_manager, provider):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("token endpoint down")
+
+        provider.get_token.side_effect = failing
+        results = await asyncio.gather(*(token_manager.get_auth_headers() for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert provider.get_token.await_count == 1
+
+        provider.get_token.side_effect = None
+        assert (await token_manager.get_auth_headers())["Authorization"] == "Bearer fresh-token"
+
+
+class TestRefreshSchedule:
+    """Test cases for the background refresh point."""
+
+    def test_refreshes_immediately_without_token(self, token_manager):
+        assert token_manager._seconds_until_refresh(0.8, 0.0) == 0.0
+
+    def test_refreshes_at_fraction_of_lifetime(self, token_manager):
+        now = time.time()
+        token_manager._token_info = TokenInfo(token="t", created_at=now, expires_at=now + 3600)
+        assert token_manager._seconds_until_refresh(0.5, 0.0) == pytest.approx(1800, abs=1)
+
+    def test_refresh_happens_before_expiry_buffer(self, token_manager):
+        now = time.time()
+        token_manager._token_info = TokenInfo(token="t", created_at=now, expires_at=now + 3600)
+        assert token_manager._seconds_until_refresh(1.0, 0.0) == pytest.approx(3300, abs=1)
+
+    def test_jitter_spreads_refresh_point(self, token_manager):
+        now = time.time()
+        token_manager._token_info = TokenInfo(token="t", created_at=now, expires_at=now + 3600)
+        delays = {round(token_manager._seconds_until_refresh(0.5, 0.2)) for _ in range(20)}
+        assert len(delays) > 1
+        assert all(1440 - 1 <= d <= 2160 + 1 for d in delays)
+
+    def test_token_without_expiry_is_never_refreshed(self, token_manager):
+        token_manager._token_info = TokenInfo(token="t")
+        assert token_manager._seconds_until_refresh(0.8, 0.1) is None
+
+
+class TestBackgroundRefresh:
+    """Test cases for the background refresh task."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_token_and_renews_it(self, token_manager, provider):
+        provider.get_token.return_value = _token(expires_in=1)  # renewed every 0.05s with fraction 0.05
+        token_manager.start_background_refresh(refresh_fraction=0.05, jitter=0.0)
+        await asyncio.sleep(0.2)
+        await token_manager.stop_background_refresh()
+
+        assert provider.get_token.await_count >= 2
+        assert token_manager.get_raw_token() == "fresh-token"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_retried(self, token_manager, provider):
+        provider.get_token.side_effect = [RuntimeError("down"), _token()]
+        with patch("greenlake_reporting_mcp.auth.token_manager._REFRESH_RETRY_INITIAL", 0.01):
+            token_manager.start_background_refresh()
+            await asyncio.sleep(0.1)
+            await token_manager.stop_background_refresh()
+
+        assert provider.get_token.await_count == 2
+        assert token_manager.is_token_valid()
+
+    @pytest.mark.asyncio
+    async def test_request_path_uses_token_from_background_refresh(self, token_manager, provider):
+        token_manager.start_background_refresh()
+        await asyncio.sleep(0.01)
+        await token_manager.get_auth_headers()
+        await token_manager.aclose()
+
+        provider.get_token.assert_awaited_once()
+        provider.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_start_without_provider_is_a_no_op(self):
+        token_manager = TokenManager(initial_token="static")
+        token_manager.start_background_refresh()
+        assert token_manager._refresh_task is None
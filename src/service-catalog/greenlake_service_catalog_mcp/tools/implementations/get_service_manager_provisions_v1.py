@@ -6,31 +6,27 @@ Implements: GET /service-catalog/v1/service-manager-provisions
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_service_catalog_mcp.config.logging import get_logger
 from greenlake_service_catalog_mcp.server.fastmcp_instance import mcp
+from greenlake_service_catalog_mcp.utils.odata_filter import normalize_filter
+from greenlake_service_catalog_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# Service manager provision properties accepted in ``filter``
+FILTER_FIELDS = frozenset(
+    {
+        "region",
+        "serviceManagerId",
+        "status",
+    }
+)
 
 
 @mcp.tool(
@@ -53,6 +49,18 @@ async def get_service_manager_provisions_v1(  # noqa: E501
             description="Examples:\n  - region eq 'us-west'\n    Returns service managers in a specified region.\n  - serviceManagerId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Returns service managers with a specific service manager ID.\n  - status eq 'PROVISIONED'\n    Returns service managers that are provisioned.\n  - status eq 'UNPROVISIONED'\n    Returns service managers that are not provisioned.\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes."
         ),
     ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """Retrieve a list of all service manager provision entries.
 
@@ -60,6 +68,8 @@ async def get_service_manager_provisions_v1(  # noqa: E501
         offset: Zero-based resource offset to start the response from.\n\nExample: 0
         limit: The maximum number of records to return.\n\nExample: 10
         filter: Examples:\n  - region eq 'us-west'\n    Returns service managers in a specified region.\n  - serviceManagerId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Returns service managers with a specific service manager ID.\n  - status eq 'PROVISIONED'\n    Returns service managers that are provisioned.\n  - status eq 'UNPROVISIONED'\n    Returns service managers that are not provisioned.\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -82,11 +92,16 @@ async def get_service_manager_provisions_v1(  # noqa: E501
             params["limit"] = int(limit)
         except (ValueError, TypeError) as exc:
             raise ValueError("'limit' must be an integer") from exc
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
 
     try:
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
         response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
@@ -6,13 +6,14 @@ Implements: GET /service-catalog/v1/service-managers
 """
 
 from __future__ import annotations
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_service_catalog_mcp.config.logging import get_logger
 from greenlake_service_catalog_mcp.server.fastmcp_instance import mcp
+from greenlake_service_catalog_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
@@ -31,12 +32,26 @@ async def get_service_managers_v1(  # noqa: E501
         int | str | None,
         Field(description="The maximum number of records to return.\n\nExample: 10", default=2000),
     ] = 2000,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """Get a list of available service managers.
 
     Args:
         offset: Specify pagination offset\n\nExample: 0
         limit: The maximum number of records to return.\n\nExample: 10
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -62,6 +77,10 @@ async def get_service_managers_v1(  # noqa: E501
 
     try:
         response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
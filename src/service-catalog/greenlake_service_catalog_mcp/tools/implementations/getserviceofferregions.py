@@ -6,31 +6,32 @@ Implements: GET /service-catalog/v1beta1/service-offer-regions
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_service_catalog_mcp.config.logging import get_logger
 from greenlake_service_catalog_mcp.server.fastmcp_instance import mcp
+from greenlake_service_catalog_mcp.utils.cursor_pagination import (
+    MAX_ITEMS_CAP,
+    fetch_all_cursor_pages,
+    resolve_max_items,
+)
+from greenlake_service_catalog_mcp.utils.odata_filter import normalize_filter
+from greenlake_service_catalog_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# Service offer region properties accepted in ``filter``
+FILTER_FIELDS = frozenset(
+    {
+        "region",
+        "serviceOfferId",
+        "status",
+    }
+)
 
 
 @mcp.tool(
@@ -55,6 +56,30 @@ async def getserviceofferregions(  # noqa: E501
             description="The `filter` query parameter is used to filter the set of resources returned in a `GET` request. The returned set of resources must match the criteria in the filter query parameter.<br><br> The value of the `filter` query parameter is a subset of [OData 4.0](https://www.odata.org/documentation/) filter expressions consisting of simple comparison operations joined by logical operators.<br><br>**Supported fields**: `serviceOfferId`, `status`, and `region`.<br>**Supported operand**: `eq`<br>**Supported operations**: `and`\n\nExamples:\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and region eq 'us-east'\n    Return service offer regions with a given service offer ID and region\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and status eq 'ONBOARDED'\n    Return service offer regions with a given service offer ID and status\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and status eq 'ONBOARDED' and region eq 'us-east'\n    Return service offer regions with a given service offer ID and status and region\n  - region eq 'us-east'\n    Return service offer regions with a given region\n  - status eq 'ONBOARDED'\n    Return service offer regions with a given status\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return service offer regions with a given service offer ID\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes."
         ),
     ] = None,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Follow the `next` cursor from page to page (prefetching the next page while the current one is processed) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with hop count, page latency and whether the walk was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """Retrieve a list of service offer regions by applying filters.\nEach service offer region represents a service offer provisioned in a specific region.\n<br><br>**Pagination:** This API supports cursor-based pagination. Provide the cursor in the `next` query parameter to retrieve the next page.\n
 
@@ -62,6 +87,10 @@ async def getserviceofferregions(  # noqa: E501
         next: Specifies the pagination cursor for the next page of service offer regions.\n\nExample: 64136af7-cd64-4b4e-88a8-150ab51a920d
         limit: Specifies the number of results to be returned.
         filter: The `filter` query parameter is used to filter the set of resources returned in a `GET` request. The returned set of resources must match the criteria in the filter query parameter.<br><br> The value of the `filter` query parameter is a subset of [OData 4.0](https://www.odata.org/documentation/) filter expressions consisting of simple comparison operations joined by logical operators.<br><br>**Supported fields**: `serviceOfferId`, `status`, and `region`.<br>**Supported operand**: `eq`<br>**Supported operations**: `and`\n\nExamples:\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and region eq 'us-east'\n    Return service offer regions with a given service offer ID and region\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and status eq 'ONBOARDED'\n    Return service offer regions with a given service offer ID and status\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and status eq 'ONBOARDED' and region eq 'us-east'\n    Return service offer regions with a given service offer ID and status and region\n  - region eq 'us-east'\n    Return service offer regions with a given region\n  - status eq 'ONBOARDED'\n    Return service offer regions with a given status\n  - serviceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return service offer regions with a given service offer ID\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes.
+        fetch_all: Follow the `next` cursor across pages and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -80,11 +109,21 @@ async def getserviceofferregions(  # noqa: E501
             params["limit"] = int(limit)
         except (ValueError, TypeError) as exc:
             raise ValueError("'limit' must be an integer") from exc
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_cursor_pages(
+                http_client, url, params, max_items=resolve_max_items(max_items)
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
@@ -6,31 +6,39 @@ Implements: GET /service-catalog/v1beta1/service-provisions
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_service_catalog_mcp.config.logging import get_logger
 from greenlake_service_catalog_mcp.server.fastmcp_instance import mcp
+from greenlake_service_catalog_mcp.utils.cursor_pagination import (
+    MAX_ITEMS_CAP,
+    fetch_all_cursor_pages,
+    resolve_max_items,
+)
+from greenlake_service_catalog_mcp.utils.odata_filter import normalize_filter
+from greenlake_service_catalog_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# Service provision properties accepted in ``filter``
+FILTER_FIELDS = frozenset(
+    {
+        "ServiceOfferId",
+        "id",
+        "organizationId",
+        "region",
+        "serviceManagerId",
+        "serviceManagerInstanceId",
+        "serviceManagerProvisionId",
+        "slug",
+        "status",
+        "workspaceId",
+    }
+)
 
 
 @mcp.tool(
@@ -67,6 +75,30 @@ async def getserviceprovisions(  # noqa: E501
             description="If true, returns unredacted entries for all workspaces, including all provisioned service offers and their sensitive fields.\n\nExample: true"
         ),
     ] = None,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Follow the `next` cursor from page to page (prefetching the next page while the current one is processed) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with hop count, page latency and whether the walk was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """Retrieve a list of service provisions by applying filters.\nA service offer provides a distinct set of functionalities that can be independently identified and assigned access. Service offers are typically associated with roles and permissions, commerce, metering, quote-to-cash, and trial evaluations.\nA service provision occurs when a service offer is provisioned (added) to a workspace.\n<br><br>**Pagination**: This endpoint supports cursor-based pagination using the `next` query parameter. Provide the cursor in the `next` query parameter to retrieve the next page. \n
 
@@ -77,6 +109,10 @@ async def getserviceprovisions(  # noqa: E501
         filter: Limit the entities operated on by this endpoint by returning only the subset of entities that match the filter. The filter grammar is a subset of OData 4.0. <br> **Supported Fields:** `id`, `ServiceOfferId`, `workspaceId`, `serviceManagerProvisionId`, `serviceManagerId`, `serviceManagerInstanceId`, `status`, `organizationId`, `slug`. <br> **Supported operand:** `eq` <br> **Supported operations:** `and`\n\nExamples:\n  - serviceManagerProvisionId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return service provisions for a given Application Customer ID.\n  - ServiceOfferId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and region eq 'us-west'\n    Return service provisions for a given service offer ID and region.\n  - serviceManagerId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050' and serviceManagerInstanceId eq '62d242c7-7d53-448d-b7d0-baf0c591f024'\n    Return service provision for a given application ID and application instance ID.\n  - status eq 'PROVISION_INITIATED'\n    Return service provisions with a given status.\n  - organizationId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return service provisions with a given organization ID.\n  - slug eq 'AC'\n    Return service provisions with a given slug.\n  - id eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return the service provision with a given ID.\n  - workspaceId eq '767c0c92-5ecc-4952-85d6-06d2bcaaf050'\n    Return service provisions for a given workspace ID.\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes.
         unredacted: If true, returns the complete entry including sensitive fields.\n\nExample: true
         all: If true, returns unredacted entries for all workspaces, including all provisioned service offers and their sensitive fields.\n\nExample: true
+        fetch_all: Follow the `next` cursor across pages and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -97,15 +133,25 @@ async def getserviceprovisions(  # noqa: E501
             params["limit"] = int(limit)
         except (ValueError, TypeError) as exc:
             raise ValueError("'limit' must be an integer") from exc
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
     if unredacted is not None and unredacted is not ...:
         params["unredacted"] = unredacted
     if all is not None and all is not ...:
         params["all"] = all
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_cursor_pages(
+                http_client, url, params, max_items=resolve_max_items(max_items)
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
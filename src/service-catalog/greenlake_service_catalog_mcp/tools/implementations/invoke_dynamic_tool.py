@@ -8,7 +8,6 @@ Generated for dynamic mode when OpenAPI spec has 12 endpoints (>= 50 threshold).
 
 from __future__ import annotations
 
-import re
 from typing import Annotated, Any
 from urllib.parse import quote
 
@@ -17,25 +16,11 @@ from pydantic import Field
 
 from greenlake_service_catalog_mcp.config.logging import get_logger
 from greenlake_service_catalog_mcp.server.fastmcp_instance import mcp
+from greenlake_service_catalog_mcp.utils.odata_filter import normalize_filter
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
-
-
 @mcp.tool(
     name="invoke_dynamic_tool",
     description="Executes any service-catalog API endpoint dynamically with parameter validation and schema support",
@@ -312,7 +297,11 @@ async def invoke_dynamic_tool(
                 }
             ]
 
-    final_url, query_params = _build_request_url(path, params, schema)
+    try:
+        final_url, query_params = _build_request_url(path, params, schema)
+    except ValueError as exc:
+        logger.error(f"Validation error in invoke_dynamic_tool: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
 
     if method != "GET":
         return [
@@ -397,9 +386,9 @@ def _build_request_url(
                     param_value = int(param_value)
                 except (ValueError, TypeError):
                     pass
-            # Normalize unquoted numeric values in OData filter expressions
+            # Parse, repair and canonicalize OData filter expressions (raises FilterError)
             if param_name in ("filter", "filter-tags") and isinstance(param_value, str):
-                param_value = _normalize_filter_quotes(param_value)
+                param_value = normalize_filter(param_value)
             query_params[param_name] = param_value
 
     return url, query_params
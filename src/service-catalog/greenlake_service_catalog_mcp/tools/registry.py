@@ -56,8 +56,9 @@ def get_tool_classes(mode: str | None = None) -> list:
             import greenlake_service_catalog_mcp.tools.implementations.service_managers_for_a_region_v1  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_service_catalog_mcp.tools.implementations.getserviceofferregion  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_service_catalog_mcp.tools.implementations.per_region_service_managers_v1  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_service_catalog_mcp.tools.implementations.read_result  # noqa: F401 (triggers @mcp.tool registration)
 
-            logger.info("Static mode: 12 endpoint tools registered")
+            logger.info("Static mode: 12 endpoint tools and read_result registered")
     except ImportError as exc:
         logger.error(f"Failed to import tool module: {exc}")
 
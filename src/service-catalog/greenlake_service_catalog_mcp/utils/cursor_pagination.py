@@ -0,0 +1,197 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Cursor-following pagination for service-catalog MCP server list tools.
+
+Service-catalog collections page with an opaque ``next`` cursor rather than an
+offset, so pages cannot be fetched in parallel: each request needs the cursor
+from the previous response. ``iter_cursor_items`` walks the cursor chain server
+side instead of costing the agent one tool call per hop, and hides most of the
+per-hop latency by requesting page N+1 as soon as page N arrives, while page N's
+items are being consumed.
+
+Items are yielded one at a time from an async generator, so at most two pages
+are held in memory; only the ``id`` values seen so far are kept, to drop
+duplicates. The walk stops when the cursor is exhausted, repeats, or the item
+or hop cap is reached.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from typing import Any, Protocol
+
+# Hard upper bound on items returned by one cursor walk
+MAX_ITEMS_CAP = 10000
+
+# Hard upper bound on pages requested by one cursor walk
+MAX_HOPS = 500
+
+
+class _GetClient(Protocol):
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]: ...
+
+
+@dataclass
+class CursorWalkStats:
+    """Hop count and latency of a cursor walk."""
+
+    hops: int = 0
+    items_returned: int = 0
+    duplicates_dropped: int = 0
+    exhausted: bool = False
+    truncated: bool = False
+    total_page_latency_seconds: float = 0.0
+    max_page_latency_seconds: float = 0.0
+    elapsed_seconds: float = 0.0
+    _started: float = field(default_factory=time.monotonic, repr=False)
+
+    def record_page(self, latency: float) -> None:
+        """Record one page request and its latency."""
+        self.hops += 1
+        self.total_page_latency_seconds += latency
+        self.max_page_latency_seconds = max(self.max_page_latency_seconds, latency)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the stats as a dictionary, with latencies rounded to milliseconds."""
+        data = asdict(self)
+        del data["_started"]
+        data["avg_page_latency_seconds"] = self.total_page_latency_seconds / self.hops if self.hops else 0.0
+        for key in ("total_page_latency_seconds", "max_page_latency_seconds", "avg_page_latency_seconds"):
+            data[key] = round(data[key], 3)
+        data["elapsed_seconds"] = round(time.monotonic() - self._started, 3)
+        return data
+
+
+def resolve_max_items(max_items: int | str | None) -> int:
+    """
+    Validate a requested item cap and clamp it to ``MAX_ITEMS_CAP``.
+
+    Args:
+        max_items: Requested cap (strings from LLM clients are coerced); None means the hard cap
+
+    Returns:
+        The effective item cap
+
+    Raises:
+        ValueError: If the value is not a positive integer
+    """
+    if max_items is None:
+        return MAX_ITEMS_CAP
+    try:
+        value = int(max_items)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("'max_items' must be an integer") from exc
+    if value < 1:
+        raise ValueError("'max_items' must be at least 1")
+    return min(value, MAX_ITEMS_CAP)
+
+
+async def iter_cursor_items(
+    http_client: _GetClient,
+    endpoint: str,
+    params: dict[str, Any],
+    max_items: int = MAX_ITEMS_CAP,
+    max_hops: int = MAX_HOPS,
+    stats: CursorWalkStats | None = None,
+) -> AsyncIterator[Any]:
+    """
+    Yield the items of a ``next``-cursor collection, following the cursor across pages.
+
+    The request for the next page is started before the current page's items are
+    yielded. Items with an ``id`` already yielded are skipped. Closing the
+    generator early cancels the prefetch in flight.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: API endpoint path
+        params: Query parameters of the first page; ``next`` may hold a starting cursor
+        max_items: Maximum number of items to yield
+        max_hops: Maximum number of pages to request
+        stats: Optional stats object updated as the walk progresses
+
+    Yields:
+        Collection items in cursor order
+    """
+    stats = stats if stats is not None else CursorWalkStats()
+    seen_ids: set[Any] = set()
+    seen_cursors: set[str] = set()
+
+    async def fetch(cursor: str | None) -> dict[str, Any]:
+        page_params = {**params, "next": cursor} if cursor else {k: v for k, v in params.items() if k != "next"}
+        started = time.monotonic()
+        response = await http_client.get(endpoint, params=page_params)
+        stats.record_page(time.monotonic() - started)
+        return response
+
+    def follow(cursor: str) -> asyncio.Task[dict[str, Any]]:
+        seen_cursors.add(cursor)
+        return asyncio.ensure_future(fetch(cursor))
+
+    start_cursor = params.get("next") or None
+    if start_cursor is not None:
+        seen_cursors.add(start_cursor)
+    pending: asyncio.Task[dict[str, Any]] | None = asyncio.ensure_future(fetch(start_cursor))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            items = page.get("items") or []
+            cursor: str | None = page.get("next") or None
+            if cursor in seen_cursors:
+                cursor = None  # a repeated cursor would loop forever
+            if cursor is not None and stats.hops < max_hops and stats.items_returned + len(items) < max_items:
+                # Prefetch the next page while this one is consumed
+                pending = follow(cursor)
+
+            for item in items:
+                item_id = item.get("id") if isinstance(item, dict) else None
+                if item_id is not None:
+                    if item_id in seen_ids:
+                        stats.duplicates_dropped += 1
+                        continue
+                    seen_ids.add(item_id)
+                if stats.items_returned >= max_items:
+                    stats.truncated = True
+                    return
+                stats.items_returned += 1
+                yield item
+
+            if pending is None:
+                if cursor is None:
+                    stats.exhausted = True
+                elif stats.hops >= max_hops or stats.items_returned >= max_items:
+                    stats.truncated = True
+                else:
+                    # Not prefetched because the page looked like it would reach the cap, but duplicates kept it short
+                    pending = follow(cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
+            await asyncio.gather(pending, return_exceptions=True)
+
+
+async def fetch_all_cursor_pages(
+    http_client: _GetClient,
+    endpoint: str,
+    params: dict[str, Any],
+    max_items: int = MAX_ITEMS_CAP,
+) -> dict[str, Any]:
+    """
+    Walk a ``next``-cursor collection and return all items as one result.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: API endpoint path
+        params: Query parameters of the first page; ``next`` may hold a starting cursor
+        max_items: Maximum number of items to return
+
+    Returns:
+        Dictionary with the merged ``items``, their ``count`` and a ``pagination``
+        summary with hop count and latency stats
+    """
+    stats = CursorWalkStats()
+    items = [item async for item in iter_cursor_items(http_client, endpoint, params, max_items, stats=stats)]
+    return {"items": items, "count": len(items), "pagination": stats.snapshot()}
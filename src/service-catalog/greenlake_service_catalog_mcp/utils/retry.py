@@ -0,0 +1,189 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Retry policy for service-catalog MCP server HTTP requests.
+
+GreenLake APIs enforce per-workspace rate limits and answer bursts with ``429``
+(and occasionally ``502``/``503``/``504`` from the gateway). This module decides
+which failures are worth retrying, how long to wait between attempts, and keeps
+per-endpoint counters so retry pressure is visible in the logs and in tests.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+
+# Status codes that indicate a transient condition on the server side or gateway
+RETRYABLE_STATUS_CODES: frozenset[int] = frozenset({429, 502, 503, 504})
+
+# Transport errors that mean the request never produced a response (connection
+# refused/reset, peer closed the stream). Read timeouts are deliberately excluded:
+# the per-call deadline would be consumed by a single slow attempt anyway.
+RETRYABLE_EXCEPTIONS: tuple[type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadError,
+    httpx.WriteError,
+    httpx.RemoteProtocolError,
+)
+
+
+def parse_retry_after(response: httpx.Response) -> float | None:
+    """Extract the server-requested delay from a response.
+
+    The ``Retry-After`` header is checked first (delta-seconds or HTTP-date), then
+    the GreenLake error body, which carries ``retryAfterSeconds`` either at the top
+    level or inside ``serverErrorDetails`` (see ``models.base.ServerErrorDetail``).
+
+    Args:
+        response: HTTP response with a retryable status code
+
+    Returns:
+        Delay in seconds, or None if the server did not specify one
+    """
+    header = response.headers.get("Retry-After")
+    if header:
+        header = header.strip()
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    try:
+        body = response.json()
+    except Exception:
+        return None
+
+    if not isinstance(body, dict):
+        return None
+
+    candidates: list[Any] = [body.get("retryAfterSeconds")]
+    details = body.get("serverErrorDetails")
+    if isinstance(details, list):
+        candidates.extend(d.get("retryAfterSeconds") for d in details if isinstance(d, dict))
+
+    for value in candidates:
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0:
+            return float(value)
+    return None
+
+
+class RetryPolicy:
+    """Jittered exponential backoff bounded by a total per-call deadline."""
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        deadline: float = 120.0,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt
+            initial_backoff: Backoff ceiling in seconds for the first retry
+            max_backoff: Upper bound in seconds for a computed backoff
+            deadline: Total time budget in seconds for one call including all waits
+        """
+        self.max_retries = max(0, max_retries)
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+
+    def compute_delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Compute the wait before the next attempt.
+
+        Without a server hint this is "full jitter" backoff: a uniform draw between
+        zero and the exponential ceiling, so concurrent callers spread out instead of
+        retrying in lock-step. A server hint is honoured as a floor, with up to 10%
+        extra jitter so callers released at the same instant do not collide again.
+
+        Args:
+            attempt: Zero-based index of the retry being scheduled
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if retry_after is not None:
+            return retry_after + random.uniform(0, retry_after * 0.1)
+
+        ceiling = min(self.initial_backoff * (2**attempt), self.max_backoff)
+        return random.uniform(0, ceiling)
+
+
+@dataclass
+class EndpointRetryCounters:
+    """Retry counters for a single endpoint family."""
+
+    requests: int = 0
+    attempts: int = 0
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+    retry_wait_seconds: float = 0.0
+    reasons: dict[str, int] = field(default_factory=dict)
+
+
+class RetryStats:
+    """Per-endpoint retry counters shared by every request made through one client.
+
+    Only touched from the event loop thread, so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty counters."""
+        self._counters: dict[str, EndpointRetryCounters] = {}
+
+    def _get(self, endpoint: str) -> EndpointRetryCounters:
+        counters = self._counters.get(endpoint)
+        if counters is None:
+            counters = self._counters[endpoint] = EndpointRetryCounters()
+        return counters
+
+    def record_attempt(self, endpoint: str, first: bool) -> None:
+        """Count an upstream attempt (and a logical request when ``first`` is True)."""
+        counters = self._get(endpoint)
+        counters.attempts += 1
+        if first:
+            counters.requests += 1
+
+    def record_retry(self, endpoint: str, reason: str, delay: float) -> None:
+        """Count a scheduled retry and the reason that triggered it."""
+        counters = self._get(endpoint)
+        counters.retries += 1
+        counters.retry_wait_seconds += delay
+        counters.reasons[reason] = counters.reasons.get(reason, 0) + 1
+
+    def record_outcome(self, endpoint: str, retried: bool, exhausted: bool) -> None:
+        """Count how a request that needed at least one retry ended."""
+        if not retried:
+            return
+        counters = self._get(endpoint)
+        if exhausted:
+            counters.exhausted += 1
+        else:
+            counters.recovered += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of all counters keyed by endpoint family."""
+        return {endpoint: asdict(counters) for endpoint, counters in self._counters.items()}
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        self._counters.clear()
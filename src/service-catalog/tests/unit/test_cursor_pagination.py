@@ -0,0 +1,137 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for cursor-following pagination in service-catalog MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from greenlake_service_catalog_mcp.utils.cursor_pagination import (
+    CursorWalkStats,
+    fetch_all_cursor_pages,
+    iter_cursor_items,
+    resolve_max_items,
+)
+
+ENDPOINT = "/service-catalog/v1beta1/service-offer-regions"
+
+
+class FakeCursorCollection:
+    """``next``-cursor endpoint over ``total`` items that records the requests it serves."""
+
+    def __init__(self, total: int, page_size: int = 10, delay: float = 0.01):
+        self.items = [{"id": f"region-{i}"} for i in range(total)]
+        self.page_size = page_size
+        self.delay = delay
+        self.cursors: list[str | None] = []
+        self.events: list[str] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        cursor = (params or {}).get("next")
+        self.cursors.append(cursor)
+        self.events.append(f"request:{cursor}")
+        await asyncio.sleep(self.delay)
+        start = int(cursor.removeprefix("c")) if cursor else 0
+        page = self.items[start : start + self.page_size]
+        end = start + len(page)
+        response: dict[str, Any] = {"items": page, "count": len(page), "total": len(self.items)}
+        if end < len(self.items):
+            response["next"] = f"c{end}"
+        return response
+
+
+class TestIterCursorItems:
+    """Test cases for the cursor-walking generator."""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_until_exhausted(self):
+        api = FakeCursorCollection(total=25)
+        stats = CursorWalkStats()
+        items = [item async for item in iter_cursor_items(api, ENDPOINT, {"limit": 10}, stats=stats)]
+
+        assert [item["id"] for item in items] == [f"region-{i}" for i in range(25)]
+        assert api.cursors == [None, "c10", "c20"]
+        assert stats.hops == 3
+        assert stats.exhausted is True
+        assert stats.truncated is False
+
+    @pytest.mark.asyncio
+    async def test_prefetches_next_page_while_items_are_consumed(self):
+        api = FakeCursorCollection(total=20)
+        async for item in iter_cursor_items(api, ENDPOINT, {}):
+            if item["id"] == "region-0":
+                await asyncio.sleep(0)
+                assert api.events == ["request:None", "request:c10"]
+                break
+
+    @pytest.mark.asyncio
+    async def test_item_cap_stops_walk_and_cancels_prefetch(self):
+        api = FakeCursorCollection(total=100)
+        stats = CursorWalkStats()
+        items = [item async for item in iter_cursor_items(api, ENDPOINT, {}, max_items=15, stats=stats)]
+
+        assert len(items) == 15
+        assert api.cursors == [None, "c10"]
+        assert stats.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_hop_cap_stops_walk(self):
+        api = FakeCursorCollection(total=100)
+        stats = CursorWalkStats()
+        items = [item async for item in iter_cursor_items(api, ENDPOINT, {}, max_hops=2, stats=stats)]
+
+        assert len(items) == 20
+        assert stats.hops == 2
+        assert stats.truncated is True
+
+    @pytest.mark.asyncio
+    async def test_repeated_cursor_ends_walk(self):
+        class LoopingApi(FakeCursorCollection):
+            async def get(self, endpoint, params=None):
+                self.cursors.append((params or {}).get("next"))
+                return {"items": self.items[:10], "next": "same"}
+
+        api = LoopingApi(total=50)
+        items = [item async for item in iter_cursor_items(api, ENDPOINT, {})]
+
+        assert api.cursors == [None, "same"]
+        assert len(items) == 10  # second page repeats ids of the first and is de-duplicated
+
+    @pytest.mark.asyncio
+    async def test_page_failure_propagates(self):
+        api = FakeCursorCollection(total=30)
+        original = api.get
+
+        async def flaky(endpoint, params=None):
+            if (params or {}).get("next") == "c20":
+                raise RuntimeError("upstream failed")
+            return await original(endpoint, params)
+
+        api.get = flaky  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError):
+            _ = [item async for item in iter_cursor_items(api, ENDPOINT, {})]
+
+
+class TestFetchAllCursorPages:
+    """Test cases for the merged result."""
+
+    @pytest.mark.asyncio
+    async def test_returns_merged_items_with_stats(self):
+        api = FakeCursorCollection(total=25)
+        result = await fetch_all_cursor_pages(api, ENDPOINT, {"next": "c5"})
+
+        assert result["count"] == 20
+        assert result["items"][0]["id"] == "region-5"
+        assert result["pagination"]["hops"] == 2
+        assert result["pagination"]["max_page_latency_seconds"] >= 0.01
+        assert result["pagination"]["avg_page_latency_seconds"] > 0
+
+    def test_resolve_max_items_rejects_invalid_values(self):
+        with pytest.raises(ValueError):
+            resolve_max_items("many")
+        with pytest.raises(ValueError):
+            resolve_max_items(0)
@@ -74,3 +74,33 @@ class TestGetserviceofferregionsTool:
         await _impl_getserviceofferregions(ctx)
 
         ctx.request_context.lifespan_context.http_client.get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_follows_cursor(self):
+        """fetch_all must follow the next cursor and return the merged items."""
+        ctx = _make_mock_ctx()
+        pages = {
+            None: {"items": [{"id": "r1"}, {"id": "r2"}], "next": "c2"},
+            "c2": {"items": [{"id": "r2"}, {"id": "r3"}]},
+        }
+
+        async def get(url, params=None):
+            return pages[params.get("next")]
+
+        ctx.request_context.lifespan_context.http_client.get.side_effect = get
+
+        result = await _impl_getserviceofferregions(ctx, fetch_all=True)
+
+        assert result[0]["success"] is True
+        assert [item["id"] for item in result[0]["result"]["items"]] == ["r1", "r2", "r3"]
+        assert result[0]["result"]["pagination"]["hops"] == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_max_items_returns_validation_error(self):
+        """An invalid max_items must be reported as a validation error."""
+        ctx = _make_mock_ctx()
+
+        result = await _impl_getserviceofferregions(ctx, max_items="lots")
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
@@ -0,0 +1,317 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the response cache in service-catalog MCP server.
+"""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from greenlake_service_catalog_mcp.utils.http_client import ServiceCatalogHttpClient
+from greenlake_service_catalog_mcp.utils.response_cache import MemoryResponseCache, SqliteResponseCache
+
+
+def _json_response(payload: object, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(200, json=payload, headers=headers, request=httpx.Request("GET", "https://api.example.test/"))
+
+
+def _not_modified() -> httpx.Response:
+    return httpx.Response(304, request=httpx.Request("GET", "https://api.example.test/"))
+
+
+@pytest.fixture
+def http_client() -> ServiceCatalogHttpClient:
+    """HTTP client with caching enabled for the detail endpoint only."""
+    token_manager = Mock(get_auth_headers=AsyncMock(), aclose=AsyncMock())
+    token_manager.get_auth_headers.return_value = {"Authorization": "Bearer test-token"}
+    with patch("greenlake_service_catalog_mcp.utils.http_client.TokenManager", return_value=token_manager):
+        client = ServiceCatalogHttpClient(response_cache=MemoryResponseCache())
+    client.settings = Mock(wraps=client.settings)
+    client.settings.http_cache_enabled = True
+    client.settings.http_cache_ttls = {"/service-catalog/v1beta1/service-offers/{id}": 60}
+    client.settings.http_cache_default_ttl = 0
+    client.settings.http_cache_revalidate = False
+    return client
+
+
+class TestMemoryResponseCache:
+    """Test cases for the in-memory LRU backend."""
+
+    def test_hit_and_miss(self):
+        cache = MemoryResponseCache()
+        assert cache.get("k", "/a") is None
+        cache.set("k", {"v": 1}, "/a", size=10, ttl=60)
+        assert cache.get("k", "/a").value == {"v": 1}
+
+        stats = cache.snapshot()
+        assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (1, 1, 1, 10)
+        assert stats["hits_by_endpoint"] == {"/a": 1}
+
+    def test_expired_entry_is_a_miss(self):
+        cache = MemoryResponseCache()
+        with patch("greenlake_service_catalog_mcp.utils.response_cache.time.monotonic", return_value=1000.0):
+            cache.set("k", 1, "/a", size=1, ttl=5)
+        with patch("greenlake_service_catalog_mcp.utils.response_cache.time.monotonic", return_value=1006.0):
+            assert cache.get("k", "/a") is None
+        assert cache.snapshot()["expirations"] == 1
+
+    def test_lru_eviction_by_entry_count(self):
+        cache = MemoryResponseCache(max_entries=2)
+        cache.set("a", 1, "/x", size=1, ttl=60)
+        cache.set("b", 2, "/x", size=1, ttl=60)
+        cache.get("a", "/x")  # "b" is now least recently used
+        cache.set("c", 3, "/x", size=1, ttl=60)
+
+        assert cache.get("b", "/x") is None
+        assert cache.get("a", "/x") is not None
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_eviction_by_byte_size(self):
+        cache = MemoryResponseCache(max_bytes=100)
+        cache.set("a", 1, "/x", size=60, ttl=60)
+        cache.set("b", 2, "/x", size=60, ttl=60)
+        assert cache.get("a", "/x") is None
+        assert cache.snapshot()["bytes"] == 60
+
+    def test_oversized_entry_is_not_stored(self):
+        cache = MemoryResponseCache(max_bytes=10)
+        cache.set("a", 1, "/x", size=11, ttl=60)
+        assert cache.snapshot()["entries"] == 0
+
+    def test_invalidate_by_prefix(self):
+        cache = MemoryResponseCache()
+        cache.set("a", 1, "/service-catalog/v1beta1/service-offers", size=1, ttl=60)
+        cache.set("b", 2, "/service-catalog/v1beta1/service-offers/{id}", size=1, ttl=60)
+        cache.set("c", 3, "/other/v1/things", size=1, ttl=60)
+
+        assert cache.invalidate("/service-catalog/v1beta1/service-offers") == 2
+        assert cache.snapshot()["entries"] == 1
+        assert cache.invalidate() == 1
+
+
+class TestSqliteResponseCache:
+    """Test cases for the persistent SQLite backend."""
+
+    KEY = ("GET", "https://api.example.test/service-catalog/v1beta1/service-offers/d1", (("limit", "1"),), "abc")
+
+    def test_entries_survive_reopen_and_are_shared(self, tmp_path):
+        path = tmp_path / "cache" / "responses.sqlite3"
+        writer = SqliteResponseCache(path)
+        writer.set(self.KEY, {"id": "d1"}, "/service-catalog/v1beta1/service-offers/{id}", size=10, ttl=60)
+        other = SqliteResponseCache(path)  # e.g. a second server process
+        assert other.get(self.KEY, "/service-catalog/v1beta1/service-offers/{id}").value == {"id": "d1"}
+        writer.close()
+        other.close()
+
+        reopened = SqliteResponseCache(path)
+        assert reopened.get(self.KEY, "/service-catalog/v1beta1/service-offers/{id}").value == {"id": "d1"}
+        assert oct(path.stat().st_mode & 0o777) == "0o600"
+        reopened.close()
+
+    def test_expired_entry_is_a_miss(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "responses.sqlite3")
+        with patch("greenlake_service_catalog_mcp.utils.response_cache.time.time", return_value=1000.0):
+            cache.set(self.KEY, 1, "/a", size=1, ttl=5)
+        with patch("greenlake_service_catalog_mcp.utils.response_cache.time.time", return_value=1006.0):
+            assert cache.get(self.KEY, "/a") is None
+        stats = cache.snapshot()
+        assert (stats["expirations"], stats["entries"]) == (1, 0)
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "responses.sqlite3", max_entries=2)
+        now = time.time()
+        clock = iter(range(10))
+        with patch(
+            "greenlake_service_catalog_mcp.utils.response_cache.time.time", side_effect=lambda: now + next(clock)
+        ):
+            cache.set("a", 1, "/x", size=1, ttl=60)
+            cache.set("b", 2, "/x", size=1, ttl=60)
+            cache.get("a", "/x")
+            cache.set("c", 3, "/x", size=1, ttl=60)
+
+        assert cache.get("b", "/x") is None
+        assert cache.get("a", "/x") is not None
+        assert cache.snapshot()["evictions"] == 1
+
+    def test_byte_bound_uses_serialized_size(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "responses.sqlite3", max_bytes=20)
+        cache.set("a", "x" * 50, "/x", size=0, ttl=60)
+        assert cache.snapshot()["entries"] == 0
+
+    def test_invalidate_by_prefix(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "responses.sqlite3")
+        cache.set("a", 1, "/service-catalog/v1beta1/service-offers", size=1, ttl=60)
+        cache.set("b", 2, "/service-catalog/v1beta1/service-offers/{id}", size=1, ttl=60)
+        cache.set("c", 3, "/other/v1/things", size=1, ttl=60)
+
+        assert cache.invalidate("/service-catalog/v1beta1/service-offers") == 2
+        assert cache.invalidate() == 1
+
+    def test_expired_entry_with_validators_is_kept_for_revalidation(self, tmp_path):
+        cache = SqliteResponseCache(tmp_path / "responses.sqlite3")
+        cache.set(
+            self.KEY,
+            {"items": []},
+            "/service-catalog/v1beta1/service-offers",
+            size=12,
+            ttl=0,
+            etag='"v1"',
+            decode_seconds=0.5,
+        )
+
+        assert cache.get(self.KEY, "/service-catalog/v1beta1/service-offers") is None
+        stale = cache.get_stale(self.KEY)
+        assert (stale.etag, stale.size, stale.decode_seconds) == ('"v1"', 12, 0.5)
+
+        cache.refresh(self.KEY, ttl=60)
+        assert cache.get(self.KEY, "/service-catalog/v1beta1/service-offers").value == {"items": []}
+
+    def test_client_falls_back_to_memory_when_disk_unavailable(self, http_client, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        http_client.settings.http_cache_persistent = True
+        http_client.settings.http_cache_dir = str(blocker)
+        http_client.settings.http_cache_max_entries = 10
+        http_client.settings.http_cache_max_bytes = 1000
+        assert isinstance(http_client._create_response_cache(), MemoryResponseCache)
+
+
+class TestHttpClientCaching:
+    """Test cases for response caching inside the HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_cached_endpoint_is_fetched_once(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({"id": "d1"}))) as mock_get:
+            first = await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            second = await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+
+        assert first == second == {"id": "d1"}
+        mock_get.assert_called_once()
+        assert http_client.get_cache_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_endpoint_without_ttl_is_not_cached(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({"items": []}))) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+
+        assert mock_get.call_count == 2
+        assert http_client.get_cache_stats()["stores"] == 0
+
+    @pytest.mark.asyncio
+    async def test_bypass_refetches_and_refreshes(self, http_client):
+        responses = [_json_response({"v": 1}), _json_response({"v": 2})]
+        with patch.object(http_client.client, "get", AsyncMock(side_effect=responses)):
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            assert await http_client.get("/service-catalog/v1beta1/service-offers/d1", use_cache=False) == {"v": 2}
+            assert await http_client.get("/service-catalog/v1beta1/service-offers/d1") == {"v": 2}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_refetch(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({}))) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            assert http_client.invalidate_cache("/service-catalog/v1beta1/service-offers") == 1
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_survives_token_refresh(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({}))) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            http_client.token_manager.get_auth_headers.return_value = {"Authorization": "Bearer rotated"}
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+
+        mock_get.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_is_bypassed(self, http_client):
+        http_client.settings.http_cache_enabled = False
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({}))) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+
+        assert mock_get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_cached_never_requests(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({"id": "d1"}))) as mock_get:
+            assert await http_client.get_cached("/service-catalog/v1beta1/service-offers/d1") is None
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            assert await http_client.get_cached("/service-catalog/v1beta1/service-offers/d1") == {"id": "d1"}
+            assert await http_client.get_cached("/service-catalog/v1beta1/service-offers") is None
+
+        mock_get.assert_called_once()
+
+
+class TestConditionalRevalidation:
+    """Test cases for ETag / Last-Modified revalidation in the HTTP client."""
+
+    @pytest.fixture(autouse=True)
+    def _enable_revalidation(self, http_client):
+        http_client.settings.http_cache_revalidate = True
+
+    @pytest.mark.asyncio
+    async def test_not_modified_returns_cached_body(self, http_client):
+        responses = [_json_response({"items": [1, 2]}, headers={"ETag": '"abc"'}), _not_modified()]
+        with patch.object(http_client.client, "get", AsyncMock(side_effect=responses)) as mock_get:
+            first = await http_client.get("/service-catalog/v1beta1/service-offers")
+            second = await http_client.get("/service-catalog/v1beta1/service-offers")
+
+        assert first == second == {"items": [1, 2]}
+        assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+        assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+        stats = http_client.get_revalidation_stats()["/service-catalog/v1beta1/service-offers"]
+        assert (stats["requests"], stats["not_modified"]) == (1, 1)
+        assert stats["bytes_saved"] == len(b'{"items":[1,2]}')
+
+    @pytest.mark.asyncio
+    async def test_modified_response_replaces_cached_body(self, http_client):
+        responses = [
+            _json_response({"v": 1}, headers={"Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+            _json_response({"v": 2}, headers={"Last-Modified": "Thu, 22 Oct 2026 07:28:00 GMT"}),
+            _not_modified(),
+        ]
+        with patch.object(http_client.client, "get", AsyncMock(side_effect=responses)) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+            assert await http_client.get("/service-catalog/v1beta1/service-offers") == {"v": 2}
+            assert await http_client.get("/service-catalog/v1beta1/service-offers") == {"v": 2}
+
+        sent = [c.kwargs["headers"].get("If-Modified-Since") for c in mock_get.call_args_list]
+        assert sent == [None, "Wed, 21 Oct 2026 07:28:00 GMT", "Thu, 22 Oct 2026 07:28:00 GMT"]
+        stats = http_client.get_revalidation_stats()["/service-catalog/v1beta1/service-offers"]
+        assert (stats["requests"], stats["not_modified"]) == (2, 1)
+
+    @pytest.mark.asyncio
+    async def test_fresh_entry_with_ttl_needs_no_request(self, http_client):
+        response = _json_response({"id": "d1"}, headers={"ETag": '"abc"'})
+        with patch.object(http_client.client, "get", AsyncMock(return_value=response)) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+            await http_client.get("/service-catalog/v1beta1/service-offers/d1")
+
+        mock_get.assert_called_once()
+        assert http_client.get_revalidation_stats() == {}
+
+    @pytest.mark.asyncio
+    async def test_responses_without_validators_are_not_kept(self, http_client):
+        with patch.object(http_client.client, "get", AsyncMock(return_value=_json_response({}))) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+
+        assert all("If-None-Match" not in c.kwargs["headers"] for c in mock_get.call_args_list)
+        assert http_client.get_cache_stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_disabled_revalidation_sends_no_validators(self, http_client):
+        http_client.settings.http_cache_revalidate = False
+        response = _json_response({}, headers={"ETag": '"abc"'})
+        with patch.object(http_client.client, "get", AsyncMock(return_value=response)) as mock_get:
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+
+        assert all("If-None-Match" not in c.kwargs["headers"] for c in mock_get.call_args_list)
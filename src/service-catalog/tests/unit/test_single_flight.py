@@ -0,0 +1,120 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for single-flight request coalescing in service-catalog MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from greenlake_service_catalog_mcp.utils.http_client import ServiceCatalogHttpClient
+from greenlake_service_catalog_mcp.utils.single_flight import SingleFlight, canonical_params, request_key
+
+
+@pytest.fixture
+def http_client() -> ServiceCatalogHttpClient:
+    token_manager = Mock(get_auth_headers=AsyncMock(), aclose=AsyncMock())
+    token_manager.get_auth_headers.return_value = {"Authorization": "Bearer test-token"}
+    with patch("greenlake_service_catalog_mcp.utils.http_client.TokenManager", return_value=token_manager):
+        return ServiceCatalogHttpClient()
+
+
+def _slow_get(payload: dict, calls: list[str]):
+    async def _get(url, headers=None, params=None):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=payload, request=httpx.Request("GET", url))
+
+    return _get
+
+
+class TestRequestKey:
+    """Test cases for coalescing key construction."""
+
+    def test_param_order_and_none_do_not_matter(self):
+        assert canonical_params({"limit": 10, "filter": "a eq 'b'", "offset": None}) == canonical_params(
+            {"filter": "a eq 'b'", "limit": "10"}
+        )
+
+    def test_identity_splits_keys(self):
+        a = request_key("GET", "https://x/devices", None, {"Authorization": "Bearer a"})
+        b = request_key("GET", "https://x/devices", None, {"Authorization": "Bearer b"})
+        assert a != b
+        assert "Bearer a" not in repr(a)
+
+    def test_tracking_headers_do_not_split_keys(self):
+        a = request_key("GET", "https://x/devices", None, {"Authorization": "Bearer a", "User-Agent": "v1"})
+        b = request_key("GET", "https://x/devices", None, {"Authorization": "Bearer a", "User-Agent": "v2"})
+        assert a == b
+
+
+class TestSingleFlight:
+    """Test cases for the coalescing primitive."""
+
+    @pytest.mark.asyncio
+    async def test_exception_reaches_all_waiters(self):
+        flight = SingleFlight()
+
+        async def boom():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        results = await asyncio.gather(*(flight.do("k", boom) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flight.stats.leaders == 1
+        assert flight.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_does_not_cancel_followers(self):
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        assert await follower == "done"
+
+
+class TestHttpClientCoalescing:
+    """Test cases for coalescing inside the HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_one_request(self, http_client):
+        calls: list[str] = []
+        with patch.object(http_client.client, "get", side_effect=_slow_get({"items": [1, 2]}, calls)):
+            results = await asyncio.gather(
+                *(http_client.get("/service-catalog/v1beta1/service-offers") for _ in range(5))
+            )
+
+        assert len(calls) == 1
+        assert all(r == {"items": [1, 2]} for r in results)
+        assert http_client.get_coalescing_stats() == {"leaders": 1, "hits": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self, http_client):
+        calls: list[str] = []
+        with patch.object(http_client.client, "get", side_effect=_slow_get({}, calls)):
+            await asyncio.gather(
+                http_client.get("/service-catalog/v1beta1/service-offers", params={"limit": 1}),
+                http_client.get("/service-catalog/v1beta1/service-offers", params={"limit": 2}),
+            )
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_sequential_gets_are_not_cached(self, http_client):
+        calls: list[str] = []
+        with patch.object(http_client.client, "get", side_effect=_slow_get({}, calls)):
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+            await http_client.get("/service-catalog/v1beta1/service-offers")
+
+        assert len(calls) == 2
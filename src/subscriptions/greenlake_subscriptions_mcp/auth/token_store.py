@@ -0,0 +1,243 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Cross-process shared token cache for subscriptions MCP server.
+
+Every GreenLake MCP server process otherwise requests its own access token for
+the same client credentials. With the shared store enabled, a token is written
+to a small JSON file keyed by token issuer and client ID; other processes
+(including the other GreenLake MCP servers) reuse it while it is valid.
+
+Refreshes are serialized with an advisory ``flock`` on a sibling lock file: the
+process holding the lock re-reads the file and only requests a new token if no
+other process already replaced the one being renewed. Token files are owner-only
+(0600) in an owner-only directory (0700), are replaced atomically, and are
+ignored if their permissions have been widened.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+from .oauth2_provider import OAuth2TokenResponse
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# Version of the token file layout; files with another version are ignored
+TOKEN_FILE_VERSION = 1
+
+
+class SharedTokenStore:
+    """File-backed token cache shared by processes using the same client credentials."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        issuer: str,
+        client_id: str,
+        lock_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        """
+        Initialize the store, creating its directory if needed.
+
+        Args:
+            directory: Base cache directory; token files are kept in its ``tokens`` subdirectory
+            issuer: OAuth2 token issuer URL the tokens are issued by
+            client_id: OAuth2 client ID the tokens are issued to
+            lock_timeout: Seconds to wait for another process's refresh before requesting a token anyway
+            poll_interval: Seconds between attempts to take the refresh lock
+
+        Raises:
+            OSError: If advisory locking is unavailable or the directory cannot be created
+        """
+        if fcntl is None:
+            raise OSError("advisory file locking is not available on this platform")
+        self.issuer = issuer
+        self.client_id = client_id
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.directory = Path(directory).expanduser() / "tokens"
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(self.directory, 0o700)
+        digest = hashlib.sha256(f"{issuer}\n{client_id}".encode()).hexdigest()[:32]
+        self.path = self.directory / f"{digest}.json"
+        self.lock_path = self.directory / f"{digest}.lock"
+
+    def load(self, buffer_seconds: float = 0.0) -> OAuth2TokenResponse | None:
+        """
+        Read the shared token if present and valid for at least ``buffer_seconds``.
+
+        Args:
+            buffer_seconds: Remaining lifetime a token needs to be returned
+
+        Returns:
+            The stored token, or None if missing, expired, unreadable or not owner-only
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                st = os.fstat(f.fileno())
+                if st.st_uid != os.getuid() or st.st_mode & 0o077:
+                    logger.warning(
+                        "Ignoring shared token file with unsafe ownership or permissions", path=str(self.path)
+                    )
+                    return None
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to read shared token file", path=str(self.path), error=str(e))
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != TOKEN_FILE_VERSION
+            or data.get("issuer") != self.issuer
+            or data.get("client_id") != self.client_id
+        ):
+            return None
+        expires_at = data.get("expires_at")
+        if expires_at is None or time.time() >= expires_at - buffer_seconds:
+            return None
+        try:
+            return OAuth2TokenResponse(
+                access_token=data["access_token"],
+                token_type=data.get("token_type", "Bearer"),
+                expires_in=round(expires_at - data["issued_at"]),
+                scope=data.get("scope"),
+                issued_at=data["issued_at"],
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, token: OAuth2TokenResponse) -> None:
+        """
+        Atomically replace the shared token file.
+
+        Tokens without an expiry are not shared, since other processes could not
+        tell when to stop reusing them.
+
+        Args:
+            token: Token response to share
+        """
+        if token.expires_at is None:
+            return
+        data: dict[str, Any] = {
+            "version": TOKEN_FILE_VERSION,
+            "issuer": self.issuer,
+            "client_id": self.client_id,
+            "access_token": token.access_token,
+            "token_type": token.token_type,
+            "scope": token.scope,
+            "issued_at": token.issued_at,
+            "expires_at": token.expires_at,
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    async def _wait_for_lock(self, fd: int) -> bool:
+        """Poll for the exclusive lock on ``fd`` until it is taken or ``lock_timeout`` passes."""
+        deadline = time.monotonic() + self.lock_timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for shared token refresh lock", path=str(self.lock_path))
+                    return False
+            except OSError as e:
+                logger.warning("Failed to lock shared token file", path=str(self.lock_path), error=str(e))
+                return False
+            await asyncio.sleep(self.poll_interval)
+
+    @asynccontextmanager
+    async def _refresh_lock(self) -> AsyncIterator[bool]:
+        """Hold the exclusive refresh lock; yields False if it could not be taken."""
+        try:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            logger.warning("Failed to open shared token lock file", path=str(self.lock_path), error=str(e))
+            fd = None
+        if fd is None:
+            yield False
+            return
+        try:
+            locked = await self._wait_for_lock(fd)
+            try:
+                yield locked
+            finally:
+                if locked:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    async def acquire(
+        self,
+        fetch: Callable[[], Awaitable[OAuth2TokenResponse]],
+        replace: str | None = None,
+        buffer_seconds: float = 0.0,
+    ) -> OAuth2TokenResponse:
+        """
+        Return a shared token, requesting a new one only if no process has a usable one.
+
+        A stored token is reused if it is valid for ``buffer_seconds`` and is not
+        ``replace`` (the token the caller is renewing). Otherwise the refresh lock is
+        taken, the file re-read in case another process refreshed meanwhile, and
+        only then is ``fetch`` called and its result shared.
+
+        Store errors never fail token acquisition: if the lock cannot be taken the
+        token is requested without being shared.
+
+        Args:
+            fetch: Coroutine factory requesting a token from the issuer
+            replace: Access token being renewed, which must not be returned
+            buffer_seconds: Remaining lifetime a stored token needs to be reused
+
+        Returns:
+            A valid token response
+        """
+
+        def usable() -> OAuth2TokenResponse | None:
+            token = self.load(buffer_seconds)
+            if token is not None and token.access_token != replace:
+                return token
+            return None
+
+        token = usable()
+        if token is not None:
+            logger.info("Reusing shared token", path=str(self.path))
+            return token
+
+        async with self._refresh_lock() as locked:
+            if locked:
+                token = usable()
+                if token is not None:
+                    logger.info("Reusing token refreshed by another process", path=str(self.path))
+                    return token
+            token = await fetch()
+            if locked:
+                try:
+                    self.save(token)
+                except OSError as e:
+                    logger.warning("Failed to write shared token file", path=str(self.path), error=str(e))
+            return token
@@ -32,6 +32,40 @@ class Settings(BaseSettings):
 
     greenlake_workspace_id: str = Field(description="GreenLake workspace identifier", alias="GREENLAKE_WORKSPACE_ID")
 
+    token_background_refresh: bool = Field(
+        default=True,
+        description="Renew the access token in a background task before it expires",
+        alias="GREENLAKE_TOKEN_BACKGROUND_REFRESH",
+    )
+
+    token_refresh_fraction: float = Field(
+        default=0.8,
+        gt=0,
+        le=1,
+        description="Fraction of the token lifetime after which the background task renews it",
+        alias="GREENLAKE_TOKEN_REFRESH_FRACTION",
+    )
+
+    token_refresh_jitter: float = Field(
+        default=0.1,
+        ge=0,
+        lt=1,
+        description="Random relative spread applied to the background refresh point",
+        alias="GREENLAKE_TOKEN_REFRESH_JITTER",
+    )
+
+    token_cache_shared: bool = Field(
+        default=False,
+        description="Share access tokens with other GreenLake MCP server processes through a locked token file",
+        alias="GREENLAKE_TOKEN_CACHE_SHARED",
+    )
+
+    token_cache_dir: str = Field(
+        default="~/.hpe/mcp-cache",
+        description="Directory of the shared token cache (tokens are kept in its tokens/ subdirectory)",
+        alias="GREENLAKE_TOKEN_CACHE_DIR",
+    )
+
     # Application Configuration
     log_level: str = Field(default="INFO", description="Logging level", alias="LOG_LEVEL")
 
@@ -40,6 +74,142 @@ class Settings(BaseSettings):
 
     http_retries: int = Field(default=3, description="HTTP request retry attempts", alias="HTTP_RETRIES")
 
+    http_retry_backoff: float = Field(
+        default=0.5,
+        description="Initial backoff ceiling in seconds for retried HTTP requests (doubles per retry, jittered)",
+        alias="HTTP_RETRY_BACKOFF",
+    )
+
+    http_retry_max_backoff: float = Field(
+        default=30.0,
+        description="Maximum computed backoff in seconds between HTTP retries",
+        alias="HTTP_RETRY_MAX_BACKOFF",
+    )
+
+    http_retry_deadline: float = Field(
+        default=120.0,
+        description="Total time budget in seconds for one HTTP request including all retries",
+        alias="HTTP_RETRY_DEADLINE",
+    )
+
+    # Client-side Rate Limiting (requests per minute per workspace)
+    http_rate_limits: dict[str, int] = Field(
+        default_factory=lambda: {"/subscriptions/v1/subscriptions": 60, "/subscriptions/v1/subscriptions/{id}": 20},
+        description="Requests per minute per workspace keyed by endpoint family (JSON object); defaults to the documented API limits",
+        alias="HTTP_RATE_LIMITS",
+    )
+
+    http_rate_limit_per_minute: int = Field(
+        default=0,
+        description="Requests per minute per workspace for endpoints without an entry in HTTP_RATE_LIMITS (0 disables)",
+        alias="HTTP_RATE_LIMIT_PER_MINUTE",
+    )
+
+    http_rate_limit_burst: int = Field(
+        default=10,
+        description="Requests allowed back-to-back before client-side pacing starts",
+        alias="HTTP_RATE_LIMIT_BURST",
+    )
+
+    http_rate_limit_max_wait: float = Field(
+        default=60.0,
+        description="Longest time in seconds a request may queue for the rate limiter before failing",
+        alias="HTTP_RATE_LIMIT_MAX_WAIT",
+    )
+
+    # Response Cache Configuration
+    http_cache_enabled: bool = Field(
+        default=True, description="Cache GET responses for endpoints with a TTL", alias="HTTP_CACHE_ENABLED"
+    )
+
+    http_cache_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description="Response cache TTL in seconds keyed by endpoint family (JSON object)",
+        alias="HTTP_CACHE_TTLS",
+    )
+
+    http_cache_default_ttl: float = Field(
+        default=0.0,
+        description="Response cache TTL in seconds for endpoints without an entry in HTTP_CACHE_TTLS (0 disables)",
+        alias="HTTP_CACHE_DEFAULT_TTL",
+    )
+
+    http_cache_max_entries: int = Field(
+        default=512, description="Maximum number of cached responses", alias="HTTP_CACHE_MAX_ENTRIES"
+    )
+
+    http_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        description="Maximum total size in bytes of cached response bodies",
+        alias="HTTP_CACHE_MAX_BYTES",
+    )
+
+    http_cache_revalidate: bool = Field(
+        default=True,
+        description="Revalidate expired responses with If-None-Match/If-Modified-Since when the API sent an ETag or "
+        "Last-Modified header; such responses are kept for revalidation even on endpoints without a TTL",
+        alias="HTTP_CACHE_REVALIDATE",
+    )
+
+    http_cache_persistent: bool = Field(
+        default=False,
+        description="Store cached responses in a SQLite database under HTTP_CACHE_DIR so they survive restarts",
+        alias="HTTP_CACHE_PERSISTENT",
+    )
+
+    http_cache_dir: str = Field(
+        default="~/.hpe/mcp-cache",
+        description="Directory of the persistent response cache, shared by all GreenLake MCP servers",
+        alias="HTTP_CACHE_DIR",
+    )
+
+    http_cache_disk_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of responses in the persistent cache",
+        alias="HTTP_CACHE_DISK_MAX_ENTRIES",
+    )
+
+    http_cache_disk_max_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description="Maximum total size in bytes of response bodies in the persistent cache",
+        alias="HTTP_CACHE_DISK_MAX_BYTES",
+    )
+
+    # Server-side store for list results returned by handle
+    result_store_ttl: float = Field(
+        default=900.0,
+        gt=0,
+        description="Seconds a list result stored with return_handle stays readable",
+        alias="RESULT_STORE_TTL",
+    )
+
+    result_store_max_entries: int = Field(
+        default=64,
+        description="Maximum number of list results kept in the result store",
+        alias="RESULT_STORE_MAX_ENTRIES",
+    )
+
+    result_store_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum total serialized size in bytes of list results kept in the result store",
+        alias="RESULT_STORE_MAX_BYTES",
+    )
+
+    # Response size budget applied to every tool result
+    response_max_tokens: int = Field(
+        default=0,
+        ge=0,
+        description="Estimated token budget for a tool result, for example 25000; larger list results are truncated with a continuation (0, the default, disables)",
+        alias="RESPONSE_MAX_TOKENS",
+    )
+
+    response_max_bytes: int = Field(
+        default=0,
+        ge=0,
+        description="Serialized byte budget for a tool result; the smaller of this and the token budget applies (0 disables)",
+        alias="RESPONSE_MAX_BYTES",
+    )
+
     # MCP Tool Configuration
     mcp_tool_mode: str = Field(
         default="static",
@@ -0,0 +1,170 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+analyze_subscriptions tool for subscriptions MCP server.
+
+Answers renewal planning questions (what expires in the next 30/60/90 days,
+how much quantity per SKU and tier, how much of it is used) without returning
+the subscriptions: paged GET /subscriptions/v1/subscriptions requests are
+streamed through ``utils.pagination.iter_pages`` and each page is folded into
+``utils.subscription_analytics.SubscriptionAnalytics`` as it arrives, so only
+a few pages are held at a time and the result is a compact summary with the
+subscription IDs behind each expiry bucket.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_subscriptions_mcp.config.logging import get_logger
+from greenlake_subscriptions_mcp.server.fastmcp_instance import mcp
+from greenlake_subscriptions_mcp.tools.implementations.getsubscriptionsv1 import FILTER_FIELDS
+from greenlake_subscriptions_mcp.utils.batch_lookup import MAX_BATCH_IDS
+from greenlake_subscriptions_mcp.utils.odata_filter import normalize_filter
+from greenlake_subscriptions_mcp.utils.pagination import MAX_ITEMS_CAP, PaginationSummary, iter_pages
+from greenlake_subscriptions_mcp.utils.subscription_analytics import (
+    DEFAULT_IDS_PER_BUCKET,
+    DEFAULT_WINDOWS,
+    MAX_WINDOWS,
+    SubscriptionAnalytics,
+)
+
+logger = get_logger(__name__)
+
+COLLECTION_ENDPOINT = "/subscriptions/v1/subscriptions"
+
+# Subscriptions requested per page
+PAGE_SIZE = 50
+
+
+def _windows(values: list[int] | str | None) -> list[int]:
+    """Parse expiry windows given as a list or a comma separated string of days."""
+    if values is None:
+        return list(DEFAULT_WINDOWS)
+    parts: Sequence[int | str] = values.split(",") if isinstance(values, str) else values
+    try:
+        return [int(str(v).strip()) for v in parts if str(v).strip()]
+    except ValueError as exc:
+        raise ValueError(f"'windows' must be whole numbers of days: {exc}") from exc
+
+
+def _as_of(value: str | None) -> datetime:
+    """Parse the reference instant (ISO 8601; naive values are UTC), or return now."""
+    if not value:
+        return datetime.now(timezone.utc)
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError as exc:
+        raise ValueError(f"'as_of' must be an ISO 8601 timestamp, got '{value}'") from exc
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+@mcp.tool(
+    name="analyze_subscriptions",
+    description=f"Summarize the subscriptions of the workspace for renewal planning instead of listing them: expiry buckets (expired, ending within each window of days such as 0-30d, 30-60d, 60-90d, later, no endTime) with their counts, quantity and subscription IDs, quantity, available quantity and utilisation ((quantity - availableQuantity) / quantity) per sku and per tier, counts per subscriptionStatus, and overall utilisation. Optionally restricted with the same OData filter and filter-tags as getsubscriptionsv1. Every page of getsubscriptionsv1 is read server-side and folded as it arrives (up to {MAX_ITEMS_CAP} subscriptions), so the result stays small whatever the number of subscriptions.",
+)
+async def analyze_subscriptions(
+    ctx: Context,
+    windows: Annotated[
+        list[int] | str | None,
+        Field(
+            description=f"Expiry windows in days, as a list or a comma separated string (up to {MAX_WINDOWS}). The default value is 30,60,90."
+        ),
+    ] = None,
+    filter: Annotated[
+        str | None,
+        Field(
+            description="Filter on subscription properties, as for getsubscriptionsv1, for example \"subscriptionType eq 'CENTRAL_AP'\"."
+        ),
+    ] = None,
+    filter_tags: Annotated[
+        str | None,
+        Field(
+            description="Filter on tag keys and values, as for getsubscriptionsv1, for example \"'city' eq 'London'\"."
+        ),
+    ] = None,
+    as_of: Annotated[
+        str | None,
+        Field(
+            description="ISO 8601 instant expiry is measured from, for example '2026-12-31T00:00:00Z'. The default value is now."
+        ),
+    ] = None,
+    ids_per_bucket: Annotated[
+        int,
+        Field(
+            description=f"Maximum number of subscription IDs listed per expiry bucket. The default value is {DEFAULT_IDS_PER_BUCKET}.",
+            ge=0,
+            le=MAX_BATCH_IDS,
+        ),
+    ] = DEFAULT_IDS_PER_BUCKET,
+    limit: Annotated[
+        int,
+        Field(description="Maximum number of rows in the sku and tier tables. The default value is 50.", ge=1),
+    ] = 50,
+) -> list[dict[str, Any]]:
+    """Summarize subscription expiry, quantities and utilisation.
+
+    Args:
+        windows: Expiry windows in days
+        filter: Filter on subscription properties
+        filter_tags: Filter on tag keys and values
+        as_of: Instant expiry is measured from
+        ids_per_bucket: Maximum number of subscription IDs listed per expiry bucket
+        limit: Maximum number of rows in the sku and tier tables
+    Returns:
+        Subscription analytics, as a list containing one result dict.
+    """
+    http_client = ctx.request_context.lifespan_context.http_client
+
+    try:
+        analytics = SubscriptionAnalytics(_as_of(as_of), _windows(windows), ids_per_bucket)
+        params: dict[str, Any] = {}
+        if filter:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if filter_tags:
+            params["filter-tags"] = normalize_filter(filter_tags)
+
+        started = time.perf_counter()
+        pagination = PaginationSummary()
+        seen: set[str] = set()
+        duplicates = 0
+        async for page in iter_pages(http_client, COLLECTION_ENDPOINT, params, PAGE_SIZE, summary=pagination):
+            unseen = []
+            for subscription in page:
+                subscription_id = subscription.get("id") if isinstance(subscription, dict) else None
+                if subscription_id is not None:
+                    # Offset pages can overlap if subscriptions change while they are read
+                    if subscription_id in seen:
+                        duplicates += 1
+                        continue
+                    seen.add(subscription_id)
+                unseen.append(subscription)
+            analytics.add(unseen)
+        elapsed_seconds = round(time.perf_counter() - started, 3)
+
+        logger.info(
+            f"analyze_subscriptions: {analytics.subscriptions} subscriptions in {pagination.pages_fetched} requests "
+            f"({elapsed_seconds}s)"
+        )
+        result = analytics.summary(limit)
+        result["scan"] = {
+            "requests": pagination.pages_fetched,
+            "total": pagination.total,
+            "duplicates_dropped": duplicates,
+            "complete": not pagination.truncated,
+            "elapsed_seconds": elapsed_seconds,
+        }
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in analyze_subscriptions: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in analyze_subscriptions: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -0,0 +1,110 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+getsubscriptiondetailsbyids tool for subscriptions MCP server.
+
+Looks up many subscriptions in one tool call instead of one
+``getsubscriptiondetailsbyidv1`` call per subscription. The detail endpoint
+GET /subscriptions/v1/subscriptions/{id} allows 20 requests per minute against
+60 for the list endpoint, so subscriptions whose detail response is not cached
+are looked up with ``id in '...'`` filters on GET /subscriptions/v1/subscriptions
+(as many per request as the URL length allows), and only the IDs those filters
+miss are fetched from the detail endpoint.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_subscriptions_mcp.config.logging import get_logger
+from greenlake_subscriptions_mcp.server.fastmcp_instance import mcp
+from greenlake_subscriptions_mcp.utils.batch_lookup import (
+    MAX_BATCH_IDS,
+    chunk_in_filters,
+    fetch_by_filter,
+    fetch_by_path,
+    parse_ids,
+    probe_cache,
+)
+
+logger = get_logger(__name__)
+
+COLLECTION_ENDPOINT = "/subscriptions/v1/subscriptions"
+ITEM_ENDPOINT = "/subscriptions/v1/subscriptions/{id}"
+
+
+@mcp.tool(
+    name="getsubscriptiondetailsbyids",
+    description=f"Get many subscriptions in one call by subscription ID (up to {MAX_BATCH_IDS}), instead of calling getsubscriptiondetailsbyidv1 once per subscription. Cached subscriptions are returned without a request; the rest are looked up with as few filtered getsubscriptionsv1 list requests as the URL length allows, and only IDs the list misses are fetched from the rate-limited detail endpoint. Returns the subscriptions keyed by ID, per-item errors (not_found or request_failed) keyed by ID, and a lookup summary with the requests made.",
+)
+async def getsubscriptiondetailsbyids(
+    ctx: Context,
+    ids: Annotated[
+        list[str] | str,
+        Field(description="Subscription IDs to look up, as a list or a comma separated string."),
+    ],
+) -> list[dict[str, Any]]:
+    """Get many subscriptions by subscription ID.
+
+    Args:
+        ids: Subscription IDs to look up
+    Returns:
+        Subscriptions keyed by ID with per-item errors, as a list containing one result dict.
+    """
+    http_client = ctx.request_context.lifespan_context.http_client
+
+    try:
+        subscription_ids = parse_ids(ids, "ids")
+        if not subscription_ids:
+            raise ValueError("Provide at least one value in 'ids'")
+
+        started = time.monotonic()
+        found = await probe_cache(http_client, ITEM_ENDPOINT, subscription_ids)
+        lookup: dict[str, Any] = {"cache_hits": len(found), "list_requests": 0, "detail_requests": 0}
+        errors: dict[str, dict[str, Any]] = {}
+
+        remaining = [i for i in subscription_ids if i not in found]
+        chunks = chunk_in_filters("id", remaining, f"{http_client.base_url}{COLLECTION_ENDPOINT}") if remaining else []
+        if chunks:
+            listed, errors = await fetch_by_filter(http_client, COLLECTION_ENDPOINT, "id", chunks)
+            found.update(listed)
+            lookup["list_requests"] = len(chunks)
+
+        # Only what the list queries did not return goes to the 20-per-minute detail endpoint
+        missed = [i for i in subscription_ids if i not in found]
+        if missed:
+            detailed, errors = await fetch_by_path(http_client, ITEM_ENDPOINT, missed)
+            found.update(detailed)
+            lookup["detail_requests"] = len(missed)
+
+        lookup["requests"] = lookup["list_requests"] + lookup["detail_requests"]
+        lookup["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        subscriptions = {i: found[i] for i in subscription_ids if i in found}
+        logger.info(
+            f"getsubscriptiondetailsbyids: {len(subscriptions)} of {len(subscription_ids)} found "
+            f"({lookup['cache_hits']} cached, {lookup['list_requests']} list and "
+            f"{lookup['detail_requests']} detail requests)"
+        )
+        return [
+            {
+                "success": True,
+                "result": {
+                    "items": subscriptions,
+                    "errors": errors,
+                    "count": len(subscriptions),
+                    "requested": len(subscription_ids),
+                    "lookup": lookup,
+                },
+            }
+        ]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in getsubscriptiondetailsbyids: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in getsubscriptiondetailsbyids: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
@@ -46,8 +46,13 @@ def get_tool_classes(mode: str | None = None) -> list:
             # register the function with the FastMCP instance.
             import greenlake_subscriptions_mcp.tools.implementations.getsubscriptionsv1  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_subscriptions_mcp.tools.implementations.getsubscriptiondetailsbyidv1  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_subscriptions_mcp.tools.implementations.getsubscriptiondetailsbyids  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_subscriptions_mcp.tools.implementations.analyze_subscriptions  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_subscriptions_mcp.tools.implementations.read_result  # noqa: F401 (triggers @mcp.tool registration)
 
-            logger.info("Static mode: 2 endpoint tools registered")
+            logger.info(
+                "Static mode: 2 endpoint tools, getsubscriptiondetailsbyids, analyze_subscriptions and read_result registered"
+            )
     except ImportError as exc:
         logger.error(f"Failed to import tool module: {exc}")
 
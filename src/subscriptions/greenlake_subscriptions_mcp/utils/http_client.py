@@ -5,24 +5,77 @@ HTTP client for subscriptions MCP server.
 This module provides HTTP client functionality with authentication integration.
 """
 
+import asyncio
+import re
+import sqlite3
+import time
+from pathlib import Path
+
 from loguru import logger
 from typing import Any, Dict, Optional
 
 import httpx
 from greenlake_subscriptions_mcp.config.settings import settings
 from greenlake_subscriptions_mcp.auth.token_manager import TokenManager
+from greenlake_subscriptions_mcp.auth.token_store import SharedTokenStore
 from greenlake_subscriptions_mcp._version import USER_AGENT
+from greenlake_subscriptions_mcp.utils.rate_limiter import RateLimiter
+from greenlake_subscriptions_mcp.utils.response_cache import (
+    MemoryResponseCache,
+    ResponseCache,
+    RevalidationStats,
+    SqliteResponseCache,
+)
+from greenlake_subscriptions_mcp.utils.single_flight import SingleFlight, request_key
+from greenlake_subscriptions_mcp.utils.retry import (
+    RETRYABLE_EXCEPTIONS,
+    RETRYABLE_STATUS_CODES,
+    RetryPolicy,
+    RetryStats,
+    parse_retry_after,
+)
+
+# Path segments that look like resource identifiers (contain a digit, or are long
+# opaque tokens) are collapsed so per-endpoint statistics stay bounded.
+_VERSION_SEGMENT = re.compile(r"^v\d+[a-z0-9]*$")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """
+    Reduce a concrete request path to its endpoint family.
+
+    ``/subscriptions/v1/subscriptions/ABC123`` becomes ``/subscriptions/v1/subscriptions/{id}`` so that
+    statistics and per-endpoint settings are keyed by API operation rather than by
+    every individual resource that was requested.
+
+    Args:
+        endpoint: API endpoint path as passed to the client
+
+    Returns:
+        Endpoint path with identifier-like segments replaced by ``{id}``
+    """
+    segments = endpoint.split("?", 1)[0].split("/")
+    for i, segment in enumerate(segments):
+        if not segment or _VERSION_SEGMENT.match(segment):
+            continue
+        if any(ch.isdigit() for ch in segment) or len(segment) > 32:
+            segments[i] = "{id}"
+    return "/".join(segments)
 
 
 class SubscriptionsHttpClient:
     """HTTP client for subscriptions API with authentication."""
 
-    def __init__(self):
-        """Initialize the HTTP client with lazy token authentication."""
+    def __init__(self, response_cache: Optional[ResponseCache] = None):
+        """Initialize the HTTP client with lazy token authentication.
+
+        Args:
+            response_cache: Cache backend for GET responses (defaults to an in-memory LRU cache)
+        """
         self.settings = settings
         self.base_url = settings.greenlake_api_base_url
         self.logger = logger  # Use global loguru logger
-        self.token_manager = TokenManager(settings=self.settings)
+        self.token_manager = TokenManager(settings=self.settings, token_store=self._create_token_store())
 
         # HTTP client configuration
         self.client = httpx.AsyncClient(
@@ -30,11 +83,68 @@ class SubscriptionsHttpClient:
             limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
         )
 
+        # Retry configuration for idempotent GET requests
+        self.retry_policy = RetryPolicy(
+            max_retries=self.settings.http_retries,
+            initial_backoff=self.settings.http_retry_backoff,
+            max_backoff=self.settings.http_retry_max_backoff,
+            deadline=self.settings.http_retry_deadline,
+        )
+        self.retry_stats = RetryStats()
+
+        # Client-side pacing shared by all concurrent tool calls
+        self.rate_limiter = RateLimiter(
+            default_per_minute=self.settings.http_rate_limit_per_minute,
+            family_limits=self.settings.http_rate_limits,
+            burst=self.settings.http_rate_limit_burst,
+            max_wait=self.settings.http_rate_limit_max_wait,
+        )
+
+        # Identical concurrent GETs share one upstream request
+        self.single_flight = SingleFlight()
+
+        # Cache for GET responses of endpoints with a configured TTL
+        self.response_cache: ResponseCache = response_cache or self._create_response_cache()
+        self.revalidation_stats = RevalidationStats()
+        self._cache_identity = f"{self.settings.workspace_id}:{self.settings.client_id}"
+
+    def _create_token_store(self) -> Optional[SharedTokenStore]:
+        """Create the cross-process token store if enabled, or None if disabled or unavailable."""
+        if not self.settings.token_cache_shared:
+            return None
+        try:
+            return SharedTokenStore(
+                self.settings.token_cache_dir,
+                issuer=self.settings.token_issuer,
+                client_id=self.settings.client_id,
+            )
+        except OSError as e:
+            self.logger.warning(f"Shared token cache unavailable, tokens will not be shared: {e}")
+            return None
+
+    def _create_response_cache(self) -> ResponseCache:
+        """Create the configured response cache, falling back to memory if the disk cache cannot be opened."""
+        if self.settings.http_cache_persistent:
+            path = Path(self.settings.http_cache_dir).expanduser() / "responses.sqlite3"
+            try:
+                return SqliteResponseCache(
+                    path,
+                    max_entries=self.settings.http_cache_disk_max_entries,
+                    max_bytes=self.settings.http_cache_disk_max_bytes,
+                )
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"Persistent response cache at {path} unavailable, using memory cache: {e}")
+        return MemoryResponseCache(
+            max_entries=self.settings.http_cache_max_entries,
+            max_bytes=self.settings.http_cache_max_bytes,
+        )
+
     async def get(
         self,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         additional_headers: Optional[Dict[str, str]] = None,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Make GET request to the API.
@@ -43,9 +153,13 @@ class SubscriptionsHttpClient:
             endpoint: API endpoint path
             params: Query parameters
             additional_headers: Additional headers to include in the request
+            use_cache: When False, skip the response cache lookup and ask the API
+                (the fresh response still replaces the cached one; an unchanged
+                response may still be confirmed with a conditional request)
 
         Returns:
-            Response data as dictionary
+            Response data as dictionary. Cached and coalesced responses are shared
+            between callers, so callers must treat the result as read-only.
         """
         url = f"{self.base_url}{endpoint}"
         headers = await self._get_auth_headers()
@@ -54,12 +168,103 @@ class SubscriptionsHttpClient:
         if additional_headers:
             headers.update(additional_headers)
 
+        family = endpoint_family(endpoint)
+        ttl = self._cache_ttl(family)
+        # Cache keys use the stable workspace/client identity so entries survive token refreshes
+        cache_key = request_key("GET", url, params, headers, identity=self._cache_identity)
+
+        if ttl > 0 and use_cache:
+            entry = self.response_cache.get(cache_key, family)
+            if entry is not None:
+                self.logger.debug(f"Cache hit for GET {family}")
+                return entry.value  # type: ignore[no-any-return]
+
+        return await self.single_flight.do(  # type: ignore[no-any-return]
+            request_key("GET", url, params, headers),
+            lambda: self._fetch_json(endpoint, url, headers, params, cache_key, ttl),
+        )
+
+    async def get_cached(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the fresh cached response of a GET request without contacting the API.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            The cached response data (read-only, as for ``get``), or None if the
+            endpoint is not cached or has no fresh entry
+        """
+        family = endpoint_family(endpoint)
+        if self._cache_ttl(family) <= 0:
+            return None
+        headers = await self._get_auth_headers()
+        cache_key = request_key("GET", f"{self.base_url}{endpoint}", params, headers, identity=self._cache_identity)
+        entry = self.response_cache.get(cache_key, family)
+        return entry.value if entry is not None else None  # type: ignore[no-any-return]
+
+    async def _fetch_json(
+        self,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+        cache_key: Any = None,
+        cache_ttl: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Perform a GET request, decode the JSON body and store it in the response cache.
+
+        If a cached entry with an ``ETag`` or ``Last-Modified`` validator exists, the
+        request is sent with ``If-None-Match`` / ``If-Modified-Since``; a ``304 Not
+        Modified`` refreshes the entry and returns the cached body without decoding.
+
+        Args:
+            endpoint: API endpoint path
+            url: Fully-qualified request URL
+            headers: Request headers
+            params: Query parameters
+            cache_key: Response cache key for this request
+            cache_ttl: Seconds to cache the decoded body (0 keeps it only for revalidation)
+
+        Returns:
+            Response data as dictionary
+        """
         self.logger.debug(f"GET request to: {url}")
 
+        family = endpoint_family(endpoint)
+        revalidate = self._revalidation_enabled()
+        stale = self.response_cache.get_stale(cache_key) if revalidate and cache_key is not None else None
+        if stale is not None:
+            headers = dict(headers)
+            if stale.etag:
+                headers["If-None-Match"] = stale.etag
+            if stale.last_modified:
+                headers["If-Modified-Since"] = stale.last_modified
+
         try:
-            response = await self.client.get(url, headers=headers, params=params)
+            response = await self._get_with_retry(endpoint, url, headers, params)
+            if stale is not None:
+                not_modified = response.status_code == 304
+                self.revalidation_stats.record(family, stale, not_modified)
+                if not_modified:
+                    self.logger.debug(f"GET {family} not modified, refreshing cached response")
+                    self.response_cache.refresh(cache_key, cache_ttl)
+                    return stale.value  # type: ignore[no-any-return]
             response.raise_for_status()
-            return response.json()  # type: ignore[no-any-return]
+
+            started = time.perf_counter()
+            data = response.json()
+            decode_seconds = time.perf_counter() - started
+
+            etag = response.headers.get("ETag") if revalidate else None
+            last_modified = response.headers.get("Last-Modified") if revalidate else None
+            if cache_key is not None and (cache_ttl > 0 or etag or last_modified):
+                body = response.content
+                size = len(body) if isinstance(body, bytes) else 0
+                self.response_cache.set(cache_key, data, family, size, cache_ttl, etag, last_modified, decode_seconds)
+            return data  # type: ignore[no-any-return]
 
         except httpx.HTTPStatusError as e:
             self.logger.error(f"HTTP error {e.response.status_code}: {e.response.text}")
@@ -68,6 +273,149 @@ class SubscriptionsHttpClient:
             self.logger.error(f"Request failed: {str(e)}")
             raise
 
+    async def _get_with_retry(
+        self,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        """
+        Send a GET request, retrying transient failures according to the retry policy.
+
+        Retries 429/502/503/504 responses and connection-level errors. The delay honours
+        ``Retry-After`` / ``retryAfterSeconds`` when the server provides one and falls back
+        to jittered exponential backoff otherwise. No retry is scheduled past the policy's
+        total deadline; the last response (or exception) is handed back to the caller.
+        Every attempt, including retries, first takes a token from the rate limiter.
+
+        Args:
+            endpoint: API endpoint path (used for per-endpoint statistics)
+            url: Fully-qualified request URL
+            headers: Request headers
+            params: Query parameters
+
+        Returns:
+            The final HTTP response (possibly still a retryable error status)
+        """
+        policy = self.retry_policy
+        family = endpoint_family(endpoint)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + policy.deadline
+        attempt = 0
+
+        while True:
+            await self.rate_limiter.acquire(self.settings.workspace_id, family)
+            self.retry_stats.record_attempt(family, first=attempt == 0)
+            try:
+                response = await self.client.get(url, headers=headers, params=params)
+            except RETRYABLE_EXCEPTIONS as e:
+                reason = type(e).__name__
+                delay = policy.compute_delay(attempt)
+                if attempt >= policy.max_retries or loop.time() + delay > deadline:
+                    self.retry_stats.record_outcome(family, retried=attempt > 0, exhausted=True)
+                    raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES:
+                    self.retry_stats.record_outcome(family, retried=attempt > 0, exhausted=False)
+                    return response
+                reason = str(response.status_code)
+                retry_after = parse_retry_after(response)
+                if response.status_code == 429 and retry_after:
+                    # Hold back other callers too, not just this one
+                    self.rate_limiter.throttle(self.settings.workspace_id, family, retry_after)
+                delay = policy.compute_delay(attempt, retry_after)
+                if attempt >= policy.max_retries or loop.time() + delay > deadline:
+                    self.retry_stats.record_outcome(family, retried=attempt > 0, exhausted=True)
+                    return response
+
+            self.retry_stats.record_retry(family, reason, delay)
+            self.logger.warning(
+                f"Retrying GET {family} after {reason} in {delay:.2f}s (retry {attempt + 1}/{policy.max_retries})"
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def _cache_ttl(self, family: str) -> float:
+        """Return the response cache TTL in seconds for an endpoint family (0 = not cached)."""
+        if not self.settings.http_cache_enabled:
+            return 0.0
+        ttl = self.settings.http_cache_ttls.get(family)
+        return float(ttl if ttl is not None else self.settings.http_cache_default_ttl)
+
+    def _revalidation_enabled(self) -> bool:
+        """Whether responses with validators are kept and revalidated with conditional requests."""
+        return bool(self.settings.http_cache_enabled and self.settings.http_cache_revalidate)
+
+    def invalidate_cache(self, endpoint: Optional[str] = None) -> int:
+        """
+        Drop cached responses.
+
+        Args:
+            endpoint: Endpoint path or family prefix to invalidate (e.g. ``/subscriptions/v1/subscriptions``
+                also drops ``/subscriptions/v1/subscriptions/{id}`` entries); None clears the whole cache
+
+        Returns:
+            Number of cached responses removed
+        """
+        prefix = endpoint_family(endpoint) if endpoint is not None else None
+        return self.response_cache.invalidate(prefix)
+
+    def _invalidate_after_write(self, endpoint: str) -> None:
+        """Drop cached responses for the collection a successful write touched."""
+        family = endpoint_family(endpoint)
+        collection = family.split("/{id}", 1)[0]
+        self.response_cache.invalidate(collection)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get response cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, store, eviction, expiration and invalidation counts,
+            per-endpoint hits/misses, and current entry count and size in bytes
+        """
+        return self.response_cache.snapshot()
+
+    def get_revalidation_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-endpoint conditional request statistics.
+
+        Returns:
+            Dictionary keyed by endpoint family with conditional request and ``304`` counts,
+            and the response bytes and JSON decode time the ``304`` responses saved
+        """
+        return self.revalidation_stats.snapshot()
+
+    def get_retry_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-endpoint retry counters.
+
+        Returns:
+            Dictionary keyed by endpoint family with request, attempt, retry and outcome counts
+        """
+        return self.retry_stats.snapshot()
+
+    def get_rate_limit_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get client-side rate limiter statistics.
+
+        Returns:
+            Dictionary keyed by ``workspace:family`` with acquired, delayed and rejected
+            counts, wait times and current/maximum queue depth
+        """
+        return self.rate_limiter.snapshot()
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get single-flight coalescing statistics.
+
+        Returns:
+            Dictionary with ``leaders`` (upstream requests), ``hits`` (callers that joined
+            an in-flight request) and ``in_flight`` counts
+        """
+        return self.single_flight.snapshot()
+
     async def post(
         self, endpoint: str, data: Optional[Dict[str, Any]] = None, additional_headers: Optional[Dict[str, str]] = None
     ) -> Dict[str, Any]:
@@ -92,8 +440,10 @@ class SubscriptionsHttpClient:
         self.logger.debug(f"POST request to: {url}")
 
         try:
+            await self.rate_limiter.acquire(self.settings.workspace_id, endpoint_family(endpoint))
             response = await self.client.post(url, headers=headers, json=data)
             response.raise_for_status()
+            self._invalidate_after_write(endpoint)
             return response.json()  # type: ignore[no-any-return]
 
         except httpx.HTTPStatusError as e:
@@ -127,8 +477,10 @@ class SubscriptionsHttpClient:
         self.logger.debug(f"PUT request to: {url}")
 
         try:
+            await self.rate_limiter.acquire(self.settings.workspace_id, endpoint_family(endpoint))
             response = await self.client.put(url, headers=headers, json=data)
             response.raise_for_status()
+            self._invalidate_after_write(endpoint)
             return response.json()  # type: ignore[no-any-return]
 
         except httpx.HTTPStatusError as e:
@@ -162,8 +514,10 @@ class SubscriptionsHttpClient:
         self.logger.debug(f"PATCH request to: {url}")
 
         try:
+            await self.rate_limiter.acquire(self.settings.workspace_id, endpoint_family(endpoint))
             response = await self.client.patch(url, headers=headers, json=data)
             response.raise_for_status()
+            self._invalidate_after_write(endpoint)
             return response.json()  # type: ignore[no-any-return]
 
         except httpx.HTTPStatusError as e:
@@ -194,8 +548,10 @@ class SubscriptionsHttpClient:
         self.logger.debug(f"DELETE request to: {url}")
 
         try:
+            await self.rate_limiter.acquire(self.settings.workspace_id, endpoint_family(endpoint))
             response = await self.client.delete(url, headers=headers)
             response.raise_for_status()
+            self._invalidate_after_write(endpoint)
 
             # Handle empty responses (like 204 No Content)
             if response.status_code == 204:
@@ -217,7 +573,7 @@ class SubscriptionsHttpClient:
             Dictionary with Accept and User-Agent headers.
             In OAuth2 mode an Authorization header is also included.
         """
-        headers: Dict[str, str] = self.token_manager.get_auth_headers()
+        headers: Dict[str, str] = await self.token_manager.get_auth_headers()
         headers["HPE-AI-Origin"] = "mcp"
         headers["Accept"] = "application/json"
         headers["User-Agent"] = USER_AGENT
@@ -225,8 +581,10 @@ class SubscriptionsHttpClient:
         return headers
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client, the token provider's connections and the response cache."""
         await self.client.aclose()
+        await self.token_manager.aclose()
+        self.response_cache.close()
 
     async def __aenter__(self):
         """Async context manager entry."""
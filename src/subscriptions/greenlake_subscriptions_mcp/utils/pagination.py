@@ -0,0 +1,273 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Concurrent offset/limit auto-pagination for subscriptions MCP server list tools.
+
+List endpoints return one ``limit``-sized page plus ``count`` and ``total``. In
+``fetch_all`` mode a tool fetches the first page, uses ``total`` to work out the
+remaining offsets and fetches those pages concurrently instead of leaving the
+agent to page serially, one LLM round trip per page.
+
+Concurrency is bounded here; request pacing is left to the HTTP client's rate
+limiter, so a large fan-out queues within the configured per-minute limit rather
+than triggering ``429`` responses. Pages are merged in offset order, items are
+deduplicated by ``id`` (offset pages can overlap if the collection changes while
+it is being read), and the result never exceeds a hard item cap.
+
+``iter_pages`` fetches the same pages but yields them one at a time in offset
+order, with at most ``max_concurrency`` pages buffered, for callers that fold
+a collection into a summary instead of returning every item.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import asdict, dataclass
+from typing import Any, Literal, Protocol
+
+# Hard upper bound on items returned by one auto-paginated call
+MAX_ITEMS_CAP = 10000
+
+# Pages fetched at once after the first page
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class _GetClient(Protocol):
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]: ...
+
+
+@dataclass
+class PaginationSummary:
+    """How an auto-paginated result was assembled."""
+
+    pages_fetched: int = 0
+    items_returned: int = 0
+    duplicates_dropped: int = 0
+    total: int | None = None
+    truncated: bool = False
+    max_items: int = MAX_ITEMS_CAP
+    elapsed_seconds: float = 0.0
+
+
+def resolve_max_items(max_items: int | str | None) -> int:
+    """
+    Validate a requested item cap and clamp it to ``MAX_ITEMS_CAP``.
+
+    Args:
+        max_items: Requested cap (strings from LLM clients are coerced); None means the hard cap
+
+    Returns:
+        The effective item cap
+
+    Raises:
+        ValueError: If the value is not a positive integer
+    """
+    if max_items is None:
+        return MAX_ITEMS_CAP
+    try:
+        value = int(max_items)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("'max_items' must be an integer") from exc
+    if value < 1:
+        raise ValueError("'max_items' must be at least 1")
+    return min(value, MAX_ITEMS_CAP)
+
+
+def merge_items(pages: Iterable[list[Any]], max_items: int) -> tuple[list[Any], int]:
+    """
+    Concatenate pages in order, dropping repeated ``id`` values and stopping at ``max_items``.
+
+    Items without an ``id`` are always kept.
+
+    Args:
+        pages: Item lists in offset order
+        max_items: Maximum number of items to return
+
+    Returns:
+        Tuple of (merged items, number of duplicates dropped)
+    """
+    merged: list[Any] = []
+    seen: set[Any] = set()
+    duplicates = 0
+    for page in pages:
+        for item in page:
+            item_id = item.get("id") if isinstance(item, dict) else None
+            if item_id is not None:
+                if item_id in seen:
+                    duplicates += 1
+                    continue
+                seen.add(item_id)
+            merged.append(item)
+            if len(merged) >= max_items:
+                return merged, duplicates
+    return merged, duplicates
+
+
+def _plan(
+    total: int, returned: int, start: int, page_size: int, max_items: int, offset_unit: str
+) -> tuple[int, int, int]:
+    """Return (page size, items available from ``start``, pages to fetch) from the first page's ``total``."""
+    # The API may clamp limit; plan with the page size it actually returned
+    size = page_size
+    if 0 < returned < page_size and total > (start if offset_unit == "items" else start * returned) + returned:
+        size = returned
+    available = total - (start if offset_unit == "items" else start * size)
+    return size, available, math.ceil(min(max(available, 0), max_items) / size)
+
+
+async def fetch_all_pages(
+    http_client: _GetClient,
+    endpoint: str,
+    params: dict[str, Any],
+    page_size: int,
+    max_items: int = MAX_ITEMS_CAP,
+    offset_unit: Literal["items", "pages"] = "items",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> dict[str, Any]:
+    """
+    Fetch every page of an offset/limit collection and merge the items.
+
+    The first page is fetched alone; its ``total`` determines the remaining
+    offsets, which are then fetched concurrently (at most ``max_concurrency`` at
+    a time). If the response has no ``total``, pages are fetched one after another
+    until a short page is returned. Any page failure fails the whole call.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: API endpoint path
+        params: Query parameters of the first page; ``offset`` is the starting offset
+        page_size: Items per page, sent as ``limit``
+        max_items: Maximum number of items to return
+        offset_unit: Whether ``offset`` counts items or whole pages
+        max_concurrency: Maximum number of page requests in flight
+
+    Returns:
+        The first page's response with ``items``, ``count`` and ``offset`` describing
+        the merged result, plus a ``pagination`` summary
+    """
+    started = time.monotonic()
+    if page_size < 1:
+        raise ValueError("'limit' must be at least 1 when fetching all pages")
+    start = int(params.get("offset") or 0)
+
+    def page_params(index: int, size: int) -> dict[str, Any]:
+        offset = start + index * (size if offset_unit == "items" else 1)
+        return {**params, "limit": page_size, "offset": offset}
+
+    first = await http_client.get(endpoint, params=page_params(0, page_size))
+    pages: list[list[Any]] = [list(first.get("items") or [])]
+    total = first.get("total")
+    available: int | None = None
+
+    if isinstance(total, int):
+        size, available, page_count = _plan(total, len(pages[0]), start, page_size, max_items, offset_unit)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch(index: int) -> list[Any]:
+            async with semaphore:
+                response = await http_client.get(endpoint, params=page_params(index, size))
+            return list(response.get("items") or [])
+
+        pages.extend(await asyncio.gather(*(fetch(i) for i in range(1, page_count))))
+    else:
+        # No total to plan with: page serially until a short page or the cap
+        while len(pages[-1]) >= page_size and sum(map(len, pages)) < max_items:
+            response = await http_client.get(endpoint, params=page_params(len(pages), page_size))
+            pages.append(list(response.get("items") or []))
+
+    items, duplicates = merge_items(pages, max_items)
+    summary = PaginationSummary(
+        pages_fetched=len(pages),
+        items_returned=len(items),
+        duplicates_dropped=duplicates,
+        total=total if available is not None else None,
+        truncated=len(items) >= max_items
+        and (available > len(items) if available is not None else len(pages[-1]) >= page_size),
+        max_items=max_items,
+        elapsed_seconds=round(time.monotonic() - started, 3),
+    )
+    return {**first, "items": items, "count": len(items), "offset": start, "pagination": asdict(summary)}
+
+
+async def iter_pages(
+    http_client: _GetClient,
+    endpoint: str,
+    params: dict[str, Any],
+    page_size: int,
+    max_items: int = MAX_ITEMS_CAP,
+    offset_unit: Literal["items", "pages"] = "items",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    summary: PaginationSummary | None = None,
+) -> AsyncIterator[list[Any]]:
+    """
+    Fetch every page of an offset/limit collection and yield the pages' items in offset order.
+
+    Pages are planned as in ``fetch_all_pages``, but requested through a sliding
+    window: at most ``max_concurrency`` pages are in flight or waiting to be
+    yielded, so memory stays bounded by the window rather than the collection.
+    Items are not deduplicated across pages. Closing the iterator early cancels
+    the requests still in flight.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: API endpoint path
+        params: Query parameters of the first page; ``offset`` is the starting offset
+        page_size: Items per page, sent as ``limit``
+        max_items: Maximum number of items to yield
+        offset_unit: Whether ``offset`` counts items or whole pages
+        max_concurrency: Maximum number of page requests in flight
+        summary: Updated with pages fetched, items yielded, total and truncation as pages arrive
+
+    Yields:
+        The items of each page, the last one cut at ``max_items``
+    """
+    started = time.monotonic()
+    if page_size < 1:
+        raise ValueError("'limit' must be at least 1 when fetching all pages")
+    summary = summary if summary is not None else PaginationSummary()
+    summary.max_items = max_items
+    start = int(params.get("offset") or 0)
+
+    def page_params(index: int, size: int) -> dict[str, Any]:
+        offset = start + index * (size if offset_unit == "items" else 1)
+        return {**params, "limit": page_size, "offset": offset}
+
+    async def fetch(index: int, size: int) -> list[Any]:
+        response = await http_client.get(endpoint, params=page_params(index, size))
+        return list(response.get("items") or [])
+
+    def take(page: list[Any]) -> list[Any]:
+        page = page[: max_items - summary.items_returned]
+        summary.pages_fetched += 1
+        summary.items_returned += len(page)
+        summary.elapsed_seconds = round(time.monotonic() - started, 3)
+        return page
+
+    first = await http_client.get(endpoint, params=page_params(0, page_size))
+    page = list(first.get("items") or [])
+    total = first.get("total")
+    yield take(page)
+
+    if isinstance(total, int):
+        size, available, page_count = _plan(total, len(page), start, page_size, max_items, offset_unit)
+        summary.total = total
+        summary.truncated = available > max_items
+        window: list[asyncio.Task[list[Any]]] = []
+        next_index = 1
+        try:
+            while next_index < page_count or window:
+                while next_index < page_count and len(window) < max(1, max_concurrency):
+                    window.append(asyncio.create_task(fetch(next_index, size)))
+                    next_index += 1
+                yield take(await window.pop(0))
+        finally:
+            for task in window:
+                task.cancel()
+    else:
+        # No total to plan with: page serially until a short page or the cap
+        while len(page) >= page_size and summary.items_returned < max_items:
+            page = await fetch(summary.pages_fetched, page_size)
+            yield take(page)
+        summary.truncated = summary.items_returned >= max_items and len(page) >= page_size
@@ -0,0 +1,189 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Client-side rate limiting for subscriptions MCP server HTTP requests.
+
+GreenLake enforces per-workspace request limits (for example 160 requests per
+minute on ``GET /subscriptions/v1/subscriptions``). Concurrent tool calls share one HTTP
+client, so pacing requests here keeps the server at the documented ceiling
+instead of bouncing off ``429`` responses and paying for retries.
+
+Each (workspace, endpoint family) pair gets its own token bucket. Families without
+an explicit limit share one default bucket per workspace. Callers that would
+exceed the limit wait in FIFO order; a caller whose wait would exceed the
+configured bound fails immediately with ``RateLimitTimeoutError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+DEFAULT_FAMILY = "*"
+
+
+class RateLimitTimeoutError(RuntimeError):
+    """Raised when a request would have to wait longer than the configured bound."""
+
+
+@dataclass
+class RateLimitStats:
+    """Counters for a single token bucket."""
+
+    requests_per_minute: float = 0.0
+    acquired: int = 0
+    delayed: int = 0
+    rejected: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket with reservation semantics.
+
+    Tokens may go negative: each caller reserves a token immediately and sleeps
+    until the refill catches up with its reservation. This gives FIFO ordering
+    without a lock and lets the expected wait be computed before committing.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int):
+        """
+        Initialize the bucket.
+
+        Args:
+            requests_per_minute: Sustained request rate
+            burst: Maximum number of requests allowed back-to-back
+        """
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self.stats = RateLimitStats(requests_per_minute=requests_per_minute)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, max_wait: float) -> float:
+        """
+        Take one token, waiting for refill if necessary.
+
+        Args:
+            max_wait: Longest acceptable wait in seconds
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitTimeoutError: If the wait would exceed ``max_wait``
+        """
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+        if wait > max_wait:
+            self._tokens += 1
+            self.stats.rejected += 1
+            raise RateLimitTimeoutError(
+                f"Client-side rate limit of {self.stats.requests_per_minute:g} requests/minute would require "
+                f"waiting {wait:.1f}s (limit {max_wait:g}s)"
+            )
+
+        self.stats.acquired += 1
+        if wait > 0:
+            self.stats.delayed += 1
+            self.stats.queue_depth += 1
+            self.stats.max_queue_depth = max(self.stats.max_queue_depth, self.stats.queue_depth)
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # Give the reservation back so callers queued behind are not penalised
+                self._tokens += 1
+                raise
+            finally:
+                self.stats.queue_depth -= 1
+            self.stats.total_wait_seconds += wait
+            self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, wait)
+        return wait
+
+    def throttle(self, seconds: float) -> None:
+        """
+        Hold back new reservations for ``seconds`` after the server signalled overload.
+
+        Args:
+            seconds: Delay requested by the server (``Retry-After``)
+        """
+        self._refill(time.monotonic())
+        self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RateLimiter:
+    """Token buckets keyed by workspace and endpoint family."""
+
+    def __init__(
+        self,
+        default_per_minute: float = 0,
+        family_limits: dict[str, float] | None = None,
+        burst: int = 10,
+        max_wait: float = 60.0,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            default_per_minute: Limit shared by families without their own entry (0 disables)
+            family_limits: Requests per minute keyed by endpoint family (e.g. ``/subscriptions/v1/subscriptions/{id}``)
+            burst: Bucket capacity, i.e. requests allowed back-to-back before pacing starts
+            max_wait: Longest time in seconds a request may be queued before failing
+        """
+        self.default_per_minute = default_per_minute
+        self.family_limits = dict(family_limits or {})
+        self.burst = burst
+        self.max_wait = max_wait
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+
+    def _bucket(self, workspace_id: str, family: str) -> TokenBucket | None:
+        limit = self.family_limits.get(family)
+        if limit is None:
+            family, limit = DEFAULT_FAMILY, self.default_per_minute
+        if not limit or limit <= 0:
+            return None
+
+        key = (workspace_id, family)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(limit, self.burst)
+        return bucket
+
+    async def acquire(self, workspace_id: str, family: str) -> float:
+        """
+        Wait for permission to send one request.
+
+        Args:
+            workspace_id: Workspace the request is billed against
+            family: Endpoint family of the request
+
+        Returns:
+            Seconds spent waiting (0 when unlimited or tokens were available)
+
+        Raises:
+            RateLimitTimeoutError: If the wait would exceed ``max_wait``
+        """
+        bucket = self._bucket(workspace_id, family)
+        if bucket is None:
+            return 0.0
+        return await bucket.acquire(self.max_wait)
+
+    def throttle(self, workspace_id: str, family: str, seconds: float) -> None:
+        """Apply a server-requested pause to the bucket serving ``family``."""
+        bucket = self._bucket(workspace_id, family)
+        if bucket is not None and seconds > 0:
+            bucket.throttle(seconds)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return per-bucket statistics keyed by ``workspace:family``."""
+        return {f"{workspace}:{family}": asdict(bucket.stats) for (workspace, family), bucket in self._buckets.items()}
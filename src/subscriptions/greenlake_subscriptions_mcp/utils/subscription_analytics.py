@@ -0,0 +1,251 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Expiry, quantity and utilisation analytics over subscription pages for subscriptions MCP server.
+
+``SubscriptionAnalytics`` folds ``getsubscriptionsv1`` pages one at a time.
+Each page is first transposed into columns: IDs, ``sku``, ``tier`` and
+``subscriptionStatus`` as lists, and ``endTime`` (seconds since the epoch) and
+``quantity``/``availableQuantity`` as ``array('d')`` with NaN for missing or
+unparseable values. The arithmetic then runs column-wise: days to expiry
+relative to ``as_of``, the expiry bucket of every row, and quantity and
+availability totals per ``sku`` and ``tier``. The page is dropped afterwards,
+so memory is bounded by the groups and the IDs kept per bucket, not by the
+number of subscriptions.
+
+Expiry buckets are disjoint: ``expired`` (``endTime`` before ``as_of``),
+one bucket per window (``0-30d`` holds subscriptions ending within 30 days,
+``30-60d`` those ending after 30 and within 60, ...), ``over <N>d`` for later
+ends, and ``no endTime``. Utilisation is ``(quantity - availableQuantity) /
+quantity`` over the subscriptions that report both.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+# Default expiry windows in days
+DEFAULT_WINDOWS = (30, 60, 90)
+
+# Maximum number of expiry windows
+MAX_WINDOWS = 10
+
+# Default number of subscription IDs kept per expiry bucket
+DEFAULT_IDS_PER_BUCKET = 100
+
+_SECONDS_PER_DAY = 86400.0
+_NAN = float("nan")
+
+
+@dataclass
+class _Columns:
+    """One page of subscriptions transposed into columns."""
+
+    ids: list[str]
+    sku: list[str | None]
+    tier: list[str | None]
+    status: list[str | None]
+    end: array
+    quantity: array
+    available: array
+
+
+@dataclass
+class _Bucket:
+    """Subscriptions in one expiry bucket: count, quantity and the first IDs."""
+
+    label: str
+    subscriptions: int = 0
+    quantity: float = 0.0
+    ids: list[str] = field(default_factory=list)
+
+
+class SubscriptionAnalytics:
+    """Expiry buckets, quantity totals per sku and tier, and utilisation over streamed subscription pages."""
+
+    def __init__(
+        self,
+        as_of: datetime,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        ids_per_bucket: int = DEFAULT_IDS_PER_BUCKET,
+    ) -> None:
+        """
+        Initialize empty accumulators.
+
+        Args:
+            as_of: Instant expiry is measured from (naive values are UTC)
+            windows: Expiry windows in days; sorted and de-duplicated
+            ids_per_bucket: Maximum number of subscription IDs kept per expiry bucket
+
+        Raises:
+            ValueError: If there are no windows, too many, or a window is not a positive number of days
+        """
+        windows = sorted(set(windows))
+        if not windows:
+            raise ValueError("Provide at least one expiry window")
+        if len(windows) > MAX_WINDOWS:
+            raise ValueError(f"At most {MAX_WINDOWS} expiry windows are accepted, got {len(windows)}")
+        if windows[0] < 1:
+            raise ValueError("Expiry windows must be at least 1 day")
+        self.as_of = as_of if as_of.tzinfo is not None else as_of.replace(tzinfo=timezone.utc)
+        self.windows = tuple(windows)
+        self.ids_per_bucket = ids_per_bucket
+        self.subscriptions = 0
+        self.pages = 0
+        self._now = self.as_of.timestamp()
+        labels = [f"{low}-{high}d" for low, high in zip((0, *windows[:-1]), windows, strict=True)]
+        self._buckets = [_Bucket("expired"), *(_Bucket(label) for label in labels)]
+        self._buckets += [_Bucket(f"over {windows[-1]}d"), _Bucket("no endTime")]
+        # Per key: [subscriptions, quantity, available, quantity of rows reporting both, used]
+        self._by_sku: dict[str | None, list[float]] = {}
+        self._by_tier: dict[str | None, list[float]] = {}
+        self._by_status: dict[str | None, int] = {}
+
+    def add(self, items: Iterable[Any]) -> None:
+        """Fold one page of subscriptions into the accumulators."""
+        columns = _to_columns(items)
+        self.pages += 1
+        self.subscriptions += len(columns.ids)
+
+        # Days to expiry and the bucket of every row, column-wise
+        days = array("d", ((end - self._now) / _SECONDS_PER_DAY for end in columns.end))
+        buckets = [self._bucket_index(d) for d in days]
+        for index, subscription_id, quantity in zip(buckets, columns.ids, columns.quantity, strict=True):
+            bucket = self._buckets[index]
+            bucket.subscriptions += 1
+            if not math.isnan(quantity):
+                bucket.quantity += quantity
+            if len(bucket.ids) < self.ids_per_bucket:
+                bucket.ids.append(subscription_id)
+
+        _fold_totals(self._by_sku, columns.sku, columns.quantity, columns.available)
+        _fold_totals(self._by_tier, columns.tier, columns.quantity, columns.available)
+        for status in columns.status:
+            self._by_status[status] = self._by_status.get(status, 0) + 1
+
+    def _bucket_index(self, days: float) -> int:
+        if math.isnan(days):
+            return len(self._buckets) - 1
+        if days < 0:
+            return 0
+        # 1 + the first window the end falls within; len(windows) + 1 is "over <N>d"
+        return 1 + bisect.bisect_left(self.windows, days)
+
+    def summary(self, limit: int | None = None) -> dict[str, Any]:
+        """
+        Return the expiry buckets, the sku and tier tables, status counts and overall utilisation.
+
+        Args:
+            limit: Maximum number of rows per sku and tier table (largest quantity first), or None for all
+
+        Returns:
+            Compact summary of every subscription folded so far
+        """
+        overall = [0.0] * 5
+        for totals in self._by_sku.values():
+            overall = [a + b for a, b in zip(overall, totals, strict=True)]
+        return {
+            "as_of": self.as_of.isoformat().replace("+00:00", "Z"),
+            "subscriptions": self.subscriptions,
+            "expiry": [
+                {
+                    "bucket": b.label,
+                    "subscriptions": b.subscriptions,
+                    "quantity": _number(b.quantity),
+                    "ids": b.ids,
+                    **({"ids_truncated": True} if b.subscriptions > len(b.ids) else {}),
+                }
+                for b in self._buckets
+            ],
+            "by_sku": _table("sku", self._by_sku, limit),
+            "by_tier": _table("tier", self._by_tier, limit),
+            "by_status": {
+                str(k) if k is not None else "null": v
+                for k, v in sorted(self._by_status.items(), key=lambda kv: -kv[1])
+            },
+            "utilisation": {
+                "quantity": _number(overall[1]),
+                "available": _number(overall[2]),
+                "used": _number(overall[4]),
+                "utilisation": _ratio(overall[4], overall[3]),
+            },
+        }
+
+
+def _to_columns(items: Iterable[Any]) -> _Columns:
+    """Transpose subscription records into columns; numbers and timestamps that cannot be parsed become NaN."""
+    columns = _Columns([], [], [], [], array("d"), array("d"), array("d"))
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        columns.ids.append(str(item.get("id")))
+        columns.sku.append(item.get("sku"))
+        columns.tier.append(item.get("tier"))
+        columns.status.append(item.get("subscriptionStatus"))
+        columns.end.append(_epoch(item.get("endTime")))
+        columns.quantity.append(_float(item.get("quantity")))
+        columns.available.append(_float(item.get("availableQuantity")))
+    return columns
+
+
+def _fold_totals(
+    totals: dict[str | None, list[float]], keys: list[str | None], quantity: array, available: array
+) -> None:
+    for key, q, a in zip(keys, quantity, available, strict=True):
+        row = totals.get(key)
+        if row is None:
+            row = totals[key] = [0.0] * 5
+        row[0] += 1
+        if not math.isnan(q):
+            row[1] += q
+            if not math.isnan(a):
+                row[3] += q
+                row[4] += q - a
+        if not math.isnan(a):
+            row[2] += a
+
+
+def _table(name: str, totals: dict[str | None, list[float]], limit: int | None) -> dict[str, Any]:
+    rows = [
+        [key, int(t[0]), _number(t[1]), _number(t[2]), _ratio(t[4], t[3])]
+        for key, t in sorted(totals.items(), key=lambda kv: (-kv[1][1], str(kv[0])))
+    ]
+    table: dict[str, Any] = {
+        "columns": [name, "subscriptions", "quantity", "available", "utilisation"],
+        "rows": rows if limit is None else rows[:limit],
+    }
+    if limit is not None and len(rows) > limit:
+        table["truncated"] = len(rows)
+    return table
+
+
+def _epoch(value: Any) -> float:
+    if not isinstance(value, str):
+        return _NAN
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return _NAN
+    return (parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _float(value: Any) -> float:
+    if isinstance(value, bool) or value is None:
+        return _NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _number(value: float) -> int | float:
+    return int(value) if value.is_integer() else round(value, 3)
+
+
+def _ratio(used: float, quantity: float) -> float | None:
+    return round(used / quantity, 4) if quantity else None
@@ -0,0 +1,122 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for batch subscription lookup in subscriptions MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from greenlake_subscriptions_mcp.tools.implementations.getsubscriptiondetailsbyids import getsubscriptiondetailsbyids
+from greenlake_subscriptions_mcp.utils.batch_lookup import MAX_BATCH_IDS, chunk_in_filters, parse_ids
+
+BASE_URL = "https://global.api.greenlake.hpe.com"
+LIST_ENDPOINT = "/subscriptions/v1/subscriptions"
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", f"{BASE_URL}{LIST_ENDPOINT}")
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=httpx.Response(status, request=request))
+
+
+def _subscription_id(i: int) -> str:
+    return f"{i:08d}-1111-4000-8000-000000000000"
+
+
+class FakeSubscriptionsApi:
+    """Subscriptions API whose list endpoint can omit some subscriptions that the detail endpoint returns."""
+
+    def __init__(self, count: int = 400, hidden_from_list: set[str] | None = None):
+        self.base_url = BASE_URL
+        self.subscriptions = {
+            _subscription_id(i): {"id": _subscription_id(i), "key": f"KEY{i:05d}"} for i in range(count)
+        }
+        self.hidden_from_list = hidden_from_list or set()
+        self.cached: dict[str, dict[str, Any]] = {}
+        self.requests: list[str] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        await asyncio.sleep(0.001)
+        if endpoint == LIST_ENDPOINT:
+            self.requests.append("list")
+            values = re.match(r"id in (.*)", params["filter"]).group(1)
+            wanted = {v.strip().strip("'") for v in values.split(",")} - self.hidden_from_list
+            return {"items": [s for i, s in self.subscriptions.items() if i in wanted]}
+        self.requests.append("detail")
+        subscription_id = endpoint.rsplit("/", 1)[1]
+        if subscription_id not in self.subscriptions:
+            raise _status_error(404)
+        return {**self.subscriptions[subscription_id], "detail": True}
+
+    async def get_cached(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        return self.cached.get(endpoint.rsplit("/", 1)[1])
+
+
+def _ctx(api: FakeSubscriptionsApi) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    return ctx
+
+
+class TestGetSubscriptionDetailsByIds:
+    """Test cases for the getsubscriptiondetailsbyids tool."""
+
+    @pytest.mark.asyncio
+    async def test_300_subscriptions_take_a_handful_of_list_requests(self):
+        api = FakeSubscriptionsApi()
+        ids = [_subscription_id(i) for i in range(300)]
+
+        payload = (await getsubscriptiondetailsbyids(_ctx(api), ids=[*ids, ids[0]]))[0]["result"]
+
+        assert list(payload["items"]) == ids
+        assert payload["errors"] == {}
+        assert payload["requested"] == 300
+        assert payload["lookup"]["detail_requests"] == 0
+        assert api.requests == ["list"] * payload["lookup"]["list_requests"]
+        assert len(api.requests) < 10
+
+    @pytest.mark.asyncio
+    async def test_only_ids_missed_by_list_go_to_detail_endpoint(self):
+        hidden = _subscription_id(3)
+        api = FakeSubscriptionsApi(count=10, hidden_from_list={hidden})
+        ids = [*(_subscription_id(i) for i in range(10)), "unknown"]
+
+        payload = (await getsubscriptiondetailsbyids(_ctx(api), ids=ids))[0]["result"]
+
+        assert payload["items"][hidden]["detail"] is True
+        assert payload["errors"] == {"unknown": payload["errors"]["unknown"]}
+        assert payload["errors"]["unknown"]["error"] == "not_found"
+        assert payload["lookup"]["detail_requests"] == 2
+        assert api.requests.count("detail") == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_subscriptions_need_no_request(self):
+        api = FakeSubscriptionsApi(count=3)
+        api.cached = {i: {**s, "cached": True} for i, s in api.subscriptions.items()}
+
+        payload = (await getsubscriptiondetailsbyids(_ctx(api), ids=",".join(api.subscriptions)))[0]["result"]
+
+        assert all(s["cached"] for s in payload["items"].values())
+        assert payload["lookup"]["cache_hits"] == 3
+        assert api.requests == []
+
+    @pytest.mark.asyncio
+    async def test_too_many_ids_is_a_validation_error(self):
+        ids = [_subscription_id(i) for i in range(MAX_BATCH_IDS + 1)]
+
+        result = await getsubscriptiondetailsbyids(_ctx(FakeSubscriptionsApi(count=1)), ids=ids)
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
+
+    def test_helpers_dedupe_and_chunk(self):
+        ids = parse_ids([_subscription_id(1), _subscription_id(1), _subscription_id(2)])
+
+        assert ids == [_subscription_id(1), _subscription_id(2)]
+        assert chunk_in_filters("id", ids, f"{BASE_URL}{LIST_ENDPOINT}") == [ids]
@@ -0,0 +1,102 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the client-side rate limiter in subscriptions MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from greenlake_subscriptions_mcp.utils.http_client import SubscriptionsHttpClient
+from greenlake_subscriptions_mcp.utils.rate_limiter import RateLimiter, RateLimitTimeoutError, TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for a single token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_served_without_waiting(self):
+        bucket = TokenBucket(requests_per_minute=60, burst=3)
+        waits = [await bucket.acquire(max_wait=10) for _ in range(3)]
+        assert waits == [0.0, 0.0, 0.0]
+        assert bucket.stats.acquired == 3
+        assert bucket.stats.delayed == 0
+
+    @pytest.mark.asyncio
+    async def test_excess_requests_queue_in_order(self):
+        bucket = TokenBucket(requests_per_minute=6000, burst=1)  # one token every 10ms
+        waits = await asyncio.gather(*(bucket.acquire(max_wait=1) for _ in range(4)))
+        assert waits[0] == 0.0
+        assert waits[1] < waits[2] < waits[3]
+        assert bucket.stats.delayed == 3
+        assert bucket.stats.max_queue_depth == 3
+        assert bucket.stats.queue_depth == 0
+
+    @pytest.mark.asyncio
+    async def test_wait_beyond_bound_is_rejected(self):
+        bucket = TokenBucket(requests_per_minute=1, burst=1)
+        await bucket.acquire(max_wait=0)
+        with pytest.raises(RateLimitTimeoutError):
+            await bucket.acquire(max_wait=5)
+        assert bucket.stats.rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_throttle_holds_back_new_callers(self):
+        bucket = TokenBucket(requests_per_minute=60, burst=5)
+        bucket.throttle(30)
+        with pytest.raises(RateLimitTimeoutError):
+            await bucket.acquire(max_wait=10)
+
+
+class TestRateLimiter:
+    """Test cases for bucket selection."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_by_default(self):
+        limiter = RateLimiter()
+        assert await limiter.acquire("ws", "/subscriptions/v1/subscriptions") == 0.0
+        assert limiter.snapshot() == {}
+
+    @pytest.mark.asyncio
+    async def test_family_and_default_buckets_are_separate(self):
+        limiter = RateLimiter(default_per_minute=100, family_limits={"/subscriptions/v1/subscriptions/{id}": 40})
+        await limiter.acquire("ws", "/subscriptions/v1/subscriptions/{id}")
+        await limiter.acquire("ws", "/subscriptions/v1/subscriptions")
+        await limiter.acquire("ws", "/other/v1/things")
+
+        stats = limiter.snapshot()
+        assert stats["ws:/subscriptions/v1/subscriptions/{id}"]["requests_per_minute"] == 40
+        assert stats["ws:*"]["acquired"] == 2
+
+    @pytest.mark.asyncio
+    async def test_workspaces_do_not_share_buckets(self):
+        limiter = RateLimiter(default_per_minute=1, burst=1, max_wait=0)
+        await limiter.acquire("ws-a", "/subscriptions/v1/subscriptions")
+        await limiter.acquire("ws-b", "/subscriptions/v1/subscriptions")
+        with pytest.raises(RateLimitTimeoutError):
+            await limiter.acquire("ws-a", "/subscriptions/v1/subscriptions")
+
+
+class TestHttpClientRateLimiting:
+    """Test cases for rate limiting inside the HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_get_acquires_token_per_attempt(self):
+        token_manager = Mock(get_auth_headers=AsyncMock(), aclose=AsyncMock())
+        token_manager.get_auth_headers.return_value = {"Authorization": "Bearer test-token"}
+        with patch("greenlake_subscriptions_mcp.utils.http_client.TokenManager", return_value=token_manager):
+            client = SubscriptionsHttpClient()
+        client.rate_limiter = RateLimiter(family_limits={"/subscriptions/v1/subscriptions/{id}": 600}, burst=5)
+
+        request = httpx.Request("GET", "https://api.example.test/subscriptions/v1/subscriptions/abc123")
+        response = httpx.Response(200, json={"id": "abc123"}, request=request)
+        with patch.object(client.client, "get", AsyncMock(return_value=response)):
+            for _ in range(3):
+                await client.get("/subscriptions/v1/subscriptions/abc123")
+
+        stats = client.get_rate_limit_stats()
+        assert stats[f"{client.settings.workspace_id}:/subscriptions/v1/subscriptions/{{id}}"]["acquired"] == 3
@@ -0,0 +1,138 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for subscription expiry and quantity analytics and the analyze_subscriptions tool in subscriptions MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from greenlake_subscriptions_mcp.tools.implementations.analyze_subscriptions import analyze_subscriptions
+from greenlake_subscriptions_mcp.utils.subscription_analytics import SubscriptionAnalytics
+
+AS_OF = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _subscription(i: int, days_left: float | None, quantity: str | None = "10", available: str | None = "4"):
+    return {
+        "id": f"sub-{i:04d}",
+        "sku": f"SKU-{i % 2}",
+        "tier": "FOUNDATION" if i % 3 else "ADVANCED",
+        "subscriptionStatus": "STARTED" if days_left is None or days_left >= 0 else "ENDED",
+        "endTime": (AS_OF + timedelta(days=days_left)).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        if days_left is not None
+        else None,
+        "quantity": quantity,
+        "availableQuantity": available,
+    }
+
+
+class FakeSubscriptionsApi:
+    """Subscriptions API paged by item offset over a fixed list."""
+
+    def __init__(self, subscriptions: list[dict[str, Any]]):
+        self.subscriptions = subscriptions
+        self.requests: list[dict[str, Any]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append(params)
+        await asyncio.sleep(0.001)
+        offset, limit = params["offset"], params["limit"]
+        return {"items": self.subscriptions[offset : offset + limit], "total": len(self.subscriptions)}
+
+
+def _ctx(api: FakeSubscriptionsApi) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    return ctx
+
+
+class TestSubscriptionAnalytics:
+    """Test cases for folding subscription pages into expiry buckets and quantity totals."""
+
+    def test_expiry_buckets_are_disjoint(self):
+        analytics = SubscriptionAnalytics(AS_OF, windows=[60, 30])
+        analytics.add([_subscription(0, -1), _subscription(1, 0.5), _subscription(2, 30)])
+        analytics.add([_subscription(3, 30.01), _subscription(4, 400), _subscription(5, None, quantity=None)])
+
+        expiry = {b["bucket"]: (b["subscriptions"], b["ids"]) for b in analytics.summary()["expiry"]}
+        assert expiry == {
+            "expired": (1, ["sub-0000"]),
+            "0-30d": (2, ["sub-0001", "sub-0002"]),
+            "30-60d": (1, ["sub-0003"]),
+            "over 60d": (1, ["sub-0004"]),
+            "no endTime": (1, ["sub-0005"]),
+        }
+        assert analytics.summary()["expiry"][1]["quantity"] == 20
+
+    def test_quantity_totals_and_utilisation(self):
+        analytics = SubscriptionAnalytics(AS_OF)
+        analytics.add([_subscription(i, 10) for i in range(6)])
+        analytics.add([_subscription(6, 10, quantity="5", available=None), _subscription(7, 10, quantity="n/a")])
+        summary = analytics.summary()
+
+        assert summary["by_sku"]["columns"] == ["sku", "subscriptions", "quantity", "available", "utilisation"]
+        # SKU-0: 0, 2, 4 and 6 (no availableQuantity, so left out of utilisation); SKU-1: 1, 3, 5 and 7 (bad quantity)
+        assert summary["by_sku"]["rows"] == [["SKU-0", 4, 35, 12, 0.6], ["SKU-1", 4, 30, 16, 0.6]]
+        assert summary["by_tier"]["rows"][0][:3] == ["FOUNDATION", 5, 40]
+        assert summary["by_status"] == {"STARTED": 8}
+        assert summary["utilisation"] == {"quantity": 65, "available": 28, "used": 36, "utilisation": 0.6}
+
+    def test_ids_per_bucket_and_table_limits(self):
+        analytics = SubscriptionAnalytics(AS_OF, ids_per_bucket=2)
+        analytics.add([_subscription(i, -5) for i in range(5)])
+        summary = analytics.summary(limit=1)
+
+        assert summary["expiry"][0]["ids"] == ["sub-0000", "sub-0001"]
+        assert summary["expiry"][0]["ids_truncated"] is True
+        assert len(summary["by_sku"]["rows"]) == 1
+        assert summary["by_sku"]["truncated"] == 2
+
+    @pytest.mark.parametrize("windows", [[], [0, 30], list(range(1, 20))])
+    def test_invalid_windows(self, windows):
+        with pytest.raises(ValueError):
+            SubscriptionAnalytics(AS_OF, windows=windows)
+
+
+class TestAnalyzeSubscriptionsTool:
+    """Test cases for the analyze_subscriptions tool."""
+
+    @pytest.mark.asyncio
+    async def test_streams_every_page_into_a_compact_summary(self):
+        subscriptions = [_subscription(i, i - 20) for i in range(230)]
+        api = FakeSubscriptionsApi(subscriptions)
+
+        response = await analyze_subscriptions(
+            _ctx(api), windows="30, 90", as_of="2026-01-01T00:00:00Z", filter="tier eq ADVANCED", ids_per_bucket=3
+        )
+        result = response[0]["result"]
+
+        assert response[0]["success"] is True
+        assert result["subscriptions"] == 230
+        counts = {b["bucket"]: b["subscriptions"] for b in result["expiry"]}
+        assert counts == {"expired": 20, "0-30d": 31, "30-90d": 60, "over 90d": 119, "no endTime": 0}
+        assert result["expiry"][0]["ids"] == ["sub-0000", "sub-0001", "sub-0002"]
+        assert result["scan"] == {
+            "requests": 5,
+            "total": 230,
+            "duplicates_dropped": 0,
+            "complete": True,
+            "elapsed_seconds": result["scan"]["elapsed_seconds"],
+        }
+        assert all(r["filter"] == "tier eq 'ADVANCED'" and r["limit"] == 50 for r in api.requests)
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_are_validation_errors(self):
+        api = FakeSubscriptionsApi([])
+
+        bad_windows = await analyze_subscriptions(_ctx(api), windows="thirty")
+        bad_as_of = await analyze_subscriptions(_ctx(api), as_of="next week")
+        bad_filter = await analyze_subscriptions(_ctx(api), filter="colour eq 'red'")
+
+        assert [r[0]["error"] for r in (bad_windows, bad_as_of, bad_filter)] == ["validation_error"] * 3
+        assert api.requests == []
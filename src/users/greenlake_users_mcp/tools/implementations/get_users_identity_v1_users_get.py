@@ -6,31 +6,31 @@ Implements: GET /identity/v1/users
 """
 
 from __future__ import annotations
-import re
-from typing import Annotated, Any
+from typing import Annotated, Any, Literal
 
 from mcp.server.fastmcp import Context
 from pydantic import Field
 
 from greenlake_users_mcp.config.logging import get_logger
 from greenlake_users_mcp.server.fastmcp_instance import mcp
+from greenlake_users_mcp.utils.odata_filter import normalize_filter
+from greenlake_users_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages, resolve_max_items
+from greenlake_users_mcp.utils.table_format import format_result
 
 logger = get_logger(__name__)
 
 
-def _normalize_filter_quotes(filter_expr: str) -> str:
-    """Wrap unquoted numeric values in single quotes for OData filter expressions.
-
-    LLMs sometimes omit quotes around numeric filter values (e.g., ``quantity eq 5``
-    instead of ``quantity eq '5'``), which causes 400 Bad Request from the API.
-    This function normalises those bare numeric values while leaving booleans,
-    already-quoted strings, and other tokens untouched.
-    """
-    return re.sub(
-        r"\b(eq|ne|gt|ge|lt|le)\s+(-?\d+(?:\.\d+)?)\b",
-        r"\1 '\2'",
-        filter_expr,
-    )
+# User properties accepted in ``filter``
+FILTER_FIELDS = frozenset(
+    {
+        "createdAt",
+        "id",
+        "lastLogin",
+        "updatedAt",
+        "userStatus",
+        "username",
+    }
+)
 
 
 @mcp.tool(
@@ -58,6 +58,30 @@ async def get_users_identity_v1_users_get(  # noqa: E501
             default=300,
         ),
     ] = 300,
+    fetch_all: Annotated[
+        bool,
+        Field(
+            description="Fetch every page starting at offset (several pages at a time) and return the merged, de-duplicated items. limit sets the page size. The result includes a pagination summary with pages fetched, elapsed time and whether it was truncated."
+        ),
+    ] = False,
+    max_items: Annotated[
+        int | str | None,
+        Field(
+            description=f"Maximum number of items to return across pages; implies fetch_all. Capped at {MAX_ITEMS_CAP}."
+        ),
+    ] = None,
+    return_handle: Annotated[
+        bool,
+        Field(
+            description="Keep the full result on the server and return a compact summary (item count, field names, a short preview) with a handle. Read slices with the read_result tool or the greenlake://results/{handle}?offset=&limit= resource."
+        ),
+    ] = False,
+    format: Annotated[
+        Literal["json", "table"],
+        Field(
+            description="Output format. 'table' returns the item keys once as columns plus one row of values per item, drops fields that are null or empty in every item and abbreviates nested resource references to their id or name (tags are kept as they are); the result reports the compression ratio achieved. The default value is json."
+        ),
+    ] = "json",
 ) -> list[dict[str, Any]]:
     """Retrieve list of users with filtering, and pagination options. All users are returned when no filters are provided. \n**Note**: User view all permission is required to invoke this API. \nRate limit: 300 requests per minute per workspace, resulting in a `429` error if exceeded.\n
 
@@ -65,6 +89,10 @@ async def get_users_identity_v1_users_get(  # noqa: E501
         filter: Filter data using a subset of OData 4.0 and return only the subset of resources that match the filter.\n\nSupported classes and examples include:\n- **Types**: timestamp, string\n- **Comparison**: eq, ne, gt, ge, lt\n- **Logical Expressions**: and, or, not\n\nThe Get users API can be filtered by:\n- id\n- username\n- userStatus\n- createdAt\n- updatedAt\n- lastLogin\n\nuserStatus can be one of the following:\n- UNVERIFIED\n- VERIFIED\n- BLOCKED\n- DELETE_IN_PROGRESS\n- DELETED\n- SUSPENDED\n\n**Note**: The userStatus filter is case-sensitive.\n\nExamples:\n  - updatedAt gt '2020-09-21T14:19:09.769747'\n    Returns users updated after 2020-09-21T14:19:09.769747\n  - userStatus ne 'UNVERIFIED'\n    Returns users that are not unverified.\n  - username eq 'user@example.com'\n    Returns the user with a specific username.\n  - createdAt gt '2020-09-21T14:19:09.769747'\n    Returns users created after 2020-09-21T14:19:09.769747\n  - username eq 'user@example.com'\n    Returns the user with a specific email.\n  - id eq '7600415a-8876-5722-9f3c-b0fd11112283'\n    Returns the user with a specific ID.\n  - lastLogin lt '2020-09-21T14:19:09.769747'\n    Returns users that logged in before 2020-09-21T14:19:09.769747\n\n**Filter Syntax**: Use OData-style filters with the field names shown in the examples above. String values must be enclosed in single quotes.
         offset: Specify pagination offset. An offset argument defines how many pages to skip before returning results.
         limit: Specify the maximum number of entries per page. NOTE: The maximum value accepted is 600.
+        fetch_all: Fetch every page starting at offset and return the merged, de-duplicated items.
+        max_items: Maximum number of items to return across pages; implies fetch_all.
+        return_handle: Keep the full result on the server and return a summary with a handle.
+        format: Output format, json or table (columns plus value rows).
     Returns:
         API response data as a list containing one result dict.
     """
@@ -75,8 +103,6 @@ async def get_users_identity_v1_users_get(  # noqa: E501
 
     # Collect query / body parameters; skip values that were not provided
     params: dict[str, Any] = {}
-    if filter is not None and filter is not ...:
-        params["filter"] = _normalize_filter_quotes(filter)
     if offset is not None and offset is not ...:
         # Coerce string supplied by LLM clients to int
         try:
@@ -91,7 +117,24 @@ async def get_users_identity_v1_users_get(  # noqa: E501
             raise ValueError("'limit' must be an integer") from exc
 
     try:
-        response_data = await http_client.get(url, params=params)
+        # Parse, repair and canonicalize filters; a malformed filter is a validation error, not a 400
+        if filter is not None and filter is not ...:
+            params["filter"] = normalize_filter(filter, fields=FILTER_FIELDS)
+        if fetch_all or max_items is not None:
+            response_data = await fetch_all_pages(
+                http_client,
+                url,
+                params,
+                page_size=params.get("limit", 300),
+                max_items=resolve_max_items(max_items),
+                offset_unit="pages",
+            )
+        else:
+            response_data = await http_client.get(url, params=params)
+        if return_handle:
+            response_data = ctx.request_context.lifespan_context.result_store.store(response_data)
+        else:
+            response_data = format_result(response_data, format)
         return [{"success": True, "result": response_data}]
 
     except ValueError as exc:
@@ -0,0 +1,227 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+resolve_users tool for users MCP server.
+
+Resolves many user IDs and/or usernames in one tool call instead of one
+``get_user_detailed_identity_v1_users_id_get`` call per user. Lookups are
+answered from the in-memory user directory (see ``utils.user_directory``),
+which is loaded from paged GET /identity/v1/users listings and refreshed when
+stale. Only directory misses go upstream: IDs to GET /identity/v1/users/{id}
+and usernames to ``username eq '...'`` filtered listings, at bounded concurrency.
+
+A ``filter`` is evaluated over the directory when it holds every workspace
+user (see ``utils.odata_eval``), so it costs no request; otherwise it is sent
+to GET /identity/v1/users.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Annotated, Any
+
+from mcp.server.fastmcp import Context
+from pydantic import Field
+
+from greenlake_users_mcp.config.logging import get_logger
+from greenlake_users_mcp.server.fastmcp_instance import mcp
+from greenlake_users_mcp.tools.implementations.get_users_identity_v1_users_get import FILTER_FIELDS
+from greenlake_users_mcp.utils.batch_lookup import MAX_BATCH_IDS, fetch_by_eq_filter, fetch_by_path, parse_ids
+from greenlake_users_mcp.utils.odata_filter import normalize_filter
+from greenlake_users_mcp.utils.pagination import fetch_all_pages
+from greenlake_users_mcp.utils.user_directory import COLLECTION_ENDPOINT, PAGE_SIZE, UserDirectory
+
+logger = get_logger(__name__)
+
+ITEM_ENDPOINT = "/identity/v1/users/{id}"
+
+
+@mcp.tool(
+    name="resolve_users",
+    description=f"Resolve many users in one call by user ID and/or username (up to {MAX_BATCH_IDS} in total), for example the user IDs in audit logs or workspace owners, instead of calling get_user_detailed_identity_v1_users_id_get once per user, and/or find the users matching an OData filter (same syntax as get_users_identity_v1_users_get, for example \"userStatus eq 'UNVERIFIED' and lastLogin lt '2024-01-01T00:00:00Z'\"). Users are answered from an in-memory directory of the workspace users that is refreshed when stale; only users missing from it are fetched from the API, and a filter is evaluated locally whenever the directory holds every user. Returns the users keyed by user ID, a usernames map from each found username to its user ID, the IDs matching the filter, per-item errors (not_found or request_failed) keyed by the requested ID or username, and a lookup summary with the directory hit ratio, refresh age and upstream calls saved.",
+)
+async def resolve_users(
+    ctx: Context,
+    ids: Annotated[
+        list[str] | str | None,
+        Field(description="User IDs to resolve, as a list or a comma separated string."),
+    ] = None,
+    usernames: Annotated[
+        list[str] | str | None,
+        Field(description="Usernames (email addresses) to resolve, as a list or a comma separated string."),
+    ] = None,
+    filter: Annotated[
+        str | None,
+        Field(
+            description=f"OData filter on id, username, userStatus, createdAt, updatedAt or lastLogin; at most {MAX_BATCH_IDS} matching users are returned."
+        ),
+    ] = None,
+    refresh: Annotated[
+        bool,
+        Field(description="Reload the user directory before resolving, even if it is not stale."),
+    ] = False,
+) -> list[dict[str, Any]]:
+    """Resolve many users by user ID and/or username, or by filter.
+
+    Args:
+        ids: User IDs to resolve
+        usernames: Usernames to resolve
+        filter: OData filter selecting users
+        refresh: Reload the user directory first
+    Returns:
+        Users keyed by ID with per-item errors, as a list containing one result dict.
+    """
+    lifespan_context = ctx.request_context.lifespan_context
+    http_client = lifespan_context.http_client
+    directory = getattr(lifespan_context, "user_directory", None)
+    if directory is None:
+        directory = UserDirectory(ttl=0)
+
+    try:
+        user_ids = parse_ids(ids, "ids")
+        names = parse_ids(usernames, "usernames")
+        if not user_ids and not names and not filter:
+            raise ValueError("Provide at least one value in 'ids' or 'usernames', or a 'filter'")
+        if len(user_ids) + len(names) > MAX_BATCH_IDS:
+            raise ValueError(f"'ids' and 'usernames' accept at most {MAX_BATCH_IDS} values in total")
+        # Reject a malformed filter before anything is fetched
+        canonical = normalize_filter(filter, fields=FILTER_FIELDS) if filter else None
+
+        started = time.monotonic()
+        lookup: dict[str, Any] = {"refreshed": False, "refresh_requests": 0}
+        refresh_requests = directory.stats.refresh_requests
+        try:
+            lookup["refreshed"] = await directory.ensure_fresh(http_client, force=refresh)
+        except Exception as exc:
+            # A failed refresh leaves the previous directory in place; misses are still fetched one by one
+            logger.warning(f"resolve_users: user directory refresh failed: {exc}")
+            lookup["refresh_error"] = str(exc)
+        lookup["refresh_requests"] = directory.stats.refresh_requests - refresh_requests
+
+        users: dict[str, Any] = {}
+        for user_id in user_ids:
+            user = directory.get(user_id)
+            if user is not None:
+                users[user_id] = user
+        by_username: dict[str, str] = {}
+        for name in names:
+            user = directory.find(name)
+            if user is not None:
+                by_username[name] = str(user["id"])
+                users.setdefault(str(user["id"]), user)
+        hits = sum(1 for i in user_ids if i in users) + len(by_username)
+
+        errors: dict[str, dict[str, Any]] = {}
+        missed_ids = [i for i in user_ids if i not in users]
+        if missed_ids:
+            fetched, errors = await fetch_by_path(http_client, ITEM_ENDPOINT, missed_ids)
+            for user_id, user in fetched.items():
+                directory.add(user)
+                users[user_id] = user
+        missed_names = [n for n in names if n not in by_username]
+        if missed_names:
+            fetched, name_errors = await fetch_by_eq_filter(http_client, COLLECTION_ENDPOINT, "username", missed_names)
+            for name, user in fetched.items():
+                directory.add(user)
+                user_id = str(user.get("id", name))
+                by_username[name] = user_id
+                users.setdefault(user_id, user)
+            errors.update(name_errors)
+
+        matches: list[str] | None = None
+        filter_requests = 0
+        if canonical:
+            matched, lookup["filter"] = await _select_users(http_client, directory, canonical)
+            matches = [str(user["id"]) for user in matched]
+            for user in matched:
+                users.setdefault(str(user["id"]), user)
+            filter_requests = lookup["filter"]["requests"]
+
+        requested = len(user_ids) + len(names)
+        fallback_requests = len(missed_ids) + len(missed_names)
+        age = directory.age()
+        lookup.update(
+            directory_hits=hits,
+            fallback_requests=fallback_requests,
+            requests=lookup["refresh_requests"] + fallback_requests + filter_requests,
+            hit_ratio=round(hits / requested, 4) if requested else None,
+            refresh_age_seconds=round(age, 3) if age is not None else None,
+            upstream_calls_saved=requested - lookup["refresh_requests"] - fallback_requests,
+            elapsed_seconds=round(time.monotonic() - started, 3),
+        )
+        # Order by request: IDs first, then users found only by username
+        ordered = {i: users[i] for i in user_ids if i in users}
+        ordered.update((i, u) for i, u in users.items() if i not in ordered)
+        logger.info(
+            f"resolve_users: {len(ordered)} of {requested} resolved "
+            f"({hits} from the directory, {lookup['requests']} requests)"
+        )
+        result: dict[str, Any] = {
+            "items": ordered,
+            "errors": errors,
+            "count": len(ordered),
+            "requested": requested,
+            "lookup": lookup,
+            "directory": directory.snapshot(),
+        }
+        if names:
+            result["usernames"] = by_username
+        if matches is not None:
+            result["matches"] = matches
+        return [{"success": True, "result": result}]
+
+    except ValueError as exc:
+        logger.error(f"Validation error in resolve_users: {exc}")
+        return [{"success": False, "error": "validation_error", "message": str(exc)}]
+
+    except Exception as exc:
+        logger.error(f"Error in resolve_users: {exc}", exc_info=True)
+        return [{"success": False, "error": "request_failed", "message": str(exc)}]
+
+
+async def _select_users(
+    http_client: Any, directory: UserDirectory, filter: str
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """
+    Return up to ``MAX_BATCH_IDS`` users matching ``filter``, from the directory when it holds every user.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        directory: The user directory
+        filter: Canonical OData filter expression
+
+    Returns:
+        Matching users, and a summary of how they were selected
+    """
+    if directory.enabled and directory.complete and directory.is_fresh():
+        started = time.perf_counter()
+        matched, selection = directory.query(filter, fields=FILTER_FIELDS)
+        summary = {
+            "source": "directory",
+            "total": len(matched),
+            "truncated": len(matched) > MAX_BATCH_IDS,
+            "indexed": selection.indexed,
+            "scanned": selection.scanned,
+            "requests": 0,
+            "evaluate_microseconds": round((time.perf_counter() - started) * 1e6, 1),
+        }
+        return matched[:MAX_BATCH_IDS], {"filter": filter, **summary}
+
+    response = await fetch_all_pages(
+        http_client,
+        COLLECTION_ENDPOINT,
+        {"filter": filter},
+        page_size=PAGE_SIZE,
+        max_items=MAX_BATCH_IDS,
+        offset_unit="pages",
+    )
+    matched = [u for u in response["items"] if isinstance(u, dict) and u.get("id")]
+    for user in matched:
+        directory.add(user)
+    pagination = response["pagination"]
+    summary = {
+        "source": "api",
+        "total": pagination["total"] if pagination["total"] is not None else len(matched),
+        "truncated": pagination["truncated"],
+        "requests": pagination["pages_fetched"],
+    }
+    return matched, {"filter": filter, **summary}
@@ -46,8 +46,10 @@ def get_tool_classes(mode: str | None = None) -> list:
             # register the function with the FastMCP instance.
             import greenlake_users_mcp.tools.implementations.get_users_identity_v1_users_get  # noqa: F401 (triggers @mcp.tool registration)
             import greenlake_users_mcp.tools.implementations.get_user_detailed_identity_v1_users_id_get  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_users_mcp.tools.implementations.resolve_users  # noqa: F401 (triggers @mcp.tool registration)
+            import greenlake_users_mcp.tools.implementations.read_result  # noqa: F401 (triggers @mcp.tool registration)
 
-            logger.info("Static mode: 2 endpoint tools registered")
+            logger.info("Static mode: 2 endpoint tools, resolve_users and read_result registered")
     except ImportError as exc:
         logger.error(f"Failed to import tool module: {exc}")
 
@@ -0,0 +1,270 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Batch lookup of resources by identifier for users MCP server tools.
+
+Looking up a few hundred resources one ``GET /{id}`` at a time costs one request
+(and, when the agent drives it, one LLM round trip) per identifier. A collection
+endpoint that accepts ``filter=<field> in '<a>', '<b>', ...`` returns many of
+them per request instead, limited only by how long a URL the gateway accepts.
+
+``probe_cache`` first takes identifiers whose item response is still in the HTTP
+client's response cache. ``chunk_in_filters`` packs the rest into as few ``in``
+filters as fit in the URL length limit; ``fetch_by_filter`` runs those filters
+and ``fetch_by_path`` fans out per-identifier requests. Both run at most
+``max_concurrency`` requests at a time (request pacing is left to the HTTP
+client's rate limiter) and report each identifier that was not returned as a
+per-item error instead of failing the whole batch.
+
+The Get users API filter has no ``in`` operator, so ``fetch_by_eq_filter``
+looks users up by a non-ID property with one ``<field> eq '<value>'`` request
+per value.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any, Protocol
+from urllib.parse import quote
+
+import httpx
+
+from greenlake_users_mcp.utils.pagination import DEFAULT_MAX_CONCURRENCY
+
+# Maximum number of identifiers accepted by one batch lookup
+MAX_BATCH_IDS = 500
+
+# Conservative URL length accepted by API gateways and proxies
+MAX_URL_LENGTH = 2048
+
+
+class _GetClient(Protocol):
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]: ...
+
+
+def parse_ids(values: list[str] | str | None, name: str = "ids") -> list[str]:
+    """
+    Normalize identifiers given as a list or a comma separated string.
+
+    Args:
+        values: Identifiers, or None
+        name: Parameter name used in error messages
+
+    Returns:
+        Stripped, de-duplicated identifiers in their original order
+
+    Raises:
+        ValueError: If more than ``MAX_BATCH_IDS`` identifiers are given
+    """
+    if values is None:
+        return []
+    if isinstance(values, str):
+        values = values.split(",")
+    parsed = list(dict.fromkeys(str(v).strip() for v in values if str(v).strip()))
+    if len(parsed) > MAX_BATCH_IDS:
+        raise ValueError(f"'{name}' accepts at most {MAX_BATCH_IDS} values, got {len(parsed)}")
+    return parsed
+
+
+def in_filter(field: str, values: Iterable[str]) -> str:
+    """Return the filter expression ``<field> in '<v1>', '<v2>'`` with quotes escaped."""
+    quoted = ", ".join("'" + v.replace("'", "''") + "'" for v in values)
+    return f"{field} in {quoted}"
+
+
+def chunk_in_filters(
+    field: str, values: list[str], url_prefix: str, max_url_length: int = MAX_URL_LENGTH
+) -> list[list[str]] | None:
+    """
+    Split ``values`` into groups whose ``in`` filter keeps the request URL within the limit.
+
+    Args:
+        field: Property compared by the filter
+        values: Identifiers to look up
+        url_prefix: Request URL without query string (base URL and endpoint path)
+        max_url_length: Maximum length of the full request URL
+
+    Returns:
+        Groups of identifiers in order, or None if a single identifier does not fit
+    """
+    # Length of "<prefix>?filter=<field in >...&limit=<n>" grows by one encoded value (and separator) per identifier
+    fixed = len(url_prefix) + len("?filter=") + len(quote(f"{field} in ", safe="")) + len("&limit=")
+    separator = len(quote(", ", safe=""))
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    used = 0
+    for value in values:
+        piece = len(quote("'" + value.replace("'", "''") + "'", safe=""))
+        if current and fixed + used + separator + piece + len(str(len(current) + 1)) > max_url_length:
+            chunks.append(current)
+            current, used = [], 0
+        if not current and fixed + piece + 1 > max_url_length:
+            return None
+        used += piece + (separator if current else 0)
+        current.append(value)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def probe_cache(http_client: Any, path_template: str, ids: list[str]) -> dict[str, Any]:
+    """
+    Return the item responses for ``ids`` that the HTTP client has cached, without requests.
+
+    Args:
+        http_client: Client with a ``get_cached`` method (others have no cache to probe)
+        path_template: Item endpoint with an ``{id}`` placeholder
+        ids: Identifiers to look up
+
+    Returns:
+        Cached items keyed by identifier
+    """
+    get_cached = getattr(http_client, "get_cached", None)
+    if get_cached is None:
+        return {}
+    found: dict[str, Any] = {}
+    for resource_id in ids:
+        cached = await get_cached(path_template.replace("{id}", quote(resource_id, safe="")))
+        if isinstance(cached, dict):
+            found[resource_id] = cached
+    return found
+
+
+def _error(exc: Exception) -> dict[str, Any]:
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return {"error": "not_found" if status == 404 else "request_failed", "status": status, "message": str(exc)}
+    return {"error": "request_failed", "message": str(exc)}
+
+
+async def fetch_by_filter(
+    http_client: _GetClient,
+    endpoint: str,
+    field: str,
+    chunks: list[list[str]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Look up identifiers with one ``in`` filter request per chunk.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: Collection endpoint accepting ``filter`` and ``limit``
+        field: Property compared by the filter; returned items are matched on it
+        chunks: Identifier groups from ``chunk_in_filters``
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Items keyed by identifier, and per-identifier errors: ``not_found`` for
+        identifiers the filter did not return, the request error for every
+        identifier of a failed chunk
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(chunk: list[str]) -> dict[str, Any]:
+        async with semaphore:
+            return await http_client.get(endpoint, params={"filter": in_filter(field, chunk), "limit": len(chunk)})
+
+    responses = await asyncio.gather(*(fetch(chunk) for chunk in chunks), return_exceptions=True)
+    found: dict[str, Any] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    for chunk, response in zip(chunks, responses, strict=True):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            errors.update(dict.fromkeys(chunk, _error(response)))
+            continue
+        wanted = set(chunk)
+        for item in response.get("items") or []:
+            if isinstance(item, dict) and item.get(field) in wanted:
+                found[item[field]] = item
+        for value in chunk:
+            if value not in found:
+                errors[value] = {"error": "not_found", "message": f"No resource with {field} '{value}'"}
+    return found, errors
+
+
+def eq_filter(field: str, value: str) -> str:
+    """Return the filter expression ``<field> eq '<value>'`` with quotes escaped."""
+    return f"{field} eq '" + value.replace("'", "''") + "'"
+
+
+async def fetch_by_eq_filter(
+    http_client: _GetClient,
+    endpoint: str,
+    field: str,
+    values: list[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Look up values with one ``eq`` filter request per value.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        endpoint: Collection endpoint accepting ``filter`` and ``limit``
+        field: Property compared by the filter
+        values: Values to look up
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        The first returned item keyed by value, and per-value errors (``not_found``
+        for values the filter did not return)
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(value: str) -> dict[str, Any]:
+        async with semaphore:
+            return await http_client.get(endpoint, params={"filter": eq_filter(field, value), "limit": 1})
+
+    responses = await asyncio.gather(*(fetch(v) for v in values), return_exceptions=True)
+    found: dict[str, Any] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    for value, response in zip(values, responses, strict=True):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            errors[value] = _error(response)
+            continue
+        items = [item for item in response.get("items") or [] if isinstance(item, dict)]
+        if items:
+            found[value] = items[0]
+        else:
+            errors[value] = {"error": "not_found", "message": f"No resource with {field} '{value}'"}
+    return found, errors
+
+
+async def fetch_by_path(
+    http_client: _GetClient,
+    path_template: str,
+    ids: list[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """
+    Look up identifiers with one ``GET`` per identifier.
+
+    Args:
+        http_client: Client whose ``get`` performs (rate-limited) requests
+        path_template: Item endpoint with an ``{id}`` placeholder
+        ids: Identifiers to look up
+        max_concurrency: Maximum number of requests in flight
+
+    Returns:
+        Items keyed by identifier, and per-identifier errors (``not_found`` for ``404``)
+    """
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(resource_id: str) -> dict[str, Any]:
+        async with semaphore:
+            return await http_client.get(path_template.replace("{id}", quote(resource_id, safe="")))
+
+    responses = await asyncio.gather(*(fetch(i) for i in ids), return_exceptions=True)
+    found: dict[str, Any] = {}
+    errors: dict[str, dict[str, Any]] = {}
+    for resource_id, response in zip(ids, responses, strict=True):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            errors[resource_id] = _error(response)
+        else:
+            found[resource_id] = response
+    return found, errors
@@ -0,0 +1,318 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Local evaluation of OData filters over cached records for users MCP server.
+
+``compile_predicate`` turns a filter (parsed by ``utils.odata_filter``) into a
+Python predicate built from closures, so a record set is filtered without
+walking the AST per record. ``select`` applies a predicate to a record set
+and, when the caller passes an ``index`` callback, first narrows the records
+to the candidates of the ``eq`` and ``in`` terms the index can answer. The
+predicate is still applied to every candidate, so an index only has to return
+a superset (a case-insensitive index is fine).
+
+Semantics follow the APIs' filters:
+
+- A slash path walks nested objects; a list on the way matches if any element
+  does (``roles/id eq 'x'`` with ``roles`` a list of objects). A quoted field is a tag key, looked up in
+  the record's ``tags``.
+- Missing values are null. ``eq null`` matches them and ``ne`` is the negation
+  of ``eq``; every other comparison with a null is false.
+- A string compared with a number is compared as a number, ``'true'`` and
+  ``'false'`` compare with booleans, and two ISO 8601 timestamps compare as
+  instants. Values that cannot be compared are never equal and never ordered.
+- String comparisons and ``contains``, ``startswith`` and ``endswith`` are
+  case-sensitive.
+"""
+
+from __future__ import annotations
+
+import functools
+import operator
+import re
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from greenlake_users_mcp.utils.odata_filter import (
+    FILTER_CACHE_SIZE,
+    Call,
+    Comparison,
+    FieldRef,
+    InList,
+    Literal,
+    Logical,
+    Node,
+    Not,
+    compile_filter,
+)
+
+Predicate = Callable[[Mapping[str, Any]], bool]
+
+# Returns a superset of the record keys whose ``field`` may equal ``value``, or None if ``field`` has no index
+IndexLookup = Callable[[FieldRef, Any], "set[str] | None"]
+
+_ORDERINGS: dict[str, Callable[[Any, Any], bool]] = {
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "lt": operator.lt,
+    "le": operator.le,
+}
+_FUNCTIONS: dict[str, Callable[[str, str], bool]] = {
+    "contains": lambda actual, expected: expected in actual,
+    "startswith": str.startswith,
+    "endswith": str.endswith,
+}
+_TIMESTAMP_RE = re.compile(r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)?(?:Z|[+-]\d{2}:?\d{2})?\Z")
+_NUMBER_RE = re.compile(r"\s*-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\s*\Z")
+_INTEGER_RE = re.compile(r"\s*-?\d+\s*\Z")
+_INCOMPARABLE = object()
+
+
+@dataclass
+class Selection:
+    """Records matched by ``select`` and how they were found."""
+
+    ids: list[str]
+    indexed: bool
+    candidates: int
+    scanned: int
+
+
+def compile_predicate(
+    expression: str | Node, fields: frozenset[str] | None = None, quote: str = "'", tags_field: str = "tags"
+) -> Predicate:
+    """
+    Compile a filter into a predicate over records.
+
+    Args:
+        expression: Filter expression, or an AST from ``compile_filter``
+        fields: Known field names, or None to accept any field
+        quote: Quote character of string values in ``expression``
+        tags_field: Record property holding the tags compared by quoted fields
+
+    Returns:
+        Function of a record returning whether it matches
+
+    Raises:
+        FilterError: If the expression is malformed or names an unknown field
+    """
+    if isinstance(expression, str):
+        return _compile_cached(expression, fields, quote, tags_field)
+    return _compile(expression, tags_field)
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_cached(expression: str, fields: frozenset[str] | None, quote: str, tags_field: str) -> Predicate:
+    return _compile(compile_filter(expression, fields, quote).ast, tags_field)
+
+
+def select(
+    records: Mapping[str, Mapping[str, Any]],
+    expression: str | Node,
+    index: IndexLookup | None = None,
+    fields: frozenset[str] | None = None,
+    quote: str = "'",
+    tags_field: str = "tags",
+) -> Selection:
+    """
+    Return the keys of the records matching a filter, using ``index`` for ``eq`` and ``in`` terms.
+
+    Args:
+        records: Records keyed by ID
+        expression: Filter expression, or an AST from ``compile_filter``
+        index: Candidate lookup for indexed fields, or None to scan every record
+        fields: Known field names, or None to accept any field
+        quote: Quote character of string values in ``expression``
+        tags_field: Record property holding the tags compared by quoted fields
+
+    Returns:
+        Matching keys, sorted, with the number of candidates and records scanned
+
+    Raises:
+        FilterError: If the expression is malformed or names an unknown field
+    """
+    ast = compile_filter(expression, fields, quote).ast if isinstance(expression, str) else expression
+    predicate = compile_predicate(expression, fields, quote, tags_field)
+    candidates = _candidates(ast, index) if index is not None else None
+    if candidates is None:
+        ids = sorted(key for key, record in records.items() if predicate(record))
+        return Selection(ids, indexed=False, candidates=len(records), scanned=len(records))
+    present = [key for key in candidates if key in records]
+    ids = sorted(key for key in present if predicate(records[key]))
+    return Selection(ids, indexed=True, candidates=len(candidates), scanned=len(present))
+
+
+def _candidates(node: Node, index: IndexLookup) -> set[str] | None:
+    """Return a superset of the keys matching ``node`` from the index, or None if it cannot narrow them."""
+    if isinstance(node, Comparison):
+        if node.op != "eq" or node.value.kind == "null":
+            return None
+        return index(node.field, node.value.value)
+    if isinstance(node, InList):
+        found: set[str] = set()
+        for value in node.values:
+            keys = index(node.field, value.value) if value.kind != "null" else None
+            if keys is None:
+                return None
+            found |= keys
+        return found
+    if isinstance(node, Logical):
+        parts = [_candidates(operand, index) for operand in node.operands]
+        known: list[set[str]] = [p for p in parts if p is not None]
+        if node.op == "and":
+            return set.intersection(*sorted(known, key=len)) if known else None
+        if len(known) < len(parts):
+            return None
+        return set[str]().union(*known)
+    return None
+
+
+# -- predicate compilation ---------------------------------------------------
+
+
+def _compile(node: Node, tags_field: str) -> Predicate:
+    if isinstance(node, Logical):
+        operands = tuple(_compile(operand, tags_field) for operand in node.operands)
+        if node.op == "and":
+            return lambda record: all(p(record) for p in operands)
+        return lambda record: any(p(record) for p in operands)
+    if isinstance(node, Not):
+        operand = _compile(node.operand, tags_field)
+        return lambda record: not operand(record)
+    if isinstance(node, Comparison):
+        resolve = resolver(node.field, tags_field)
+        if node.op == "ne":
+            equal = _comparison("eq", node.value)
+            return lambda record: not any(equal(v) for v in resolve(record))
+        test = _comparison(node.op, node.value)
+        return lambda record: any(test(v) for v in resolve(record))
+    if isinstance(node, InList):
+        resolve = resolver(node.field, tags_field)
+        tests = tuple(_comparison("eq", value) for value in node.values)
+        return lambda record: any(t(v) for v in resolve(record) for t in tests)
+    if isinstance(node, Call):
+        resolve = resolver(node.field, tags_field)
+        function = _FUNCTIONS[node.function]
+        expected = node.value.value
+        if node.value.kind != "string":
+            return lambda record: False
+        return lambda record: any(isinstance(v, str) and function(v, expected) for v in resolve(record))
+    raise TypeError(f"Unsupported filter node {type(node).__name__}")
+
+
+def resolver(field: FieldRef, tags_field: str = "tags") -> Callable[[Mapping[str, Any]], list[Any]]:
+    """
+    Return a function giving the values at ``field`` in a record, with the filters' path semantics.
+
+    Args:
+        field: Property path, or a quoted tag key
+        tags_field: Record property holding the tags looked up by quoted fields
+
+    Returns:
+        Function of a record returning the values found (lists flattened), or ``[None]`` when there are none
+    """
+    if field.quoted:
+        tag_key = field.path
+
+        def resolve_tag(record: Mapping[str, Any]) -> list[Any]:
+            tags = record.get(tags_field)
+            return [tags.get(tag_key) if isinstance(tags, Mapping) else None]
+
+        return resolve_tag
+
+    steps = tuple(field.path.split("/"))
+    if len(steps) == 1:
+        step = steps[0]
+
+        def resolve_top(record: Mapping[str, Any]) -> list[Any]:
+            value = record.get(step)
+            return value if isinstance(value, list) and value else [value]
+
+        return resolve_top
+
+    def resolve_path(record: Mapping[str, Any]) -> list[Any]:
+        values: list[Any] = [record]
+        for step in steps:
+            values = list(_flatten(v.get(step) if isinstance(v, Mapping) else None for v in values))
+        return values or [None]
+
+    return resolve_path
+
+
+def _flatten(values: Iterable[Any]) -> Iterable[Any]:
+    for value in values:
+        if isinstance(value, list):
+            yield from value
+        else:
+            yield value
+
+
+def _comparison(op: str, literal: Literal) -> Callable[[Any], bool]:
+    """Return a test of one resolved value against ``literal`` (``ne`` is compiled as the negation of ``eq``)."""
+    expected = literal.value
+    if literal.kind == "null":
+        if op == "eq":
+            return lambda actual: actual is None
+        return lambda actual: False
+    if op == "eq":
+        return lambda actual: actual is not None and _coerce(actual, expected) == _key(actual)
+    compare = _ORDERINGS[op]
+
+    def ordered(actual: Any) -> bool:
+        if actual is None:
+            return False
+        right = _coerce(actual, expected)
+        if right is _INCOMPARABLE:
+            return False
+        try:
+            return bool(compare(_key(actual), right))
+        except TypeError:
+            return False
+
+    return ordered
+
+
+def _key(actual: Any) -> Any:
+    """Return the comparable form of a record value: timestamps as instants, other values unchanged."""
+    if isinstance(actual, str):
+        instant = parse_timestamp(actual)
+        if instant is not None:
+            return instant
+    return actual
+
+
+def _coerce(actual: Any, expected: Any) -> Any:
+    """Convert a filter value to the type of the record value it is compared with."""
+    if isinstance(actual, bool):
+        if isinstance(expected, bool):
+            return expected
+        if isinstance(expected, str) and expected.lower() in ("true", "false"):
+            return expected.lower() == "true"
+        return _INCOMPARABLE
+    if isinstance(actual, (int, float)):
+        if isinstance(expected, str) and _NUMBER_RE.match(expected):
+            return int(expected) if _INTEGER_RE.match(expected) else float(expected)
+        return _INCOMPARABLE
+    if isinstance(actual, str):
+        if isinstance(expected, bool):
+            return "true" if expected else "false"
+        if not isinstance(expected, str):
+            return _INCOMPARABLE
+        if parse_timestamp(actual) is not None:
+            instant = parse_timestamp(expected)
+            return instant if instant is not None else _INCOMPARABLE
+        return expected
+    return _INCOMPARABLE
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_timestamp(text: str) -> datetime | None:
+    """Parse an ISO 8601 timestamp (naive ones are UTC), or return None if ``text`` is not one."""
+    if not _TIMESTAMP_RE.match(text):
+        return None
+    try:
+        parsed = datetime.fromisoformat(text.replace("Z", "+00:00").replace(" ", "T"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
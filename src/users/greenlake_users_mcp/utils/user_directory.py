@@ -0,0 +1,200 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+In-memory user directory for users MCP server.
+
+Resolving the user IDs and usernames that show up in audit logs or as workspace
+owners costs one ``GET /identity/v1/users/{id}`` per user. The directory instead
+loads the whole workspace user list with paged ``GET /identity/v1/users``
+requests (600 users per page) and indexes it by ID and by username, so a
+batch of lookups is answered from memory.
+
+The directory is refreshed when it is older than its TTL; concurrent callers
+share one refresh. Users fetched individually for directory misses are added
+to it, so they hit on the next lookup. Counters track hits, misses, refresh
+requests and the upstream calls saved, that is per-user requests answered from
+memory minus the requests spent loading the directory.
+
+``query`` evaluates ``Get users`` style OData filters over the directory (see
+``utils.odata_eval``); ``eq`` and ``in`` terms on ``id`` and ``username`` are
+answered from the two indexes.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from greenlake_users_mcp.config.logging import get_logger
+from greenlake_users_mcp.utils.odata_eval import Selection, select
+from greenlake_users_mcp.utils.odata_filter import FieldRef
+from greenlake_users_mcp.utils.pagination import MAX_ITEMS_CAP, fetch_all_pages
+from greenlake_users_mcp.utils.single_flight import SingleFlight
+
+logger = get_logger(__name__)
+
+COLLECTION_ENDPOINT = "/identity/v1/users"
+
+# Largest page the Get users API returns
+PAGE_SIZE = 600
+
+
+@dataclass
+class DirectoryStats:
+    """Counters for directory lookups since the server started."""
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_requests: int = 0
+    queries: int = 0
+
+    @property
+    def upstream_calls_saved(self) -> int:
+        """Per-user requests answered from memory, less the requests spent loading the directory."""
+        return self.hits - self.refresh_requests
+
+
+class UserDirectory:
+    """Users of the workspace indexed by ID and by (case-insensitive) username."""
+
+    def __init__(self, ttl: float, max_users: int = MAX_ITEMS_CAP) -> None:
+        """
+        Initialize an empty directory.
+
+        Args:
+            ttl: Seconds a loaded directory is used before it is refreshed (0 disables the directory)
+            max_users: Maximum number of users loaded by a refresh
+        """
+        self.ttl = ttl
+        self.max_users = max_users
+        self.complete = False
+        self.stats = DirectoryStats()
+        self._by_id: dict[str, dict[str, Any]] = {}
+        self._by_username: dict[str, str] = {}
+        self._refreshed_at: float | None = None
+        self._refresh_flight = SingleFlight()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether lookups may be answered from the directory."""
+        return self.ttl > 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def age(self) -> float | None:
+        """Seconds since the last refresh, or None if the directory was never loaded."""
+        if self._refreshed_at is None:
+            return None
+        return time.monotonic() - self._refreshed_at
+
+    def is_fresh(self) -> bool:
+        """Whether the directory is loaded and younger than its TTL."""
+        age = self.age()
+        return age is not None and age < self.ttl
+
+    async def ensure_fresh(self, http_client: Any, force: bool = False) -> bool:
+        """
+        Refresh the directory if it is stale (or ``force`` is set).
+
+        Concurrent callers that find the directory stale wait for the same refresh.
+
+        Args:
+            http_client: Client whose ``get`` performs (rate-limited) requests
+            force: Refresh even if the directory is fresh
+
+        Returns:
+            True if this call waited for a refresh
+        """
+        if not self.enabled or (self.is_fresh() and not force):
+            return False
+        await self._refresh_flight.do(COLLECTION_ENDPOINT, lambda: self._refresh(http_client))
+        return True
+
+    async def _refresh(self, http_client: Any) -> None:
+        response = await fetch_all_pages(
+            http_client, COLLECTION_ENDPOINT, {}, page_size=PAGE_SIZE, max_items=self.max_users, offset_unit="pages"
+        )
+        pagination = response["pagination"]
+        self._by_id, self._by_username = {}, {}
+        for user in response["items"]:
+            self.add(user)
+        self.complete = not pagination["truncated"]
+        self._refreshed_at = time.monotonic()
+        self.stats.refreshes += 1
+        self.stats.refresh_requests += pagination["pages_fetched"]
+        logger.info(
+            f"User directory refreshed: {len(self._by_id)} users in {pagination['pages_fetched']} requests "
+            f"({pagination['elapsed_seconds']}s{', truncated' if not self.complete else ''})"
+        )
+
+    def add(self, user: Any) -> None:
+        """Index a user record by its ``id`` and ``username``."""
+        if not isinstance(user, dict) or not user.get("id"):
+            return
+        self._by_id[str(user["id"])] = user
+        if user.get("username"):
+            self._by_username[str(user["username"]).lower()] = str(user["id"])
+
+    def get(self, user_id: str) -> dict[str, Any] | None:
+        """Return the user with ``user_id``, counting the hit or miss."""
+        user = self._by_id.get(user_id) if self.enabled else None
+        self._count(user)
+        return user
+
+    def find(self, username: str) -> dict[str, Any] | None:
+        """Return the user with ``username`` (case-insensitive), counting the hit or miss."""
+        user_id = self._by_username.get(username.lower()) if self.enabled else None
+        user = self._by_id.get(user_id) if user_id is not None else None
+        self._count(user)
+        return user
+
+    def query(self, filter: str, fields: frozenset[str] | None = None) -> tuple[list[dict[str, Any]], Selection]:
+        """
+        Return the users matching an OData filter, evaluated over the directory.
+
+        Args:
+            filter: Filter expression, as for the Get users API
+            fields: Known user properties, or None to accept any property
+
+        Returns:
+            Matching users ordered by ID, and how they were selected
+
+        Raises:
+            FilterError: If the filter is malformed or names an unknown field
+        """
+        selection = select(self._by_id, filter, self._candidates, fields=fields)
+        self.stats.queries += 1
+        return [self._by_id[i] for i in selection.ids], selection
+
+    def _candidates(self, field: FieldRef, value: Any) -> set[str] | None:
+        """Index lookup for ``select``: users whose ``field`` may equal ``value``."""
+        if field.quoted or not isinstance(value, str):
+            return None
+        if field.path == "id":
+            return {value}
+        if field.path == "username":
+            user_id = self._by_username.get(value.lower())
+            return {user_id} if user_id is not None else set()
+        return None
+
+    def _count(self, user: dict[str, Any] | None) -> None:
+        if user is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return directory size, age and lookup counters."""
+        age = self.age()
+        lookups = self.stats.hits + self.stats.misses
+        return {
+            "users": len(self._by_id),
+            "complete": self.complete,
+            "ttl_seconds": self.ttl,
+            "refresh_age_seconds": round(age, 3) if age is not None else None,
+            **asdict(self.stats),
+            "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else None,
+            "upstream_calls_saved": self.stats.upstream_calls_saved,
+        }
@@ -0,0 +1,257 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for local OData filter evaluation in users MCP server.
+
+Besides hand-written cases, random filters are evaluated both by ``select``
+and by SQLite over the same records (the stand-in for the API's filter
+engine), and the matches must agree.
+"""
+
+from __future__ import annotations
+
+import random
+import sqlite3
+from typing import Any
+
+import pytest
+
+from greenlake_users_mcp.utils.odata_eval import compile_predicate, select
+from greenlake_users_mcp.utils.odata_filter import (
+    Call,
+    Comparison,
+    FieldRef,
+    FilterError,
+    InList,
+    Literal,
+    Logical,
+    Node,
+    Not,
+    compile_filter,
+)
+
+RECORD = {
+    "id": "d1",
+    "serialNumber": "SN100",
+    "quantity": 5,
+    "archived": False,
+    "createdAt": "2024-01-18T19:53:51.480Z",
+    "user": {"username": "ana@example.com"},
+    "additionalInfo": {"ipAddress": "10.0.0.1"},
+    "subscription": [{"id": "s1"}, {"id": "s2"}],
+    "tags": {"city": "London"},
+}
+
+
+class TestPredicates:
+    """Test cases for compiled predicates over single records."""
+
+    @pytest.mark.parametrize(
+        ("expression", "expected"),
+        [
+            ("serialNumber eq 'SN100'", True),
+            ("serialNumber eq 'sn100'", False),
+            ("serialNumber ne 'SN100'", False),
+            ("quantity eq 5", True),
+            ("quantity gt '10'", False),
+            ("quantity ge '4.5'", True),
+            ("archived eq false", True),
+            ("archived eq 'false'", True),
+            ("createdAt ge '2024-01-18'", True),
+            ("createdAt lt '2024-01-18T20:53:51+01:00'", False),
+            ("user/username eq 'ana@example.com'", True),
+            ("additionalInfo/ipAddress in ('10.0.0.1', '10.0.0.2')", True),
+            ("subscription/id eq 's2'", True),
+            ("subscription/id ne 's2'", False),
+            ("'city' eq 'London' and not 'street' eq 'Piccadilly'", True),
+            ("contains(user/username, '@example')", True),
+            ("startswith(serialNumber, 'SN1') and endswith(serialNumber, '00')", True),
+            ("contains(quantity, '5')", False),
+            ("secondaryName eq null and serialNumber ne null", True),
+            ("secondaryName ne 'x'", True),
+            ("secondaryName lt 'x' or secondaryName gt 'x'", False),
+            ("location/id eq null", True),
+        ],
+    )
+    def test_semantics(self, expression, expected):
+        assert compile_predicate(expression)(RECORD) is expected
+
+    def test_unknown_fields_are_rejected(self):
+        with pytest.raises(FilterError):
+            compile_predicate("colour eq 'red'", fields=frozenset({"serialNumber"}))
+
+
+RECORDS = {f"d{i}": {"serialNumber": f"SN{i}", "partNumber": f"PN{i % 3}"} for i in range(30)}
+
+
+class TestSelect:
+    """Test cases for selecting records with and without an index."""
+
+    def _index(self, lookups: list[Any]):
+        def index(field: FieldRef, value: Any) -> set[str] | None:
+            lookups.append((field.path, value))
+            if field.path != "serialNumber":
+                return None
+            # Case-insensitive, so a superset of the exact matches
+            return {k for k, r in RECORDS.items() if r["serialNumber"].lower() == str(value).lower()}
+
+        return index
+
+    def test_indexed_terms_narrow_the_scan(self):
+        lookups: list[Any] = []
+        selection = select(RECORDS, "serialNumber in 'sn1', 'SN2' and partNumber eq 'PN2'", self._index(lookups))
+
+        assert selection.ids == ["d2"]
+        assert (selection.indexed, selection.candidates, selection.scanned) == (True, 2, 2)
+        assert ("serialNumber", "sn1") in lookups
+
+    def test_unindexed_or_branch_falls_back_to_a_scan(self):
+        selection = select(RECORDS, "serialNumber eq 'SN1' or partNumber eq 'PN0'", self._index([]))
+
+        assert selection.indexed is False
+        assert selection.scanned == 30
+        assert len(selection.ids) == 11
+
+
+# -- differential tests against SQLite -------------------------------------
+
+_COLUMNS = {
+    "serialNumber": "TEXT",
+    "deviceType": "TEXT",
+    "quantity": "INTEGER",
+    "archived": "INTEGER",
+    "createdAt": "TEXT",
+    "user/username": "TEXT",
+}
+_TEXT_FIELDS = ("serialNumber", "deviceType", "user/username")
+
+
+def _random_records(rng: random.Random, count: int) -> dict[str, dict[str, Any]]:
+    records = {}
+    for i in range(count):
+        record: dict[str, Any] = {"id": f"r{i:04d}"}
+        if rng.random() < 0.9:
+            record["serialNumber"] = rng.choice(["SN", "sn", "XS"]) + str(rng.randint(0, 40))
+        if rng.random() < 0.8:
+            record["deviceType"] = rng.choice(["COMPUTE", "STORAGE", "SWITCH", "compute"])
+        if rng.random() < 0.8:
+            record["quantity"] = rng.randint(-5, 30)
+        if rng.random() < 0.7:
+            record["archived"] = rng.random() < 0.5
+        if rng.random() < 0.85:
+            record["createdAt"] = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00.000Z"
+        if rng.random() < 0.7:
+            record["user"] = {"username": rng.choice(["ana", "bo", "cy", "Ana"]) + "@example.com"}
+        records[record["id"]] = record
+    return records
+
+
+def _random_value(rng: random.Random, field: str) -> str:
+    if field == "serialNumber":
+        return f"'{rng.choice(['SN', 'sn', 'XS'])}{rng.randint(0, 40)}'"
+    if field == "deviceType":
+        return f"'{rng.choice(['COMPUTE', 'STORAGE', 'SWITCH', 'compute', 'OTHER'])}'"
+    if field == "quantity":
+        return rng.choice([str(rng.randint(-6, 31)), f"'{rng.randint(-6, 31)}'"])
+    if field == "archived":
+        return rng.choice(["true", "false"])
+    if field == "createdAt":
+        return f"'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00.000Z'"
+    return f"'{rng.choice(['ana', 'bo', 'cy', 'Ana', 'dee'])}@example.com'"
+
+
+def _random_filter(rng: random.Random, depth: int = 0) -> str:
+    roll = rng.random()
+    if depth < 3 and roll < 0.3:
+        op = rng.choice(["and", "or"])
+        return f"({_random_filter(rng, depth + 1)} {op} {_random_filter(rng, depth + 1)})"
+    if depth < 3 and roll < 0.38:
+        return f"not {_random_filter(rng, depth + 1)}"
+    field = rng.choice(list(_COLUMNS))
+    kind = rng.random()
+    if kind < 0.1:
+        return f"{field} {rng.choice(['eq', 'ne'])} null"
+    if kind < 0.25:
+        values = ", ".join(_random_value(rng, field) for _ in range(rng.randint(1, 3)))
+        return f"{field} in ({values})"
+    if kind < 0.4 and field in _TEXT_FIELDS:
+        function = rng.choice(["contains", "startswith", "endswith"])
+        fragment = rng.choice(["S", "SN1", "1", "@ex", "ana", "PUTE", "co"])
+        return f"{function}({field}, '{fragment}')"
+    operators = ["eq", "ne"] if field == "archived" else ["eq", "ne", "gt", "ge", "lt", "le"]
+    return f"{field} {rng.choice(operators)} {_random_value(rng, field)}"
+
+
+def _column(field: FieldRef) -> str:
+    return '"' + field.path.replace("/", "__") + '"'
+
+
+def _param(value: Literal) -> Any:
+    return int(value.value) if value.kind == "boolean" else value.value
+
+
+def _to_sql(node: Node, params: list[Any]) -> str:
+    """Translate a filter AST to a two-valued SQLite condition (nulls never compare)."""
+    if isinstance(node, Logical):
+        return "(" + f" {node.op.upper()} ".join(_to_sql(o, params) for o in node.operands) + ")"
+    if isinstance(node, Not):
+        return f"(NOT {_to_sql(node.operand, params)})"
+    column = _column(node.field)
+    if isinstance(node, InList):
+        params.extend(_param(v) for v in node.values)
+        return f"COALESCE({column} IN ({', '.join('?' * len(node.values))}), 0)"
+    if isinstance(node, Call):
+        params.append(node.value.value)
+        if node.function == "contains":
+            return f"COALESCE(instr({column}, ?) > 0, 0)"
+        params.append(node.value.value)
+        if node.function == "startswith":
+            return f"COALESCE(substr({column}, 1, length(?)) = ?, 0)"
+        return f"COALESCE(substr({column}, -length(?)) = ?, 0)"
+    assert isinstance(node, Comparison)
+    if node.value.kind == "null":
+        return {"eq": f"({column} IS NULL)", "ne": f"({column} IS NOT NULL)"}.get(node.op, "0")
+    params.append(_param(node.value))
+    if node.op == "ne":
+        return f"({column} IS NOT ?)"
+    sql_op = {"eq": "=", "gt": ">", "ge": ">=", "lt": "<", "le": "<="}[node.op]
+    return f"COALESCE({column} {sql_op} ?, 0)"
+
+
+def _sqlite(records: dict[str, dict[str, Any]]) -> sqlite3.Connection:
+    db = sqlite3.connect(":memory:")
+    columns = ", ".join(f'"{f.replace("/", "__")}" {t}' for f, t in _COLUMNS.items())
+    db.execute(f"CREATE TABLE records (id TEXT PRIMARY KEY, {columns})")
+    for record in records.values():
+        row = [record["id"]]
+        for field in _COLUMNS:
+            value: Any = record
+            for step in field.split("/"):
+                value = value.get(step) if isinstance(value, dict) else None
+            row.append(value)
+        db.execute(f"INSERT INTO records VALUES ({', '.join('?' * len(row))})", row)
+    return db
+
+
+class TestDifferential:
+    """Random filters must select the same records locally and in the SQLite stand-in."""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_matches_sqlite(self, seed):
+        rng = random.Random(seed)
+        records = _random_records(rng, 300)
+        db = _sqlite(records)
+
+        def index(field: FieldRef, value: Any) -> set[str] | None:
+            if field.path != "serialNumber" or not isinstance(value, str):
+                return None
+            return {k for k, r in records.items() if str(r.get("serialNumber", "")).lower() == value.lower()}
+
+        for _ in range(150):
+            expression = _random_filter(rng)
+            ast = compile_filter(expression).ast
+            params: list[Any] = []
+            sql = _to_sql(ast, params)
+            expected = [row[0] for row in db.execute(f"SELECT id FROM records WHERE {sql} ORDER BY id", params)]
+
+            assert select(records, expression).ids == expected, expression
+            assert select(records, expression, index).ids == expected, expression
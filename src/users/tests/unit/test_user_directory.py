@@ -0,0 +1,248 @@
+# (c) Copyright 2026 Hewlett Packard Enterprise Development LP
+"""
+Tests for the user directory and resolve_users tool in users MCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from typing import Any
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from greenlake_users_mcp.tools.implementations.resolve_users import resolve_users
+from greenlake_users_mcp.utils.batch_lookup import eq_filter
+from greenlake_users_mcp.utils.user_directory import UserDirectory
+
+BASE_URL = "https://global.api.greenlake.hpe.com"
+
+
+def _status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", f"{BASE_URL}/identity/v1/users")
+    return httpx.HTTPStatusError(f"HTTP {status}", request=request, response=httpx.Response(status, request=request))
+
+
+class FakeUsersApi:
+    """Get users API over a fixed user list that records requests (offset counts pages)."""
+
+    def __init__(self, count: int = 1500, fail_list: bool = False):
+        self.base_url = BASE_URL
+        self.users = {
+            f"{i:08d}-0000-4000-8000-000000000000": {
+                "id": f"{i:08d}-0000-4000-8000-000000000000",
+                "username": f"user{i}@example.com",
+                "userStatus": "VERIFIED" if i % 4 else "UNVERIFIED",
+            }
+            for i in range(count)
+        }
+        self.fail_list = fail_list
+        self.requests: list[tuple[str, dict[str, Any] | None]] = []
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+        self.requests.append((endpoint, params))
+        await asyncio.sleep(0.001)
+        if endpoint == "/identity/v1/users":
+            if self.fail_list:
+                raise _status_error(503)
+            users = list(self.users.values())
+            if "filter" in params:
+                username = re.match(r"username eq '(.*)'", params["filter"]).group(1)
+                return {"items": [u for u in users if u["username"] == username], "total": 1}
+            limit, page = params["limit"], params["offset"]
+            return {"items": users[page * limit : (page + 1) * limit], "total": len(users)}
+        user_id = endpoint.rsplit("/", 1)[1]
+        if user_id not in self.users:
+            raise _status_error(404)
+        return self.users[user_id]
+
+
+def _ctx(api: FakeUsersApi, directory: UserDirectory | None) -> MagicMock:
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context.http_client = api
+    ctx.request_context.lifespan_context.user_directory = directory
+    return ctx
+
+
+class TestUserDirectory:
+    """Test cases for loading and querying the directory."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_loads_all_pages_and_indexes_usernames(self):
+        api = FakeUsersApi(count=1500)
+        directory = UserDirectory(ttl=60)
+
+        assert await directory.ensure_fresh(api) is True
+        assert len(directory) == 1500
+        assert directory.complete is True
+        assert directory.find("USER7@example.com")["id"] == "00000007-0000-4000-8000-000000000000"
+        assert directory.stats.refresh_requests == 3
+        assert await directory.ensure_fresh(api) is False
+        assert len(api.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self):
+        api = FakeUsersApi(count=100)
+        directory = UserDirectory(ttl=60)
+
+        await asyncio.gather(*(directory.ensure_fresh(api) for _ in range(5)))
+
+        assert directory.stats.refreshes == 1
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_directory_is_refreshed(self):
+        api = FakeUsersApi(count=10)
+        directory = UserDirectory(ttl=60)
+        await directory.ensure_fresh(api)
+        directory._refreshed_at -= 61
+
+        assert await directory.ensure_fresh(api) is True
+        assert directory.stats.refreshes == 2
+
+    @pytest.mark.asyncio
+    async def test_max_users_marks_directory_incomplete(self):
+        directory = UserDirectory(ttl=60, max_users=600)
+
+        await directory.ensure_fresh(FakeUsersApi(count=1500))
+
+        assert len(directory) == 600
+        assert directory.complete is False
+
+    def test_zero_ttl_disables_directory(self):
+        directory = UserDirectory(ttl=0)
+        directory.add({"id": "a", "username": "a@example.com"})
+
+        assert directory.get("a") is None
+        assert directory.snapshot()["misses"] == 1
+
+    def test_eq_filter_escapes_quotes(self):
+        assert eq_filter("username", "o'neil@example.com") == "username eq 'o''neil@example.com'"
+
+
+class TestResolveUsers:
+    """Test cases for the resolve_users tool."""
+
+    @pytest.mark.asyncio
+    async def test_warm_directory_answers_without_requests(self):
+        api = FakeUsersApi(count=1500)
+        directory = UserDirectory(ttl=60)
+        await directory.ensure_fresh(api)
+        api.requests.clear()
+        ids = list(api.users)[:200]
+
+        result = await resolve_users(_ctx(api, directory), ids=ids, usernames=["user1400@example.com"])
+        payload = result[0]["result"]
+
+        assert result[0]["success"] is True
+        assert api.requests == []
+        assert list(payload["items"])[:200] == ids
+        assert payload["usernames"] == {"user1400@example.com": "00001400-0000-4000-8000-000000000000"}
+        assert payload["lookup"]["hit_ratio"] == 1.0
+        assert payload["lookup"]["upstream_calls_saved"] == 201
+        assert payload["lookup"]["refresh_age_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_cold_directory_is_loaded_once(self):
+        api = FakeUsersApi(count=1500)
+        directory = UserDirectory(ttl=60)
+        ids = list(api.users)[:50]
+
+        payload = (await resolve_users(_ctx(api, directory), ids=ids))[0]["result"]
+
+        assert payload["lookup"]["refreshed"] is True
+        assert payload["lookup"]["requests"] == payload["lookup"]["refresh_requests"] == 3
+        assert payload["lookup"]["upstream_calls_saved"] == 47
+        assert payload["directory"]["users"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_misses_fall_back_to_detail_and_filter_requests(self):
+        api = FakeUsersApi(count=20)
+        directory = UserDirectory(ttl=60)
+        await directory.ensure_fresh(api)
+        new_user = {"id": "ffffffff-0000-4000-8000-000000000000", "username": "new@example.com"}
+        api.users[new_user["id"]] = new_user
+        api.requests.clear()
+
+        payload = (
+            await resolve_users(
+                _ctx(api, directory),
+                ids=[new_user["id"], "missing"],
+                usernames="new@example.com, nobody@example.com",
+            )
+        )[0]["result"]
+
+        assert list(payload["items"]) == [new_user["id"]]
+        assert payload["errors"]["missing"]["error"] == "not_found"
+        assert payload["errors"]["nobody@example.com"]["error"] == "not_found"
+        assert payload["lookup"]["fallback_requests"] == len(api.requests) == 4
+        assert directory.get(new_user["id"]) == new_user
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_falls_back_to_detail_requests(self):
+        api = FakeUsersApi(count=5, fail_list=True)
+        user_id = next(iter(api.users))
+
+        payload = (await resolve_users(_ctx(api, UserDirectory(ttl=60)), ids=user_id))[0]["result"]
+
+        assert list(payload["items"]) == [user_id]
+        assert "503" in payload["lookup"]["refresh_error"]
+        assert payload["lookup"]["hit_ratio"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_requires_ids_or_usernames(self):
+        result = await resolve_users(_ctx(FakeUsersApi(count=1), UserDirectory(ttl=60)))
+
+        assert result[0]["success"] is False
+        assert result[0]["error"] == "validation_error"
+
+
+class TestFilterQueries:
+    """Test cases for OData filters answered from the directory."""
+
+    @pytest.mark.asyncio
+    async def test_username_terms_use_the_index(self):
+        directory = UserDirectory(ttl=60)
+        await directory.ensure_fresh(FakeUsersApi(count=100))
+
+        users, selection = directory.query("username in 'user1@example.com', 'USER2@example.com'")
+
+        assert [u["username"] for u in users] == ["user1@example.com"]
+        assert (selection.indexed, selection.scanned) == (True, 2)
+        assert directory.stats.queries == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_is_answered_from_a_complete_directory(self):
+        api = FakeUsersApi(count=100)
+        ctx = _ctx(api, UserDirectory(ttl=60))
+
+        result = (await resolve_users(ctx, filter="userStatus = UNVERIFIED"))[0]["result"]
+
+        assert len(result["matches"]) == 25
+        assert result["count"] == 25
+        assert result["lookup"]["filter"]["source"] == "directory"
+        assert result["lookup"]["filter"]["filter"] == "userStatus eq 'UNVERIFIED'"
+        assert result["lookup"]["requests"] == 1
+        assert len(api.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_filter_goes_upstream_without_a_directory(self):
+        api = FakeUsersApi(count=10)
+        ctx = _ctx(api, UserDirectory(ttl=0))
+
+        result = (await resolve_users(ctx, filter="username eq 'user3@example.com'"))[0]["result"]
+
+        assert result["matches"] == ["00000003-0000-4000-8000-000000000000"]
+        assert result["lookup"]["filter"]["source"] == "api"
+        assert api.requests[0][1]["filter"] == "username eq 'user3@example.com'"
+
+    @pytest.mark.asyncio
+    async def test_malformed_filter_is_rejected_before_any_request(self):
+        api = FakeUsersApi(count=10)
+
+        result = await resolve_users(_ctx(api, UserDirectory(ttl=60)), filter="role eq 'admin'")
+
+        assert result[0]["error"] == "validation_error"
+        assert api.requests == []
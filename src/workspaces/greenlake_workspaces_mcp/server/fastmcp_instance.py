@@ -27,6 +27,7 @@ class AppContext:
     """
 
     http_client: Any  # WorkspacesHttpClient
+    response_cache: Any = None  # ResponseCache shared with http_client
 
 
 @asynccontextmanager
@@ -45,9 +46,15 @@ async def _lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     log.info("Initialising workspaces HTTP client...")
 
     http_client = get_http_client()
+    if http_client.settings.token_background_refresh:
+        # Fetch the token now and renew it ahead of expiry so tool calls never wait for it
+        http_client.token_manager.start_background_refresh(
+            refresh_fraction=http_client.settings.token_refresh_fraction,
+            jitter=http_client.settings.token_refresh_jitter,
+        )
     try:
         log.info("workspaces MCP server ready")
-        yield AppContext(http_client=http_client)
+        yield AppContext(http_client=http_client, response_cache=http_client.response_cache)
     finally:
         log.info("Shutting down workspaces HTTP client...")
         await http_client.close()